@@ -0,0 +1,52 @@
+"""add alert_data facet indexes to alert_sessions
+
+Revision ID: d8e9f0a1b2c3
+Revises: b67c135119d7
+Create Date: 2026-02-02 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: Union[str, Sequence[str], None] = "b67c135119d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with INDEXED_ALERT_DATA_FACETS / alert_data_facet_sql in tarsy.models.db_models
+FACETS = ("cluster", "namespace", "severity")
+
+
+def _facet_expression(dialect_name: str, key: str) -> str:
+    if dialect_name == "postgresql":
+        return f"(alert_data ->> '{key}')"
+    return f"json_extract(alert_data, '$.{key}')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect_name = op.get_bind().dialect.name
+
+    # Expression indexes for the built-in facets (equality lookups on one key)
+    for key in FACETS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_alert_sessions_alert_data_{key} "
+            f"ON alert_sessions ({_facet_expression(dialect_name, key)})"
+        )
+
+    # GIN index for containment filters on any other configured facet key
+    if dialect_name == "postgresql":
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_alert_sessions_alert_data_gin "
+            "ON alert_sessions USING gin ((CAST(alert_data AS jsonb)) jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_alert_sessions_alert_data_gin")
+    for key in FACETS:
+        op.execute(f"DROP INDEX IF EXISTS ix_alert_sessions_alert_data_{key}")
@@ -0,0 +1,46 @@
+"""add llm_rate_budgets table for pod-shared LLM rate limits
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-02-12 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Check if table already exists (for idempotency)
+    from sqlalchemy import inspect
+
+    inspector = inspect(op.get_bind())
+    if "llm_rate_budgets" not in inspector.get_table_names():
+        op.create_table(
+            "llm_rate_budgets",
+            sa.Column("provider", sa.String(length=100), nullable=False),
+            sa.Column("window_start", sa.BigInteger(), autoincrement=False, nullable=False),
+            sa.Column("requests_used", sa.Integer(), nullable=False),
+            sa.Column("tokens_used", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("provider", "window_start"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Check if table exists before dropping (for idempotency)
+    from sqlalchemy import inspect
+
+    inspector = inspect(op.get_bind())
+    if "llm_rate_budgets" in inspector.get_table_names():
+        op.drop_table("llm_rate_budgets")
@@ -12,9 +12,14 @@ from typing import TYPE_CHECKING, Dict, List, Optional, assert_never
 
 from tarsy.config.settings import get_settings
 from tarsy.integrations.llm.manager import LLMManager
+from tarsy.integrations.llm.token_budget import (
+    TokenBudget,
+    TokenBudgetExceededError,
+    token_budget_scope,
+)
 from tarsy.integrations.mcp.client import MCPClient
 from tarsy.models.agent_execution_result import AgentExecutionResult
-from tarsy.models.constants import StageStatus
+from tarsy.models.constants import LLMInteractionType, StageStatus
 from tarsy.models.mcp_selection_models import MCPSelectionConfig
 from tarsy.models.parallel_metadata import ParallelExecutionMetadata
 from tarsy.models.processing_context import (
@@ -105,6 +110,13 @@ class BaseAgent(ABC):
         # When None, uses the global default provider from settings
         self._llm_provider_name: Optional[str] = None
         
+        # Chain-level model per LLM interaction type (e.g. summarization)
+        # When None, the provider's interaction_models apply
+        self._interaction_models: Optional[Dict[str, str]] = None
+        
+        # LLM token budget for one stage of this agent (None = unlimited)
+        self._token_budget: Optional[int] = None
+        
         # MCP servers override from configuration hierarchy (chain/stage/parallel-agent level)
         # When None, uses agent's default mcp_servers() method
         # When set, completely overrides agent default (unless alert-level override is present)
@@ -344,8 +356,10 @@ class BaseAgent(ABC):
                 agent=self
             )
             
-            # Delegate to appropriate iteration controller
-            analysis_result = await self._iteration_controller.execute_analysis_loop(stage_context)
+            # Delegate to appropriate iteration controller (within the agent's token budget)
+            agent_budget = TokenBudget("agent", self._token_budget) if self._token_budget else None
+            with token_budget_scope(agent_budget):
+                analysis_result = await self._iteration_controller.execute_analysis_loop(stage_context)
             
             # Create strategy-specific execution result summary
             result_summary = self._iteration_controller.create_result_summary(
@@ -397,6 +411,20 @@ class BaseAgent(ABC):
                 iteration_strategy=self._iteration_strategy.value,
                 llm_provider=self._llm_provider_name
             )
+        except TokenBudgetExceededError as e:
+            # Hard stop: no conclusion could be reached within the token budget
+            logger.error(f"Agent {self.__class__.__name__} stopped: {e}")
+            
+            return AgentExecutionResult(
+                status=StageStatus.FAILED,
+                agent_name=self.__class__.__name__,
+                stage_name=context.current_stage_name,
+                timestamp_us=now_us(),
+                result_summary=f"Agent execution stopped: {str(e)}",
+                error_message=str(e),
+                iteration_strategy=self._iteration_strategy.value,
+                llm_provider=self._llm_provider_name
+            )
         except Exception as e:
             # Handle unexpected errors
             error_msg = f"Agent processing failed with unexpected error: {str(e)}"
@@ -519,6 +547,25 @@ class BaseAgent(ABC):
         if provider_name:
             logger.info(f"Agent {self.__class__.__name__} configured with LLM provider: {provider_name}")
     
+    def set_interaction_models(self, interaction_models: Optional[Dict[str, str]]):
+        """
+        Set the chain-level model per LLM interaction type for this agent instance.
+        
+        Args:
+            interaction_models: Interaction type -> model name (overrides the provider's routing)
+        """
+        self._interaction_models = interaction_models
+    
+    def set_token_budget(self, token_budget: Optional[int]) -> None:
+        """
+        Set the LLM token budget for each stage of this agent instance.
+        
+        Args:
+            token_budget: Maximum tokens (prompt + completion), or None for unlimited
+        """
+        self._token_budget = token_budget
+        logger.info(f"Agent {self.__class__.__name__} configured with token_budget: {token_budget}")
+    
     def get_llm_provider(self) -> Optional[str]:
         """
         Get the LLM provider override for this agent instance.
@@ -566,7 +613,12 @@ class BaseAgent(ABC):
         # Create and inject summarizer if LLM manager is available
         if hasattr(self, 'llm_manager') and self.llm_manager:
             from tarsy.integrations.mcp.summarizer import MCPResultSummarizer
-            summarizer = MCPResultSummarizer(self.llm_manager, self._prompt_builder)
+            summarizer = MCPResultSummarizer(
+                self.llm_manager,
+                self._prompt_builder,
+                provider=self._llm_provider_name,
+                model=(self._interaction_models or {}).get(LLMInteractionType.SUMMARIZATION.value)
+            )
             # Update MCP client with summarizer
             self.mcp_client.summarizer = summarizer
         
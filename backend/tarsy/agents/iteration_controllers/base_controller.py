@@ -8,8 +8,13 @@ all iteration controller implementations.
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 
+from ...integrations.llm.token_budget import (
+    TokenBudgetExceededError,
+    get_exhausting_token_budget,
+)
 from ...models.unified_interactions import LLMConversation, MessageRole
 from ..parsers.react_parser import ReActParser
+from .context_budget import ContextBudgetManager
 
 if TYPE_CHECKING:
     from ...agents.prompts import PromptBuilder
@@ -77,6 +82,50 @@ class IterationController(ABC):
         
         return getattr(mcp, "native_tools", None)
     
+    def _compact_conversation(self, conversation: LLMConversation) -> None:
+        """
+        Compact older observations if the conversation exceeds the provider's context budget.
+        
+        Args:
+            conversation: Conversation about to be sent to the LLM (compacted in place)
+        """
+        from tarsy.config.settings import get_settings
+        
+        settings = get_settings()
+        if not settings.llm_context_compaction_enabled:
+            return
+        
+        # Compaction must never fail the iteration - an oversized request fails on its own
+        try:
+            llm_manager = getattr(self, 'llm_manager', None)
+            context_window = llm_manager.get_context_window_tokens(self._llm_provider_name) if llm_manager else None
+            ContextBudgetManager(settings, context_window).compact(conversation)
+        except Exception as e:
+            logger = getattr(self, 'logger', None)
+            if logger:
+                logger.warning(f"Conversation compaction failed: {e}")
+    
+    def _should_conclude_for_token_budget(self) -> bool:
+        """
+        Check whether the session/agent token budget is nearly used up.
+        
+        Returns:
+            True if the investigation should stop and force a conclusion
+        """
+        from tarsy.config.settings import get_settings
+        
+        budget = get_exhausting_token_budget(get_settings().token_budget_conclusion_threshold)
+        if budget is None:
+            return False
+        
+        logger = getattr(self, 'logger', None)
+        if logger:
+            logger.warning(
+                f"{budget.scope.capitalize()} token budget nearly used up "
+                f"({budget.used:,}/{budget.limit:,} tokens) - forcing conclusion"
+            )
+        return True
+    
     def _restore_paused_conversation(
         self, 
         context: 'StageContext',
@@ -355,6 +404,7 @@ class IterationController(ABC):
         
         # Add conclusion request to conversation
         conversation.append_observation(conclusion_prompt)
+        self._compact_conversation(conversation)
         
         # Get settings for timeout
         settings = get_settings()
@@ -366,6 +416,8 @@ class IterationController(ABC):
                 context=context,
                 timeout=settings.llm_iteration_timeout
             )
+        except TokenBudgetExceededError:
+            raise
         except asyncio.TimeoutError:
             if logger:
                 logger.warning("Forced conclusion call timed out")
@@ -0,0 +1,168 @@
+"""
+Context budget management for iteration controllers.
+
+Every tool observation is appended to the conversation verbatim, so long
+investigations grow until later iterations slow down and eventually exceed
+the model's context window.
+
+Logic:
+- Budget: llm_context_compaction_threshold x the provider's context_window_tokens
+  (DEFAULT_CONTEXT_WINDOW_TOKENS when the provider doesn't configure one)
+- Checked before every LLM call; tokenization is skipped while the conversation's
+  UTF-8 size is within budget (a token is at least one byte), and message token
+  counts are cached, so each message is tokenized once rather than every iteration
+- Over budget: the oldest tool observations are replaced by references (size and
+  an excerpt) until the conversation is below COMPACTION_TARGET of the budget,
+  so compaction doesn't run again on the next iteration
+- Never compacted: the system prompt, the first user message (alert and task)
+  and the latest llm_context_keep_recent_messages messages
+- Each compaction is recorded in LLMConversation.compactions, which is stored in
+  history with every later LLM interaction
+"""
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from tarsy.config.settings import Settings
+from tarsy.models.unified_interactions import (
+    ConversationCompaction,
+    LLMConversation,
+    MessageRole,
+)
+from tarsy.utils.logger import get_module_logger
+from tarsy.utils.token_counter import TokenCounter
+
+logger = get_module_logger(__name__)
+
+# Context window assumed for providers without context_window_tokens
+DEFAULT_CONTEXT_WINDOW_TOKENS = 128000
+
+# Compact down to this fraction of the budget (headroom for the next iterations)
+COMPACTION_TARGET = 0.75
+
+# Observations smaller than this are not worth compacting
+MIN_COMPACTED_TOKENS = 500
+
+# Characters of the original observation kept in its reference
+EXCERPT_CHARS = 1000
+
+# Observation labels used by the ReAct and native thinking controllers
+OBSERVATION_PREFIXES = ("Observation:", "Tool Result:")
+
+COMPACTED_MARKER = "[Compacted to stay within the context window"
+
+# Upper bound on cached message token counts
+MAX_CACHED_MESSAGE_COUNTS = 10000
+
+_token_counter: Optional[TokenCounter] = None
+
+# Token counts by message (length, hash), least recently used first
+_message_token_counts: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+
+
+def _get_token_counter() -> TokenCounter:
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter()
+    return _token_counter
+
+
+def _count_message_tokens(content: str) -> int:
+    """Count a message's tokens, reusing the count from earlier iterations."""
+    # Keyed by hash so cached counts don't keep large observations alive
+    key = (len(content), hash(content))
+    tokens = _message_token_counts.get(key)
+    if tokens is not None:
+        _message_token_counts.move_to_end(key)
+        return tokens
+    tokens = _get_token_counter().count_tokens(content)
+    _message_token_counts[key] = tokens
+    while len(_message_token_counts) > MAX_CACHED_MESSAGE_COUNTS:
+        _message_token_counts.popitem(last=False)
+    return tokens
+
+
+class ContextBudgetManager:
+    """Keeps an iteration controller's conversation within the model's context budget."""
+
+    def __init__(self, settings: Settings, context_window_tokens: Optional[int] = None):
+        self.settings = settings
+        self.context_window_tokens = context_window_tokens or DEFAULT_CONTEXT_WINDOW_TOKENS
+        self.token_budget = int(self.context_window_tokens * settings.llm_context_compaction_threshold)
+
+    def compact(self, conversation: LLMConversation) -> Optional[ConversationCompaction]:
+        """
+        Compact older observations in place if the conversation exceeds the budget.
+
+        Args:
+            conversation: Conversation about to be sent to the LLM
+
+        Returns:
+            The recorded compaction, or None if the conversation is within budget
+        """
+        if sum(len(m.content.encode("utf-8")) for m in conversation.messages) <= self.token_budget:
+            return None
+
+        message_tokens = [_count_message_tokens(m.content) for m in conversation.messages]
+        tokens_before = sum(message_tokens)
+        if tokens_before <= self.token_budget:
+            return None
+
+        target = int(self.token_budget * COMPACTION_TARGET)
+        total = tokens_before
+        compacted = 0
+        for index in self._compactable_indices(conversation):
+            if total <= target:
+                break
+            message = conversation.messages[index]
+            message.content = self._build_reference(message.content, message_tokens[index])
+            reference_tokens = _count_message_tokens(message.content)
+            total -= message_tokens[index] - reference_tokens
+            message_tokens[index] = reference_tokens
+            compacted += 1
+
+        if not compacted:
+            logger.warning(
+                f"Conversation has {tokens_before:,} tokens (budget {self.token_budget:,}) "
+                f"but no older observations left to compact"
+            )
+            return None
+
+        compaction = ConversationCompaction(
+            tokens_before=tokens_before,
+            tokens_after=total,
+            token_budget=self.token_budget,
+            compacted_messages=compacted,
+        )
+        conversation.compactions.append(compaction)
+        logger.info(
+            f"Compacted {compacted} observations: {tokens_before:,} -> {total:,} tokens "
+            f"(budget {self.token_budget:,})"
+        )
+        return compaction
+
+    def _compactable_indices(self, conversation: LLMConversation) -> List[int]:
+        """Indices of large, not yet compacted observations outside the protected messages, oldest first."""
+        keep_recent = self.settings.llm_context_keep_recent_messages
+        end = len(conversation.messages) - keep_recent
+        # Rough pre-filter (~4 characters per token) before the exact count
+        min_chars = MIN_COMPACTED_TOKENS * 4
+        return [
+            index
+            for index in range(2, end)
+            if conversation.messages[index].role == MessageRole.USER
+            and conversation.messages[index].content.startswith(OBSERVATION_PREFIXES)
+            and COMPACTED_MARKER not in conversation.messages[index].content
+            and len(conversation.messages[index].content) >= min_chars
+        ]
+
+    @staticmethod
+    def _build_reference(content: str, tokens: int) -> str:
+        """Replace an observation by its label, size and an excerpt."""
+        prefix = next(p for p in OBSERVATION_PREFIXES if content.startswith(p))
+        body = content[len(prefix):].strip()
+        return (
+            f"{prefix} {COMPACTED_MARKER}: {tokens:,} tokens of tool output omitted. "
+            f"Call the tool again if the omitted details are needed.]\n"
+            f"{body[:EXCERPT_CHARS]}..."
+        )
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Optional
 
 from tarsy.config.settings import get_settings
 from tarsy.integrations.llm.gemini_client import GeminiNativeThinkingClient
+from tarsy.integrations.llm.token_budget import TokenBudgetExceededError
 from tarsy.models.constants import LLMInteractionType
 from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
 from tarsy.utils.logger import get_module_logger
@@ -226,10 +227,21 @@ class NativeThinkingController(IterationController):
                 self.logger.error(error_msg)
                 raise Exception(error_msg)
             
+            # Conclude with the data gathered so far when the token budget is nearly used up
+            if self._should_conclude_for_token_budget():
+                return await self._force_conclusion(
+                    conversation=conversation,
+                    context=context,
+                    iteration=iteration
+                )
+            
             try:
                 # Get parallel execution metadata for streaming
                 parallel_metadata = agent.get_parallel_execution_metadata()
                 
+                # Keep the conversation within the model's context budget
+                self._compact_conversation(conversation)
+                
                 # Call LLM with native thinking
                 response = await asyncio.wait_for(
                     native_client.generate(
@@ -348,6 +360,10 @@ class NativeThinkingController(IterationController):
                 
                 # Otherwise, append error and continue
                 conversation.append_observation(f"Error: {error_msg}")
+            
+            except TokenBudgetExceededError:
+                # Hard stop - no further LLM calls within this budget
+                raise
                 
             except Exception as e:
                 import traceback
@@ -11,6 +11,7 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING, Optional
 
 from ...config.settings import get_settings
+from ...integrations.llm.token_budget import TokenBudgetExceededError
 from ...models.constants import LLMInteractionType
 from ...models.unified_interactions import LLMConversation, MessageRole
 from ..parsers.react_parser import ReActParser
@@ -74,6 +75,14 @@ class ReactController(IterationController):
                 self.logger.error(error_msg)
                 raise Exception(error_msg)
             
+            # Conclude with the data gathered so far when the token budget is nearly used up
+            if self._should_conclude_for_token_budget():
+                return await self._force_conclusion(
+                    conversation=conversation,
+                    context=context,
+                    iteration=iteration
+                )
+            
             # Wrap ENTIRE iteration (LLM + tool execution) with timeout
             # This timeout is configurable and should allow MCP.s full retry cycle to complete
             try:
@@ -87,13 +96,18 @@ class ReactController(IterationController):
                     # Get parallel execution metadata for streaming
                     parallel_metadata = context.agent.get_parallel_execution_metadata()
                     
+                    # Keep the conversation within the model's context budget
+                    self._compact_conversation(conversation)
+                    
                     conversation_result = await self.llm_manager.generate_response(
                         conversation=conversation,
                         session_id=context.session_id,
                         stage_execution_id=context.agent.get_current_stage_execution_id(),
                         provider=self._llm_provider_name,
                         native_tools_override=native_tools_override,
-                        parallel_metadata=parallel_metadata
+                        parallel_metadata=parallel_metadata,
+                        # End the response after Action Input / Final Answer
+                        stop_sequences=ReActParser.STOP_SEQUENCES
                     )
                     
                     # 4. Extract and parse assistant response
@@ -208,6 +222,10 @@ class ReactController(IterationController):
                 # Otherwise, append error observation and continue
                 error_observation = f"Error: {error_msg}"
                 conversation.append_observation(f"Observation: {error_observation}")
+            
+            except TokenBudgetExceededError:
+                # Hard stop - no further LLM calls within this budget
+                raise
                     
             except Exception as e:
                 stage_execution_id = context.agent.get_current_stage_execution_id() if context.agent else None
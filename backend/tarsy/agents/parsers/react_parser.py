@@ -102,6 +102,10 @@ class ReActParser:
     Replaces dict-based parsing from builders.py with proper types.
     """
     
+    # End of a ReAct response: the system provides observations, so everything the
+    # model writes from a hallucinated observation on is discarded (_should_stop_parsing)
+    STOP_SEQUENCES = ("\nObservation:",)
+    
     @staticmethod
     def parse_response(response: str) -> ReActResponse:
         """
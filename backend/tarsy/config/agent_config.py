@@ -200,6 +200,8 @@ class ConfigurationLoader:
                     "max_iterations": chain_config.max_iterations,
                     "force_conclusion_at_max_iterations": chain_config.force_conclusion_at_max_iterations,
                     "mcp_servers": chain_config.mcp_servers,
+                    "interaction_models": chain_config.interaction_models,
+                    "token_budget": chain_config.token_budget,
                     "chat": {
                         "enabled": chain_config.chat.enabled,
                         "agent": chain_config.chat.agent,
@@ -17,6 +17,7 @@ Agent classes are imported dynamically by AgentFactory when needed.
 import copy
 from typing import Any, Dict
 
+from tarsy.models.constants import LLMInteractionType
 from tarsy.models.llm_models import GoogleNativeTool, LLMProviderConfig, LLMProviderType
 from tarsy.models.mcp_transport_config import TRANSPORT_STDIO
 
@@ -242,6 +243,14 @@ BUILTIN_CODE_MASKERS: Dict[str, str] = {
 # BUILT-IN LLM PROVIDERS
 # ==============================================================================
 
+def _cheap_interaction_models(model: str) -> Dict[str, str]:
+    """Route high-volume, low-difficulty calls (tool result and executive summaries) to a faster model."""
+    return {
+        LLMInteractionType.SUMMARIZATION.value: model,
+        LLMInteractionType.FINAL_ANALYSIS_SUMMARY.value: model,
+    }
+
+
 # Central registry of all built-in LLM provider configurations
 # Format: "provider-name" -> LLMProviderConfig instance
 BUILTIN_LLM_PROVIDERS: Dict[str, LLMProviderConfig] = {
@@ -249,29 +258,37 @@ BUILTIN_LLM_PROVIDERS: Dict[str, LLMProviderConfig] = {
         type=LLMProviderType.OPENAI,
         model="gpt-5",
         api_key_env="OPENAI_API_KEY",
+        interaction_models=_cheap_interaction_models("gpt-5-mini"),
+        context_window_tokens=272000,
         max_tool_result_tokens=250000  # Conservative for 272K context
     ),
     "google-default": LLMProviderConfig(
         type=LLMProviderType.GOOGLE, 
         model="gemini-2.5-pro",
         api_key_env="GOOGLE_API_KEY",
+        interaction_models=_cheap_interaction_models("gemini-2.5-flash"),
         native_tools={
             GoogleNativeTool.GOOGLE_SEARCH.value: True,
             GoogleNativeTool.CODE_EXECUTION.value: False,  # Disabled by default
             GoogleNativeTool.URL_CONTEXT.value: True,
         },
+        context_window_tokens=1048576,
         max_tool_result_tokens=950000  # Conservative for 1M context
     ),
     "xai-default": LLMProviderConfig(
         type=LLMProviderType.XAI,
         model="grok-4", 
         api_key_env="XAI_API_KEY",
+        interaction_models=_cheap_interaction_models("grok-3-mini"),
+        context_window_tokens=256000,
         max_tool_result_tokens=200000  # Conservative for 256K context
     ),
     "anthropic-default": LLMProviderConfig(
         type=LLMProviderType.ANTHROPIC,
         model="claude-sonnet-4-20250514",
         api_key_env="ANTHROPIC_API_KEY",
+        interaction_models=_cheap_interaction_models("claude-haiku-4-5-20251001"),
+        context_window_tokens=200000,
         max_tool_result_tokens=150000  # Conservative for 200K context
     ),
     "vertexai-default": LLMProviderConfig(
@@ -279,6 +296,8 @@ BUILTIN_LLM_PROVIDERS: Dict[str, LLMProviderConfig] = {
         model="claude-sonnet-4-5@20250929",  # Claude Sonnet 4.5 on Vertex AI
         project_env="GOOGLE_CLOUD_PROJECT",  # Standard GCP project ID env var
         location_env="GOOGLE_CLOUD_LOCATION",  # Standard GCP location env var
+        interaction_models=_cheap_interaction_models("claude-haiku-4-5@20251001"),
+        context_window_tokens=200000,
         max_tool_result_tokens=150000  # Conservative for 200K context
     )
 }
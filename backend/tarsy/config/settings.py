@@ -11,10 +11,11 @@ from typing import Dict, List, Optional
 from urllib.parse import quote_plus, urlparse
 
 import yaml
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, ValidationInfo, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from tarsy.config.builtin_config import get_builtin_llm_providers
+from tarsy.models.db_models import ALERT_DATA_FACET_KEY_PATTERN
 from tarsy.models.llm_models import LLMProviderConfig, LLMProviderType
 
 def is_testing() -> bool:
@@ -89,11 +90,88 @@ class Settings(BaseSettings):
         description="Force LLM to conclude with available data when max iterations reached (instead of pausing for manual resume). Chats always use forced conclusion regardless of this setting."
     )
     
+    # Conversation Compaction Configuration (context windows are set per provider in llm_providers.yaml)
+    llm_context_compaction_enabled: bool = Field(
+        default=True,
+        description="Collapse older tool observations when a conversation outgrows its context budget"
+    )
+    llm_context_compaction_threshold: float = Field(
+        default=0.8,
+        gt=0,
+        le=1,
+        description="Fraction of the model's context window a conversation may use before it is compacted"
+    )
+    llm_context_keep_recent_messages: int = Field(
+        default=4,
+        ge=0,
+        description="Latest conversation messages that are never compacted (besides the system prompt and alert)"
+    )
+    
+    # Token Budgets
+    session_token_budget: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Default LLM token budget per session, for chains without token_budget (None = unlimited)"
+    )
+    token_budget_conclusion_threshold: float = Field(
+        default=0.9,
+        gt=0,
+        le=1,
+        description="Fraction of a session/agent token budget after which the agent is forced to conclude"
+    )
+    
     # LLM Streaming Configuration
     enable_llm_streaming: bool = Field(
         default=True,
         description="Enable real-time streaming of LLM thoughts via WebSocket (PostgreSQL only)"
     )
+    llm_streaming_snapshot_interval: int = Field(
+        default=50,
+        description="Publish a full snapshot every N streaming events (deltas in between) for late-joining clients"
+    )
+    
+    # LLM Rate Limiting Configuration (limits are set per provider in llm_providers.yaml)
+    llm_rate_limit_shared: bool = Field(
+        default=True,
+        description="Share provider rate limits across pods through the llm_rate_budgets table (otherwise each pod limits on its own)"
+    )
+
+    # LLM Hedging / Failover Configuration
+    llm_fallback_provider: Optional[str] = Field(
+        default=None,
+        description="Secondary LLM provider for hedged requests and failover (disabled when unset)"
+    )
+    llm_hedging_enabled: bool = Field(
+        default=True,
+        description="Send a request to the fallback provider as well when the first token is late"
+    )
+    llm_hedge_latency_percentile: float = Field(
+        default=95.0,
+        gt=0,
+        le=100,
+        description="Percentile of the provider's recent time-to-first-token used as hedge deadline"
+    )
+    llm_hedge_min_delay_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Lower bound of the hedge deadline in seconds"
+    )
+    llm_hedge_max_delay_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Upper bound of the hedge deadline in seconds (also used until enough latencies are known)"
+    )
+    llm_failover_error_rate: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        description="Error rate over the provider's recent requests that switches to the fallback provider"
+    )
+    llm_failover_cooldown_seconds: int = Field(
+        default=300,
+        gt=0,
+        description="How long requests go to the fallback provider before the primary is tried again"
+    )
     
     # Database Configuration
     database_url: str = Field(
@@ -135,6 +213,28 @@ class Settings(BaseSettings):
         default=12,
         description="How often to run history retention cleanup (hours)"
     )
+    alert_data_facets_str: str = Field(
+        default="cluster,namespace,severity",
+        alias="alert_data_facets",
+        description="Comma-separated alert_data keys offered as session list facet filters. "
+                    "cluster, namespace and severity are backed by dedicated indexes."
+    )
+    
+    @property
+    def alert_data_facets(self) -> List[str]:
+        """Get alert_data facet keys as a list."""
+        return [key.strip() for key in self.alert_data_facets_str.split(',') if key.strip()]
+    
+    @field_validator('alert_data_facets_str', mode='after')
+    @classmethod
+    def validate_alert_data_facets(cls, v: str) -> str:
+        """Ensure facet keys are plain identifiers (they are embedded in index expressions)."""
+        for key in (k.strip() for k in v.split(',')):
+            if key and not ALERT_DATA_FACET_KEY_PATTERN.fullmatch(key):
+                raise ValueError(
+                    f"alert_data_facets keys may only contain letters, digits and underscores, got: {key}"
+                )
+        return v
     orphaned_session_timeout_minutes: int = Field(
         default=30,
         description="Mark sessions as orphaned if no activity for N minutes"
@@ -153,15 +253,50 @@ class Settings(BaseSettings):
         default=6,
         description="How often to run event cleanup (hours)"
     )
+    event_publish_batch_window_ms: int = Field(
+        default=0,
+        description="Coalesce events published within this many milliseconds into one transaction (0 disables)"
+    )
+    event_notify_shard_count: int = Field(
+        default=0,
+        description=(
+            "NOTIFY on this many fixed shard channels and route by logical channel in-process "
+            "(0 = one LISTEN per channel). Must be identical on all pods"
+        )
+    )
+    event_local_delivery: bool = Field(
+        default=True,
+        description="Deliver events published by this pod to its own subscribers in-process, skipping the NOTIFY/poll round trip"
+    )
+    
+    # WebSocket Delivery Configuration
+    websocket_send_queue_high_water: int = Field(
+        default=100,
+        description="Queued messages per WebSocket connection above which new streaming chunks are dropped"
+    )
+    websocket_send_queue_max_size: int = Field(
+        default=1000,
+        description="Queued messages per WebSocket connection at which a slow consumer is disconnected"
+    )
     
     # PostgreSQL Connection Pool Configuration
+    # Each purpose gets its own pool; a purpose's budget is its pool size plus max overflow.
+    # Event listening always uses one dedicated connection.
     postgres_pool_size: int = Field(
         default=5,
-        description="PostgreSQL connection pool size"
+        description="PostgreSQL connection pool size for alert-processing writes"
+    )
+    postgres_dashboard_pool_size: int = Field(
+        default=3,
+        description="PostgreSQL connection pool size for dashboard and other read-only history queries"
+    )
+    postgres_event_pool_size: int = Field(
+        default=5,
+        description="PostgreSQL connection pool size for event publishing and cleanup"
     )
     postgres_max_overflow: int = Field(
         default=10,
-        description="PostgreSQL connection pool max overflow"
+        description="PostgreSQL connection pool max overflow (applies to each pool)"
     )
     postgres_pool_timeout: int = Field(
         default=30,
@@ -176,6 +311,18 @@ class Settings(BaseSettings):
         description="Enable PostgreSQL connection pool pre-ping to validate connections"
     )
     
+    # SQLite Write Configuration
+    sqlite_single_writer: bool = Field(
+        default=False,
+        description="Route all history writes through one dedicated writer connection that batches "
+                    "queued operations into transactions, while reads use the regular connection pool. "
+                    "Only applies to file-based SQLite databases."
+    )
+    sqlite_writer_max_batch_size: int = Field(
+        default=50,
+        description="Maximum number of queued write operations committed in a single SQLite transaction"
+    )
+    
     # Alert Queue Configuration
     max_concurrent_alerts: int = Field(
         default=5,
@@ -202,6 +349,36 @@ class Settings(BaseSettings):
             )
         return v
     
+    @field_validator('sqlite_writer_max_batch_size', mode='after')
+    @classmethod
+    def validate_sqlite_writer_max_batch_size(cls, v: int) -> int:
+        """Ensure sqlite_writer_max_batch_size is a positive integer."""
+        if not isinstance(v, int) or v <= 0:
+            raise ValueError(
+                f"sqlite_writer_max_batch_size must be an integer greater than 0, got: {v}"
+            )
+        return v
+    
+    @field_validator('event_publish_batch_window_ms', 'event_notify_shard_count', mode='after')
+    @classmethod
+    def validate_event_publishing_options(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure event publishing options are non-negative integers (0 disables)."""
+        if not isinstance(v, int) or v < 0:
+            raise ValueError(
+                f"{info.field_name} must be an integer >= 0, got: {v}"
+            )
+        return v
+    
+    @field_validator('llm_streaming_snapshot_interval', 'websocket_send_queue_high_water', 'websocket_send_queue_max_size', mode='after')
+    @classmethod
+    def validate_delivery_limits(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure streaming and WebSocket send queue limits are positive integers."""
+        if not isinstance(v, int) or v <= 0:
+            raise ValueError(
+                f"{info.field_name} must be an integer greater than 0, got: {v}"
+            )
+        return v
+    
     @field_validator('max_queue_size', mode='after')
     @classmethod
     def validate_max_queue_size(cls, v: Optional[int]) -> Optional[int]:
@@ -10,10 +10,11 @@ performance and consistency with the rest of the system.
 
 import asyncio
 import logging
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Query
 
+from tarsy.config.settings import get_settings
 from tarsy.models.api_models import CancelAgentResponse, ErrorResponse
 from tarsy.models.history_models import (
     DetailedSession,
@@ -36,6 +37,32 @@ VALID_EVENT_TYPES = {'llm', 'mcp', 'system'}
 
 router = APIRouter(prefix="/api/v1/history", tags=["history"])
 
+
+def parse_facet_filters(facets: List[str], allowed_keys: List[str]) -> Dict[str, List[str]]:
+    """
+    Parse 'key:value' facet query parameters into alert_data filters.
+    
+    Raises:
+        HTTPException: 400 if a facet is malformed or its key is not configured
+    """
+    alert_data_filters: Dict[str, List[str]] = {}
+    for item in facets:
+        key, separator, value = item.partition(':')
+        key, value = key.strip(), value.strip()
+        if not separator or not key or not value:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid facet filter '{item}', expected 'key:value'"
+            )
+        if key not in allowed_keys:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported facet '{key}'. Supported facets: {', '.join(allowed_keys)}"
+            )
+        alert_data_filters.setdefault(key, []).append(value)
+    return alert_data_filters
+
+
 @router.get(
     "/sessions", 
     response_model=PaginatedSessions,
@@ -58,6 +85,12 @@ router = APIRouter(prefix="/api/v1/history", tags=["history"])
     4. Search error messages: `search=connection refused&status=failed`
     5. Search analysis content: `search=namespace terminating`
     6. Time range analysis: `start_date_us=1734476400000000&end_date_us=1734562799999999`
+    7. Alert data facets: `facet=cluster:prod-east&facet=severity:critical&facet=severity:warning`
+    
+    **Facet Filters:**
+    - `facet=key:value` filters on a field of the original alert data
+    - Repeating a key matches any of its values; different keys must all match
+    - Keys must be listed in the ALERT_DATA_FACETS setting (see `/filter-options`)
     
     **Timestamp Format:**
     - All timestamps are Unix timestamps in microseconds since epoch (UTC)
@@ -71,6 +104,7 @@ async def list_sessions(
     search: Optional[str] = Query(None, description="Text search across alert messages, error messages, and analysis results", min_length=3),
     start_date_us: Optional[int] = Query(None, description="Filter sessions started after this timestamp (microseconds since epoch UTC)"),
     end_date_us: Optional[int] = Query(None, description="Filter sessions started before this timestamp (microseconds since epoch UTC)"),
+    facet: Optional[List[str]] = Query(None, description="Filter by alert data field as 'key:value' - supports multiple values"),
     page: int = Query(1, ge=1, description="Page number for pagination"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page (1-100)"),
     sort_by: Optional[str] = Query(None, description="Field to sort by. Supported: 'started_at_us', 'status', 'alert_type', 'agent_type', 'author', 'duration_ms'. Unsupported values fall back to default ordering."),
@@ -87,6 +121,7 @@ async def list_sessions(
         search: Optional text search across alert messages, errors, and analysis (minimum 3 characters)
         start_date_us: Optional start timestamp filter (microseconds since epoch UTC, inclusive)
         end_date_us: Optional end timestamp filter (microseconds since epoch UTC, inclusive)
+        facet: Optional alert data facet filter(s) as 'key:value' (e.g., ['cluster:prod-east'])
         page: Page number (starting from 1)
         page_size: Number of items per page (1-100)
         sort_by: Field to sort by. Supported: 'started_at_us', 'status', 'alert_type', 
@@ -116,6 +151,8 @@ async def list_sessions(
             filters['start_date_us'] = start_date_us
         if end_date_us is not None:
             filters['end_date_us'] = end_date_us
+        if facet:
+            filters['alert_data'] = parse_facet_filters(facet, get_settings().alert_data_facets)
             
         # Validate timestamp range
         if start_date_us and end_date_us and start_date_us >= end_date_us:
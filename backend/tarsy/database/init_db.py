@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import Pool, StaticPool
 from sqlmodel import Session, SQLModel, create_engine, text
 
 from tarsy.config.settings import Settings, get_settings
@@ -56,13 +56,41 @@ def detect_database_type(database_url: str) -> str:
         raise ValueError(f"Unsupported database scheme: {scheme}")
 
 
-def create_database_engine(database_url: str, settings: Optional[Settings] = None) -> Engine:
+def _pool_overrides(
+    pool_size: Optional[int],
+    max_overflow: Optional[int],
+    poolclass: Optional[type[Pool]],
+) -> dict:
+    """Build engine keyword arguments for explicitly requested pool settings."""
+    overrides: dict = {}
+    if poolclass is not None:
+        overrides["poolclass"] = poolclass
+    if pool_size is not None:
+        overrides["pool_size"] = pool_size
+    if max_overflow is not None:
+        overrides["max_overflow"] = max_overflow
+    return overrides
+
+
+def create_database_engine(
+    database_url: str,
+    settings: Optional[Settings] = None,
+    *,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    poolclass: Optional[type[Pool]] = None,
+    application_name: str = "tarsy",
+) -> Engine:
     """
     Create database engine with type-specific optimizations.
     
     Args:
         database_url: Database connection string
         settings: Settings instance (will get default if None)
+        pool_size: Pool size override (PostgreSQL defaults to postgres_pool_size)
+        max_overflow: Pool overflow override (PostgreSQL defaults to postgres_max_overflow)
+        poolclass: Pool class override (ignored for in-memory SQLite)
+        application_name: PostgreSQL application_name reported in pg_stat_activity
         
     Returns:
         SQLAlchemy engine configured for the database type
@@ -77,14 +105,15 @@ def create_database_engine(database_url: str, settings: Optional[Settings] = Non
         return create_engine(
             database_url,
             echo=False,
-            pool_size=settings.postgres_pool_size,
-            max_overflow=settings.postgres_max_overflow,
+            **_pool_overrides(None, None, poolclass),
+            pool_size=pool_size if pool_size is not None else settings.postgres_pool_size,
+            max_overflow=max_overflow if max_overflow is not None else settings.postgres_max_overflow,
             pool_timeout=settings.postgres_pool_timeout,
             pool_recycle=settings.postgres_pool_recycle,
             pool_pre_ping=settings.postgres_pool_pre_ping,
             # PostgreSQL-specific connection parameters
             connect_args={
-                "application_name": "tarsy",
+                "application_name": application_name,
                 "options": "-c timezone=UTC"
             }
         )
@@ -104,6 +133,7 @@ def create_database_engine(database_url: str, settings: Optional[Settings] = Non
             engine = create_engine(
                 database_url,
                 echo=False,
+                **_pool_overrides(pool_size, max_overflow, poolclass),
                 connect_args=connect_args
             )
             
@@ -220,8 +250,13 @@ def test_database_connection(database_url: Optional[str] = None) -> bool:
             settings = get_settings()
             database_url = settings.database_url
         
-        # Create engine with optimizations and test connection
-        engine = create_database_engine(database_url)
+        # Reuse the dashboard read pool when available instead of a throwaway engine
+        from tarsy.database.pool_manager import PoolPurpose, get_pool_manager
+        pool_manager = get_pool_manager(database_url)
+        if pool_manager is not None:
+            engine = pool_manager.get_engine(PoolPurpose.DASHBOARD_READS)
+        else:
+            engine = create_database_engine(database_url)
         
         with Session(engine) as session:
             # Simple connectivity test
@@ -272,15 +307,28 @@ def get_database_info() -> dict:
 # Async database engine and session factory (for event system)
 _async_engine: Optional[AsyncEngine] = None
 _async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+_async_engine_owned: bool = False
 
 
-def create_async_database_engine(database_url: str, settings: Optional[Settings] = None) -> AsyncEngine:
+def create_async_database_engine(
+    database_url: str,
+    settings: Optional[Settings] = None,
+    *,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    poolclass: Optional[type[Pool]] = None,
+    application_name: str = "tarsy-events",
+) -> AsyncEngine:
     """
     Create async database engine for event system.
     
     Args:
         database_url: Database connection string
         settings: Settings instance (will get default if None)
+        pool_size: Pool size override (PostgreSQL defaults to postgres_pool_size)
+        max_overflow: Pool overflow override (PostgreSQL defaults to postgres_max_overflow)
+        poolclass: Pool class override (ignored for in-memory SQLite)
+        application_name: PostgreSQL application_name reported in pg_stat_activity
         
     Returns:
         SQLAlchemy async engine configured for the database type
@@ -299,13 +347,14 @@ def create_async_database_engine(database_url: str, settings: Optional[Settings]
         return create_async_engine(
             database_url,
             echo=False,
-            pool_size=settings.postgres_pool_size,
-            max_overflow=settings.postgres_max_overflow,
+            **_pool_overrides(None, None, poolclass),
+            pool_size=pool_size if pool_size is not None else settings.postgres_pool_size,
+            max_overflow=max_overflow if max_overflow is not None else settings.postgres_max_overflow,
             pool_timeout=settings.postgres_pool_timeout,
             pool_recycle=settings.postgres_pool_recycle,
             pool_pre_ping=settings.postgres_pool_pre_ping,
             connect_args={
-                "server_settings": {"application_name": "tarsy-events"}
+                "server_settings": {"application_name": application_name}
             }
         )
     else:  # SQLite
@@ -331,6 +380,7 @@ def create_async_database_engine(database_url: str, settings: Optional[Settings]
             engine = create_async_engine(
                 database_url,
                 echo=False,
+                **_pool_overrides(pool_size, max_overflow, poolclass),
                 connect_args=connect_args
             )
             
@@ -357,13 +407,21 @@ def initialize_async_database(database_url: Optional[str] = None) -> None:
     Args:
         database_url: Optional database URL, uses settings if not provided
     """
-    global _async_engine, _async_session_factory
+    global _async_engine, _async_session_factory, _async_engine_owned
     
     if database_url is None:
         settings = get_settings()
         database_url = settings.database_url
     
-    _async_engine = create_async_database_engine(database_url)
+    # Use the event publishing pool when the pool manager serves this database
+    from tarsy.database.pool_manager import PoolPurpose, get_pool_manager
+    pool_manager = get_pool_manager(database_url)
+    if pool_manager is not None:
+        _async_engine = pool_manager.get_async_engine(PoolPurpose.EVENT_PUBLISHING)
+        _async_engine_owned = False
+    else:
+        _async_engine = create_async_database_engine(database_url)
+        _async_engine_owned = True
     _async_session_factory = async_sessionmaker(
         _async_engine,
         class_=AsyncSession,
@@ -390,11 +448,13 @@ def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
 
 async def dispose_async_database() -> None:
     """Dispose async database engine and cleanup resources."""
-    global _async_engine, _async_session_factory
+    global _async_engine, _async_session_factory, _async_engine_owned
     
-    if _async_engine:
+    # Engines from the pool manager are disposed with the manager
+    if _async_engine and _async_engine_owned:
         await _async_engine.dispose()
         logger.info("Async database engine disposed")
     
     _async_engine = None
+    _async_engine_owned = False
     _async_session_factory = None 
\ No newline at end of file
@@ -0,0 +1,340 @@
+"""
+Connection Pool Manager - one owner for every database connection pool in the process.
+
+Alert processing, the dashboard API and the event system used to create their own
+engines, each with a full-size pool, so the real number of connections a pod could
+open was the sum of several independently configured pools. The pool manager owns
+one engine per purpose, each with an explicit budget, and records checkout and
+wait-time metrics so pool sizes can be set from observed concurrency.
+
+Logic:
+- Purposes: alert-processing writes, dashboard reads, event publishing and event
+  listening; engines are created lazily on first use
+- PostgreSQL budgets: postgres_pool_size (alert writes), postgres_dashboard_pool_size,
+  postgres_event_pool_size, each plus postgres_max_overflow; listening always uses
+  exactly one dedicated connection
+- SQLite keeps the default pool sizes, except the polling listener (one connection);
+  in-memory databases share one engine per sync/async flavor, since every new
+  engine would otherwise open a separate empty database
+- Wait time is measured around pool checkout, so it reflects time spent queueing
+  for a connection (including connection establishment), not query time
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from tarsy.config.settings import Settings, get_settings
+from tarsy.database.init_db import (
+    create_async_database_engine,
+    create_database_engine,
+    detect_database_type,
+)
+
+if TYPE_CHECKING:
+    import asyncpg
+
+logger = logging.getLogger(__name__)
+
+
+class PoolPurpose(str, Enum):
+    """What a connection pool is used for."""
+
+    ALERT_WRITES = "alert_writes"
+    DASHBOARD_READS = "dashboard_reads"
+    EVENT_PUBLISHING = "event_publishing"
+    EVENT_LISTENING = "event_listening"
+
+
+SYNC_PURPOSES = frozenset({PoolPurpose.ALERT_WRITES, PoolPurpose.DASHBOARD_READS})
+ASYNC_PURPOSES = frozenset({PoolPurpose.EVENT_PUBLISHING, PoolPurpose.EVENT_LISTENING})
+
+
+@dataclass
+class PoolMetrics:
+    """Checkout and wait-time counters for one pool."""
+
+    purpose: PoolPurpose
+    budget: Optional[int] = None  # Max connections (pool size + overflow), None if unbounded
+    checkouts: int = 0
+    checkins: int = 0
+    timeouts: int = 0
+    waits: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    peak_in_use: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def in_use(self) -> int:
+        """Connections currently checked out."""
+        return self.checkouts - self.checkins
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.peak_in_use = max(self.peak_in_use, self.checkouts - self.checkins)
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a JSON-serializable view of the counters."""
+        with self._lock:
+            avg_wait = self.total_wait_seconds / self.waits if self.waits else 0.0
+            return {
+                "budget": self.budget,
+                "in_use": self.checkouts - self.checkins,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+def _timed_pool_class(base: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """
+    Create a pool class that records how long each checkout waited.
+
+    A class (rather than an instance attribute) is used because engine.dispose()
+    recreates the pool from its class.
+    """
+
+    class TimedPool(base):  # type: ignore[valid-type, misc]
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                metrics.record_timeout()
+                raise
+            finally:
+                metrics.record_wait(time.perf_counter() - start)
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    TimedPool.__qualname__ = TimedPool.__name__
+    return TimedPool
+
+
+def _track_checkouts(engine: Engine, metrics: PoolMetrics) -> None:
+    """Count checkouts and checkins through pool events."""
+    try:
+        event.listen(engine, "checkout", lambda *_: metrics.record_checkout())
+        event.listen(engine, "checkin", lambda *_: metrics.record_checkin())
+    except Exception:
+        # Skip if engine is mocked in tests
+        pass
+
+
+class ConnectionPoolManager:
+    """Owns per-purpose database engines and their pool metrics."""
+
+    def __init__(self, database_url: str, settings: Optional[Settings] = None) -> None:
+        self.database_url = database_url
+        self.settings: Settings = settings or get_settings()
+        self.db_type = detect_database_type(database_url)
+        self.is_in_memory = ':memory:' in database_url
+        self._engines: Dict[PoolPurpose, Engine] = {}
+        self._async_engines: Dict[PoolPurpose, AsyncEngine] = {}
+        self._metrics: Dict[PoolPurpose, PoolMetrics] = {
+            purpose: PoolMetrics(purpose=purpose, budget=self._budget(purpose))
+            for purpose in PoolPurpose
+        }
+        self._lock = threading.Lock()
+
+    def _pool_size(self, purpose: PoolPurpose) -> Optional[int]:
+        """Pool size for a purpose, or None to keep the driver default (SQLite)."""
+        if purpose == PoolPurpose.EVENT_LISTENING:
+            return 1
+        if self.db_type != 'postgresql':
+            return None
+        if purpose == PoolPurpose.ALERT_WRITES:
+            return self.settings.postgres_pool_size
+        if purpose == PoolPurpose.DASHBOARD_READS:
+            return self.settings.postgres_dashboard_pool_size
+        return self.settings.postgres_event_pool_size
+
+    def _max_overflow(self, purpose: PoolPurpose) -> Optional[int]:
+        if purpose == PoolPurpose.EVENT_LISTENING:
+            return 0
+        if self.db_type != 'postgresql':
+            return None
+        return self.settings.postgres_max_overflow
+
+    def _budget(self, purpose: PoolPurpose) -> Optional[int]:
+        pool_size = self._pool_size(purpose)
+        if pool_size is None:
+            return None
+        return pool_size + (self._max_overflow(purpose) or 0)
+
+    def _shared_purpose(self, purpose: PoolPurpose) -> PoolPurpose:
+        """In-memory SQLite: all purposes of a flavor share one engine (one database)."""
+        if not self.is_in_memory:
+            return purpose
+        return PoolPurpose.ALERT_WRITES if purpose in SYNC_PURPOSES else PoolPurpose.EVENT_PUBLISHING
+
+    def get_engine(self, purpose: PoolPurpose) -> Engine:
+        """
+        Get the sync engine for a purpose, creating it on first use.
+
+        Raises:
+            ValueError: If the purpose is served by an async engine
+        """
+        if purpose not in SYNC_PURPOSES:
+            raise ValueError(f"Pool purpose '{purpose.value}' uses an async engine")
+        purpose = self._shared_purpose(purpose)
+        with self._lock:
+            engine = self._engines.get(purpose)
+            if engine is None:
+                metrics = self._metrics[purpose]
+                engine = create_database_engine(
+                    self.database_url,
+                    self.settings,
+                    pool_size=self._pool_size(purpose),
+                    max_overflow=self._max_overflow(purpose),
+                    poolclass=None if self.is_in_memory else _timed_pool_class(QueuePool, metrics),
+                    application_name=f"tarsy-{purpose.value.replace('_', '-')}",
+                )
+                _track_checkouts(engine, metrics)
+                self._engines[purpose] = engine
+                logger.info(
+                    f"Created '{purpose.value}' database pool (budget: {metrics.budget or 'default'})"
+                )
+            return engine
+
+    def get_async_engine(self, purpose: PoolPurpose) -> AsyncEngine:
+        """
+        Get the async engine for a purpose, creating it on first use.
+
+        Raises:
+            ValueError: If the purpose is served by a sync engine
+        """
+        if purpose not in ASYNC_PURPOSES:
+            raise ValueError(f"Pool purpose '{purpose.value}' uses a sync engine")
+        purpose = self._shared_purpose(purpose)
+        with self._lock:
+            engine = self._async_engines.get(purpose)
+            if engine is None:
+                metrics = self._metrics[purpose]
+                engine = create_async_database_engine(
+                    self.database_url,
+                    self.settings,
+                    pool_size=self._pool_size(purpose),
+                    max_overflow=self._max_overflow(purpose),
+                    poolclass=None if self.is_in_memory else _timed_pool_class(AsyncAdaptedQueuePool, metrics),
+                    application_name=f"tarsy-{purpose.value.replace('_', '-')}",
+                )
+                _track_checkouts(engine.sync_engine, metrics)
+                self._async_engines[purpose] = engine
+                logger.info(
+                    f"Created '{purpose.value}' async database pool (budget: {metrics.budget or 'default'})"
+                )
+            return engine
+
+    async def connect_listener(self, timeout: float = 10.0) -> "asyncpg.Connection":
+        """
+        Open the dedicated PostgreSQL LISTEN connection.
+
+        LISTEN registrations are bound to a session, so the listener cannot borrow a
+        pooled connection; it still counts against the event listening budget.
+        """
+        import asyncpg
+
+        metrics = self._metrics[PoolPurpose.EVENT_LISTENING]
+        start = time.perf_counter()
+        try:
+            connection = await asyncio.wait_for(asyncpg.connect(self.database_url), timeout=timeout)
+        except asyncio.TimeoutError:
+            metrics.record_timeout()
+            raise
+        finally:
+            metrics.record_wait(time.perf_counter() - start)
+        metrics.record_checkout()
+        return connection
+
+    async def release_listener(self, connection: "asyncpg.Connection") -> None:
+        """Close the dedicated LISTEN connection."""
+        try:
+            await connection.close()
+        finally:
+            self._metrics[PoolPurpose.EVENT_LISTENING].record_checkin()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get pool metrics keyed by purpose."""
+        return {purpose.value: metrics.snapshot() for purpose, metrics in self._metrics.items()}
+
+    async def dispose(self) -> None:
+        """Dispose every engine owned by the manager."""
+        with self._lock:
+            engines = list(self._engines.values())
+            async_engines = list(self._async_engines.values())
+            self._engines.clear()
+            self._async_engines.clear()
+        for engine in engines:
+            engine.dispose()
+        for async_engine in async_engines:
+            await async_engine.dispose()
+        logger.info("Database connection pools disposed")
+
+
+_pool_manager: Optional[ConnectionPoolManager] = None
+
+
+def initialize_pool_manager(database_url: str, settings: Optional[Settings] = None) -> ConnectionPoolManager:
+    """
+    Initialize the process-wide connection pool manager.
+
+    Args:
+        database_url: Database connection string
+        settings: Settings instance (will get default if None)
+    """
+    global _pool_manager
+    _pool_manager = ConnectionPoolManager(database_url, settings)
+    logger.info(f"Connection pool manager initialized for: {database_url.split('/')[-1]}")
+    return _pool_manager
+
+
+def get_pool_manager(database_url: Optional[str] = None) -> Optional[ConnectionPoolManager]:
+    """
+    Get the process-wide connection pool manager.
+
+    Args:
+        database_url: If given, only return the manager when it serves this database
+
+    Returns:
+        The pool manager, or None if not initialized (callers then create their own engine)
+    """
+    if _pool_manager is None:
+        return None
+    if database_url is not None and _pool_manager.database_url != database_url:
+        return None
+    return _pool_manager
+
+
+async def dispose_pool_manager() -> None:
+    """Dispose all pooled connections and reset the process-wide manager."""
+    global _pool_manager
+    if _pool_manager is not None:
+        await _pool_manager.dispose()
+    _pool_manager = None
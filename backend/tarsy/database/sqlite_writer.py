@@ -0,0 +1,230 @@
+"""
+SQLite single-writer queue.
+
+SQLite allows only one writer at a time. When history writes run on many worker
+threads (``asyncio.to_thread``), they contend for the write lock and surface as
+``database is locked`` retries. In single-writer mode every write operation is
+queued to one dedicated writer thread that owns the only write connection.
+
+Logic:
+- Callers submit write operations and get a future back; reads never go through
+  the queue and keep using the regular connection pool (WAL readers don't block)
+- The writer drains whatever is queued (up to ``max_batch_size``) and runs the
+  batch inside a single ``BEGIN IMMEDIATE`` transaction
+- Each operation runs in its own SAVEPOINT, so a failing operation is rolled back
+  without affecting the rest of the batch
+- Futures are resolved only after the batch is committed; if the commit fails,
+  every operation in the batch receives the error and can be retried
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, TypeVar
+
+from sqlalchemy import Connection, Engine, event
+from sqlmodel import Session, create_engine
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _WriteOperation:
+    """A queued write operation and the future its caller waits on."""
+    func: Callable[[], Any]
+    future: Future = field(default_factory=Future)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+def create_sqlite_writer_engine(database_url: str) -> Engine:
+    """
+    Create the engine backing the dedicated writer connection.
+
+    pysqlite's own transaction handling does not support SAVEPOINT correctly, so
+    the driver is put in autocommit mode and SQLAlchemy emits ``BEGIN IMMEDIATE``
+    itself. IMMEDIATE takes the write lock at the start of a batch instead of
+    upgrading a read lock mid-transaction.
+    """
+    engine = create_engine(
+        database_url,
+        echo=False,
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+class SQLiteWriteQueue:
+    """Serializes SQLite write operations onto one writer thread and connection."""
+
+    def __init__(self, engine: Engine, max_batch_size: int = 50) -> None:
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Optional[_WriteOperation]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._connection: Optional[Connection] = None
+        self._in_batch: bool = False
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the writer thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Open the writer connection and start the writer thread."""
+        if self.is_running:
+            return
+        self._connection = self.engine.connect()
+        self._thread = threading.Thread(
+            target=self._run, name="sqlite-writer", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"SQLite single-writer started (max batch size: {self.max_batch_size})")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Drain queued operations, stop the writer thread and close the connection."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("SQLite writer thread did not stop within timeout")
+            self._thread = None
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception as e:
+                logger.error(f"Error closing SQLite writer connection: {str(e)}")
+            self._connection = None
+        self.engine.dispose()
+        logger.info("SQLite single-writer stopped")
+
+    def is_writer_thread(self) -> bool:
+        """Check whether the caller is running on the writer thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, func: Callable[[], T]) -> "Future[T]":
+        """
+        Queue a write operation.
+
+        Operations submitted from the writer thread itself (a write operation that
+        triggers another write) run inline in the current batch, since waiting on
+        the queue from there would deadlock.
+
+        Returns:
+            Future resolved with the operation's result once its batch is committed
+        """
+        operation = _WriteOperation(func=func)
+        if self.is_writer_thread():
+            try:
+                operation.future.set_result(func())
+            except BaseException as e:
+                operation.future.set_exception(e)
+            return operation.future
+        if not self.is_running:
+            operation.future.set_exception(RuntimeError("SQLite writer is not running"))
+            return operation.future
+        self._queue.put(operation)
+        return operation.future
+
+    def get_session(self) -> Optional[Session]:
+        """
+        Get a session joined to the current batch transaction.
+
+        Returns:
+            A session whose commit/rollback only affects its own SAVEPOINT, or None
+            when not called from inside a batch on the writer thread
+        """
+        if not self._in_batch or not self.is_writer_thread():
+            return None
+        return Session(
+            bind=self._connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+
+    def _next_batch(self) -> Optional[List[_WriteOperation]]:
+        """Block for the next operation, then drain what's queued without waiting."""
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        while len(batch) < self.max_batch_size:
+            try:
+                operation = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if operation is None:
+                # Put the stop marker back so the loop exits after this batch
+                self._queue.put(None)
+                break
+            batch.append(operation)
+        return batch
+
+    def _run(self) -> None:
+        """Writer thread loop."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._execute_batch(batch)
+
+    def _execute_batch(self, batch: List[_WriteOperation]) -> None:
+        """Run a batch of operations in one transaction and resolve their futures."""
+        try:
+            transaction = self._connection.begin()
+        except Exception as e:
+            logger.warning(f"SQLite writer failed to begin transaction: {str(e)}")
+            for operation in batch:
+                operation.future.set_exception(e)
+            return
+
+        self._in_batch = True
+        try:
+            for operation in batch:
+                try:
+                    operation.result = operation.func()
+                except BaseException as e:
+                    operation.error = e
+        finally:
+            self._in_batch = False
+
+        try:
+            transaction.commit()
+        except Exception as e:
+            logger.warning(f"SQLite writer failed to commit batch of {len(batch)}: {str(e)}")
+            try:
+                transaction.rollback()
+            except Exception:
+                pass
+            for operation in batch:
+                operation.future.set_exception(e)
+            return
+
+        if len(batch) > 1:
+            logger.debug(f"SQLite writer committed batch of {len(batch)} operations")
+        for operation in batch:
+            if operation.error is not None:
+                operation.future.set_exception(operation.error)
+            else:
+                operation.future.set_result(operation.result)
@@ -27,6 +27,8 @@ class LLMHistoryHook(BaseHook[LLMInteraction]):
     Receives unified LLMInteraction and stores it using HistoryService.
     """
     
+    persists_data = True
+    
     def __init__(self, history_service: HistoryService):
         super().__init__("llm_history")
         self.history_service = history_service
@@ -70,6 +72,8 @@ class MCPHistoryHook(BaseHook[MCPInteraction]):
     Receives unified MCPInteraction and stores it using HistoryService.
     """
     
+    persists_data = True
+    
     def __init__(self, history_service: HistoryService):
         super().__init__("mcp_history")
         self.history_service = history_service
@@ -121,6 +125,8 @@ class MCPListHistoryHook(BaseHook[MCPInteraction]):
     Receives unified MCPInteraction and stores it using HistoryService.
     """
     
+    persists_data = True
+    
     def __init__(self, history_service: HistoryService):
         super().__init__("mcp_list_history")
         self.history_service = history_service
@@ -157,6 +163,8 @@ class StageExecutionHistoryHook(BaseHook[StageExecution]):
     Receives StageExecution and creates/updates it using HistoryService.
     """
     
+    persists_data = True
+    
     def __init__(self, history_service: HistoryService):
         super().__init__("stage_history")
         self.history_service = history_service
@@ -77,6 +77,10 @@ class BaseHook(ABC, Generic[TInteraction]):
     Provides type-safe hook execution with proper error handling.
     """
     
+    # True for hooks that write the data to the database (history hooks).
+    # Skipped when the caller has already persisted the data itself.
+    persists_data: bool = False
+    
     def __init__(self, name: str):
         self.name = name
         self.is_enabled = True
@@ -168,15 +172,27 @@ class HookManager:
         """Trigger all MCP list hooks with typed data."""
         return await self._trigger_hooks(self.mcp_list_hooks, interaction, "MCP_LIST")
 
-    async def trigger_stage_hooks(self, stage_execution: StageExecution) -> Dict[str, bool]:
+    async def trigger_stage_hooks(
+        self,
+        stage_execution: StageExecution,
+        already_persisted: bool = False,
+    ) -> Dict[str, bool]:
         """
         Trigger all stage execution hooks with typed data.
         
         Unlike other hooks, stage execution hooks use stricter error handling because
         stage creation/updates are critical operations that must succeed.
+        
+        Args:
+            stage_execution: Stage execution data
+            already_persisted: If True, the stage was already written to the database
+                              (e.g. by a guarded transition) and persistence hooks are skipped
         """
+        hooks = self.stage_hooks
+        if already_persisted:
+            hooks = {name: hook for name, hook in hooks.items() if not hook.persists_data}
         return await self._trigger_hooks(
-            self.stage_hooks, 
+            hooks, 
             stage_execution, 
             "STAGE_EXECUTION",
             allow_exceptions=True  # Let exceptions propagate for critical stage operations
@@ -579,6 +595,7 @@ class StageExecutionHookContext:
         stage_execution: StageExecution,
         hook_manager: HookManager,
         allow_exceptions: bool = True,
+        already_persisted: bool = False,
     ):
         """
         Initialize stage execution hook context.
@@ -588,10 +605,12 @@ class StageExecutionHookContext:
             hook_manager: Manager for hooks
             allow_exceptions: If True, let hook exceptions propagate instead of suppressing.
                             Stage execution hooks are critical operations, so defaults to True.
+            already_persisted: If True, skip persistence hooks (stage already written)
         """
         self.stage_execution = stage_execution
         self.hook_manager = hook_manager
         self.allow_exceptions = allow_exceptions
+        self.already_persisted = already_persisted
 
     async def __aenter__(self) -> 'StageExecutionHookContext':
         """Enter async context."""
@@ -601,7 +620,9 @@ class StageExecutionHookContext:
         """Exit async context - trigger hooks."""
         # Always trigger stage hooks - stage execution state is managed by the service
         try:
-            await self.hook_manager.trigger_stage_hooks(self.stage_execution)
+            await self.hook_manager.trigger_stage_hooks(
+                self.stage_execution, already_persisted=self.already_persisted
+            )
         except Exception as e:
             logger.error(f"Failed to trigger stage execution hooks: {e}")
             if self.allow_exceptions:
@@ -614,6 +635,7 @@ class StageExecutionHookContext:
 async def stage_execution_context(
     stage_execution: StageExecution,
     allow_exceptions: bool = True,
+    already_persisted: bool = False,
 ) -> AsyncContextManager[StageExecutionHookContext]:
     """
     Create a simple context for stage execution events.
@@ -622,11 +644,16 @@ async def stage_execution_context(
         stage_execution: Stage execution data
         allow_exceptions: If True, let hook exceptions propagate.
                          Stage execution hooks are critical, so defaults to True.
+        already_persisted: If True, the stage was already written by a guarded
+                          transition and only notification hooks run.
         
     Yields:
         Simple hook context for stage execution
     """
     async with StageExecutionHookContext(
-        stage_execution, get_hook_manager(), allow_exceptions=allow_exceptions
+        stage_execution,
+        get_hook_manager(),
+        allow_exceptions=allow_exceptions,
+        already_persisted=already_persisted,
     ) as ctx:
         yield ctx
\ No newline at end of file
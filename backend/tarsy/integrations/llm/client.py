@@ -19,32 +19,44 @@ tool combination. The NEW SDK types (google.genai.types) are required.
 """
 
 import asyncio
+import importlib
 import pprint
+import threading
 import traceback
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
 
-import httpx
 import urllib3
 from google.genai import (
     types as google_genai_types,  # Google SDK types for tool definitions
 )
-from langchain_anthropic import ChatAnthropic
 from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_google_vertexai.model_garden import ChatAnthropicVertex
-from langchain_openai import ChatOpenAI
-from langchain_xai import ChatXAI
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+)
+from langchain_core.messages.ai import add_ai_message_chunks
 
 from tarsy.config.settings import Settings
 from tarsy.hooks.hook_context import llm_interaction_context
-
-# Apply url_context patch for Gemini models
-# This enables url_context tool support which is not yet natively supported in LangChain
 from tarsy.integrations.llm.gemini_url_context_patch import apply_url_context_patch
+from tarsy.integrations.llm.http_pool import get_llm_http_pool
 from tarsy.integrations.llm.native_tools import NativeToolsHelper
+from tarsy.integrations.llm.prompt_cache import (
+    apply_cache_breakpoints,
+    get_cached_input_tokens,
+    uses_cache_breakpoints,
+)
+from tarsy.integrations.llm.rate_limiter import (
+    estimate_request_tokens,
+    get_rate_limiter,
+    request_priority,
+)
+from tarsy.integrations.llm.stream_parser import ReActStreamParser, StreamUpdate
 from tarsy.integrations.llm.streaming import StreamingPublisher
+from tarsy.integrations.llm.token_budget import record_token_usage
 from tarsy.models.constants import LLMInteractionType, StreamingEventType
 from tarsy.models.llm_models import GoogleNativeTool, LLMProviderConfig, LLMProviderType
 from tarsy.models.mcp_selection_models import NativeToolsConfig
@@ -53,12 +65,11 @@ from tarsy.models.processing_context import ToolWithServer
 from tarsy.models.unified_interactions import LLMConversation, MessageRole
 from tarsy.utils.error_details import extract_error_details
 from tarsy.utils.logger import get_module_logger
+from tarsy.utils.token_counter import TokenCounter
 
 if TYPE_CHECKING:
     from tarsy.integrations.llm.gemini_client import GeminiNativeThinkingClient
 
-apply_url_context_patch()
-
 # Suppress SSL warnings when SSL verification is disabled
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -74,6 +85,49 @@ llm_comm_logger = get_module_logger("llm.communications")
 CODE_EXECUTION_PART_EXECUTABLE = 'executable_code'
 CODE_EXECUTION_PART_RESULT = 'code_execution_result'
 
+# Provider types whose models accept stop sequences by default
+# (OpenAI / xAI reasoning models such as gpt-5 and grok-4 reject them)
+STOP_SEQUENCE_PROVIDERS = frozenset({
+    LLMProviderType.GOOGLE,
+    LLMProviderType.ANTHROPIC,
+    LLMProviderType.VERTEXAI,
+})
+
+
+# LangChain provider classes by name -> module. Provider SDKs are large and most
+# pods only use one or two providers, so each is imported when the first client
+# of the provider is created (module attributes, so tests can patch them).
+_PROVIDER_CLASS_MODULES = {
+    "ChatOpenAI": "langchain_openai",
+    "ChatGoogleGenerativeAI": "langchain_google_genai",
+    "ChatXAI": "langchain_xai",
+    "ChatAnthropic": "langchain_anthropic",
+    "ChatAnthropicVertex": "langchain_google_vertexai.model_garden",
+}
+_provider_import_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """Import LangChain provider classes on first use."""
+    module_name = _PROVIDER_CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _provider_import_lock:
+        if name not in globals():
+            provider_class = getattr(importlib.import_module(module_name), name)
+            if name == "ChatGoogleGenerativeAI":
+                # Apply url_context patch for Gemini models
+                # This enables url_context tool support which is not yet natively supported in LangChain
+                apply_url_context_patch()
+            globals()[name] = provider_class
+            logger.info(f"Loaded LLM provider SDK: {module_name}")
+    return globals()[name]
+
+
+def _provider_class(name: str) -> Any:
+    """Get a LangChain provider class, importing its SDK if needed."""
+    return globals().get(name) or __getattr__(name)
+
 
 # LLM Providers mapping using LangChain
 def _create_openai_client(temp, api_key, model, disable_ssl_verification=False, base_url=None):
@@ -93,11 +147,12 @@ def _create_openai_client(temp, api_key, model, disable_ssl_verification=False,
     if base_url:
         client_kwargs["base_url"] = base_url
     
-    if disable_ssl_verification:
-        client_kwargs["http_client"] = httpx.Client(verify=False)
-        client_kwargs["http_async_client"] = httpx.AsyncClient(verify=False)
+    # Shared keep-alive connections (SSL verification disabled on request)
+    http_pool = get_llm_http_pool()
+    client_kwargs["http_client"] = http_pool.get_client(verify=not disable_ssl_verification)
+    client_kwargs["http_async_client"] = http_pool.get_async_client(verify=not disable_ssl_verification)
     
-    return ChatOpenAI(**client_kwargs)
+    return _provider_class("ChatOpenAI")(**client_kwargs)
 
 def _create_google_client(temp, api_key, model, disable_ssl_verification=False, base_url=None):
     """Create ChatGoogleGenerativeAI client."""
@@ -106,8 +161,9 @@ def _create_google_client(temp, api_key, model, disable_ssl_verification=False,
         "temperature": temp if temp is not None else 1.0,  # Default to 1.0 if not specified
         "google_api_key": api_key
     }
-    # Note: ChatGoogleGenerativeAI may not support custom base_url or HTTP clients
-    return ChatGoogleGenerativeAI(**client_kwargs)
+    # Note: ChatGoogleGenerativeAI doesn't support a custom base_url or HTTP client;
+    # it keeps a persistent gRPC (HTTP/2) channel per client
+    return _provider_class("ChatGoogleGenerativeAI")(**client_kwargs)
 
 def _create_xai_client(temp, api_key, model, disable_ssl_verification=False, base_url=None):
     """Create ChatXAI client."""
@@ -118,8 +174,10 @@ def _create_xai_client(temp, api_key, model, disable_ssl_verification=False, bas
     }
     if base_url:
         client_kwargs["base_url"] = base_url
-    # Note: ChatXAI may not support custom HTTP clients - would need to verify
-    return ChatXAI(**client_kwargs)
+    http_pool = get_llm_http_pool()
+    client_kwargs["http_client"] = http_pool.get_client(verify=not disable_ssl_verification)
+    client_kwargs["http_async_client"] = http_pool.get_async_client(verify=not disable_ssl_verification)
+    return _provider_class("ChatXAI")(**client_kwargs)
 
 def _create_anthropic_client(temp, api_key, model, disable_ssl_verification=False, base_url=None):
     """Create ChatAnthropic client."""
@@ -130,8 +188,9 @@ def _create_anthropic_client(temp, api_key, model, disable_ssl_verification=Fals
     }
     if base_url:
         client_kwargs["base_url"] = base_url
-    # Note: ChatAnthropic may not support custom HTTP clients - would need to verify  
-    return ChatAnthropic(**client_kwargs)
+    # Note: ChatAnthropic doesn't accept an HTTP client; it already shares cached
+    # httpx clients (and their connections) per base_url
+    return _provider_class("ChatAnthropic")(**client_kwargs)
 
 def _create_vertexai_client(temp, project, model, disable_ssl_verification=False, base_url=None, location="us-east5"):
     """Create ChatAnthropicVertex client for Claude models on Vertex AI.
@@ -143,7 +202,7 @@ def _create_vertexai_client(temp, project, model, disable_ssl_verification=False
         temp: Temperature for response generation
         project: GCP project ID (required)
         model: Model name (e.g., claude-sonnet-4-5@20250929)
-        disable_ssl_verification: Whether to disable SSL verification (unused for VertexAI, kept for interface consistency)
+        disable_ssl_verification: Whether to disable SSL verification of the shared HTTP clients
         base_url: Custom base URL (unused for VertexAI, kept for interface consistency)
         location: GCP region (default: us-east5)
     
@@ -156,8 +215,11 @@ def _create_vertexai_client(temp, project, model, disable_ssl_verification=False
         "location": location,
         "temperature": temp
     }
+    http_pool = get_llm_http_pool()
+    client_kwargs["http_client"] = http_pool.get_client(verify=not disable_ssl_verification)
+    client_kwargs["async_http_client"] = http_pool.get_async_client(verify=not disable_ssl_verification)
     
-    return ChatAnthropicVertex(**client_kwargs)
+    return _provider_class("ChatAnthropicVertex")(**client_kwargs)
 
 LLM_PROVIDERS = {
     LLMProviderType.OPENAI.value: _create_openai_client,
@@ -182,6 +244,17 @@ class LLMClient:
         self.project = (config.project or "").strip()  # For VertexAI
         self.location = (config.location or "").strip()  # For VertexAI
         self.temperature = config.temperature  # Field with default in BaseModel
+        # Explicit prompt cache breakpoints (Anthropic / Claude on Vertex AI)
+        self.cache_breakpoints = config.prompt_caching and uses_cache_breakpoints(config.type)
+        # Stop sequences sent to the provider (otherwise the stream is cancelled client-side)
+        self.native_stop_sequences = (
+            config.supports_stop_sequences if config.supports_stop_sequences is not None
+            else config.type in STOP_SEQUENCE_PROVIDERS
+        )
+        # Estimates usage of streams cancelled at a stop sequence (created on first use)
+        self._token_counter: Optional[TokenCounter] = None
+        # Process-wide rate limiter of this provider (None = no limits configured)
+        self.rate_limiter = get_rate_limiter(provider_name, config)
         self.llm_client: Optional[BaseChatModel] = None
         self.settings = settings  # Store settings for feature flag access
         self.available: bool = False
@@ -397,7 +470,9 @@ class LLMClient:
         timeout_seconds: int = 120,
         mcp_event_id: Optional[str] = None,
         native_tools_override: Optional[NativeToolsConfig] = None,
-        parallel_metadata: Optional['ParallelExecutionMetadata'] = None
+        parallel_metadata: Optional['ParallelExecutionMetadata'] = None,
+        on_first_token: Optional[Callable[[], None]] = None,
+        stop_sequences: Optional[Sequence[str]] = None
     ) -> LLMConversation:
         """
         Generate response with streaming to WebSocket.
@@ -407,10 +482,15 @@ class LLMClient:
         
         Includes retry logic:
         - Timeout protection (default: 120s, increased for code execution scenarios)
+        - Per-provider rate limiting (if configured) shared by all sessions
         - Rate limit retry with exponential backoff
         - Timeout retry with increasing delays
         - Empty response handling
         
+        With stop sequences the response ends before the first stop sequence: they are
+        sent to providers that support them, and the stream is cancelled as soon as one
+        arrives otherwise.
+        
         Args:
             conversation: The conversation to generate a response for
             session_id: Session ID for tracking
@@ -426,6 +506,9 @@ class LLMClient:
             native_tools_override: Optional per-session native tools configuration override.
                                  When specified, completely replaces provider's default native tools
                                  settings for this request (Google/Gemini only).
+            parallel_metadata: Optional parallel execution metadata for streaming events
+            on_first_token: Optional callback invoked once, when the first response token arrives
+            stop_sequences: Optional sequences that end the response (e.g. ReAct's "\nObservation:")
         
         Returns:
             Updated conversation with assistant response appended
@@ -472,21 +555,14 @@ class LLMClient:
                 try:
                     # Convert typed conversation to LangChain format  
                     langchain_messages = self._convert_conversation_to_langchain(conversation)
-                    accumulated_content = ""
+                    if self.cache_breakpoints:
+                        langchain_messages = apply_cache_breakpoints(langchain_messages)
                     
-                    # Streaming state (for thoughts, final answers, and summarizations)
-                    is_streaming_thought = False
-                    is_streaming_final_answer = False
-                    is_streaming_summarization = False
-                    token_count_since_last_send = 0
-                    THOUGHT_CHUNK_SIZE = 1  # Faster streaming for plain text thoughts
-                    FINAL_ANSWER_CHUNK_SIZE = 3  # Reduced but still stable for markdown
-                    SUMMARIZATION_CHUNK_SIZE = 1  # Faster streaming for plain text summaries
-                    
-                    # Check if we should stream as plain text summarization
-                    if interaction_type == LLMInteractionType.SUMMARIZATION.value:
-                        is_streaming_summarization = True
-                        logger.debug(f"Streaming plain text summarization for {session_id}")
+                    # Incremental ReAct / summarization stream parser (thoughts, final answers)
+                    stream_parser = ReActStreamParser(
+                        summarization=interaction_type == LLMInteractionType.SUMMARIZATION.value,
+                        stop_sequences=stop_sequences or ()
+                    )
                     
                     # Stream tokens with timeout protection
                     # Token usage tracking uses dual approach:
@@ -496,6 +572,9 @@ class LLMClient:
                     config = {"callbacks": [callback]}
                     if max_tokens is not None:
                         config["max_tokens"] = max_tokens
+                    stream_kwargs = {}
+                    if stop_sequences and self.native_stop_sequences:
+                        stream_kwargs["stop"] = list(stop_sequences)
                     
                     # HYBRID APPROACH: Bind native tools to model using Google AI SDK types
                     # Tools are converted to dicts and bound to the model, not passed to astream()
@@ -531,198 +610,48 @@ class LLMClient:
                                 logger.error(f"Failed to bind native tools: {e}, continuing without tools")
                                 llm_with_tools = self.llm_client
                     
-                    # Aggregate chunks for usage metadata (OpenAI stream_usage=True approach)
-                    aggregate_chunk = None
+                    # Chunks are combined once the stream ends for usage metadata
+                    # (OpenAI stream_usage=True approach)
+                    chunks = []
+                    
+                    # Wait for the provider budget shared with other sessions (not part of the timeout)
+                    rate_limit_grant = None
+                    if self.rate_limiter:
+                        rate_limit_grant = await self.rate_limiter.acquire(
+                            estimate_request_tokens(conversation, max_tokens),
+                            priority=request_priority(interaction_type)
+                        )
                     
                     # Wrap streaming with timeout protection (Python 3.11+)
                     async with asyncio.timeout(timeout_seconds):
-                        async for chunk in llm_with_tools.astream(langchain_messages, config=config):
-                            # Aggregate chunks by adding them together
-                            # This properly accumulates usage_metadata across all chunks
-                            aggregate_chunk = chunk if aggregate_chunk is None else aggregate_chunk + chunk
+                        stream = llm_with_tools.astream(langchain_messages, config=config, **stream_kwargs)
+                        async for chunk in stream:
+                            chunks.append(chunk)
                             
                             # Extract token content, filtering out code execution parts if enabled
                             # This preserves ReAct format by only accumulating text content
                             token = self._extract_token_content(chunk, filter_code_execution=code_execution_enabled)
-                            accumulated_content += token
-                            
-                            # Detect start of "Thought:" streaming (disabled during summarization)
-                            if (not is_streaming_summarization) and (not is_streaming_thought) and (not is_streaming_final_answer):
-                                if "Thought:" in accumulated_content and "Final Answer:" not in accumulated_content:
-                                    is_streaming_thought = True
-                                    token_count_since_last_send = 0
-                                    logger.debug(f"Started streaming thought for {session_id}")
-                            
-                            # Check if we should STOP streaming thought
-                            if is_streaming_thought and ("Action:" in accumulated_content or "Final Answer:" in accumulated_content):
-                                # Extract clean thought content (everything between "Thought:" and stop marker)
-                                thought_start_idx = accumulated_content.find("Thought:")
-                                stop_idx = accumulated_content.find("Action:") if "Action:" in accumulated_content else accumulated_content.find("Final Answer:")
-                                clean_thought = accumulated_content[thought_start_idx + len("Thought:"):stop_idx].strip()
-                                
-                                # Send final complete thought
-                                if clean_thought:
-                                    await self._streaming_publisher.publish_chunk(
-                                        session_id, stage_execution_id,
-                                        StreamingEventType.THOUGHT, clean_thought,
-                                        is_complete=True,
-                                        llm_interaction_id=ctx.interaction.interaction_id,
-                                        parallel_metadata=parallel_metadata
-                                    )
-                                else:
-                                    # Send completion marker
-                                    await self._streaming_publisher.publish_chunk(
-                                        session_id, stage_execution_id,
-                                        StreamingEventType.THOUGHT, "",
-                                        is_complete=True,
-                                        llm_interaction_id=ctx.interaction.interaction_id,
-                                        parallel_metadata=parallel_metadata
-                                    )
-                                is_streaming_thought = False
-                                token_count_since_last_send = 0
-                                logger.debug(f"Stopped streaming thought for {session_id}")
-                                
-                                # If "Final Answer:" detected, start streaming it
-                                if "Final Answer:" in accumulated_content:
-                                    is_streaming_final_answer = True
-                                    token_count_since_last_send = 0
-                                    logger.debug(f"Started streaming final answer for {session_id}")
-                                
-                                continue  # Skip token accumulation for this iteration
-                            
-                            # Send periodic updates with ENTIRE content (not just new tokens)
-                            if is_streaming_thought or is_streaming_final_answer or is_streaming_summarization:
-                                token_count_since_last_send += 1
-                                
-                                # Determine chunk size based on what we're streaming
-                                if is_streaming_thought:
-                                    current_chunk_size = THOUGHT_CHUNK_SIZE
-                                elif is_streaming_final_answer:
-                                    current_chunk_size = FINAL_ANSWER_CHUNK_SIZE
-                                else:  # is_streaming_summarization
-                                    current_chunk_size = SUMMARIZATION_CHUNK_SIZE
-                                
-                                # Send entire content every N tokens
-                                if token_count_since_last_send >= current_chunk_size:
-                                    if is_streaming_thought:
-                                        thought_start_idx = accumulated_content.find("Thought:")
-                                        current_thought = accumulated_content[thought_start_idx + len("Thought:"):].lstrip()
-                                        
-                                        # Check if Action: or Final Answer: appeared (strip them from streaming)
-                                        # This handles cases where LLM doesn't put them on new lines
-                                        if "Action:" in current_thought:
-                                            current_thought = current_thought[:current_thought.find("Action:")].strip()
-                                        elif "Final Answer:" in current_thought:
-                                            current_thought = current_thought[:current_thought.find("Final Answer:")].strip()
-                                        
-                                        if current_thought:
-                                            await self._streaming_publisher.publish_chunk(
-                                                session_id, stage_execution_id,
-                                                StreamingEventType.THOUGHT, current_thought,
-                                                is_complete=False,
-                                                llm_interaction_id=ctx.interaction.interaction_id,
-                                                parallel_metadata=parallel_metadata
-                                            )
-                                    
-                                    elif is_streaming_final_answer:
-                                        final_answer_start_idx = accumulated_content.find("Final Answer:")
-                                        current_final_answer = accumulated_content[final_answer_start_idx + len("Final Answer:"):].lstrip()
-                                        
-                                        if current_final_answer:
-                                            await self._streaming_publisher.publish_chunk(
-                                                session_id, stage_execution_id,
-                                                StreamingEventType.FINAL_ANSWER, current_final_answer,
-                                                is_complete=False,
-                                                llm_interaction_id=ctx.interaction.interaction_id,
-                                                parallel_metadata=parallel_metadata
-                                            )
-                                    
-                                    elif is_streaming_summarization:
-                                        # Stream entire accumulated content as plain text
-                                        if accumulated_content.strip():
-                                            await self._streaming_publisher.publish_chunk(
-                                                session_id, stage_execution_id,
-                                                StreamingEventType.SUMMARIZATION, accumulated_content.strip(),
-                                                is_complete=False,
-                                                mcp_event_id=mcp_event_id,
-                                                parallel_metadata=parallel_metadata
-                                            )
-                                    
-                                    token_count_since_last_send = 0
+                            if on_first_token and token:
+                                on_first_token()
+                                on_first_token = None
+                            for update in stream_parser.feed(token):
+                                await self._publish_stream_update(
+                                    update, session_id, stage_execution_id, ctx, mcp_event_id, parallel_metadata
+                                )
+                            if stream_parser.stopped:
+                                # Don't wait for (and pay for) the rest of the response
+                                await stream.aclose()
+                                logger.debug(f"Stop sequence received from {self.provider_name}, response stream cancelled")
+                                break
                     
                     # Send final complete content if streaming is still active (after stream completes)
-                    if is_streaming_thought:
-                        thought_start_idx = accumulated_content.find("Thought:")
-                        final_thought = accumulated_content[thought_start_idx + len("Thought:"):].strip()
-                        
-                        # Strip any trailing Action: or Final Answer: (in case LLM didn't put them on new lines)
-                        if "Action:" in final_thought:
-                            final_thought = final_thought[:final_thought.find("Action:")].strip()
-                        elif "Final Answer:" in final_thought:
-                            final_thought = final_thought[:final_thought.find("Final Answer:")].strip()
-                        
-                        if final_thought:
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.THOUGHT, final_thought,
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                        else:
-                            # Send completion marker
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.THOUGHT, "",
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                    
-                    # Send final complete final answer if streaming is still active
-                    if is_streaming_final_answer:
-                        final_answer_start_idx = accumulated_content.find("Final Answer:")
-                        final_answer = accumulated_content[final_answer_start_idx + len("Final Answer:"):].strip()
-                        
-                        if final_answer:
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.FINAL_ANSWER, final_answer,
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                        else:
-                            # Send completion marker
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.FINAL_ANSWER, "",
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
+                    for update in stream_parser.finish():
+                        await self._publish_stream_update(
+                            update, session_id, stage_execution_id, ctx, mcp_event_id, parallel_metadata
+                        )
                     
-                    # Send final complete summarization if streaming is still active
-                    if is_streaming_summarization:
-                        final_summarization = accumulated_content.strip()
-                        
-                        if final_summarization:
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.SUMMARIZATION, final_summarization,
-                                is_complete=True,
-                                mcp_event_id=mcp_event_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                        else:
-                            # Send completion marker
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.SUMMARIZATION, "",
-                                is_complete=True,
-                                mcp_event_id=mcp_event_id,
-                                parallel_metadata=parallel_metadata
-                            )
+                    accumulated_content = stream_parser.content
+                    aggregate_chunk = self._aggregate_chunks(chunks)
                     
                     # Check for empty response and retry if needed
                     if not accumulated_content or accumulated_content.strip() == "":
@@ -743,6 +672,14 @@ class LLMClient:
                     
                     # Store usage metadata (from aggregated chunks or callback)
                     self._store_usage_metadata(ctx, callback, chunk_usage)
+                    if stream_parser.stopped and ctx.interaction.total_tokens is None:
+                        # The usage chunk comes last, so a stream cancelled at a stop sequence lacks it
+                        await asyncio.to_thread(
+                            self._store_estimated_usage, ctx, conversation, accumulated_content
+                        )
+                    if rate_limit_grant:
+                        await rate_limit_grant.settle(ctx.interaction.total_tokens)
+                    record_token_usage(ctx.interaction.total_tokens)
                     
                     # Extract complete response metadata from aggregated chunk
                     if aggregate_chunk and hasattr(aggregate_chunk, 'response_metadata'):
@@ -813,6 +750,9 @@ class LLMClient:
                         if retry_delay is None:
                             # Exponential backoff: 2^attempt seconds (1s, 2s, 4s)
                             retry_delay = (2 ** attempt)
+                        if self.rate_limiter:
+                            # Hold other sessions' calls to this provider as well
+                            self.rate_limiter.penalize(retry_delay)
                         
                         logger.warning(f"Rate limit hit (attempt {attempt + 1}/{max_retries + 1}), retrying in {retry_delay}s")
                         await asyncio.sleep(retry_delay)
@@ -912,6 +852,50 @@ class LLMClient:
         # Defensive str() coercion for future-proofing against potential library API shifts
         return str(token) if not isinstance(token, str) else token
     
+    @staticmethod
+    def _aggregate_chunks(chunks: List[Any]) -> Any:
+        """
+        Combine streamed chunks into one message (content, usage and response metadata).
+        
+        Merges all chunks in one pass instead of adding them up chunk by chunk,
+        which copies the accumulated content on every addition.
+        """
+        if not chunks:
+            return None
+        if all(isinstance(chunk, AIMessageChunk) for chunk in chunks):
+            return add_ai_message_chunks(chunks[0], *chunks[1:])
+        aggregate_chunk = chunks[0]
+        for chunk in chunks[1:]:
+            aggregate_chunk = aggregate_chunk + chunk
+        return aggregate_chunk
+    
+    async def _publish_stream_update(
+        self,
+        update: StreamUpdate,
+        session_id: str,
+        stage_execution_id: Optional[str],
+        ctx: Any,
+        mcp_event_id: Optional[str],
+        parallel_metadata: Optional['ParallelExecutionMetadata']
+    ) -> None:
+        """Publish a streaming update from ReActStreamParser."""
+        if update.stream_type == StreamingEventType.SUMMARIZATION:
+            await self._streaming_publisher.publish_chunk(
+                session_id, stage_execution_id,
+                update.stream_type, update.content,
+                is_complete=update.is_complete,
+                mcp_event_id=mcp_event_id,
+                parallel_metadata=parallel_metadata
+            )
+        else:
+            await self._streaming_publisher.publish_chunk(
+                session_id, stage_execution_id,
+                update.stream_type, update.content,
+                is_complete=update.is_complete,
+                llm_interaction_id=ctx.interaction.interaction_id,
+                parallel_metadata=parallel_metadata
+            )
+    
     def _store_usage_metadata(
         self, 
         ctx: Any, 
@@ -976,15 +960,36 @@ class LLMClient:
             ctx.interaction.input_tokens = input_tokens if input_tokens > 0 else None
             ctx.interaction.output_tokens = output_tokens if output_tokens > 0 else None
             ctx.interaction.total_tokens = total_tokens if total_tokens > 0 else None
+            ctx.interaction.cached_input_tokens = get_cached_input_tokens(usage_metadata)
             
             logger.debug(
                 f"Stored token usage: input={input_tokens}, "
-                f"output={output_tokens}, total={total_tokens}"
+                f"output={output_tokens}, total={total_tokens}, "
+                f"cached={ctx.interaction.cached_input_tokens}"
             )
         else:
             # Some providers may not support token usage metadata
             logger.debug(f"No token usage metadata available for {self.provider_name}")
     
+    def _store_estimated_usage(self, ctx: Any, conversation: LLMConversation, content: str) -> None:
+        """
+        Store estimated token usage for a response whose stream was cancelled.
+        
+        Counts the prompt and the trimmed output, so token budgets and history
+        are charged for the request even without provider usage metadata.
+        """
+        if self._token_counter is None:
+            self._token_counter = TokenCounter()
+        input_tokens = sum(self._token_counter.count_tokens(message.content) for message in conversation.messages)
+        output_tokens = self._token_counter.count_tokens(content)
+        ctx.interaction.input_tokens = input_tokens or None
+        ctx.interaction.output_tokens = output_tokens or None
+        ctx.interaction.total_tokens = (input_tokens + output_tokens) or None
+        logger.debug(
+            f"Estimated token usage for cancelled {self.provider_name} stream: "
+            f"input={input_tokens}, output={output_tokens}"
+        )
+    
     def _finalize_conversation(
         self,
         ctx: Any,
@@ -21,8 +21,15 @@ from google.genai import types as google_genai_types
 
 from tarsy.config.settings import get_settings
 from tarsy.hooks.hook_context import llm_interaction_context
+from tarsy.integrations.llm.http_pool import get_llm_http_pool
 from tarsy.integrations.llm.native_tools import NativeToolsHelper
+from tarsy.integrations.llm.rate_limiter import (
+    estimate_request_tokens,
+    get_rate_limiter,
+    request_priority,
+)
 from tarsy.integrations.llm.streaming import StreamingPublisher
+from tarsy.integrations.llm.token_budget import ensure_token_budget, record_token_usage
 from tarsy.models.constants import LLMInteractionType, StreamingEventType
 from tarsy.models.llm_models import LLMProviderConfig, LLMProviderType
 from tarsy.models.mcp_selection_models import NativeToolsConfig
@@ -112,8 +119,19 @@ class GeminiNativeThinkingClient:
         self.settings = get_settings()
         # Use shared streaming publisher utility
         self._streaming_publisher = StreamingPublisher(self.settings)
-        # Initialize native Google client once for reuse across requests
-        self._native_client = genai.Client(api_key=self.config.api_key)
+        # Process-wide rate limiter of this provider (shared with LLMClient)
+        self.rate_limiter = get_rate_limiter(self.provider_name, config)
+        # Initialize native Google client once for reuse across requests,
+        # on the shared keep-alive connections of all LLM clients
+        http_pool = get_llm_http_pool()
+        verify = not self.config.disable_ssl_verification
+        self._native_client = genai.Client(
+            api_key=self.config.api_key,
+            http_options=google_genai_types.HttpOptions(
+                httpx_client=http_pool.get_client(verify=verify),
+                httpx_async_client=http_pool.get_async_client(verify=verify),
+            ),
+        )
         
         logger.info(f"Initialized GeminiNativeThinkingClient for model {self.model}")
     
@@ -295,8 +313,11 @@ class GeminiNativeThinkingClient:
             
         Raises:
             TimeoutError: If generation times out
+            TokenBudgetExceededError: If the session/agent token budget is used up
             Exception: On LLM communication failures
         """
+        ensure_token_budget()
+        
         # Generate unique request ID for logging
         request_id = str(uuid.uuid4())[:8]
         
@@ -416,6 +437,14 @@ class GeminiNativeThinkingClient:
                     response_token_count = 0
                     accumulated_thinking = ""
                     
+                    # Wait for the provider budget shared with other sessions (not part of the timeout)
+                    rate_limit_grant = None
+                    if self.rate_limiter:
+                        rate_limit_grant = await self.rate_limiter.acquire(
+                            estimate_request_tokens(conversation, max_tokens),
+                            priority=request_priority(interaction_type)
+                        )
+                    
                     async with asyncio.timeout(timeout_seconds):
                         # Use async streaming generate_content for real-time updates
                         async for chunk in await self._native_client.aio.models.generate_content_stream(
@@ -520,6 +549,11 @@ class GeminiNativeThinkingClient:
                                 ctx.interaction.input_tokens = getattr(usage, 'prompt_token_count', None)
                                 ctx.interaction.output_tokens = getattr(usage, 'candidates_token_count', None)
                                 ctx.interaction.total_tokens = getattr(usage, 'total_token_count', None)
+                                # Implicit prompt caching of repeated prefixes (see prompt_cache)
+                                cached_tokens = getattr(usage, 'cached_content_token_count', None)
+                                ctx.interaction.cached_input_tokens = (
+                                    cached_tokens if isinstance(cached_tokens, int) and cached_tokens > 0 else None
+                                )
                         
                         # Determine if this is a final response (no tool calls)
                         # Must check this before sending final chunks so we use correct event type
@@ -605,6 +639,9 @@ class GeminiNativeThinkingClient:
                     ctx.interaction.native_tools_config = native_tools_config
                     
                     await ctx.complete_success({})
+                    if rate_limit_grant:
+                        await rate_limit_grant.settle(ctx.interaction.total_tokens)
+                    record_token_usage(ctx.interaction.total_tokens)
                     
                     logger.info(
                         f"[{request_id}] Native thinking complete: "
@@ -0,0 +1,210 @@
+"""
+Hedged and failover LLM requests across configured providers.
+
+A latency spike on the primary provider otherwise stalls every iteration until
+the iteration timeout; a failing provider makes every session exhaust its retries.
+
+Logic:
+- Enabled when llm_fallback_provider is set (and differs from the provider of
+  the request)
+- ProviderHealth keeps rolling windows of time-to-first-token and request
+  outcomes per provider
+- Hedging: if the primary's first token hasn't arrived within the hedge
+  deadline, the same request is sent to the fallback provider; the first
+  attempt to succeed wins and the other one is cancelled. Both attempts are
+  recorded as LLM interactions (the loser as cancelled with reason hedge_lost)
+- Hedge deadline: the configured percentile of the primary's recent
+  time-to-first-token, clamped to [min, max] delay; the max delay is used
+  until enough latencies are known
+- Failover: once the primary's error rate over its recent requests reaches
+  llm_failover_error_rate, requests go straight to the fallback provider for
+  llm_failover_cooldown_seconds, then the primary gets a fresh start
+- Only the primary attempt works on the caller's conversation; the hedge gets
+  a copy, and the winner's conversation is returned
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+
+from tarsy.config.settings import Settings
+from tarsy.models.constants import CancellationReason
+from tarsy.models.unified_interactions import LLMConversation
+from tarsy.utils.logger import get_module_logger
+
+if TYPE_CHECKING:
+    from tarsy.integrations.llm.client import LLMClient
+
+logger = get_module_logger(__name__)
+
+# Requests / latencies kept per provider
+HEALTH_WINDOW = 50
+
+# Latencies needed before the percentile replaces the max hedge delay
+MIN_LATENCY_SAMPLES = 10
+
+# Requests needed before the error rate can trigger failover
+MIN_FAILOVER_REQUESTS = 10
+
+
+class ProviderHealth:
+    """Rolling time-to-first-token and error statistics of one provider."""
+
+    def __init__(self, window: int = HEALTH_WINDOW):
+        self.first_token_latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)  # True = success
+        self.failover_until = 0.0
+
+    def record_first_token(self, seconds: float) -> None:
+        self.first_token_latencies.append(seconds)
+
+    def record_outcome(self, success: bool) -> None:
+        self.outcomes.append(success)
+
+    def error_rate(self) -> Optional[float]:
+        """Fraction of failed recent requests (None until enough requests)."""
+        if len(self.outcomes) < MIN_FAILOVER_REQUESTS:
+            return None
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Nearest-rank percentile of recent time-to-first-token (None until enough samples)."""
+        if len(self.first_token_latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.first_token_latencies)
+        rank = max(1, math.ceil(len(ordered) * percentile / 100))
+        return ordered[rank - 1]
+
+    def in_failover(self) -> bool:
+        return time.monotonic() < self.failover_until
+
+
+class LLMRequestHedger:
+    """Runs LLM requests with hedging and failover to a fallback provider."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._health: Dict[str, ProviderHealth] = {}
+
+    def health(self, provider_name: str) -> ProviderHealth:
+        """Get (or create) the health statistics of a provider."""
+        if provider_name not in self._health:
+            self._health[provider_name] = ProviderHealth()
+        return self._health[provider_name]
+
+    def hedge_delay(self, provider_name: str) -> float:
+        """Seconds to wait for the first token before hedging."""
+        min_delay = self.settings.llm_hedge_min_delay_seconds
+        max_delay = self.settings.llm_hedge_max_delay_seconds
+        latency = self.health(provider_name).latency_percentile(self.settings.llm_hedge_latency_percentile)
+        if latency is None:
+            return max_delay
+        return min(max(latency, min_delay), max_delay)
+
+    async def run(
+        self,
+        primary: "LLMClient",
+        fallback: "LLMClient",
+        conversation: LLMConversation,
+        **request: Any,
+    ) -> LLMConversation:
+        """
+        Generate a response with the primary provider, hedging or failing over to the fallback.
+
+        Args:
+            primary: Client of the requested provider
+            fallback: Client of the fallback provider
+            conversation: Conversation to generate a response for
+            **request: Remaining LLMClient.generate_response arguments
+
+        Returns:
+            Conversation of the winning attempt with the assistant response appended
+        """
+        if self.health(primary.provider_name).in_failover():
+            logger.info(f"{primary.provider_name} is in failover, sending request to {fallback.provider_name}")
+            return await self._attempt(fallback, conversation, request)
+        if not self.settings.llm_hedging_enabled:
+            return await self._attempt(primary, conversation, request)
+
+        first_token = asyncio.Event()
+        started = time.monotonic()
+        primary_task = asyncio.create_task(self._attempt(primary, conversation, request, first_token))
+        tasks = [primary_task]
+        cancel_reason = None
+        try:
+            delay = self.hedge_delay(primary.provider_name)
+            first_token_wait = asyncio.create_task(first_token.wait())
+            await asyncio.wait({primary_task, first_token_wait}, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+            first_token_wait.cancel()
+            if primary_task.done() or first_token.is_set():
+                return await primary_task
+
+            logger.warning(
+                f"No first token from {primary.provider_name} after {delay:.1f}s, "
+                f"hedging request to {fallback.provider_name}"
+            )
+            hedge_task = asyncio.create_task(
+                self._attempt(fallback, conversation.model_copy(deep=True), request)
+            )
+            tasks.append(hedge_task)
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the primary if both finished together
+                for task in tasks:
+                    if task in done and task.exception() is None:
+                        winner = primary if task is primary_task else fallback
+                        logger.info(f"Hedged request won by {winner.provider_name}")
+                        if not first_token.is_set():
+                            # Lower bound of the primary's latency, so the deadline adapts to slow periods
+                            self.health(primary.provider_name).record_first_token(time.monotonic() - started)
+                        cancel_reason = CancellationReason.HEDGE_LOST.value
+                        return task.result()
+            # Both attempts failed - report the primary's error
+            raise primary_task.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel(cancel_reason)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _attempt(
+        self,
+        client: "LLMClient",
+        conversation: LLMConversation,
+        request: Dict[str, Any],
+        first_token: Optional[asyncio.Event] = None,
+    ) -> LLMConversation:
+        """Run one attempt, recording its first-token latency and outcome."""
+        health = self.health(client.provider_name)
+        started = time.monotonic()
+
+        def on_first_token() -> None:
+            health.record_first_token(time.monotonic() - started)
+            if first_token:
+                first_token.set()
+
+        try:
+            result = await client.generate_response(conversation, on_first_token=on_first_token, **request)
+        except Exception:
+            health.record_outcome(False)
+            if client.provider_name != self.settings.llm_fallback_provider:
+                self._check_failover(client.provider_name, health)
+            raise
+        health.record_outcome(True)
+        return result
+
+    def _check_failover(self, provider_name: str, health: ProviderHealth) -> None:
+        error_rate = health.error_rate()
+        if error_rate is None or error_rate < self.settings.llm_failover_error_rate:
+            return
+        cooldown = self.settings.llm_failover_cooldown_seconds
+        health.failover_until = time.monotonic() + cooldown
+        health.outcomes.clear()  # Fresh start after the cooldown
+        logger.warning(
+            f"{provider_name} error rate {error_rate:.0%} reached the failover threshold, "
+            f"using {self.settings.llm_fallback_provider} for {cooldown}s"
+        )
@@ -0,0 +1,174 @@
+"""
+Shared HTTP connection pool for LLM provider clients.
+
+Without sharing, every LLM client builds its own httpx client, so each agent
+(and each fallback/summarization client) opens fresh TCP and TLS connections
+to the same provider hosts and DNS is resolved again for each of them.
+
+Logic:
+- One httpx.Client and one httpx.AsyncClient per process (and per SSL
+  verification mode), shared by all provider clients that accept an httpx
+  client: ChatOpenAI, ChatXAI, ChatAnthropicVertex and the google-genai client
+  of GeminiNativeThinkingClient
+- Keep-alive connections (MAX_KEEPALIVE_CONNECTIONS, KEEPALIVE_EXPIRY) are
+  reused across sessions, so TCP/TLS setup and DNS lookups only happen for new
+  connections
+- HTTP/2 is used when the optional h2 package is installed (httpx[http2]), so
+  concurrent calls to a provider are multiplexed over one connection
+- ChatAnthropic and ChatGoogleGenerativeAI don't accept an httpx client; they
+  already reuse connections (cached httpx clients / a persistent gRPC channel)
+- Connection reuse is tracked with httpcore's trace extension: requests, new
+  TCP connections and TLS handshakes are counted and reported in /health
+"""
+
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+
+from tarsy.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Connections kept per client (all provider hosts together)
+MAX_CONNECTIONS = 100
+
+# Idle connections kept open for reuse
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+# Seconds an idle connection is kept open
+KEEPALIVE_EXPIRY = 120.0
+
+# LLM calls can take minutes; connecting should not
+TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+# httpcore trace events of a new connection
+_CONNECT_EVENT = "connection.connect_tcp.complete"
+_TLS_EVENT = "connection.start_tls.complete"
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class LLMHTTPPool:
+    """Process-wide httpx clients for LLM providers, with connection reuse metrics."""
+
+    def __init__(self):
+        self.http2 = _http2_available()
+        self._clients: Dict[bool, httpx.Client] = {}
+        self._async_clients: Dict[bool, httpx.AsyncClient] = {}
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        logger.info(
+            f"Shared LLM HTTP pool: http2={self.http2}, max_connections={MAX_CONNECTIONS}, "
+            f"keepalive={MAX_KEEPALIVE_CONNECTIONS} x {KEEPALIVE_EXPIRY:.0f}s"
+        )
+
+    def get_client(self, verify: bool = True) -> httpx.Client:
+        """
+        Get the shared synchronous client.
+
+        Args:
+            verify: Whether SSL certificates are verified
+        """
+        client = self._clients.get(verify)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                verify=verify,
+                http2=self.http2,
+                limits=self._limits(),
+                timeout=TIMEOUT,
+                event_hooks={"request": [self._on_request]},
+            )
+            self._clients[verify] = client
+        return client
+
+    def get_async_client(self, verify: bool = True) -> httpx.AsyncClient:
+        """
+        Get the shared asynchronous client.
+
+        Args:
+            verify: Whether SSL certificates are verified
+        """
+        client = self._async_clients.get(verify)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                verify=verify,
+                http2=self.http2,
+                limits=self._limits(),
+                timeout=TIMEOUT,
+                event_hooks={"request": [self._on_async_request]},
+            )
+            self._async_clients[verify] = client
+        return client
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Connection reuse metrics for the health endpoint."""
+        reused = max(self.requests - self.new_connections, 0)
+        return {
+            "http2": self.http2,
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "tls_handshakes": self.tls_handshakes,
+            "connection_reuse_ratio": round(reused / self.requests, 3) if self.requests else None,
+        }
+
+    async def aclose(self) -> None:
+        """Close all shared clients and their connections."""
+        for async_client in self._async_clients.values():
+            await async_client.aclose()
+        for client in self._clients.values():
+            client.close()
+        self._async_clients.clear()
+        self._clients.clear()
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+
+    def _record_trace(self, event_name: str) -> None:
+        if event_name == _CONNECT_EVENT:
+            self.new_connections += 1
+        elif event_name == _TLS_EVENT:
+            self.tls_handshakes += 1
+
+    def _on_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+        if "trace" not in request.extensions:
+            request.extensions["trace"] = self._trace
+
+    async def _on_async_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+        if "trace" not in request.extensions:
+            request.extensions["trace"] = self._async_trace
+
+    def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self._record_trace(event_name)
+
+    async def _async_trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self._record_trace(event_name)
+
+
+_llm_http_pool: Optional[LLMHTTPPool] = None
+
+
+def get_llm_http_pool() -> LLMHTTPPool:
+    """Get the process-wide LLM HTTP pool."""
+    global _llm_http_pool
+    if _llm_http_pool is None:
+        _llm_http_pool = LLMHTTPPool()
+    return _llm_http_pool
+
+
+async def close_llm_http_pool() -> None:
+    """Close the process-wide LLM HTTP pool (application shutdown)."""
+    global _llm_http_pool
+    if _llm_http_pool is not None:
+        await _llm_http_pool.aclose()
+        _llm_http_pool = None
@@ -3,13 +3,25 @@ LLM Manager for multi-provider orchestration.
 
 Manages multiple LLM providers, handles availability checking, and provides
 unified access to both LangChain-based clients and native thinking clients.
+Requests can be hedged or failed over to a fallback provider (see hedging), and
+routed to a cheaper model of the same provider per interaction type
+(LLMProviderConfig.interaction_models, overridable per chain).
+
+Provider configs are validated at startup, but clients (and their provider
+SDKs) are only created when a provider is first used - off the event loop, as
+importing an SDK takes a while. The default provider is created at startup, as
+every session uses it and its failures are reported as startup warnings.
 """
 
-from typing import TYPE_CHECKING, Dict, List, Optional
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 from tarsy.config.settings import Settings
 from tarsy.integrations.llm.client import LLMClient
-from tarsy.models.llm_models import LLMProviderType
+from tarsy.integrations.llm.hedging import LLMRequestHedger
+from tarsy.integrations.llm.token_budget import ensure_token_budget
+from tarsy.models.llm_models import LLMProviderConfig, LLMProviderType
 from tarsy.models.mcp_selection_models import NativeToolsConfig
 from tarsy.models.parallel_metadata import ParallelExecutionMetadata
 from tarsy.models.unified_interactions import LLMConversation
@@ -32,18 +44,22 @@ class LLMManager:
     
     def __init__(self, settings: Settings):
         self.settings = settings
+        # Created clients (on first use) and validated configs of usable providers
         self.clients: Dict[str, LLMClient] = {}
+        self._provider_configs: Dict[str, LLMProviderConfig] = {}
+        self._clients_lock = threading.Lock()
         self._native_thinking_clients: Dict[str, 'GeminiNativeThinkingClient'] = {}
         self.failed_providers: Dict[str, str] = {}  # provider_name -> error_message
+        # Hedging / failover to settings.llm_fallback_provider
+        self.hedger = LLMRequestHedger(settings)
+        # Interaction-type routed clients: (provider_name, model) -> client
+        self._routed_clients: Dict[Tuple[str, str], LLMClient] = {}
         self._initialize_clients()
     
     def _initialize_clients(self):
-        """Initialize LLM clients using unified implementation."""
-        # Initialize each configured LLM provider
+        """Validate provider configs and create the default provider's client."""
+        # Validate each configured LLM provider
         for provider_name in self.settings.llm_providers.keys():
-            config = None
-            auth_provided = False
-            
             try:
                 config = self.settings.get_llm_config(provider_name)
                 
@@ -51,19 +67,42 @@ class LLMManager:
                     logger.warning(f"Skipping {provider_name}: Auth not fully configured")
                     continue  # Don't track as failure - this is expected
                 
-                auth_provided = True  # Mark that we have an API key or some other means of auth
+                self._provider_configs[provider_name] = config
                 
+            except Exception as e:
+                logger.error(f"Invalid configuration for LLM provider {provider_name}: {e}")
+        
+        if self.settings.llm_provider in self._provider_configs:
+            self._create_client(self.settings.llm_provider)
+        logger.info(
+            f"Validated {len(self._provider_configs)} LLM providers "
+            f"(others are initialized on first use): {list(self._provider_configs.keys())}"
+        )
+    
+    def _create_client(self, provider_name: str) -> Optional[LLMClient]:
+        """Create and cache a provider's client (once, also with concurrent callers)."""
+        with self._clients_lock:
+            client = self.clients.get(provider_name)
+            if client is not None:
+                return client
+            config = self._provider_configs.get(provider_name)
+            if config is None:
+                return None
+            
+            try:
                 # Use unified client for all providers
                 client = LLMClient(provider_name, config, self.settings)
-                self.clients[provider_name] = client
-                logger.info(f"Initialized LLM client: {provider_name}")
-                
             except Exception as e:
                 error_msg = str(e)
                 logger.error(f"Failed to initialize LLM client {provider_name}: {error_msg}")
-                # Track failure only if auth was provided (unexpected failure)
-                if auth_provided:
-                    self.failed_providers[provider_name] = error_msg
+                # Auth was provided, so this is an unexpected failure
+                self.failed_providers[provider_name] = error_msg
+                del self._provider_configs[provider_name]
+                return None
+            
+            self.clients[provider_name] = client
+            logger.info(f"Initialized LLM client: {provider_name}")
+            return client
     
     def get_failed_providers(self) -> Dict[str, str]:
         """
@@ -75,11 +114,31 @@ class LLMManager:
         return self.failed_providers.copy()
     
     def get_client(self, provider: str = None) -> Optional[LLMClient]:
-        """Get an LLM client by provider name."""
+        """Get an LLM client by provider name (created on first use)."""
         if not provider:
             provider = self.settings.llm_provider
         
-        return self.clients.get(provider)
+        client = self.clients.get(provider)
+        if client is None and provider in self._provider_configs:
+            client = self._create_client(provider)
+        return client
+    
+    async def _get_client_async(self, provider: Optional[str] = None) -> Optional[LLMClient]:
+        """get_client() for the event loop: a provider's first client is created in a worker thread."""
+        provider = provider or self.settings.llm_provider
+        client = self.clients.get(provider)
+        if client is None and provider in self._provider_configs:
+            # Imports the provider SDK, which must not block the event loop
+            client = await asyncio.to_thread(self._create_client, provider)
+        return client
+    
+    def _get_provider_config(self, provider: Optional[str] = None) -> Optional[LLMProviderConfig]:
+        """Config of a usable provider, without creating its client."""
+        provider = provider or self.settings.llm_provider
+        client = self.clients.get(provider)
+        if client is not None:
+            return client.config
+        return self._provider_configs.get(provider)
     
     def get_native_thinking_client(
         self, 
@@ -105,15 +164,15 @@ class LLMManager:
         if provider in self._native_thinking_clients:
             return self._native_thinking_clients[provider]
         
-        # Check if this is a Google provider
-        llm_client = self.clients.get(provider)
-        if not llm_client:
+        # Check if this is a Google provider (the LangChain client isn't needed)
+        config = self._get_provider_config(provider)
+        if not config:
             logger.warning(f"LLM provider '{provider}' not found for native thinking client")
             return None
         
-        if llm_client.config.type != LLMProviderType.GOOGLE:
+        if config.type != LLMProviderType.GOOGLE:
             logger.debug(
-                f"Provider '{provider}' is {llm_client.config.type.value}, "
+                f"Provider '{provider}' is {config.type.value}, "
                 "not Google/Gemini - cannot create native thinking client"
             )
             return None
@@ -121,7 +180,7 @@ class LLMManager:
         # Create and cache native thinking client
         try:
             native_client = GeminiNativeThinkingClient(
-                llm_client.config,
+                config,
                 provider_name=provider
             )
             self._native_thinking_clients[provider] = native_client
@@ -140,7 +199,9 @@ class LLMManager:
                               interaction_type: Optional[str] = None,
                               mcp_event_id: Optional[str] = None,
                               native_tools_override: Optional[NativeToolsConfig] = None,
-                              parallel_metadata: Optional['ParallelExecutionMetadata'] = None) -> LLMConversation:
+                              parallel_metadata: Optional['ParallelExecutionMetadata'] = None,
+                              model: Optional[str] = None,
+                              stop_sequences: Optional[Sequence[str]] = None) -> LLMConversation:
         """Generate a response using the specified or default LLM provider.
         
         Args:
@@ -153,14 +214,41 @@ class LLMManager:
                             If None, auto-detects based on response content.
             mcp_event_id: Optional MCP event ID if summarizing a tool result
             native_tools_override: Optional per-session native tools configuration override
+            model: Optional model override for this request (e.g. a chain's interaction_models entry).
+                   If None, the provider's interaction_models routing applies.
+            stop_sequences: Optional sequences that end the response (e.g. ReAct's "\nObservation:")
             
         Returns:
             Updated LLMConversation with new assistant message appended
+            
+        Raises:
+            TokenBudgetExceededError: If the session/agent token budget is used up
         """
-        client = self.get_client(provider)
+        # Checked before routing so a spent budget doesn't count as a provider failure
+        ensure_token_budget()
+        
+        client = await self._get_client_async(provider)
         if not client:
-            available = list(self.clients.keys())
+            available = self.list_available_providers()
             raise Exception(f"LLM provider not available. Available: {available}")
+        client = await self._route_client(client, interaction_type, model)
+
+        fallback = await self._get_fallback_client(client)
+        if fallback:
+            fallback = await self._route_client(fallback, interaction_type)
+            return await self.hedger.run(
+                client,
+                fallback,
+                conversation,
+                session_id=session_id,
+                stage_execution_id=stage_execution_id,
+                max_tokens=max_tokens,
+                interaction_type=interaction_type,
+                mcp_event_id=mcp_event_id,
+                native_tools_override=native_tools_override,
+                parallel_metadata=parallel_metadata,
+                stop_sequences=stop_sequences
+            )
 
         return await client.generate_response(
             conversation, 
@@ -170,22 +258,89 @@ class LLMManager:
             interaction_type, 
             mcp_event_id=mcp_event_id,
             native_tools_override=native_tools_override,
-            parallel_metadata=parallel_metadata
+            parallel_metadata=parallel_metadata,
+            stop_sequences=stop_sequences
         )
 
+    def _create_routed_client(self, client: LLMClient, model: str) -> Optional[LLMClient]:
+        """Create and cache a provider's client for a routed model (once, also with concurrent callers)."""
+        key = (client.provider_name, model)
+        with self._clients_lock:
+            routed = self._routed_clients.get(key)
+            if routed is not None:
+                return routed
+            
+            try:
+                routed_config = client.config.model_copy(update={"model": model, "interaction_models": None})
+                routed = LLMClient(client.provider_name, routed_config, self.settings)
+            except Exception as e:
+                logger.error(f"Failed to initialize {client.provider_name} client for model {model}: {e}")
+                return None
+            
+            self._routed_clients[key] = routed
+            logger.info(f"Initialized LLM client: {client.provider_name} ({model})")
+            return routed
+
+    async def _route_client(
+        self,
+        client: LLMClient,
+        interaction_type: Optional[str],
+        model: Optional[str] = None
+    ) -> LLMClient:
+        """
+        Get the client for the model routed to an interaction type.
+        
+        Routed clients share the provider's config (credentials, rate limits) with
+        only the model swapped, and are created on first use in a worker thread. The
+        provider's default client is used when no model is routed or the routed client
+        is unavailable.
+        """
+        if not model and interaction_type:
+            model = (client.config.interaction_models or {}).get(interaction_type)
+        if not model or model == client.model:
+            return client
+        
+        routed = self._routed_clients.get((client.provider_name, model))
+        if routed is None:
+            routed = await asyncio.to_thread(self._create_routed_client, client, model)
+            if routed is None:
+                return client
+        
+        if not routed.available:
+            logger.warning(
+                f"{client.provider_name} model {model} not available for {interaction_type} requests, "
+                f"using {client.model}"
+            )
+            return client
+        return routed
+
+    async def _get_fallback_client(self, client: LLMClient) -> Optional[LLMClient]:
+        """Get the available fallback provider client for a request, if hedging/failover applies."""
+        fallback_name = self.settings.llm_fallback_provider
+        if not fallback_name or fallback_name == client.provider_name:
+            return None
+        fallback = await self._get_client_async(fallback_name)
+        if not fallback or not fallback.available:
+            return None
+        return fallback
+
     def list_available_providers(self) -> List[str]:
-        """List available LLM providers."""
-        return list(self.clients.keys())
+        """List available LLM providers (created or not yet used)."""
+        return list(dict.fromkeys([*self.clients.keys(), *self._provider_configs.keys()]))
     
     def is_available(self) -> bool:
         """Check if any LLM provider is available."""
-        return len(self.clients) > 0 and any(client.available for client in self.clients.values())
+        return any(self.get_availability_status().values())
     
     def get_availability_status(self) -> Dict:
-        """Get detailed availability status for all providers."""
+        """
+        Get detailed availability status for all providers.
+        
+        Providers that are not used yet count as available (valid config and auth).
+        """
         return {
-            provider: client.available 
-            for provider, client in self.clients.items()
+            provider: self.clients[provider].available if provider in self.clients else True
+            for provider in self.list_available_providers()
         }
     
     def get_max_tool_result_tokens(self) -> int:
@@ -198,4 +353,10 @@ class LLMManager:
         default_limit = 150000  # Conservative limit that works for most providers
         logger.info(f"No LLM client available, using default tool result limit: {default_limit:,} tokens")
         return default_limit
-
+    
+    def get_context_window_tokens(self, provider: Optional[str] = None) -> Optional[int]:
+        """Return the configured context window of a provider's model (None if not configured)."""
+        config = self._get_provider_config(provider)
+        if config:
+            return config.context_window_tokens
+        return None
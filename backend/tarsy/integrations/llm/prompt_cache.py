@@ -0,0 +1,94 @@
+"""
+Provider-side prompt caching for the stable prefix of LLM conversations.
+
+Every ReAct iteration resends the same system message (instructions and tool
+catalog) and first user message (alert data, runbook, task), followed by the
+history of earlier iterations, which is also unchanged since the last call.
+
+Logic:
+- Anthropic (and Claude on Vertex AI) cache only up to explicit cache_control
+  breakpoints: the system message, the first user message and the last
+  message are marked, so the next iteration reuses everything up to its new
+  messages and parallel replicas of a stage share the system / alert prefix
+- OpenAI and Gemini cache repeated prompt prefixes automatically; nothing is
+  marked for them (Gemini explicit cached content would need a cache per
+  prompt with its own lifecycle and storage cost)
+- Prompts shorter than the provider's minimum cacheable length are simply not
+  cached; breakpoints on them are harmless
+- Cache-hit tokens reported by the provider are stored as cached_input_tokens
+  on the LLM interaction (they are part of input_tokens)
+"""
+
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from tarsy.models.llm_models import LLMProviderType
+
+# Anthropic's cache type (5 minute TTL, refreshed on every hit)
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Provider types that need explicit cache breakpoints in messages
+CACHE_BREAKPOINT_PROVIDERS = frozenset({LLMProviderType.ANTHROPIC, LLMProviderType.VERTEXAI})
+
+
+def uses_cache_breakpoints(provider_type: LLMProviderType) -> bool:
+    """Whether prompt caching for a provider type needs cache_control breakpoints."""
+    return provider_type in CACHE_BREAKPOINT_PROVIDERS
+
+
+def _with_cache_breakpoint(message: BaseMessage) -> BaseMessage:
+    """Copy of a message whose last content block carries a cache breakpoint."""
+    content = message.content
+    if isinstance(content, str):
+        if not content:
+            return message  # Empty text blocks can't carry a breakpoint
+        blocks: List[Any] = [{"type": "text", "text": content}]
+    else:
+        blocks = list(content)
+    if not blocks or not isinstance(blocks[-1], dict):
+        return message
+    blocks[-1] = {**blocks[-1], "cache_control": CACHE_CONTROL}
+    return message.model_copy(update={"content": blocks})
+
+
+def apply_cache_breakpoints(messages: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    Mark the stable prefix of a conversation for caching (at most 3 breakpoints).
+
+    Args:
+        messages: LangChain messages of the request
+
+    Returns:
+        Messages with cache_control on the system message, the first user
+        message and the last message (the input list is not modified)
+    """
+    marked = set()
+    first_system = next((i for i, m in enumerate(messages) if isinstance(m, SystemMessage)), None)
+    first_user = next((i for i, m in enumerate(messages) if isinstance(m, HumanMessage)), None)
+    for index in (first_system, first_user, len(messages) - 1):
+        if index is not None and index >= 0:
+            marked.add(index)
+    return [_with_cache_breakpoint(m) if i in marked else m for i, m in enumerate(messages)]
+
+
+def get_cached_input_tokens(usage_metadata: Optional[Dict[str, Any]]) -> Optional[int]:
+    """
+    Input tokens served from the provider's prompt cache.
+
+    Args:
+        usage_metadata: LangChain usage metadata (input_token_details.cache_read)
+
+    Returns:
+        Cache-hit token count, or None if none were reported
+    """
+    if not isinstance(usage_metadata, dict):
+        return None
+    details = usage_metadata.get("input_token_details")
+    if not isinstance(details, dict):
+        return None
+    try:
+        cache_read = int(details.get("cache_read") or 0)
+    except (TypeError, ValueError):
+        return None
+    return cache_read if cache_read > 0 else None
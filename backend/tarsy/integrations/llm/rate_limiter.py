@@ -0,0 +1,338 @@
+"""
+Per-provider LLM rate limiting shared by all sessions on a pod.
+
+Without coordination every session retries provider 429s on its own, so a
+burst of alerts turns into a burst of rejected calls and exponential backoff.
+
+Logic:
+- Providers with requests_per_minute / tokens_per_minute in llm_providers.yaml
+  get one ProviderRateLimiter per process, shared by all LLMClients
+- Local token buckets (refilled continuously) pace calls within the pod
+- Waiting calls are served by priority, then in arrival order: sessions
+  further along their chain go first, and concluding calls (final analysis,
+  forced conclusion, executive summary) get an extra boost, so nearly finished
+  sessions are not starved by new alerts
+- With the shared budget enabled, every call also reserves a request and its
+  estimated tokens in the current one-minute window of the llm_rate_budgets
+  table, so all pods together stay under the provider limits; when the window
+  is full the call waits for the next one
+- Database problems fall back to local-only limiting (logged once)
+- Token estimates (prompt characters / 4 + max_tokens) are corrected with the
+  actual usage after the call; provider 429s pause the limiter for the
+  provider's retry delay
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tarsy.models.constants import LLMInteractionType
+from tarsy.models.llm_models import LLMProviderConfig
+from tarsy.models.unified_interactions import LLMConversation
+from tarsy.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Length of a shared budget window (seconds)
+WINDOW_SECONDS = 60
+
+# Completion tokens assumed when a request has no max_tokens
+DEFAULT_COMPLETION_TOKENS = 1000
+
+# Rough characters per token for prompt estimates
+CHARS_PER_TOKEN = 4
+
+# Interaction types that conclude a stage and get a priority boost
+_CONCLUDING_INTERACTIONS = frozenset({
+    LLMInteractionType.FINAL_ANALYSIS.value,
+    LLMInteractionType.FORCED_CONCLUSION.value,
+    LLMInteractionType.FINAL_ANALYSIS_SUMMARY.value,
+})
+
+# Progress of the current session through its chain (0.0 - 1.0)
+_llm_priority: ContextVar[float] = ContextVar("llm_priority", default=0.0)
+
+
+def set_llm_priority(progress: float) -> None:
+    """
+    Set the rate limiting priority for LLM calls of the current task.
+
+    Args:
+        progress: Fraction of the chain already completed (0.0 - 1.0)
+    """
+    _llm_priority.set(progress)
+
+
+def request_priority(interaction_type: Optional[str]) -> float:
+    """Priority of an LLM call in the current task (higher goes first)."""
+    priority = _llm_priority.get()
+    if interaction_type in _CONCLUDING_INTERACTIONS:
+        priority += 1.0
+    return priority
+
+
+def estimate_request_tokens(conversation: LLMConversation, max_tokens: Optional[int] = None) -> int:
+    """
+    Estimate the tokens an LLM call will use.
+
+    Args:
+        conversation: Conversation sent to the provider
+        max_tokens: Completion limit of the request, if any
+
+    Returns:
+        Estimated prompt plus completion tokens
+    """
+    prompt_chars = sum(len(message.content) for message in conversation.messages)
+    return prompt_chars // CHARS_PER_TOKEN + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class TokenBucket:
+    """Continuously refilled bucket holding up to one minute of capacity."""
+
+    def __init__(self, rate_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(rate_per_minute)
+        self.rate_per_second = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """
+        Seconds until amount can be consumed.
+
+        Amounts above the capacity only wait for a full bucket; consuming them
+        leaves the bucket in debt, which delays the calls after them.
+        """
+        self._refill()
+        needed = min(amount, self.capacity)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.rate_per_second
+
+    def consume(self, amount: float) -> None:
+        """Take amount from the bucket (negative amounts give it back)."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class RateLimitGrant:
+    """Permission for one LLM call; settle() corrects the token estimate afterwards."""
+
+    def __init__(self, limiter: "ProviderRateLimiter", estimated_tokens: int, window_start: Optional[int]):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        # Shared budget window of the reservation (None = local-only)
+        self.window_start = window_start
+        self._settled = False
+
+    async def settle(self, actual_tokens: Optional[int]) -> None:
+        """
+        Replace the estimate with the tokens the call actually used.
+
+        Args:
+            actual_tokens: Total tokens reported by the provider (ignored if unknown)
+        """
+        if self._settled or not isinstance(actual_tokens, int) or isinstance(actual_tokens, bool):
+            return
+        self._settled = True
+        await self.limiter._settle(self.window_start, actual_tokens - self.estimated_tokens)
+
+
+class ProviderRateLimiter:
+    """Priority-ordered rate limiter for one LLM provider."""
+
+    def __init__(
+        self,
+        provider_name: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        shared: bool = True,
+    ):
+        self.provider_name = provider_name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.shared = shared
+        self._request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._condition = asyncio.Condition()
+        self._waiters: List[Tuple[float, int]] = []
+        self._sequence = itertools.count()
+        self._serving = False
+        self._blocked_until = 0.0
+        self._shared_warning_logged = False
+
+    async def acquire(self, estimated_tokens: int, priority: float = 0.0) -> RateLimitGrant:
+        """
+        Wait until the provider budget allows another call.
+
+        Args:
+            estimated_tokens: Estimated tokens of the call
+            priority: Higher priorities are served first
+
+        Returns:
+            Grant to settle with the actual token usage
+        """
+        ticket = (-priority, next(self._sequence))
+        async with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                await self._condition.wait_for(lambda: not self._serving and self._waiters[0] == ticket)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiters)
+            self._serving = True
+
+        # One caller at a time waits for budget so priority order is kept
+        try:
+            window_start = await self._wait_for_budget(estimated_tokens)
+        finally:
+            async with self._condition:
+                self._serving = False
+                self._condition.notify_all()
+        return RateLimitGrant(self, estimated_tokens, window_start)
+
+    def penalize(self, retry_after_seconds: float) -> None:
+        """
+        Hold all calls after the provider rejected one for rate limiting.
+
+        Args:
+            retry_after_seconds: Retry delay requested by the provider
+        """
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after_seconds)
+        logger.info(f"Rate limiter for {self.provider_name} paused for {retry_after_seconds}s after provider rate limit")
+
+    def _local_wait_time(self, estimated_tokens: int) -> float:
+        wait = self._blocked_until - time.monotonic()
+        if self._request_bucket:
+            wait = max(wait, self._request_bucket.wait_time(1))
+        if self._token_bucket:
+            wait = max(wait, self._token_bucket.wait_time(estimated_tokens))
+        return wait
+
+    async def _wait_for_budget(self, estimated_tokens: int) -> Optional[int]:
+        """Wait for local and shared budget; returns the shared window used, if any."""
+        while True:
+            wait = self._local_wait_time(estimated_tokens)
+            if wait > 0:
+                logger.debug(f"Rate limiter for {self.provider_name} waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+                continue
+
+            window_start = int(time.time()) // WINDOW_SECONDS * WINDOW_SECONDS
+            reserved = await self._reserve_shared(window_start, estimated_tokens)
+            if reserved is False:
+                # Other pods used up this window
+                wait = max(window_start + WINDOW_SECONDS - time.time(), 0.05)
+                logger.debug(f"Shared budget of {self.provider_name} exhausted, waiting {wait:.2f}s for next window")
+                await asyncio.sleep(wait)
+                continue
+
+            if self._request_bucket:
+                self._request_bucket.consume(1)
+            if self._token_bucket:
+                self._token_bucket.consume(estimated_tokens)
+            return window_start if reserved else None
+
+    async def _reserve_shared(self, window_start: int, estimated_tokens: int) -> Optional[bool]:
+        """Reserve in the shared window; None means the shared budget is not used."""
+        if not (self.shared and _sharing_enabled):
+            return None
+        try:
+            from tarsy.database.init_db import get_async_session_factory
+            from tarsy.repositories.llm_rate_budget_repository import (
+                LLMRateBudgetRepository,
+            )
+
+            async_session_factory = get_async_session_factory()
+            async with async_session_factory() as session:
+                return await LLMRateBudgetRepository(session).reserve(
+                    self.provider_name,
+                    window_start,
+                    estimated_tokens,
+                    self.requests_per_minute,
+                    self.tokens_per_minute,
+                )
+        except RuntimeError as e:
+            # Async database not initialized - this process can only limit locally
+            self.shared = False
+            logger.warning(f"Shared LLM rate budget unavailable for {self.provider_name}, limiting per pod only: {e}")
+            return None
+        except Exception as e:
+            if not self._shared_warning_logged:
+                logger.warning(f"Failed to reserve shared LLM rate budget for {self.provider_name}, limiting per pod only: {e}")
+                self._shared_warning_logged = True
+            return None
+
+    async def _settle(self, window_start: Optional[int], delta: int) -> None:
+        if delta == 0:
+            return
+        if self._token_bucket:
+            self._token_bucket.consume(delta)
+        if window_start is None:
+            return
+        try:
+            from tarsy.database.init_db import get_async_session_factory
+            from tarsy.repositories.llm_rate_budget_repository import (
+                LLMRateBudgetRepository,
+            )
+
+            async_session_factory = get_async_session_factory()
+            async with async_session_factory() as session:
+                await LLMRateBudgetRepository(session).adjust_tokens(self.provider_name, window_start, delta)
+        except Exception as e:
+            logger.debug(f"Failed to settle shared LLM rate budget for {self.provider_name}: {e}")
+
+
+# Process-wide limiters by provider name
+_rate_limiters: Dict[str, ProviderRateLimiter] = {}
+_sharing_enabled = True
+
+
+def configure_rate_limit_sharing(enabled: bool) -> None:
+    """
+    Enable or disable the database-backed budget shared across pods.
+
+    Args:
+        enabled: Whether limiters reserve provider budget in llm_rate_budgets
+    """
+    global _sharing_enabled
+    _sharing_enabled = enabled
+
+
+def get_rate_limiter(provider_name: str, config: LLMProviderConfig) -> Optional[ProviderRateLimiter]:
+    """
+    Get the process-wide rate limiter of a provider.
+
+    Args:
+        provider_name: LLM provider name (shared budget key)
+        config: Provider configuration with the rate limits
+
+    Returns:
+        Rate limiter, or None if the provider has no limits configured
+    """
+    if config.requests_per_minute is None and config.tokens_per_minute is None:
+        return None
+    limiter = _rate_limiters.get(provider_name)
+    if (
+        limiter is None
+        or limiter.requests_per_minute != config.requests_per_minute
+        or limiter.tokens_per_minute != config.tokens_per_minute
+    ):
+        limiter = ProviderRateLimiter(
+            provider_name,
+            requests_per_minute=config.requests_per_minute,
+            tokens_per_minute=config.tokens_per_minute,
+        )
+        _rate_limiters[provider_name] = limiter
+    return limiter
@@ -0,0 +1,243 @@
+"""
+Incremental parser for streamed ReAct responses.
+
+LLMClient used to append every token to one string and re-scan the whole
+response for "Thought:", "Action:" and "Final Answer:" on each chunk, which is
+quadratic in the response length.
+
+Logic:
+- Tokens are kept in a list and joined only when text is needed; the text of
+  the section being streamed is cached and extended by the new tokens only
+- Markers are searched only in the new token plus the few characters before
+  it that a marker could straddle, and only the markers the current state
+  cares about; their positions are remembered
+- States: waiting for "Thought:" -> streaming the thought -> either streaming
+  the final answer ("Final Answer:") or done ("Action:")
+- "Final Answer:" before any "Thought:" disables ReAct streaming for the response
+- Summarization responses are plain text and streamed as a whole
+- Stop sequences (ReAct: the "Observation:" the model would hallucinate after
+  Action Input) end the response: the text from the stop sequence on is dropped
+  and `stopped` tells the client to cancel the rest of the stream, for
+  providers that don't support stop sequences themselves
+- feed() / finish() return the updates to publish, already throttled to the
+  stream's chunk size (full section text - the publisher turns it into deltas)
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Sequence
+
+from tarsy.models.constants import StreamingEventType
+
+THOUGHT_MARKER = "Thought:"
+ACTION_MARKER = "Action:"
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+# Tokens between streaming updates
+THOUGHT_CHUNK_SIZE = 1  # Faster streaming for plain text thoughts
+FINAL_ANSWER_CHUNK_SIZE = 3  # Reduced but still stable for markdown
+SUMMARIZATION_CHUNK_SIZE = 1  # Faster streaming for plain text summaries
+
+# Characters of already seen text a marker split across tokens can start in
+_MARKER_OVERLAP = max(len(THOUGHT_MARKER), len(ACTION_MARKER), len(FINAL_ANSWER_MARKER)) - 1
+
+
+class _ParserState(Enum):
+    WAITING = "waiting"
+    THOUGHT = "thought"
+    FINAL_ANSWER = "final_answer"
+    SUMMARIZATION = "summarization"
+    DONE = "done"
+
+
+# States that look for markers, and the stream published in each streaming state
+_SEARCHING_STATES = (_ParserState.WAITING, _ParserState.THOUGHT)
+_STREAM_TYPES = {
+    _ParserState.THOUGHT: StreamingEventType.THOUGHT,
+    _ParserState.FINAL_ANSWER: StreamingEventType.FINAL_ANSWER,
+    _ParserState.SUMMARIZATION: StreamingEventType.SUMMARIZATION,
+}
+
+
+@dataclass
+class StreamUpdate:
+    """One streaming update to publish."""
+    stream_type: StreamingEventType
+    content: str
+    is_complete: bool
+
+
+class ReActStreamParser:
+    """
+    Tracks a streamed LLM response in time linear in its length.
+
+    Feed it every extracted token (empty ones included - they count towards
+    the chunk size like any other chunk) and publish the returned updates.
+    """
+
+    def __init__(self, summarization: bool = False, stop_sequences: Sequence[str] = ()) -> None:
+        self._parts: List[str] = []
+        self._length = 0
+        self._tail = ""
+        self._state = _ParserState.SUMMARIZATION if summarization else _ParserState.WAITING
+        self._section_start = 0
+        # Text of the streamed section (leading whitespace stripped) and tokens not yet in it
+        self._section_text = ""
+        self._section_parts: List[str] = []
+        self._tokens_since_update = 0
+        self._stop_sequences = tuple(stop for stop in stop_sequences if stop)
+        self._stop_overlap = max((len(stop) for stop in self._stop_sequences), default=1) - 1
+        self._stop_tail = ""
+        # Set once a stop sequence was received - the rest of the response is not needed
+        self.stopped = False
+
+    @property
+    def content(self) -> str:
+        """Full response text received so far."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    @property
+    def stream_type(self) -> Optional[StreamingEventType]:
+        """Stream currently being published, if any."""
+        return _STREAM_TYPES.get(self._state)
+
+    def feed(self, token: str) -> List[StreamUpdate]:
+        """
+        Add the next token of the response.
+
+        Returns:
+            Updates to publish (usually none or one)
+        """
+        updates: List[StreamUpdate] = []
+        if self.stopped:
+            return updates
+        if token and self._stop_sequences:
+            token = self._cut_at_stop_sequence(token)
+        if token:
+            self._parts.append(token)
+            if self._state in _STREAM_TYPES:
+                self._section_parts.append(token)
+            if self._state in _SEARCHING_STATES:
+                window_start = self._length - len(self._tail)
+                window = self._tail + token
+                self._tail = window[-_MARKER_OVERLAP:]
+                self._length += len(token)
+                if self._advance(window, window_start, updates):
+                    # A section ended with this token - it isn't counted towards the next one
+                    self._tokens_since_update = 0
+                    return updates
+
+        stream_type = self.stream_type
+        if stream_type is None:
+            return updates
+        self._tokens_since_update += 1
+        if self._tokens_since_update >= self._chunk_size():
+            self._tokens_since_update = 0
+            content = self._current_section_text()
+            if content:
+                updates.append(StreamUpdate(stream_type, content, is_complete=False))
+        return updates
+
+    def finish(self) -> List[StreamUpdate]:
+        """
+        Complete the stream still being published once the response ended.
+
+        Returns:
+            The final update (an empty completion marker if the section is empty)
+        """
+        stream_type = self.stream_type
+        if stream_type is None:
+            return []
+        self._state = _ParserState.DONE
+        return [StreamUpdate(stream_type, self.content[self._section_start:].strip(), is_complete=True)]
+
+    def _advance(self, window: str, window_start: int, updates: List[StreamUpdate]) -> bool:
+        """Apply markers found in the new text; returns True if a thought ended."""
+        if self._state == _ParserState.WAITING:
+            thought = self._find(window, window_start, THOUGHT_MARKER, 0)
+            final_answer = self._find(window, window_start, FINAL_ANSWER_MARKER, 0)
+            if final_answer is not None and (thought is None or final_answer < thought):
+                self._state = _ParserState.DONE
+                return False
+            if thought is None:
+                return False
+            self._state = _ParserState.THOUGHT
+            self._start_section(thought + len(THOUGHT_MARKER))
+
+        if self._state != _ParserState.THOUGHT:
+            return False
+
+        action = self._find(window, window_start, ACTION_MARKER, self._section_start)
+        final_answer = self._find(window, window_start, FINAL_ANSWER_MARKER, self._section_start)
+        if action is None and final_answer is None:
+            return False
+
+        stop = min(index for index in (action, final_answer) if index is not None)
+        updates.append(StreamUpdate(
+            StreamingEventType.THOUGHT,
+            self.content[self._section_start:stop].strip(),
+            is_complete=True,
+        ))
+        if stop == final_answer:
+            self._state = _ParserState.FINAL_ANSWER
+            self._start_section(final_answer + len(FINAL_ANSWER_MARKER))
+        else:
+            self._state = _ParserState.DONE
+        return True
+
+    def _cut_at_stop_sequence(self, token: str) -> str:
+        """Part of the token before a stop sequence (all of it if there is none)."""
+        window = self._stop_tail + token
+        positions = [index for index in (window.find(stop) for stop in self._stop_sequences) if index >= 0]
+        if not positions:
+            self._stop_tail = window[-self._stop_overlap:] if self._stop_overlap else ""
+            return token
+        self.stopped = True
+        cut = min(positions) - len(self._stop_tail)
+        if cut >= 0:
+            return token[:cut]
+        # The stop sequence started in text already received
+        self._truncate(len(self.content) + cut)
+        return ""
+
+    def _truncate(self, length: int) -> None:
+        """Drop received text from position length on."""
+        self._parts = [self.content[:length]]
+        if self._state in _SEARCHING_STATES:
+            self._length = length
+            self._tail = self._parts[0][-_MARKER_OVERLAP:]
+        if self._state in _STREAM_TYPES:
+            self._section_text = ""
+            self._section_parts = [self._parts[0][self._section_start:]]
+
+    @staticmethod
+    def _find(window: str, window_start: int, marker: str, not_before: int) -> Optional[int]:
+        """Position of a marker in the response at or after not_before, within the new text."""
+        index = window.find(marker, max(0, not_before - window_start))
+        return None if index < 0 else window_start + index
+
+    def _chunk_size(self) -> int:
+        if self._state == _ParserState.THOUGHT:
+            return THOUGHT_CHUNK_SIZE
+        if self._state == _ParserState.FINAL_ANSWER:
+            return FINAL_ANSWER_CHUNK_SIZE
+        return SUMMARIZATION_CHUNK_SIZE
+
+    def _start_section(self, start: int) -> None:
+        """Start streaming the response text from position start."""
+        self._section_start = start
+        self._section_text = ""
+        self._section_parts = [self.content[start:]]
+        self._tokens_since_update = 0
+
+    def _current_section_text(self) -> str:
+        """Text of the section being streamed, as published while in progress."""
+        if self._section_parts:
+            new_text = "".join(self._section_parts)
+            self._section_parts = []
+            self._section_text = self._section_text + new_text if self._section_text else new_text.lstrip()
+        if self._state == _ParserState.SUMMARIZATION:
+            return self._section_text.rstrip()
+        return self._section_text
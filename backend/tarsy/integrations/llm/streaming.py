@@ -3,9 +3,26 @@ Streaming utilities for LLM responses.
 
 This module provides shared streaming functionality used by both LangChain-based
 and native Google SDK clients for publishing LLM response chunks to WebSockets.
+
+Callers always pass the full accumulated text of a stream; the publisher turns it
+into an append-only delta protocol so each event stays small regardless of how
+long the response grows.
+
+Logic:
+- Each stream (session, stage execution, stream type, LLM interaction / MCP event)
+  has a sequence number starting at 1
+- A delta carries the text to splice in at ``offset``: clients keep
+  ``content[:offset]`` and append ``chunk`` (usually offset == current length)
+- The first event of a stream and every Nth event (llm_streaming_snapshot_interval)
+  are snapshots carrying the full text, so late joiners and clients that missed a
+  delta can resynchronize
+- Clients ignore events with a sequence number they've already applied, and
+  deltas whose offset is beyond their current text (gap - wait for a snapshot)
 """
 
-from typing import TYPE_CHECKING, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from tarsy.models.constants import StreamingEventType
 from tarsy.models.parallel_metadata import ParallelExecutionMetadata
@@ -16,6 +33,37 @@ if TYPE_CHECKING:
 
 logger = get_module_logger(__name__)
 
+# Snapshot every N events when settings don't specify an interval
+DEFAULT_SNAPSHOT_INTERVAL = 50
+
+# Upper bound on tracked streams (streams that never complete are evicted oldest-first)
+MAX_TRACKED_STREAMS = 512
+
+StreamKey = Tuple[str, Optional[str], str, Optional[str], Optional[str]]
+
+
+@dataclass
+class _StreamState:
+    """Last published text and sequence number of one stream."""
+    text: str = ""
+    sequence: int = 0
+
+
+def common_prefix_length(a: str, b: str) -> int:
+    """Length of the longest common prefix of two strings."""
+    n = min(len(a), len(b))
+    if a[:n] == b[:n]:
+        return n
+    # Binary search on slice comparisons (C-speed) instead of a per-char loop
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
 
 class StreamingPublisher:
     """
@@ -29,6 +77,7 @@ class StreamingPublisher:
     - Warns about SQLite limitations (requires PostgreSQL for real-time)
     - Logs warning only once per instance to avoid spam
     - Gracefully handles publishing failures without breaking LLM calls
+    - Publishes sequence-numbered deltas with periodic snapshots (see module docstring)
     """
     
     def __init__(self, settings: Optional['Settings'] = None):
@@ -41,6 +90,46 @@ class StreamingPublisher:
         """
         self.settings = settings
         self._sqlite_warning_logged = False
+        self._streams: "OrderedDict[StreamKey, _StreamState]" = OrderedDict()
+    
+    @property
+    def snapshot_interval(self) -> int:
+        """Number of events between full snapshots of a stream."""
+        interval = getattr(self.settings, 'llm_streaming_snapshot_interval', None)
+        return interval if isinstance(interval, int) and interval > 0 else DEFAULT_SNAPSHOT_INTERVAL
+    
+    def _next_update(
+        self, key: StreamKey, text: str, is_complete: bool
+    ) -> Optional[Tuple[int, int, str, bool]]:
+        """
+        Compute the next event for a stream from its full accumulated text.
+        
+        Returns:
+            (sequence, offset, chunk, is_snapshot), or None if nothing changed
+        """
+        state = self._streams.pop(key, None) or _StreamState()
+        offset = common_prefix_length(state.text, text)
+        
+        if state.sequence > 0 and offset == len(state.text) == len(text) and not is_complete:
+            # No new content - keep tracking without publishing
+            self._streams[key] = state
+            return None
+        
+        state.sequence += 1
+        is_snapshot = state.sequence == 1 or state.sequence % self.snapshot_interval == 0
+        update = (
+            state.sequence,
+            0 if is_snapshot else offset,
+            text if is_snapshot else text[offset:],
+            is_snapshot,
+        )
+        state.text = text
+        
+        if not is_complete:
+            self._streams[key] = state
+            while len(self._streams) > MAX_TRACKED_STREAMS:
+                self._streams.popitem(last=False)
+        return update
     
     async def publish_chunk(
         self,
@@ -61,7 +150,7 @@ class StreamingPublisher:
             stage_execution_id: Stage execution identifier for tracking (child ID for parallel stages)
             stream_type: Type of streaming content (THOUGHT, FINAL_ANSWER, 
                         NATIVE_THINKING, SUMMARIZATION)
-            chunk: Content chunk (accumulated tokens)
+            chunk: Full accumulated content of the stream so far (published as a delta)
             is_complete: Whether this is the final chunk
             mcp_event_id: Optional MCP event ID (for summarizations)
             llm_interaction_id: LLM interaction ID for deduplication
@@ -72,6 +161,12 @@ class StreamingPublisher:
             # Streaming disabled by config - return early without warning (expected behavior)
             return
         
+        stream_key: StreamKey = (session_id, stage_execution_id, stream_type.value, llm_interaction_id, mcp_event_id)
+        update = self._next_update(stream_key, chunk, is_complete)
+        if update is None:
+            return
+        sequence, offset, delta, is_snapshot = update
+        
         try:
             from tarsy.database.init_db import get_async_session_factory
             from tarsy.models.event_models import LLMStreamChunkEvent
@@ -97,7 +192,10 @@ class StreamingPublisher:
                 event = LLMStreamChunkEvent(
                     session_id=session_id,
                     stage_execution_id=stage_execution_id,
-                    chunk=chunk,
+                    chunk=delta,
+                    sequence=sequence,
+                    offset=offset,
+                    is_snapshot=is_snapshot,
                     stream_type=stream_type.value,
                     is_complete=is_complete,
                     mcp_event_id=mcp_event_id,
@@ -116,8 +214,8 @@ class StreamingPublisher:
                 )
                 
                 logger.debug(
-                    f"Published streaming chunk ({stream_type.value}, "
-                    f"complete={is_complete}, mcp_event={mcp_event_id}, "
+                    f"Published streaming chunk ({stream_type.value}, seq={sequence}, "
+                    f"snapshot={is_snapshot}, complete={is_complete}, mcp_event={mcp_event_id}, "
                     f"llm_interaction={llm_interaction_id}) for {session_id}"
                 )
                 
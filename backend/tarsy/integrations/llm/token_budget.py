@@ -0,0 +1,132 @@
+"""
+Token budgets for sessions and agents.
+
+Without a budget a session keeps investigating (and spending tokens) until it
+hits max_iterations, however long its conversation has grown.
+
+Logic:
+- Session budget: the chain's token_budget, else settings.session_token_budget;
+  covers every stage of the chain (seeded with the session's tokens so far
+  when a paused session resumes), but not the executive summary
+- Agent budget: the agent's token_budget from agents.yaml; covers one stage
+- Budgets are active for the current task (ContextVar), so parallel agents
+  share the session budget and each has its own agent budget
+- Every LLM call adds its actual total tokens (as stored by the clients'
+  usage metadata) to all active budgets
+- Nearly used up (token_budget_conclusion_threshold): iteration controllers
+  stop investigating and force a conclusion with the data gathered so far
+- Used up: the next LLM call raises TokenBudgetExceededError (hard stop)
+- The tightest active budget is included in session progress events
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from tarsy.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+
+class TokenBudgetExceededError(Exception):
+    """Raised when an LLM call is attempted after a token budget has been used up."""
+
+    def __init__(self, budget: "TokenBudget"):
+        super().__init__(
+            f"Token budget exceeded: {budget.scope} budget of {budget.limit:,} tokens "
+            f"used up ({budget.used:,} tokens)"
+        )
+        self.budget = budget
+
+
+@dataclass
+class TokenBudget:
+    """Token limit and usage of one scope (session or agent)."""
+
+    scope: str
+    limit: int
+    used: int = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(self.limit - self.used, 0)
+
+    @property
+    def exceeded(self) -> bool:
+        return self.used >= self.limit
+
+    def nearly_exhausted(self, threshold: float) -> bool:
+        """Whether at least `threshold` (fraction) of the budget is used."""
+        return self.used >= self.limit * threshold
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scope": self.scope,
+            "limit": self.limit,
+            "used": self.used,
+            "remaining": self.remaining,
+        }
+
+
+# Budgets covering LLM calls of the current task (outermost first)
+_active_budgets: ContextVar[Tuple[TokenBudget, ...]] = ContextVar("active_token_budgets", default=())
+
+
+@contextmanager
+def token_budget_scope(budget: Optional[TokenBudget]) -> Iterator[Optional[TokenBudget]]:
+    """
+    Track LLM token usage of the current task against a budget.
+
+    Args:
+        budget: Budget to activate, or None (no budget, nothing to track)
+    """
+    if budget is None:
+        yield None
+        return
+    token = _active_budgets.set(_active_budgets.get() + (budget,))
+    try:
+        yield budget
+    finally:
+        _active_budgets.reset(token)
+
+
+def record_token_usage(tokens: Optional[int]) -> None:
+    """Add the total tokens of a completed LLM call to all active budgets."""
+    if not tokens:
+        return
+    for budget in _active_budgets.get():
+        budget.used += tokens
+        if budget.exceeded:
+            logger.warning(
+                f"{budget.scope.capitalize()} token budget used up: "
+                f"{budget.used:,}/{budget.limit:,} tokens"
+            )
+
+
+def ensure_token_budget() -> None:
+    """
+    Check that no active budget is used up before an LLM call.
+
+    Raises:
+        TokenBudgetExceededError: If an active budget is used up
+    """
+    for budget in _active_budgets.get():
+        if budget.exceeded:
+            raise TokenBudgetExceededError(budget)
+
+
+def get_exhausting_token_budget(threshold: float) -> Optional[TokenBudget]:
+    """Active budget with at least `threshold` (fraction) used, if any."""
+    for budget in _active_budgets.get():
+        if budget.nearly_exhausted(threshold):
+            return budget
+    return None
+
+
+def get_tightest_token_budget() -> Optional[TokenBudget]:
+    """Active budget with the fewest remaining tokens, if any."""
+    budgets = _active_budgets.get()
+    if not budgets:
+        return None
+    return min(budgets, key=lambda budget: budget.remaining)
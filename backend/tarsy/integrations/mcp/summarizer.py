@@ -24,15 +24,25 @@ logger = get_module_logger(__name__)
 class MCPResultSummarizer:
     """Agent-provided MCP result summarizer using LLM client with stage context awareness."""
     
-    def __init__(self, llm_client: 'LLMClient', prompt_builder: 'PromptBuilder'):
+    def __init__(
+        self,
+        llm_client: 'LLMClient',
+        prompt_builder: 'PromptBuilder',
+        provider: Optional[str] = None,
+        model: Optional[str] = None
+    ):
         """Initialize summarizer with LLM client and prompt builder.
         
         Args:
             llm_client: The LLM client to use for summarization
             prompt_builder: Prompt builder for creating summarization prompts
+            provider: Optional LLM provider of the agent (None = global default provider)
+            model: Optional summarization model override (None = provider's interaction routing)
         """
         self.llm_client = llm_client
         self.prompt_builder = prompt_builder
+        self.provider = provider
+        self.model = model
     
     async def summarize_result(
         self,
@@ -99,7 +109,9 @@ class MCPResultSummarizer:
                 summarization_conversation, session_id, stage_execution_id,
                 max_tokens=max_summary_tokens,
                 interaction_type=LLMInteractionType.SUMMARIZATION.value,
-                mcp_event_id=mcp_event_id
+                mcp_event_id=mcp_event_id,
+                provider=self.provider,
+                model=self.model
             )
             
             # Extract summary from response
@@ -58,7 +58,8 @@ class ExecutiveSummaryAgent:
         session_id: str,
         stage_execution_id: Optional[str] = None,
         max_tokens: int = 150,
-        provider: Optional[str] = None
+        provider: Optional[str] = None,
+        model: Optional[str] = None
     ) -> ExecutiveSummaryResult:
         """
         Generate a concise executive summary of the content.
@@ -72,6 +73,7 @@ class ExecutiveSummaryAgent:
             stage_execution_id: Optional stage execution ID (typically None for post-chain)
             max_tokens: Maximum tokens for executive summary (default: 150)
             provider: Optional LLM provider name (uses chain's provider or global default)
+            model: Optional model override (uses the provider's interaction_models routing if not set)
             
         Returns:
             ExecutiveSummaryResult with summary string or error message
@@ -111,7 +113,8 @@ class ExecutiveSummaryAgent:
                         stage_execution_id=stage_execution_id,
                         provider=provider,
                         max_tokens=max_tokens,
-                        interaction_type=LLMInteractionType.FINAL_ANALYSIS_SUMMARY.value
+                        interaction_type=LLMInteractionType.FINAL_ANALYSIS_SUMMARY.value,
+                        model=model
                     ),
                     timeout=self.settings.llm_iteration_timeout
                 )
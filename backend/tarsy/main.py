@@ -23,7 +23,7 @@ from tarsy.controllers.alert_controller import router as alert_router
 from tarsy.models.constants import AlertSessionStatus
 from tarsy.controllers.chat_controller import router as chat_router
 from tarsy.controllers.history_controller import router as history_router
-from tarsy.controllers.websocket_controller import websocket_router
+from tarsy.controllers.websocket_controller import connection_manager, websocket_router
 from tarsy.database.init_db import (
     dispose_async_database,
     get_async_session_factory,
@@ -31,6 +31,12 @@ from tarsy.database.init_db import (
     initialize_async_database,
     initialize_database,
 )
+from tarsy.database.pool_manager import (
+    dispose_pool_manager,
+    get_pool_manager,
+    initialize_pool_manager,
+)
+from tarsy.integrations.llm.http_pool import close_llm_http_pool, get_llm_http_pool
 from tarsy.models.processing_context import ChainContext
 from tarsy.services.alert_service import AlertService
 from tarsy.utils.logger import get_module_logger, setup_logging
@@ -204,6 +210,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         import sys
         sys.exit(1)  # Exit with error code
     
+    # Single owner of all connection pools (history writes, dashboard reads, events)
+    initialize_pool_manager(settings.database_url, settings)
+    
     # Clean up any orphaned sessions from previous pod crashes
     # Timeout-based detection: sessions with no interaction for configured timeout are marked as failed
     # This should happen after database initialization but before processing new alerts
@@ -270,12 +279,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Initialize async database engine for event system
         initialize_async_database(settings.database_url)
         
+        # Apply WebSocket send queue limits before clients connect
+        connection_manager.configure_send_queues(
+            high_water=settings.websocket_send_queue_high_water,
+            max_size=settings.websocket_send_queue_max_size
+        )
+        
+        # Coalesce event bursts into shared transactions (if enabled)
+        from tarsy.services.events.batcher import initialize_event_batcher
+        initialize_event_batcher(settings.event_publish_batch_window_ms)
+        
+        # Physical NOTIFY channel layout must be known before the listener starts
+        from tarsy.services.events.notify_payloads import configure_notify_shards
+        configure_notify_shards(settings.event_notify_shard_count)
+        
+        # LLM rate limiters reserve provider budget through the async database
+        from tarsy.integrations.llm.rate_limiter import configure_rate_limit_sharing
+        configure_rate_limit_sharing(settings.llm_rate_limit_shared)
+        
         # Create and start event system manager
         event_system_manager = EventSystemManager(
             database_url=settings.database_url,
             db_session_factory=get_async_session_factory(),
             event_retention_hours=settings.event_retention_hours,
-            event_cleanup_interval_hours=settings.event_cleanup_interval_hours
+            event_cleanup_interval_hours=settings.event_cleanup_interval_hours,
+            local_delivery=settings.event_local_delivery
         )
         await event_system_manager.start()
         set_event_system(event_system_manager)
@@ -460,6 +488,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown event system
     if event_system_manager is not None:
         try:
+            from tarsy.services.events.batcher import shutdown_event_batcher
+            await shutdown_event_batcher()
             await event_system_manager.stop()
             await dispose_async_database()
             logger.info("Event system stopped")
@@ -468,6 +498,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     if alert_service is not None:
         await alert_service.close()
+    
+    # Flush queued history writes and close history database connections
+    try:
+        from tarsy.services.history_service import shutdown_history_service
+        shutdown_history_service()
+    except Exception as e:
+        logger.error(f"Error shutting down history service: {e}", exc_info=True)
+    
+    try:
+        await dispose_pool_manager()
+    except Exception as e:
+        logger.error(f"Error disposing database connection pools: {e}", exc_info=True)
+    
+    try:
+        await close_llm_http_pool()
+    except Exception as e:
+        logger.error(f"Error closing LLM HTTP connections: {e}", exc_info=True)
     logger.info("Tarsy shutdown complete")
 
 
@@ -601,6 +648,17 @@ async def health_check(response: Response) -> Dict[str, Any]:
             }
         }
         
+        # Add connection pool metrics (checkouts, wait time per purpose)
+        pool_manager = get_pool_manager()
+        if pool_manager is not None:
+            health_status["services"]["database"]["pools"] = pool_manager.get_metrics()
+        
+        # Add WebSocket delivery metrics (per-connection send queue lag)
+        health_status["services"]["websocket"] = connection_manager.get_metrics()
+        
+        # Add LLM HTTP connection reuse metrics (shared keep-alive pool)
+        health_status["services"]["llm_http"] = get_llm_http_pool().get_metrics()
+        
         # Add queue metrics
         try:
             from tarsy.services.history_service import get_history_service
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .constants import SuccessPolicy, IterationStrategy  # FailurePolicy is backward compat alias
+from .llm_models import validate_interaction_models
 from .mcp_transport_config import TransportConfig
 
 # =============================================================================
@@ -199,6 +200,11 @@ class AgentConfigModel(BaseModel):
         default=None,
         description="Force LLM to conclude when max iterations reached instead of pausing (overrides system default if set)",
     )
+    token_budget: Optional[int] = Field(
+        default=None,
+        description="Maximum LLM tokens (prompt + completion) this agent may use per stage (None = unlimited)",
+        gt=0,
+    )
 
 
 class MCPServerConfigModel(BaseModel):
@@ -490,6 +496,10 @@ class ChainConfigModel(BaseModel):
         None,
         description="Optional LLM provider for all stages in this chain (uses global default if not specified)",
     )
+    interaction_models: Optional[Dict[str, str]] = Field(
+        None,
+        description="Optional model per LLM interaction type for this chain (overrides the provider's interaction_models)",
+    )
     max_iterations: Optional[int] = Field(
         default=None,
         description="Maximum number of iterations for all stages in this chain (overrides agent/system defaults)",
@@ -499,12 +509,23 @@ class ChainConfigModel(BaseModel):
         default=None,
         description="Force conclusion at max iterations for all stages in this chain (overrides agent/system defaults)",
     )
+    token_budget: Optional[int] = Field(
+        default=None,
+        description="Maximum LLM tokens (prompt + completion) per session of this chain (overrides the system default)",
+        gt=0,
+    )
     mcp_servers: Optional[List[str]] = Field(
         None,
         description="Optional MCP server override for all stages in this chain",
         min_length=1,
     )
 
+    @field_validator("interaction_models", mode="before")
+    @classmethod
+    def validate_interaction_model_names(cls, v: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Validate that interaction types are recognized and models are named."""
+        return validate_interaction_models(v)
+
 
 class CombinedConfigModel(BaseModel):
     """Root configuration model for the entire config file.
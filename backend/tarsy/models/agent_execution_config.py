@@ -9,7 +9,7 @@ This replaces individual parameter passing for cleaner APIs and easier extension
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -33,6 +33,10 @@ class AgentExecutionConfig:
         max_iterations: Maximum number of LLM->MCP iteration loops
         force_conclusion: Force conclusion when max iterations reached vs pause
         mcp_servers: Optional list of MCP server IDs to use (None = use agent default)
+        interaction_models: Optional chain-level model per LLM interaction type, only set
+                            when llm_provider is the chain's provider
+                            (None = use the provider's interaction_models)
+        token_budget: Optional agent-level LLM token budget per stage (None = unlimited)
     """
     
     llm_provider: Optional[str] = None
@@ -40,6 +44,8 @@ class AgentExecutionConfig:
     max_iterations: Optional[int] = None
     force_conclusion: Optional[bool] = None
     mcp_servers: Optional[List[str]] = None
+    interaction_models: Optional[Dict[str, str]] = None
+    token_budget: Optional[int] = None
     
     # Future extensions can be added here without changing method signatures
     # Examples: timeout_seconds, retry_policy, telemetry_config, etc.
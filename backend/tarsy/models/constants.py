@@ -78,6 +78,11 @@ class StageStatus(Enum):
         """Get all error/failure status values."""
         return [cls.FAILED, cls.CANCELLED, cls.TIMED_OUT]
 
+    @classmethod
+    def active_values(cls) -> List[str]:
+        """Status values of stages that may still transition (not yet finished)."""
+        return [cls.PENDING.value, cls.ACTIVE.value, cls.PAUSED.value]
+
 
 class CancellationReason(str, Enum):
     """Standardized reasons for task/stage cancellation."""
@@ -85,6 +90,7 @@ class CancellationReason(str, Enum):
     USER_CANCEL = "user_cancel"
     TIMEOUT = "timeout"
     SHUTDOWN = "shutdown"
+    HEDGE_LOST = "hedge_lost"  # Hedged LLM request answered first by the other provider
     UNKNOWN = "unknown"
 
 
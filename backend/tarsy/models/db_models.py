@@ -6,11 +6,12 @@ and stage executions with Unix timestamp precision for optimal
 performance and consistency.
 """
 
+import re
 import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DDL, JSON, DateTime, ForeignKey, Integer, String, event, func
 from sqlalchemy.dialects.postgresql import BIGINT
 from sqlmodel import Column, Field, Index, SQLModel
 
@@ -20,6 +21,26 @@ from tarsy.utils.timestamp import now_us
 if TYPE_CHECKING:
     from tarsy.models.agent_config import ChainConfigModel
 
+# alert_data keys with dedicated expression indexes (see the add_alert_data_facet_indexes
+# migration). Other configured facet keys are served by the GIN index on PostgreSQL.
+INDEXED_ALERT_DATA_FACETS: tuple[str, ...] = ("cluster", "namespace", "severity")
+
+# Facet keys are inlined into SQL (see alert_data_facet_sql), so only plain identifiers are allowed
+ALERT_DATA_FACET_KEY_PATTERN = re.compile(r'[A-Za-z0-9_]+')
+
+
+def alert_data_facet_sql(dialect_name: str, key: str) -> str:
+    """
+    SQL expression extracting an alert_data key as text.
+
+    Queries must use exactly this expression (with the key inlined, not bound)
+    for the database to match it against the facet expression indexes.
+    """
+    if dialect_name == 'postgresql':
+        return f"(alert_data ->> '{key}')"
+    return f"json_extract(alert_data, '$.{key}')"
+
+
 class AlertSession(SQLModel, table=True):
     """
     Represents an alert processing session with complete lifecycle tracking.
@@ -44,10 +65,8 @@ class AlertSession(SQLModel, table=True):
         # Composite index for efficient orphan detection
         Index('ix_alert_sessions_status_last_interaction', 'status', 'last_interaction_at'),
         
-        # Note: PostgreSQL-specific JSON indexes removed for database compatibility
-        # In production with PostgreSQL, consider adding:
-        # - GIN index on alert_data: Index('ix_alert_data_gin', 'alert_data', postgresql_using='gin')
-        # - JSON field indexes: Index('ix_alert_data_severity', text("((alert_data->>'severity'))"))
+        # alert_data facet indexes are dialect-specific expressions, created by the
+        # add_alert_data_facet_indexes migration (and by the DDL hooks below for create_all)
     )
     
     session_id: str = Field(
@@ -178,6 +197,26 @@ class AlertSession(SQLModel, table=True):
         return ChainConfigModel(**self.chain_definition)
 
 
+for _dialect in ('postgresql', 'sqlite'):
+    for _facet in INDEXED_ALERT_DATA_FACETS:
+        event.listen(
+            AlertSession.__table__,
+            "after_create",
+            DDL(
+                f"CREATE INDEX IF NOT EXISTS ix_alert_sessions_alert_data_{_facet} "
+                f"ON alert_sessions ({alert_data_facet_sql(_dialect, _facet)})"
+            ).execute_if(dialect=_dialect),
+        )
+event.listen(
+    AlertSession.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_alert_sessions_alert_data_gin "
+        "ON alert_sessions USING gin ((CAST(alert_data AS jsonb)) jsonb_path_ops)"
+    ).execute_if(dialect='postgresql'),
+)
+
+
 class StageExecution(SQLModel, table=True):
     """
     Represents the execution of a single stage within a chain processing session.
@@ -407,6 +446,31 @@ class ChatUserMessage(SQLModel, table=True):
     )
 
 
+
+class LLMRateBudget(SQLModel, table=True):
+    """
+    LLM provider request/token budget used in one minute, shared by all pods.
+
+    Each pod reserves its LLM calls here (see integrations.llm.rate_limiter) so
+    the fleet as a whole stays under the provider's per-minute quota.
+    """
+
+    __tablename__ = "llm_rate_budgets"
+
+    provider: str = Field(
+        sa_column=Column[Any](String(100), primary_key=True),
+        description="LLM provider name (key in llm_providers.yaml)"
+    )
+
+    window_start: int = Field(
+        sa_column=Column[Any](BIGINT, primary_key=True, autoincrement=False),
+        description="Start of the one-minute window (Unix seconds, multiple of 60)"
+    )
+
+    requests_used: int = Field(default=0, description="Requests reserved in this window")
+
+    tokens_used: int = Field(default=0, description="Tokens reserved (corrected to actual usage) in this window")
+
 # Import unified models that replace the old separate DB models
 from typing import TYPE_CHECKING
 
@@ -93,6 +93,10 @@ class SessionProgressUpdateEvent(BaseEvent):
     agent_name: Optional[str] = Field(
         default=None, description="Agent name for this execution"
     )
+    token_budget: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Tightest active token budget (scope, limit, used, remaining), None if unlimited"
+    )
 
 
 class SessionCancelRequestedEvent(BaseEvent):
@@ -237,7 +241,10 @@ class LLMStreamChunkEvent(BaseEvent):
     stage_execution_id: Optional[str] = Field(
         default=None, description="Stage execution identifier (child execution ID for parallel stages)"
     )
-    chunk: str = Field(description="Content chunk (accumulated tokens)")
+    chunk: str = Field(description="Text to splice in at offset (full text when is_snapshot)")
+    sequence: int = Field(default=0, description="Per-stream sequence number, starting at 1 (0 for standalone events)")
+    offset: int = Field(default=0, description="Position in the stream text where chunk starts (0 for snapshots)")
+    is_snapshot: bool = Field(default=True, description="True if chunk is the full text rather than a delta")
     stream_type: str = Field(description="Type of content being streamed: 'thought', 'final_answer', 'summarization', or 'native_thinking'")
     is_complete: bool = Field(default=False, description="True if this is the final chunk")
     mcp_event_id: Optional[str] = Field(
@@ -41,6 +41,7 @@ class FilterOptions(BaseModel):
     alert_types: List[str] 
     status_options: List[str]  # String values for API consistency
     time_ranges: List[TimeRangeOption]
+    alert_data_facets: Dict[str, List[str]] = Field(default_factory=dict)  # alert_data key -> distinct values
 
 
 # =============================================================================
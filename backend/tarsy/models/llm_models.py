@@ -10,6 +10,8 @@ from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from tarsy.models.constants import LLMInteractionType
+
 
 class LLMProviderType(str, Enum):
     """Supported LLM provider types."""
@@ -33,6 +35,28 @@ class GoogleNativeTool(str, Enum):
 ProviderType = LLMProviderType
 
 
+def validate_interaction_models(v: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Validate an interaction type -> model name mapping (shared by provider and chain configs)."""
+    if v is None:
+        return None
+    if not isinstance(v, dict):
+        raise ValueError(f"interaction_models must be a dictionary, got: {type(v).__name__}")
+    
+    supported_types = {interaction_type.value for interaction_type in LLMInteractionType}
+    validated: Dict[str, str] = {}
+    for interaction_type, model in v.items():
+        key = interaction_type.value if isinstance(interaction_type, LLMInteractionType) else str(interaction_type)
+        if key not in supported_types:
+            raise ValueError(
+                f"Unsupported interaction type: {key}. "
+                f"Must be one of: {', '.join(sorted(supported_types))}"
+            )
+        if not isinstance(model, str) or not model.strip():
+            raise ValueError(f"Model for interaction type '{key}' must be a non-empty string")
+        validated[key] = model.strip()
+    return validated
+
+
 class LLMProviderConfig(BaseModel):
     """Pydantic model for LLM provider configuration.
     
@@ -84,11 +108,44 @@ class LLMProviderConfig(BaseModel):
         gt=0,
         description="Maximum tokens for tool results truncation"
     )
+    context_window_tokens: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Model context window in tokens, the budget for conversation compaction "
+                    "(None = 128K default)"
+    )
     native_tools: Optional[Dict[str, bool]] = Field(
         default=None,
         description="Native tool configuration for Google/Gemini models (GoogleNativeTool enum values). "
                     "Default: google_search and url_context enabled, code_execution disabled"
     )
+    prompt_caching: bool = Field(
+        default=True,
+        description="Mark the stable conversation prefix for provider-side prompt caching "
+                    "(Anthropic / Claude on Vertex AI; OpenAI and Gemini cache prefixes automatically)"
+    )
+    supports_stop_sequences: Optional[bool] = Field(
+        default=None,
+        description="Send ReAct stop sequences to the provider so it stops generating after Action Input "
+                    "(None = by provider type: Google, Anthropic and Vertex AI; OpenAI / xAI reasoning "
+                    "models such as gpt-5 and grok-4 reject them). Otherwise the response stream is "
+                    "cancelled client-side at the stop sequence"
+    )
+    interaction_models: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="Model per LLM interaction type (e.g. summarization, final_analysis_summary) "
+                    "for cheaper / faster calls with the same provider credentials"
+    )
+    requests_per_minute: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Provider request limit shared by all sessions (None = unlimited)"
+    )
+    tokens_per_minute: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Provider token limit (prompt + completion) shared by all sessions (None = unlimited)"
+    )
     
     # Runtime fields (added by Settings.get_llm_config())
     api_key: Optional[str] = Field(
@@ -177,6 +234,12 @@ class LLMProviderConfig(BaseModel):
         
         return v
     
+    @field_validator("interaction_models", mode="before")
+    @classmethod
+    def validate_interaction_model_names(cls, v: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Validate that interaction types are recognized and models are named."""
+        return validate_interaction_models(v)
+    
     def get_native_tool_status(self, tool_name: str) -> bool:
         """Get native tool status with secure defaults.
         
@@ -38,9 +38,22 @@ class LLMMessage(SQLModel):
         return v.strip()
 
 
+class ConversationCompaction(SQLModel):
+    """Record of older messages being collapsed to keep a conversation within its context budget."""
+    timestamp_us: int = Field(default_factory=now_us, description="Compaction timestamp (microseconds since epoch UTC)")
+    tokens_before: int = Field(..., ge=0, description="Estimated conversation tokens before compaction")
+    tokens_after: int = Field(..., ge=0, description="Estimated conversation tokens after compaction")
+    token_budget: int = Field(..., gt=0, description="Token budget that triggered the compaction")
+    compacted_messages: int = Field(..., ge=0, description="Number of messages collapsed into references")
+
+
 class LLMConversation(SQLModel):
     """Complete conversation thread with structured messages."""
     messages: List[LLMMessage] = Field(..., min_items=1, description="Ordered conversation messages")
+    compactions: List[ConversationCompaction] = Field(
+        default_factory=list,
+        description="Context compactions applied to this conversation (stored with every later interaction)"
+    )
     
     @field_validator('messages')
     def validate_message_order(cls, v):
@@ -146,6 +159,9 @@ class LLMInteraction(SQLModel, table=True):
     input_tokens: Optional[int] = Field(None, ge=0, description="Input/prompt tokens")
     output_tokens: Optional[int] = Field(None, ge=0, description="Output/completion tokens")  
     total_tokens: Optional[int] = Field(None, ge=0, description="Total tokens used")
+    cached_input_tokens: Optional[int] = Field(
+        None, ge=0, description="Input tokens served from the provider's prompt cache (part of input_tokens)"
+    )
     
     # Response metadata from aggregated streaming chunks
     response_metadata: Optional[dict] = Field(
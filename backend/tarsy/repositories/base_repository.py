@@ -15,6 +15,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, SQLModel, select
 
 from tarsy.database.init_db import create_database_engine
+from tarsy.database.pool_manager import PoolPurpose, get_pool_manager
 
 logger = logging.getLogger(__name__)
 
@@ -149,12 +150,23 @@ class DatabaseManager:
         self.database_url = database_url
         self.engine: Optional[Engine] = None
         self.session_factory: Optional[sessionmaker] = None
+        # Separate read pool, only set when engines come from the pool manager
+        self.read_session_factory: Optional[sessionmaker] = None
+        self._owns_engine: bool = True
         
     def initialize(self) -> None:
         """Initialize database engine and session factory using optimized configuration."""
         try:
-            # Use the enhanced database engine creation with type-specific optimizations
-            self.engine = create_database_engine(self.database_url)
+            pool_manager = get_pool_manager(self.database_url)
+            read_engine: Optional[Engine] = None
+            if pool_manager is not None:
+                # Shared per-purpose pools: writes and dashboard reads get separate budgets
+                self.engine = pool_manager.get_engine(PoolPurpose.ALERT_WRITES)
+                read_engine = pool_manager.get_engine(PoolPurpose.DASHBOARD_READS)
+                self._owns_engine = False
+            else:
+                # Use the enhanced database engine creation with type-specific optimizations
+                self.engine = create_database_engine(self.database_url)
             
             # Enable WAL mode for SQLite for better concurrency
             if self.database_url.startswith('sqlite'):
@@ -172,6 +184,12 @@ class DatabaseManager:
                 class_=Session,
                 expire_on_commit=False
             )
+            if read_engine is not None and read_engine is not self.engine:
+                self.read_session_factory = sessionmaker(
+                    bind=read_engine,
+                    class_=Session,
+                    expire_on_commit=False
+                )
             
             safe_url = make_url(self.database_url).render_as_string(hide_password=True)
             logger.info(f"Database initialized with URL: {safe_url}")
@@ -191,20 +209,27 @@ class DatabaseManager:
             logger.error(f"Failed to create database tables: {str(e)}")
             raise
     
-    def get_session(self) -> Session:
+    def get_session(self, purpose: PoolPurpose = PoolPurpose.ALERT_WRITES) -> Session:
         """
         Get a new database session.
         
+        Args:
+            purpose: Pool to draw the connection from; dashboard reads use the
+                     read pool when one is configured
+        
         Returns:
             A new SQLModel Session instance
         """
         if not self.session_factory:
             raise RuntimeError("Database not initialized")
-            
+        
+        if purpose == PoolPurpose.DASHBOARD_READS and self.read_session_factory:
+            return self.read_session_factory()
         return self.session_factory()
     
     def close(self) -> None:
         """Close database connections."""
-        if self.engine:
+        # Pooled engines are owned (and disposed) by the pool manager
+        if self.engine and self._owns_engine:
             self.engine.dispose()
             logger.info("Database connections closed") 
\ No newline at end of file
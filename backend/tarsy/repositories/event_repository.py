@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tarsy.models.db_models import Event
@@ -95,6 +95,63 @@ class EventRepository:
             logger.error(f"Failed to get events on '{channel}' after {after_id}: {e}")
             raise
 
+    async def get_events_after_for_channels(
+        self, channels: list[str], after_id: int, limit: int = 500
+    ) -> list[Event]:
+        """
+        Get events on any of several channels after specified ID (for polling).
+
+        Args:
+            channels: Event channels to query
+            after_id: Return events with ID greater than this
+            limit: Maximum number of events to return (default: 500)
+
+        Returns:
+            List of Event objects ordered by ID ascending
+        """
+        try:
+            statement = (
+                select(Event)
+                .where(Event.channel.in_(channels))
+                .where(Event.id > after_id)
+                .order_by(Event.id.asc())
+                .limit(limit)
+            )
+
+            result = await self.session.execute(statement)
+            events = result.scalars().all()
+
+            logger.debug(
+                f"Retrieved {len(events)} event(s) on {len(channels)} channel(s) after ID {after_id}"
+            )
+
+            return list(events)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get events on {len(channels)} channel(s) after {after_id}: {e}"
+            )
+            raise
+
+    async def get_latest_event_id(self, channel: str) -> int:
+        """
+        Get the ID of the newest event on a channel (for catch-up snapshots).
+
+        Args:
+            channel: Event channel to query
+
+        Returns:
+            Highest event ID on the channel, or 0 if it has no events
+        """
+        try:
+            statement = select(func.max(Event.id)).where(Event.channel == channel)
+            result = await self.session.execute(statement)
+            return result.scalar() or 0
+
+        except Exception as e:
+            logger.error(f"Failed to get latest event ID on '{channel}': {e}")
+            raise
+
     async def delete_events_before(self, before_time: datetime) -> int:
         """
         Delete events older than specified time (for cleanup).
@@ -6,13 +6,26 @@ supporting comprehensive audit trails, chronological timeline reconstruction,
 and advanced querying capabilities using Unix timestamps for optimal performance.
 """
 
+import json
+import re
 from collections import defaultdict
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+from sqlalchemy import cast, literal, literal_column, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import Session, and_, asc, case, desc, func, or_, select
 
 from tarsy.models.constants import AlertSessionStatus, ParallelType, StageStatus
-from tarsy.models.db_models import AlertSession, Chat, ChatUserMessage, StageExecution
+from tarsy.models.db_models import (
+    ALERT_DATA_FACET_KEY_PATTERN,
+    INDEXED_ALERT_DATA_FACETS,
+    AlertSession,
+    Chat,
+    ChatUserMessage,
+    StageExecution,
+    alert_data_facet_sql,
+)
 from tarsy.models.history_models import (
     ChatUserMessageData,
     DetailedSession,
@@ -36,6 +49,25 @@ logger = get_logger(__name__)
 # Constant for session-level interactions (not associated with any specific stage)
 SESSION_LEVEL_STAGE_ID = 'unknown'
 
+# Maximum number of distinct values returned per facet in filter options
+MAX_FACET_OPTIONS = 100
+
+
+def _stage_duration_ms_expr(completed_at_us: Any) -> ColumnElement:
+    """
+    Build a SQL expression computing stage duration from the row's own start time.
+    
+    Evaluated inside the UPDATE statement so that the duration is derived from the
+    persisted started_at_us without reading the row first.
+    """
+    return case(
+        (
+            StageExecution.started_at_us.isnot(None),
+            (completed_at_us - StageExecution.started_at_us) // 1000,
+        ),
+        else_=None,
+    )
+
 
 class HistoryRepository:
     """
@@ -118,6 +150,44 @@ class HistoryRepository:
             logger.error(f"Failed to update alert session {alert_session.session_id}: {str(e)}")
             return False
     
+    def transition_alert_session(
+        self,
+        session_id: str,
+        from_statuses: Optional[Sequence[str]],
+        values: Dict[str, Any],
+    ) -> Optional[AlertSession]:
+        """
+        Apply a guarded status transition to an alert session in a single statement.
+        
+        Executes ``UPDATE ... WHERE status IN (from_statuses) RETURNING *`` so the
+        compare-and-set happens atomically in the database without reading the row first.
+        
+        Args:
+            session_id: The session identifier
+            from_statuses: Statuses the session must currently be in for the transition
+                          to apply, or None to apply unconditionally
+            values: Column values to set
+            
+        Returns:
+            The updated AlertSession, or None if the session does not exist or its
+            current status is not one of from_statuses
+        """
+        try:
+            statement = update(AlertSession).where(AlertSession.session_id == session_id)
+            if from_statuses is not None:
+                statement = statement.where(AlertSession.status.in_(list(from_statuses)))
+            statement = (
+                statement.values(**values)
+                .returning(AlertSession)
+            )
+            updated_session = self.session.execute(statement).scalars().first()
+            self.session.commit()
+            return updated_session
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to transition alert session {session_id}: {str(e)}")
+            raise
+    
     def get_stage_interaction_counts(self, execution_ids: List[str]) -> Dict[str, Dict[str, int]]:
         """
         Get interaction counts grouped by stage execution ID using SQL aggregation.
@@ -335,26 +405,129 @@ class HistoryRepository:
     def update_stage_execution(self, stage_execution: StageExecution) -> bool:
         """Update an existing stage execution record."""
         try:
-            # Fetch the existing record by primary key
-            existing_execution = self.session.get(StageExecution, stage_execution.execution_id)
-            if existing_execution is None:
+            # Single UPDATE by primary key - only the fields that can change during execution
+            statement = (
+                update(StageExecution)
+                .where(StageExecution.execution_id == stage_execution.execution_id)
+                .values(
+                    status=stage_execution.status,
+                    started_at_us=stage_execution.started_at_us,
+                    paused_at_us=stage_execution.paused_at_us,
+                    completed_at_us=stage_execution.completed_at_us,
+                    duration_ms=stage_execution.duration_ms,
+                    stage_output=stage_execution.stage_output,
+                    error_message=stage_execution.error_message,
+                    current_iteration=stage_execution.current_iteration,
+                )
+            )
+            result = self.session.execute(statement)
+            if result.rowcount == 0:
+                self.session.rollback()
                 logger.error(f"Stage execution with id {stage_execution.execution_id} not found")
                 raise ValueError(f"Stage execution with id {stage_execution.execution_id} not found")
             
-            # Update only the fields that can change during execution
-            existing_execution.status = stage_execution.status
-            existing_execution.started_at_us = stage_execution.started_at_us
-            existing_execution.completed_at_us = stage_execution.completed_at_us
-            existing_execution.duration_ms = stage_execution.duration_ms
-            existing_execution.stage_output = stage_execution.stage_output
-            existing_execution.error_message = stage_execution.error_message
-            
             self.session.commit()
             return True
         except Exception as e:
             logger.error(f"Failed to update stage execution: {str(e)}")
             raise
 
+    def transition_stage_execution(
+        self,
+        execution_id: str,
+        from_statuses: Sequence[str],
+        values: Dict[str, Any],
+        *,
+        preserve_started_at: bool = False,
+        completed_from_pause: bool = False,
+    ) -> Optional[StageExecution]:
+        """
+        Apply a guarded status transition to a stage execution in a single statement.
+        
+        Executes ``UPDATE ... WHERE status IN (from_statuses) RETURNING *``. When
+        completed_at_us is set, duration_ms is derived in SQL from the stored
+        started_at_us unless explicitly provided.
+        
+        Args:
+            execution_id: Stage execution ID
+            from_statuses: Statuses the stage must currently be in for the transition to apply
+            values: Column values to set
+            preserve_started_at: Keep an existing started_at_us (resume) and only use the
+                                 provided value when none is stored yet
+            completed_from_pause: Use the stored paused_at_us as completion time when
+                                  present, falling back to the provided completed_at_us
+            
+        Returns:
+            The updated StageExecution, or None if the stage does not exist or its
+            current status is not one of from_statuses
+        """
+        try:
+            update_values = dict(values)
+            if preserve_started_at and update_values.get('started_at_us') is not None:
+                update_values['started_at_us'] = func.coalesce(
+                    StageExecution.started_at_us, update_values['started_at_us']
+                )
+            completed_at_us = update_values.get('completed_at_us')
+            if completed_at_us is not None:
+                if completed_from_pause:
+                    completed_at_us = func.coalesce(StageExecution.paused_at_us, completed_at_us)
+                    update_values['completed_at_us'] = completed_at_us
+                update_values.setdefault('duration_ms', _stage_duration_ms_expr(completed_at_us))
+            
+            statement = (
+                update(StageExecution)
+                .where(
+                    StageExecution.execution_id == execution_id,
+                    StageExecution.status.in_(list(from_statuses)),
+                )
+                .values(**update_values)
+                .returning(StageExecution)
+            )
+            updated_stage = self.session.execute(statement).scalars().first()
+            self.session.commit()
+            return updated_stage
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to transition stage execution {execution_id}: {str(e)}")
+            raise
+
+    def cancel_paused_stage_executions(self, session_id: str, error_message: str) -> List[StageExecution]:
+        """
+        Cancel every paused stage execution of a session (including parallel children) in one statement.
+        
+        The paused_at_us timestamp is used as completion time so durations exclude the pause.
+        
+        Args:
+            session_id: The session identifier
+            error_message: Cancellation message stored on each stage
+            
+        Returns:
+            List of cancelled StageExecution instances
+        """
+        try:
+            completed_at_us = func.coalesce(StageExecution.paused_at_us, now_us())
+            statement = (
+                update(StageExecution)
+                .where(
+                    StageExecution.session_id == session_id,
+                    StageExecution.status == StageStatus.PAUSED.value,
+                )
+                .values(
+                    status=StageStatus.CANCELLED.value,
+                    error_message=error_message,
+                    completed_at_us=completed_at_us,
+                    duration_ms=_stage_duration_ms_expr(completed_at_us),
+                )
+                .returning(StageExecution)
+            )
+            cancelled_stages = list(self.session.execute(statement).scalars().all())
+            self.session.commit()
+            return cancelled_stages
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to cancel paused stages for session {session_id}: {str(e)}")
+            raise
+
     def update_session_current_stage(
         self, 
         session_id: str, 
@@ -457,6 +630,40 @@ class HistoryRepository:
             logger.error(f"Failed to get parallel stage children for parent {parent_execution_id}: {str(e)}")
             raise
 
+    def get_parallel_stage_group(
+        self, parent_execution_id: str
+    ) -> Tuple[Optional[StageExecution], List[StageExecution]]:
+        """Get a parallel stage parent together with its children in a single query.
+        
+        Args:
+            parent_execution_id: Parent stage execution ID
+            
+        Returns:
+            Tuple of (parent StageExecution or None, children ordered by parallel_index)
+        """
+        try:
+            stmt = (
+                select(StageExecution)
+                .where(
+                    or_(
+                        StageExecution.execution_id == parent_execution_id,
+                        StageExecution.parent_stage_execution_id == parent_execution_id,
+                    )
+                )
+                .order_by(asc(StageExecution.parallel_index))
+            )
+            parent = None
+            children = []
+            for stage in self.session.exec(stmt).all():
+                if stage.execution_id == parent_execution_id:
+                    parent = stage
+                else:
+                    children.append(stage)
+            return parent, children
+        except Exception as e:
+            logger.error(f"Failed to get parallel stage group for parent {parent_execution_id}: {str(e)}")
+            raise
+
     def get_alert_sessions(
         self,
         status: Optional[Union[str, List[str]]] = None,
@@ -468,11 +675,20 @@ class HistoryRepository:
         page: int = 1,
         page_size: int = 20,
         sort_by: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        alert_data_filters: Optional[Dict[str, Union[str, List[str]]]] = None
     ) -> Optional[PaginatedSessions]:
         """
         Retrieve alert sessions with filtering and pagination.
+        
+        alert_data_filters maps alert_data keys (e.g. 'cluster') to one value or a
+        list of accepted values; filters on different keys are combined with AND.
+        
+        Raises:
+            ValueError: If an alert_data filter key is not a plain identifier
         """
+        for key in alert_data_filters or {}:
+            self._check_facet_key(key)
         try:
             # Defensively handle pagination parameters to prevent negative DB offsets
             page = max(1, int(page)) if page is not None else 1
@@ -525,6 +741,12 @@ class HistoryRepository:
             if end_date_us:
                 conditions.append(AlertSession.started_at_us <= end_date_us)
             
+            # Facet filters on alert_data keys (index lookups for indexed facets)
+            for key, values in (alert_data_filters or {}).items():
+                values = values if isinstance(values, list) else [values]
+                if values:
+                    conditions.append(self._alert_data_facet_condition(key, values))
+            
             # Apply all conditions with AND logic
             if conditions:
                 statement = statement.where(and_(*conditions))
@@ -1016,9 +1238,47 @@ class HistoryRepository:
             logger.error(f"Failed to get detailed session {session_id}: {str(e)}")
             return None
 
-    def get_filter_options(self) -> FilterOptions:
+    def _dialect_name(self) -> str:
+        """Get the SQL dialect of the session's database."""
+        return self.session.get_bind().dialect.name
+    
+    @staticmethod
+    def _check_facet_key(key: str) -> None:
+        """Reject alert_data keys that are not plain identifiers (keys are inlined into SQL)."""
+        if not ALERT_DATA_FACET_KEY_PATTERN.fullmatch(key):
+            raise ValueError(f"Invalid alert_data facet key: {key}")
+    
+    def _alert_data_facet_expr(self, key: str) -> ColumnElement:
+        """
+        Build the text expression for an alert_data key.
+        
+        Raises:
+            ValueError: If the key is not a plain identifier
+        """
+        self._check_facet_key(key)
+        return literal_column(alert_data_facet_sql(self._dialect_name(), key))
+    
+    def _alert_data_facet_condition(self, key: str, values: List[str]) -> ColumnElement:
+        """
+        Build a filter condition matching sessions whose alert_data[key] is one of values.
+        
+        Indexed facets use the expression indexes. Other keys use JSONB containment
+        (GIN index) on PostgreSQL and plain json_extract on SQLite.
+        """
+        expr = self._alert_data_facet_expr(key)
+        if key in INDEXED_ALERT_DATA_FACETS or self._dialect_name() != 'postgresql':
+            return expr.in_(values)
+        return or_(*[
+            cast(AlertSession.alert_data, JSONB).op('@>')(cast(literal(json.dumps({key: value})), JSONB))
+            for value in values
+        ])
+    
+    def get_filter_options(self, facet_keys: Sequence[str] = ()) -> FilterOptions:
         """
         Get dynamic filter options based on actual data in the database.
+        
+        Args:
+            facet_keys: alert_data keys to collect distinct values for
         """
         try:
             # Get distinct agent types as a flat list of strings
@@ -1047,11 +1307,26 @@ class HistoryRepository:
                 TimeRangeOption(label="This Month", value="month")
             ]
             
+            # Distinct values per alert_data facet (index-only scans for indexed facets)
+            facets: Dict[str, List[str]] = {}
+            for key in facet_keys:
+                expr = self._alert_data_facet_expr(key)
+                values = self.session.scalars(
+                    select(expr)
+                        .select_from(AlertSession)
+                        .distinct()
+                        .where(expr.is_not(None))
+                        .order_by(expr)
+                        .limit(MAX_FACET_OPTIONS)
+                ).all()
+                facets[key] = [str(value) for value in values]
+            
             return FilterOptions(
                 agent_types=sorted(list(agent_types)) if agent_types else [],
                 alert_types=sorted(list(alert_types)) if alert_types else [],
                 status_options=status_options,
-                time_ranges=time_ranges
+                time_ranges=time_ranges,
+                alert_data_facets=facets
             )
             
         except Exception as e:
@@ -0,0 +1,126 @@
+"""LLM rate budget repository for database operations."""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tarsy.models.db_models import LLMRateBudget
+
+logger = logging.getLogger(__name__)
+
+
+class LLMRateBudgetRepository:
+    """
+    Repository for the pod-shared LLM rate budget table.
+
+    Reservations are single conditional UPDATEs, so concurrent pods never
+    exceed a window's limits without needing row locks.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with database session.
+
+        Args:
+            session: Async database session for operations
+        """
+        self.session = session
+
+    async def _ensure_window(self, provider: str, window_start: int) -> bool:
+        """Create the window row if missing; returns True if this call created it."""
+        existing = await self.session.execute(
+            select(LLMRateBudget.provider).where(
+                LLMRateBudget.provider == provider,
+                LLMRateBudget.window_start == window_start,
+            )
+        )
+        if existing.first() is not None:
+            return False
+        try:
+            self.session.add(LLMRateBudget(provider=provider, window_start=window_start))
+            await self.session.flush()
+            return True
+        except IntegrityError:
+            # Another pod created it first
+            await self.session.rollback()
+            return False
+
+    async def reserve(
+        self,
+        provider: str,
+        window_start: int,
+        tokens: int,
+        requests_per_minute: Optional[int],
+        tokens_per_minute: Optional[int],
+    ) -> bool:
+        """
+        Reserve one request and an estimated token count in a window.
+
+        A request is always granted the first tokens of a window, even if its
+        estimate alone exceeds the token limit.
+
+        Args:
+            provider: LLM provider name
+            window_start: Start of the one-minute window (Unix seconds)
+            tokens: Estimated tokens of the request
+            requests_per_minute: Request limit (None = unlimited)
+            tokens_per_minute: Token limit (None = unlimited)
+
+        Returns:
+            True if reserved, False if the window has no room left
+        """
+        created = await self._ensure_window(provider, window_start)
+        if created:
+            # First reservation of a new window - drop windows nobody needs anymore
+            await self.session.execute(
+                delete(LLMRateBudget).where(
+                    LLMRateBudget.provider == provider,
+                    LLMRateBudget.window_start < window_start - 600,
+                )
+            )
+
+        conditions = [
+            LLMRateBudget.provider == provider,
+            LLMRateBudget.window_start == window_start,
+        ]
+        if requests_per_minute is not None:
+            conditions.append(LLMRateBudget.requests_used + 1 <= requests_per_minute)
+        if tokens_per_minute is not None:
+            conditions.append(or_(
+                LLMRateBudget.tokens_used == 0,
+                LLMRateBudget.tokens_used + tokens <= tokens_per_minute,
+            ))
+        result = await self.session.execute(
+            update(LLMRateBudget)
+            .where(*conditions)
+            .values(
+                requests_used=LLMRateBudget.requests_used + 1,
+                tokens_used=LLMRateBudget.tokens_used + tokens,
+            )
+        )
+        await self.session.commit()
+        return result.rowcount == 1
+
+    async def adjust_tokens(self, provider: str, window_start: int, delta: int) -> None:
+        """
+        Correct a window's token count by the difference between actual and estimated usage.
+
+        Args:
+            provider: LLM provider name
+            window_start: Window the request was reserved in
+            delta: Actual minus estimated tokens
+        """
+        if delta == 0:
+            return
+        await self.session.execute(
+            update(LLMRateBudget)
+            .where(
+                LLMRateBudget.provider == provider,
+                LLMRateBudget.window_start == window_start,
+            )
+            .values(tokens_used=LLMRateBudget.tokens_used + delta)
+        )
+        await self.session.commit()
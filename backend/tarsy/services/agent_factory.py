@@ -176,6 +176,14 @@ class AgentFactory:
                 f"{execution_config.llm_provider}"
             )
         
+        # Apply chain-level interaction-type model routing if provided
+        if execution_config.interaction_models:
+            agent.set_interaction_models(execution_config.interaction_models)
+        
+        # Apply the agent's token budget if provided
+        if execution_config.token_budget is not None:
+            agent.set_token_budget(execution_config.token_budget)
+        
         # Apply max_iterations if provided
         if execution_config.max_iterations is not None:
             agent.set_max_iterations(execution_config.max_iterations)
@@ -22,6 +22,8 @@ from tarsy.agents.exceptions import SessionPaused
 from tarsy.config.agent_config import ConfigurationError, ConfigurationLoader
 from tarsy.config.settings import Settings
 from tarsy.integrations.llm.manager import LLMManager
+from tarsy.integrations.llm.rate_limiter import set_llm_priority
+from tarsy.integrations.llm.token_budget import TokenBudget, token_budget_scope
 from tarsy.integrations.mcp.client import MCPClient
 from tarsy.integrations.notifications.summarizer import ExecutiveSummaryAgent
 from tarsy.models.agent_config import ChainConfigModel
@@ -31,6 +33,7 @@ from tarsy.models.constants import (
     AlertSessionStatus,
     CancellationReason,
     ChainStatus,
+    LLMInteractionType,
     ParallelType,
     ProgressPhase,
     StageStatus,
@@ -304,6 +307,7 @@ class AlertService:
         """
         # Create session-scoped MCP client for this alert processing
         session_mcp_client = None
+        stage_state_tracked = False
         
         try:
             # Step 1: Validate prerequisites
@@ -393,6 +397,9 @@ class AlertService:
             chain_context.set_runbook_content(runbook_content)
             
             # Step 6: Execute chain stages sequentially with configurable timeout
+            # Stage state written during this run is kept in memory for the chain loop
+            self.stage_manager.track_session(chain_context.session_id)
+            stage_state_tracked = True
             try:
                 chain_result = await asyncio.wait_for(
                     self._execute_chain_stages(
@@ -455,7 +462,8 @@ class AlertService:
                 summary_result = await self.final_analysis_summarizer.generate_executive_summary(
                     content=analysis,
                     session_id=chain_context.session_id,
-                    provider=chain_definition.llm_provider
+                    provider=chain_definition.llm_provider,
+                    model=self._summary_model_for(chain_definition)
                 )
 
                 # Mark history session as completed successfully
@@ -554,6 +562,9 @@ class AlertService:
             return format_error_response(chain_context, error_msg)
         
         finally:
+            if stage_state_tracked:
+                self.stage_manager.untrack_session(chain_context.session_id)
+            
             # Always cleanup session-scoped MCP client
             if session_mcp_client:
                 try:
@@ -574,13 +585,16 @@ class AlertService:
         
         Steps:
         1. Validate inputs and load child stage execution
-        2. Update child stage to CANCELLED status with paused_at_us as completed_at_us
-        3. Load all sibling stages (same parent_stage_execution_id)
+        2. Guarded PAUSED→CANCELLED child transition with paused_at_us as completed_at_us
+        3. Load parent and all sibling stages (same parent_stage_execution_id) in one query
         4. Run aggregate_status() logic on all children
-        5. Update parent stage status based on aggregation
-        6. Update session status if applicable
+        5. Guarded parent stage transition based on aggregation
+        6. Guarded session status transition if applicable
         7. Publish events for real-time UI updates
         
+        All status writes are compare-and-set statements, so a concurrent resume or
+        session cancel cannot be overwritten.
+        
         Args:
             session_id: Session ID
             execution_id: Child stage execution ID to cancel
@@ -619,35 +633,33 @@ class AlertService:
         
         logger.info(f"Canceling paused agent {child_stage.agent} (execution_id: {execution_id})")
         
-        # Step 3: Update child stage to CANCELLED
-        child_stage.status = StageStatus.CANCELLED.value
-        child_stage.error_message = "Cancelled by user"
-        
-        # Use paused_at_us as completed_at_us for accurate duration
-        if child_stage.paused_at_us:
-            child_stage.completed_at_us = child_stage.paused_at_us
-        else:
-            # Fallback if paused_at_us is somehow None (shouldn't happen)
-            logger.warning(f"paused_at_us is None for {execution_id}, using now_us()")
-            child_stage.completed_at_us = now_us()
-        
-        # Calculate duration in milliseconds
-        if child_stage.started_at_us and child_stage.completed_at_us:
-            duration_us = child_stage.completed_at_us - child_stage.started_at_us
-            child_stage.duration_ms = int(duration_us / 1000)
-        
-        # Persist the updated child stage
-        await self.history_service.update_stage_execution(child_stage)
+        # Step 3: Guarded PAUSED→CANCELLED transition in a single statement.
+        # paused_at_us is used as completed_at_us for accurate duration.
+        cancelled_child = await self.history_service.transition_stage_execution(
+            execution_id,
+            [StageStatus.PAUSED.value],
+            {
+                "status": StageStatus.CANCELLED.value,
+                "error_message": "Cancelled by user",
+                "completed_at_us": now_us(),
+            },
+            completed_from_pause=True,
+        )
+        if not cancelled_child:
+            # Lost a race with resume/cancel of the same stage
+            raise ValueError(f"Stage execution {execution_id} is no longer paused")
         
-        # Trigger hooks for child stage update
+        # Trigger notification hooks for child stage update (already persisted)
         from tarsy.hooks.hook_context import stage_execution_context
-        async with stage_execution_context(child_stage):
-            pass  # Hooks are triggered on context enter/exit
+        async with stage_execution_context(cancelled_child, already_persisted=True):
+            pass
         
-        # Step 4: Load all sibling stages for aggregation
-        all_children = await self.history_service.get_parallel_stage_children(
+        # Step 4: Load parent and all sibling stages for aggregation in one query
+        parent_stage, all_children = await self.history_service.get_parallel_stage_group(
             child_stage.parent_stage_execution_id
         )
+        if not parent_stage:
+            raise Exception(f"Parent stage {child_stage.parent_stage_execution_id} not found")
         
         # Step 5: Create metadata list for aggregation
         # Transform StageExecution DB models → AgentExecutionMetadata for aggregate_status()
@@ -667,14 +679,7 @@ class AlertService:
             )
             metadatas.append(metadata)
         
-        # Step 6: Load parent stage to get success_policy
-        parent_stage = await self.history_service.get_stage_execution(
-            child_stage.parent_stage_execution_id
-        )
-        if not parent_stage:
-            raise Exception(f"Parent stage {child_stage.parent_stage_execution_id} not found")
-        
-        # Get success_policy from stage_output metadata if available
+        # Step 6: Get success_policy from parent stage_output metadata if available
         success_policy = SuccessPolicy.ANY  # Default
         if parent_stage.stage_output and isinstance(parent_stage.stage_output, dict):
             metadata_dict = parent_stage.stage_output.get("metadata", {})
@@ -690,31 +695,38 @@ class AlertService:
         
         logger.info(f"Aggregated status after cancel: {aggregated_status.value}")
         
-        # Step 7: Update parent stage if status changed
+        # Step 7: Guarded parent transition (PAUSED → aggregated) if status changed
         if aggregated_status != StageStatus.PAUSED:
-            parent_stage.status = aggregated_status.value
-            if aggregated_status == StageStatus.COMPLETED:
-                parent_stage.completed_at_us = now_us()
-                # Calculate parent duration
-                if parent_stage.started_at_us:
-                    duration_us = parent_stage.completed_at_us - parent_stage.started_at_us
-                    parent_stage.duration_ms = int(duration_us / 1000)
-            elif aggregated_status == StageStatus.FAILED:
-                parent_stage.completed_at_us = now_us()
-                parent_stage.error_message = "Parallel stage failed after agent cancellation"
-                # Calculate parent duration
-                if parent_stage.started_at_us:
-                    duration_us = parent_stage.completed_at_us - parent_stage.started_at_us
-                    parent_stage.duration_ms = int(duration_us / 1000)
-            
-            # Persist the updated parent stage
-            await self.history_service.update_stage_execution(parent_stage)
-            
-            # Trigger hooks for parent stage update
-            async with stage_execution_context(parent_stage):
-                pass
-        
-        # Step 8: Update session if stage completed or failed
+            parent_values = {"status": aggregated_status.value}
+            if aggregated_status in (StageStatus.COMPLETED, StageStatus.FAILED):
+                # Duration is derived from started_at_us in the same statement
+                parent_values["completed_at_us"] = now_us()
+            if aggregated_status == StageStatus.FAILED:
+                parent_values["error_message"] = "Parallel stage failed after agent cancellation"
+            
+            updated_parent = await self.history_service.transition_stage_execution(
+                parent_stage.execution_id,
+                [StageStatus.PAUSED.value],
+                parent_values,
+            )
+            if updated_parent:
+                parent_stage = updated_parent
+                # Trigger notification hooks for parent stage update
+                async with stage_execution_context(parent_stage, already_persisted=True):
+                    pass
+            else:
+                logger.info(
+                    f"Parent stage {parent_stage.execution_id} already left PAUSED - "
+                    "concurrent transition won, skipping session update"
+                )
+                return CancelAgentResponse(
+                    success=True,
+                    session_status=session.status,
+                    stage_status=aggregated_status.value
+                )
+        
+        # Step 8: Update session if stage completed or failed (guarded: only from PAUSED)
+        paused_only = [AlertSessionStatus.PAUSED.value]
         new_session_status = session.status
         if aggregated_status == StageStatus.COMPLETED:
             # Parallel stage completed - need to run synthesis and continue chain
@@ -722,7 +734,15 @@ class AlertService:
             logger.info("Parallel stage completed after agent cancellation - triggering chain continuation")
             
             # Change session status to IN_PROGRESS to allow continuation
-            self.session_manager.update_session_status(session_id, AlertSessionStatus.IN_PROGRESS.value)
+            if not self.session_manager.transition_session_status(
+                session_id, paused_only, AlertSessionStatus.IN_PROGRESS.value
+            ):
+                logger.info(f"Session {session_id} is no longer paused - not continuing chain")
+                return CancelAgentResponse(
+                    success=True,
+                    session_status=session.status,
+                    stage_status=aggregated_status.value
+                )
             
             # Publish session resumed event to update UI
             from tarsy.services.events.event_helpers import publish_session_resumed
@@ -747,34 +767,27 @@ class AlertService:
             
             if cancelled_count > 0 and failed_count == 0:
                 # All non-completed agents were cancelled - treat as session cancellation
-                new_session_status = AlertSessionStatus.CANCELLED.value
-                session.status = new_session_status
-                session.completed_at_us = now_us()
-                session.error_message = None  # Clear error message for cancellation
-                
-                # Update session
-                self.session_manager.update_session_status(session_id, new_session_status)
-                
-                # Publish session cancelled event
-                from tarsy.services.events.event_helpers import publish_session_cancelled
-                await publish_session_cancelled(session_id)
+                if self.session_manager.transition_session_status(
+                    session_id, paused_only, AlertSessionStatus.CANCELLED.value
+                ):
+                    new_session_status = AlertSessionStatus.CANCELLED.value
+                    
+                    # Publish session cancelled event
+                    from tarsy.services.events.event_helpers import publish_session_cancelled
+                    await publish_session_cancelled(session_id)
             else:
                 # Session fails (some agents failed, not just cancelled)
-                new_session_status = AlertSessionStatus.FAILED.value
-                session.status = new_session_status
-                session.completed_at_us = now_us()
-                session.error_message = "Stage failed after agent cancellation"
-                
-                # Update session
-                self.session_manager.update_session_status(
-                    session_id, 
-                    new_session_status, 
+                if self.session_manager.transition_session_status(
+                    session_id,
+                    paused_only,
+                    AlertSessionStatus.FAILED.value,
                     error_message="Stage failed after agent cancellation"
-                )
-                
-                # Publish session failed event
-                from tarsy.services.events.event_helpers import publish_session_failed
-                await publish_session_failed(session_id)
+                ):
+                    new_session_status = AlertSessionStatus.FAILED.value
+                    
+                    # Publish session failed event
+                    from tarsy.services.events.event_helpers import publish_session_failed
+                    await publish_session_failed(session_id)
         
         # Step 9: Publish agent cancelled event
         from tarsy.services.events.event_helpers import publish_agent_cancelled
@@ -808,6 +821,7 @@ class AlertService:
             parent_stage_execution_id: Parent parallel stage execution ID that just completed
         """
         session_mcp_client = None
+        stage_state_tracked = False
         
         try:
             logger.info(f"Starting chain continuation after parallel stage completion: {session_id}")
@@ -817,7 +831,10 @@ class AlertService:
             if not session:
                 raise Exception(f"Session {session_id} not found")
             
+            # May run on a different pod than the original execution - reconstruct from the database
             stage_executions = await self.history_service.get_stage_executions(session_id)
+            self.stage_manager.track_session(session_id, stage_executions)
+            stage_state_tracked = True
             
             completed_parent_stage = None
             for stage_exec in stage_executions:
@@ -890,6 +907,8 @@ class AlertService:
             from tarsy.services.events.event_helpers import publish_session_failed
             await publish_session_failed(session_id)
         finally:
+            if stage_state_tracked:
+                self.stage_manager.untrack_session(session_id)
             if session_mcp_client:
                 try:
                     await session_mcp_client.close()
@@ -1016,7 +1035,8 @@ class AlertService:
                 summary_result = await self.final_analysis_summarizer.generate_executive_summary(
                     content=final_result,
                     session_id=session_id,
-                    provider=chain_definition.llm_provider
+                    provider=chain_definition.llm_provider,
+                    model=self._summary_model_for(chain_definition)
                 )
 
                 # Mark as completed FIRST (database commit)
@@ -1062,7 +1082,8 @@ class AlertService:
             summary_result = await self.final_analysis_summarizer.generate_executive_summary(
                 content=final_result,
                 session_id=session_id,
-                provider=chain_definition.llm_provider
+                provider=chain_definition.llm_provider,
+                model=self._summary_model_for(chain_definition)
             )
             
             # Mark as completed FIRST (database commit)
@@ -1098,6 +1119,7 @@ class AlertService:
             Exception: If session not found, not paused, or resume fails
         """
         session_mcp_client = None
+        stage_state_tracked = False
         
         try:
             # Step 1: Validate session exists and is paused
@@ -1114,7 +1136,10 @@ class AlertService:
             logger.info(f"Resuming paused session {session_id}")
             
             # Step 2: Get all stage executions for this session
+            # Resume may run on a different pod - the database snapshot seeds in-memory stage state
             stage_executions = await self.history_service.get_stage_executions(session_id)
+            self.stage_manager.track_session(session_id, stage_executions)
+            stage_state_tracked = True
             
             # Find paused stage
             paused_stage = None
@@ -1191,8 +1216,8 @@ class AlertService:
                     # Use helper method to handle synthesis + continuation
                     logger.info("Parallel stage completed after resume - continuing with synthesis")
                     
-                    # Get fresh stage executions for synthesis index calculation
-                    existing_stages = await self.history_service.get_stage_executions(session_id)
+                    # Get current stage executions for synthesis index calculation
+                    existing_stages = await self.stage_manager.get_stage_executions(session_id)
                     stage_config = chain_definition.stages[stage_index]
                     
                     # Note: This is called in async context, not returned
@@ -1319,7 +1344,8 @@ class AlertService:
                 summary_result = await self.final_analysis_summarizer.generate_executive_summary(
                     content=analysis,
                     session_id=session_id,
-                    provider=chain_definition.llm_provider
+                    provider=chain_definition.llm_provider,
+                    model=self._summary_model_for(chain_definition)
                 )
                 
                 # Mark as completed FIRST (database commit)
@@ -1396,6 +1422,9 @@ class AlertService:
             raise
         
         finally:
+            if stage_state_tracked:
+                self.stage_manager.untrack_session(session_id)
+            
             # Clean up MCP client
             if session_mcp_client:
                 try:
@@ -1409,6 +1438,58 @@ class AlertService:
         chain_definition: ChainConfigModel, 
         chain_context: ChainContext,
         session_mcp_client: MCPClient
+    ) -> ChainExecutionResult:
+        """
+        Execute chain stages within the session's token budget.
+        
+        Args:
+            chain_definition: Chain definition with stages
+            chain_context: Chain context with all processing data
+            session_mcp_client: Session-scoped MCP client for all stages in this chain
+            
+        Returns:
+            ChainExecutionResult with execution results
+        """
+        session_budget = await self._create_session_token_budget(chain_definition, chain_context)
+        with token_budget_scope(session_budget):
+            return await self._run_chain_stages(chain_definition, chain_context, session_mcp_client)
+    
+    async def _create_session_token_budget(
+        self,
+        chain_definition: ChainConfigModel,
+        chain_context: ChainContext
+    ) -> Optional[TokenBudget]:
+        """
+        Create the session's token budget (chain token_budget, else settings.session_token_budget).
+        
+        A resumed session starts with the tokens its earlier stages already used.
+        
+        Returns:
+            TokenBudget, or None if the session has no budget
+        """
+        limit = chain_definition.token_budget or self.settings.session_token_budget
+        if not limit:
+            return None
+        
+        budget = TokenBudget("session", limit)
+        if chain_context.current_stage_name:
+            try:
+                stats = await self.history_service.get_session_summary(chain_context.session_id)
+                if stats and stats.session_total_tokens:
+                    budget.used = stats.session_total_tokens
+            except Exception as e:
+                logger.warning(f"Failed to load token usage for session {chain_context.session_id}: {e}")
+        
+        logger.info(
+            f"Session {chain_context.session_id} token budget: {budget.used:,}/{budget.limit:,} tokens used"
+        )
+        return budget
+    
+    async def _run_chain_stages(
+        self, 
+        chain_definition: ChainConfigModel, 
+        chain_context: ChainContext,
+        session_mcp_client: MCPClient
     ) -> ChainExecutionResult:
         """
         Execute chain stages sequentially with accumulated data flow.
@@ -1443,7 +1524,7 @@ class AlertService:
             # Track actual executed stage count (including dynamically added synthesis stages)
             # When resuming, count existing stages to get accurate count
             if chain_context.current_stage_name:
-                existing_stages = await self.history_service.get_stage_executions(chain_context.session_id)
+                existing_stages = await self.stage_manager.get_stage_executions(chain_context.session_id)
                 # Filter to non-parallel-child stages (parents and single stages only)
                 non_child_stages = [s for s in existing_stages if s.parent_stage_execution_id is None]
                 executed_stage_count = len(non_child_stages)
@@ -1458,6 +1539,8 @@ class AlertService:
                     continue
                     
                 logger.info(f"Executing stage {i+1}/{len(chain_definition.stages)}: '{stage.name}' with agent '{stage.agent}'")
+                # Sessions further along their chain get LLM rate budget first
+                set_llm_priority(i / len(chain_definition.stages))
                 
                 # Check if this is a parallel stage BEFORE creating execution record
                 # Parallel stages create their own parent execution record with correct parallel_type
@@ -1469,8 +1552,8 @@ class AlertService:
                     # For resumed sessions, reuse existing stage execution ID for the paused stage
                     # For new sessions or subsequent stages, create new stage execution record
                     if i == start_from_stage and chain_context.current_stage_name:
-                        # Resuming - find existing stage execution ID from history
-                        stage_executions = await self.history_service.get_stage_executions(chain_context.session_id)
+                        # Resuming - find existing stage execution ID from stage state
+                        stage_executions = await self.stage_manager.get_stage_executions(chain_context.session_id)
                         paused_stage_exec = next((s for s in stage_executions if s.stage_name == stage.name and s.status == StageStatus.PAUSED.value), None)
                         if paused_stage_exec:
                             stage_execution_id = paused_stage_exec.execution_id
@@ -1876,6 +1959,18 @@ class AlertService:
                 timestamp_us=timestamp_us
             )
     
+    @staticmethod
+    def _summary_model_for(chain_definition: ChainConfigModel) -> Optional[str]:
+        """
+        Model the chain configures for the executive summary (None for the provider default).
+
+        Only valid together with provider=chain_definition.llm_provider, the provider
+        the chain's interaction_models are written for.
+        """
+        return (chain_definition.interaction_models or {}).get(
+            LLMInteractionType.FINAL_ANALYSIS_SUMMARY.value
+        )
+
     def _aggregate_stage_errors(self, chain_context: ChainContext) -> str:
         """
         Aggregate error messages from failed stages into a descriptive chain-level error.
@@ -145,6 +145,8 @@ class ChainRegistry:
                         max_iterations=chain_data.get("max_iterations"),
                         force_conclusion_at_max_iterations=chain_data.get("force_conclusion_at_max_iterations"),
                         mcp_servers=chain_data.get("mcp_servers"),
+                        interaction_models=chain_data.get("interaction_models"),
+                        token_budget=chain_data.get("token_budget"),
                         chat=ChatConfig(
                             enabled=chain_data["chat"].get("enabled", True),
                             agent=chain_data["chat"].get("agent"),
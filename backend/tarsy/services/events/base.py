@@ -4,15 +4,22 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Awaitable
 from contextlib import suppress
 from typing import Callable, Dict, List
 
+from .codec import EncodedEvent
+from .local_delivery import LOCAL_ORIGIN_ID, ORIGIN_KEY
+
 logger = logging.getLogger(__name__)
 
 # Type alias for async event callbacks
 AsyncCallback = Callable[[dict], Awaitable[None]]
 
+# Upper bound on remembered IDs of locally delivered events
+MAX_LOCAL_EVENT_IDS = 10000
+
 
 class EventListener(ABC):
     """Abstract base class for event listener implementations."""
@@ -22,6 +29,8 @@ class EventListener(ABC):
         self.running: bool = False
         self.last_activity: Dict[str, float] = {}  # Track last activity per channel
         self._cleanup_task: asyncio.Task | None = None  # Background cleanup task
+        # IDs of persisted events already delivered in-process (see local_delivery)
+        self._local_event_ids: "OrderedDict[int, None]" = OrderedDict()
 
     @abstractmethod
     async def start(self) -> None:
@@ -109,6 +118,10 @@ class EventListener(ABC):
 
     async def _dispatch_to_callbacks(self, channel: str, event: dict) -> None:
         """Dispatch event to all registered callbacks."""
+        if not isinstance(event, EncodedEvent):
+            # Encoded at most once, however many subscribers receive it
+            event = EncodedEvent(event)
+
         # Update activity time on event dispatch
         self.last_activity[channel] = time.time()
         
@@ -121,6 +134,49 @@ class EventListener(ABC):
                 logger.info(f"🔍 Creating task for cancellation callback: {callback}")
             asyncio.create_task(self._safe_callback(callback, event))
 
+    async def dispatch_local(self, channel: str, event: dict) -> None:
+        """
+        Dispatch an event published by this process without waiting for NOTIFY/polling.
+
+        Args:
+            channel: Channel the event was published to
+            event: Event payload (with "id" for persisted events)
+        """
+        if not self.callbacks.get(channel):
+            return
+        await self._dispatch_to_callbacks(channel, event)
+
+    def claim_local_event(self, event_id: int) -> None:
+        """
+        Mark a persisted event as delivered in-process before it is committed.
+
+        Claiming before the commit keeps a poll or NOTIFY that races the
+        commit from dispatching the event ahead of dispatch_local().
+
+        Args:
+            event_id: ID of the flushed (not yet committed) event
+        """
+        self._local_event_ids[event_id] = None
+        while len(self._local_event_ids) > MAX_LOCAL_EVENT_IDS:
+            self._local_event_ids.popitem(last=False)
+
+    def release_local_event(self, event_id: int) -> None:
+        """Forget a claimed event whose transaction was rolled back."""
+        self._local_event_ids.pop(event_id, None)
+
+    def _is_local_echo(self, event: dict) -> bool:
+        """
+        Whether a received event was already delivered in-process.
+
+        Strips the origin tag from the event as a side effect.
+        """
+        origin = event.pop(ORIGIN_KEY, None)
+        event_id = event.get("id")
+        if event_id is not None and event_id in self._local_event_ids:
+            del self._local_event_ids[event_id]
+            return True
+        return origin == LOCAL_ORIGIN_ID
+
     async def _safe_callback(self, callback: AsyncCallback, event: dict) -> None:
         """Execute callback with error handling."""
         try:
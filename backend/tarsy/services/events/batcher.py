@@ -0,0 +1,136 @@
+"""
+Coalescing of event bursts into shared publish transactions.
+
+A single MCP tool call publishes several events within milliseconds (started,
+progress, tool_call, progress), each previously costing its own transaction.
+When enabled (EVENT_PUBLISH_BATCH_WINDOW_MS > 0), event helpers hand their
+events to the process-wide EventBatcher instead of publishing directly.
+
+Logic:
+- The first submission opens a batch window; everything submitted within the
+  window is published by one flush: one pooled connection from the event
+  publishing pool, one transaction, one commit
+- Events keep their submission order, so per-channel ordering is unchanged
+- Callers await their own events' IDs; if the flush fails every caller in the
+  batch gets the error
+- Submissions arriving while a flush is writing open the next batch window
+  once it completes
+- shutdown() flushes whatever is still pending
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+from tarsy.database.init_db import get_async_session_factory
+from tarsy.models.event_models import BaseEvent
+from tarsy.services.events.publisher import publish_events
+
+logger = logging.getLogger(__name__)
+
+EventBatchItem = Tuple[str, BaseEvent]
+
+
+class EventBatcher:
+    """Publishes events submitted within a short window in one transaction."""
+
+    def __init__(self, window_ms: int) -> None:
+        """
+        Initialize event batcher.
+
+        Args:
+            window_ms: How long a batch stays open after its first submission
+        """
+        self.window_seconds = window_ms / 1000
+        self._pending: List[Tuple[Sequence[EventBatchItem], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.flushes: int = 0
+        self.events_published: int = 0
+
+    async def publish(self, events: Sequence[EventBatchItem]) -> List[int]:
+        """
+        Publish events in the next batch.
+
+        Args:
+            events: (channel, event) pairs of one logical update
+
+        Returns:
+            Event IDs in the same order
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((events, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.window_seconds)
+        await self.flush()
+        if self._pending:
+            # Submitted while this flush was writing (when this task wasn't done yet)
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def flush(self) -> None:
+        """Publish every pending submission in one transaction."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        items = [item for events, _ in batch for item in events]
+        try:
+            async_session_factory = get_async_session_factory()
+            async with async_session_factory() as session:
+                event_ids = await publish_events(session, items)
+
+            self.flushes += 1
+            self.events_published += len(items)
+            position = 0
+            for events, future in batch:
+                if not future.done():
+                    future.set_result(event_ids[position:position + len(events)])
+                position += len(events)
+            logger.debug(f"Published {len(items)} event(s) from {len(batch)} update(s) in one transaction")
+        except Exception as e:
+            # Never leave callers waiting on a batch that wasn't published
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def shutdown(self) -> None:
+        """Flush pending events and stop the window timer."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        await self.flush()
+
+
+_event_batcher: Optional[EventBatcher] = None
+
+
+def get_event_batcher() -> Optional[EventBatcher]:
+    """Get the process-wide event batcher, or None if batching is disabled."""
+    return _event_batcher
+
+
+def initialize_event_batcher(window_ms: int) -> Optional[EventBatcher]:
+    """
+    Enable event batching for this process.
+
+    Args:
+        window_ms: Batch window in milliseconds (0 disables batching)
+    """
+    global _event_batcher
+    _event_batcher = EventBatcher(window_ms) if window_ms > 0 else None
+    if _event_batcher is not None:
+        logger.info(f"Event publishing batched with a {window_ms}ms window")
+    return _event_batcher
+
+
+async def shutdown_event_batcher() -> None:
+    """Flush and disable the process-wide event batcher."""
+    global _event_batcher
+    if _event_batcher is not None:
+        await _event_batcher.shutdown()
+        _event_batcher = None
@@ -0,0 +1,72 @@
+"""
+JSON encoding of events, done once per event and process.
+
+An event used to be encoded and decoded several times on its way to the
+browser: json.dumps for NOTIFY, json.loads in the listener, json.dumps again
+in every channel broadcast, and send_json per event during catch-up.
+
+Logic:
+- orjson is used when installed (it is pulled in by the LangChain stack), with
+  a compact stdlib json fallback producing the same output
+- EncodedEvent is the event dict handed to listener callbacks; it caches its
+  JSON text, so fan-out sends the same string to every subscriber
+- The PostgreSQL listener attaches the NOTIFY payload itself as the cached text
+  when it already is the event exactly as clients receive it
+"""
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj: Any) -> str:
+    """Encode to compact JSON text."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - let the stdlib decide
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class EncodedEvent(dict):
+    """
+    Event dict that remembers its JSON encoding.
+
+    Encoded on first use and reused for every channel and subscriber it is
+    sent to, so it must not be modified once handed to listener callbacks
+    (copy it with {**event} to change it).
+    """
+
+    __slots__ = ("_text",)
+
+    def __init__(self, event: dict, text: Optional[str] = None) -> None:
+        super().__init__(event)
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        """JSON text of the event."""
+        if self._text is None:
+            self._text = dumps(self)
+        return self._text
+
+
+def encode_event(event: dict) -> str:
+    """JSON text of an event, reusing the cached encoding of an EncodedEvent."""
+    if isinstance(event, EncodedEvent):
+        return event.text
+    return dumps(event)
@@ -1,13 +1,21 @@
-"""Helper functions for publishing events from sync/async contexts."""
+"""
+Helper functions for publishing events from sync/async contexts.
+
+Each helper publishes one logical update - an event on one or more channels -
+with a single transaction and commit. If an event batcher is configured (see
+batcher.py) updates from concurrent helpers are coalesced further.
+"""
 
 import asyncio
 import logging
 from typing import Optional, Union
 
 from tarsy.database.init_db import get_async_session_factory
+from tarsy.integrations.llm.token_budget import get_tightest_token_budget
 from tarsy.models.constants import AlertSessionStatus, ProgressPhase
 from tarsy.models.event_models import (
     AgentCancelledEvent,
+    BaseEvent,
     ChatCancelRequestedEvent,
     ChatCreatedEvent,
     ChatUserMessageEvent,
@@ -28,12 +36,26 @@ from tarsy.models.event_models import (
     StageCompletedEvent,
     StageStartedEvent,
 )
+from tarsy.services.events.batcher import get_event_batcher
 from tarsy.services.events.channels import EventChannel
-from tarsy.services.events.publisher import publish_event
+from tarsy.services.events.publisher import event_transaction, publish_event
 
 logger = logging.getLogger(__name__)
 
 
+async def _publish(event: BaseEvent, *channels: str) -> None:
+    """Publish one event to one or more channels in a single transaction."""
+    batcher = get_event_batcher()
+    if batcher is not None:
+        await batcher.publish([(channel, event) for channel in channels])
+        return
+
+    async_session_factory = get_async_session_factory()
+    async with async_session_factory() as session, event_transaction(session):
+        for channel in channels:
+            await publish_event(session, channel, event)
+
+
 async def publish_session_created(session_id: str, alert_type: str) -> None:
     """
     Publish session.created event to both global and session-specific channels.
@@ -43,14 +65,10 @@ async def publish_session_created(session_id: str, alert_type: str) -> None:
         alert_type: Type of alert being processed
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionCreatedEvent(session_id=session_id, alert_type=alert_type)
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info(f"[EVENT] Published session.created to channels: 'sessions' and 'session:{session_id}'")
+        event = SessionCreatedEvent(session_id=session_id, alert_type=alert_type)
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info(f"[EVENT] Published session.created to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -67,14 +85,10 @@ async def publish_session_started(session_id: str, alert_type: str) -> None:
         alert_type: Type of alert being processed
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionStartedEvent(session_id=session_id, alert_type=alert_type)
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info(f"[EVENT] Published session.started to channels: 'sessions' and 'session:{session_id}'")
+        event = SessionStartedEvent(session_id=session_id, alert_type=alert_type)
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info(f"[EVENT] Published session.started to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -90,14 +104,10 @@ async def publish_session_completed(session_id: str) -> None:
         session_id: Session identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionCompletedEvent(session_id=session_id, status=AlertSessionStatus.COMPLETED.value)
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info(f"[EVENT] Published session.completed to channels: 'sessions' and 'session:{session_id}'")
+        event = SessionCompletedEvent(session_id=session_id, status=AlertSessionStatus.COMPLETED.value)
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info(f"[EVENT] Published session.completed to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         # Don't suppress CancelledError - it indicates task/pod shutdown
         # but log that we couldn't publish the event
@@ -115,14 +125,10 @@ async def publish_session_failed(session_id: str) -> None:
         session_id: Session identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionFailedEvent(session_id=session_id, status=AlertSessionStatus.FAILED.value)
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info(f"[EVENT] Published session.failed to channels: 'sessions' and 'session:{session_id}'")
+        event = SessionFailedEvent(session_id=session_id, status=AlertSessionStatus.FAILED.value)
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info(f"[EVENT] Published session.failed to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -138,14 +144,10 @@ async def publish_session_timed_out(session_id: str) -> None:
         session_id: Session identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionTimedOutEvent(session_id=session_id, status=AlertSessionStatus.TIMED_OUT.value)
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info(f"[EVENT] Published session.timed_out to channels: 'sessions' and 'session:{session_id}'")
+        event = SessionTimedOutEvent(session_id=session_id, status=AlertSessionStatus.TIMED_OUT.value)
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info(f"[EVENT] Published session.timed_out to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -162,18 +164,14 @@ async def publish_session_paused(session_id: str, pause_metadata: Optional[dict]
         pause_metadata: Optional metadata about why session paused
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionPausedEvent(
-                session_id=session_id, 
-                status=AlertSessionStatus.PAUSED.value,
-                pause_metadata=pause_metadata
-            )
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info(f"[EVENT] Published session.paused to channels: 'sessions' and 'session:{session_id}'")
+        event = SessionPausedEvent(
+            session_id=session_id, 
+            status=AlertSessionStatus.PAUSED.value,
+            pause_metadata=pause_metadata
+        )
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info(f"[EVENT] Published session.paused to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -189,14 +187,10 @@ async def publish_session_resumed(session_id: str) -> None:
         session_id: Session identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionResumedEvent(session_id=session_id, status=AlertSessionStatus.IN_PROGRESS.value)
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info(f"[EVENT] Published session.resumed to channels: 'sessions' and 'session:{session_id}'")
+        event = SessionResumedEvent(session_id=session_id, status=AlertSessionStatus.IN_PROGRESS.value)
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info(f"[EVENT] Published session.resumed to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -229,30 +223,30 @@ async def publish_session_progress_update(
         # Convert enum to string value if needed
         phase_value = phase.value if isinstance(phase, ProgressPhase) else phase
         
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionProgressUpdateEvent(
-                session_id=session_id,
-                phase=phase_value,
-                metadata=metadata,
-                stage_execution_id=stage_execution_id,
-                parent_stage_execution_id=parent_stage_execution_id,
-                parallel_index=parallel_index,
-                agent_name=agent_name
-            )
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
+        # Remaining tokens of the calling task's session/agent budget
+        token_budget = get_tightest_token_budget()
+        
+        event = SessionProgressUpdateEvent(
+            session_id=session_id,
+            phase=phase_value,
+            metadata=metadata,
+            stage_execution_id=stage_execution_id,
+            parent_stage_execution_id=parent_stage_execution_id,
+            parallel_index=parallel_index,
+            agent_name=agent_name,
+            token_budget=token_budget.to_dict() if token_budget else None
+        )
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
             
-            # Log with parallel context if available
-            if parallel_index is not None and agent_name:
-                logger.info(
-                    f"[EVENT] Published session.progress_update (phase={phase_value}, agent={agent_name}, "
-                    f"parallel_index={parallel_index}) to channels: 'sessions' and 'session:{session_id}'"
-                )
-            else:
-                logger.info(f"[EVENT] Published session.progress_update (phase={phase_value}) to channels: 'sessions' and 'session:{session_id}'")
+        # Log with parallel context if available
+        if parallel_index is not None and agent_name:
+            logger.info(
+                f"[EVENT] Published session.progress_update (phase={phase_value}, agent={agent_name}, "
+                f"parallel_index={parallel_index}) to channels: 'sessions' and 'session:{session_id}'"
+            )
+        else:
+            logger.info(f"[EVENT] Published session.progress_update (phase={phase_value}) to channels: 'sessions' and 'session:{session_id}'")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -272,17 +266,13 @@ async def publish_llm_interaction(
         stage_id: Optional stage execution identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = LLMInteractionEvent(
-                session_id=session_id,
-                interaction_id=interaction_id,
-                stage_id=stage_id,
-            )
-            await publish_event(
-                session, EventChannel.session_details(session_id), event
-            )
-            logger.debug(f"Published llm.interaction event for {interaction_id}")
+        event = LLMInteractionEvent(
+            session_id=session_id,
+            interaction_id=interaction_id,
+            stage_id=stage_id,
+        )
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.debug(f"Published llm.interaction event for {interaction_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -310,20 +300,16 @@ async def publish_mcp_tool_call_started(
         stage_id: Optional stage execution identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = MCPToolCallStartedEvent(
-                session_id=session_id,
-                communication_id=communication_id,
-                stage_id=stage_id,
-                server_name=server_name,
-                tool_name=tool_name,
-                tool_arguments=tool_arguments,
-            )
-            await publish_event(
-                session, EventChannel.session_details(session_id), event
-            )
-            logger.debug(f"Published mcp.tool_call.started event for {communication_id}")
+        event = MCPToolCallStartedEvent(
+            session_id=session_id,
+            communication_id=communication_id,
+            stage_id=stage_id,
+            server_name=server_name,
+            tool_name=tool_name,
+            tool_arguments=tool_arguments,
+        )
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.debug(f"Published mcp.tool_call.started event for {communication_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -347,18 +333,14 @@ async def publish_mcp_tool_call(
         stage_id: Optional stage execution identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = MCPToolCallEvent(
-                session_id=session_id,
-                interaction_id=interaction_id,
-                tool_name=tool_name,
-                stage_id=stage_id,
-            )
-            await publish_event(
-                session, EventChannel.session_details(session_id), event
-            )
-            logger.debug(f"Published mcp.tool_call event for {interaction_id}")
+        event = MCPToolCallEvent(
+            session_id=session_id,
+            interaction_id=interaction_id,
+            tool_name=tool_name,
+            stage_id=stage_id,
+        )
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.debug(f"Published mcp.tool_call event for {interaction_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -382,18 +364,14 @@ async def publish_mcp_tool_list(
         stage_id: Optional stage execution identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = MCPToolListEvent(
-                session_id=session_id,
-                request_id=request_id,
-                server_name=server_name,
-                stage_id=stage_id,
-            )
-            await publish_event(
-                session, EventChannel.session_details(session_id), event
-            )
-            logger.debug(f"Published mcp.tool_list event for {request_id}")
+        event = MCPToolListEvent(
+            session_id=session_id,
+            request_id=request_id,
+            server_name=server_name,
+            stage_id=stage_id,
+        )
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.debug(f"Published mcp.tool_list event for {request_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -431,25 +409,21 @@ async def publish_stage_started(
         parallel_index: Optional position in parallel group (1-N) if this is a child stage
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = StageStartedEvent(
-                session_id=session_id, 
-                stage_id=stage_id, 
-                stage_name=stage_name, 
-                chat_id=chat_id,
-                chat_user_message_id=chat_user_message_id,
-                chat_user_message_content=chat_user_message_content,
-                chat_user_message_author=chat_user_message_author,
-                parallel_type=parallel_type,
-                expected_parallel_count=expected_parallel_count,
-                parent_stage_execution_id=parent_stage_execution_id,
-                parallel_index=parallel_index,
-            )
-            await publish_event(
-                session, EventChannel.session_details(session_id), event
-            )
-            logger.debug(f"Published stage.started event for {stage_id}")
+        event = StageStartedEvent(
+            session_id=session_id, 
+            stage_id=stage_id, 
+            stage_name=stage_name, 
+            chat_id=chat_id,
+            chat_user_message_id=chat_user_message_id,
+            chat_user_message_content=chat_user_message_content,
+            chat_user_message_author=chat_user_message_author,
+            parallel_type=parallel_type,
+            expected_parallel_count=expected_parallel_count,
+            parent_stage_execution_id=parent_stage_execution_id,
+            parallel_index=parallel_index,
+        )
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.debug(f"Published stage.started event for {stage_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -481,22 +455,18 @@ async def publish_stage_completed(
         error_message: Optional error message if stage failed or timed out
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = StageCompletedEvent(
-                session_id=session_id,
-                stage_id=stage_id,
-                stage_name=stage_name,
-                status=status,
-                chat_id=chat_id,
-                parent_stage_execution_id=parent_stage_execution_id,
-                parallel_index=parallel_index,
-                error_message=error_message,
-            )
-            await publish_event(
-                session, EventChannel.session_details(session_id), event
-            )
-            logger.debug(f"Published stage.completed event for {stage_id}")
+        event = StageCompletedEvent(
+            session_id=session_id,
+            stage_id=stage_id,
+            stage_name=stage_name,
+            status=status,
+            chat_id=chat_id,
+            parent_stage_execution_id=parent_stage_execution_id,
+            parallel_index=parallel_index,
+            error_message=error_message,
+        )
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.debug(f"Published stage.completed event for {stage_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -515,12 +485,10 @@ async def publish_cancel_request(session_id: str) -> None:
         session_id: Session identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionCancelRequestedEvent(session_id=session_id)
-            # Publish to cancellations channel (backend-only)
-            await publish_event(session, EventChannel.CANCELLATIONS, event)
-            logger.info(f"[EVENT] Published session.cancel_requested for {session_id}")
+        event = SessionCancelRequestedEvent(session_id=session_id)
+        # Publish to cancellations channel (backend-only)
+        await _publish(event, EventChannel.CANCELLATIONS)
+        logger.info(f"[EVENT] Published session.cancel_requested for {session_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -542,12 +510,10 @@ async def publish_chat_cancel_request(stage_execution_id: str) -> None:
         stage_execution_id: Stage execution identifier for the chat response
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = ChatCancelRequestedEvent(stage_execution_id=stage_execution_id)
-            # Publish to cancellations channel (backend-only)
-            await publish_event(session, EventChannel.CANCELLATIONS, event)
-            logger.info(f"[EVENT] Published chat.cancel_requested for {stage_execution_id}")
+        event = ChatCancelRequestedEvent(stage_execution_id=stage_execution_id)
+        # Publish to cancellations channel (backend-only)
+        await _publish(event, EventChannel.CANCELLATIONS)
+        logger.info(f"[EVENT] Published chat.cancel_requested for {stage_execution_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled (task/pod shutting down)")
         raise
@@ -566,14 +532,10 @@ async def publish_session_cancelled(session_id: str) -> None:
         session_id: Session identifier
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = SessionCancelledEvent(session_id=session_id, status=AlertSessionStatus.CANCELLED.value)
-            # Publish to global 'sessions' channel for dashboard
-            await publish_event(session, EventChannel.SESSIONS, event)
-            # Also publish to session-specific channel for detail views
-            await publish_event(session, f"session:{session_id}", event)
-            logger.info("[EVENT] Published session.cancelled to channels")
+        event = SessionCancelledEvent(session_id=session_id, status=AlertSessionStatus.CANCELLED.value)
+        # Global 'sessions' channel for dashboard, session channel for detail views
+        await _publish(event, EventChannel.SESSIONS, f"session:{session_id}")
+        logger.info("[EVENT] Published session.cancelled to channels")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -599,17 +561,15 @@ async def publish_agent_cancelled(
         parent_stage_execution_id: Parent stage execution ID
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = AgentCancelledEvent(
-                session_id=session_id,
-                execution_id=execution_id,
-                agent_name=agent_name,
-                parent_stage_execution_id=parent_stage_execution_id
-            )
-            # Publish to session-specific channel for real-time UI updates
-            await publish_event(session, EventChannel.session_details(session_id), event)
-            logger.info(f"[EVENT] Published agent.cancelled for {agent_name} (execution_id={execution_id})")
+        event = AgentCancelledEvent(
+            session_id=session_id,
+            execution_id=execution_id,
+            agent_name=agent_name,
+            parent_stage_execution_id=parent_stage_execution_id
+        )
+        # Publish to session-specific channel for real-time UI updates
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.info(f"[EVENT] Published agent.cancelled for {agent_name} (execution_id={execution_id})")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -631,16 +591,14 @@ async def publish_chat_created(
         created_by: User who created the chat
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = ChatCreatedEvent(
-                session_id=session_id,
-                chat_id=chat_id,
-                created_by=created_by
-            )
-            # Publish to session-specific channel (reuse existing subscription)
-            await publish_event(session, EventChannel.session_details(session_id), event)
-            logger.info(f"[EVENT] Published chat.created for chat {chat_id} to session:{session_id}")
+        event = ChatCreatedEvent(
+            session_id=session_id,
+            chat_id=chat_id,
+            created_by=created_by
+        )
+        # Publish to session-specific channel (reuse existing subscription)
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.info(f"[EVENT] Published chat.created for chat {chat_id} to session:{session_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -666,18 +624,16 @@ async def publish_chat_user_message(
         author: Message author
     """
     try:
-        async_session_factory = get_async_session_factory()
-        async with async_session_factory() as session:
-            event = ChatUserMessageEvent(
-                session_id=session_id,
-                chat_id=chat_id,
-                message_id=message_id,
-                content=content,
-                author=author
-            )
-            # Publish to session-specific channel (reuse existing subscription)
-            await publish_event(session, EventChannel.session_details(session_id), event)
-            logger.debug(f"Published chat.user_message for message {message_id}")
+        event = ChatUserMessageEvent(
+            session_id=session_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            content=content,
+            author=author
+        )
+        # Publish to session-specific channel (reuse existing subscription)
+        await _publish(event, EventChannel.session_details(session_id))
+        logger.debug(f"Published chat.user_message for message {message_id}")
     except asyncio.CancelledError:
         logger.warning(f"Event publishing cancelled for session {session_id} (task/pod shutting down)")
         raise
@@ -0,0 +1,67 @@
+"""
+Same-pod short-circuit delivery of published events.
+
+The pod running a session usually also serves the WebSocket watching it, yet
+its events used to reach local subscribers only after the INSERT/NOTIFY/LISTEN
+round trip (or the SQLite poll interval).
+
+Logic:
+- When enabled, EventSystemManager attaches its listener here; publishers hand
+  every event to it right after the commit (or NOTIFY for transient events),
+  and it is dispatched to this pod's subscribers immediately
+- NOTIFY payloads are tagged with this process's origin ID, so the PostgreSQL
+  listener drops its own echoes; persisted events are also claimed by event ID
+  once flushed, before the commit, so the SQLite poller skips them even if it
+  polls between the commit and the local dispatch (claims are released on
+  rollback)
+- Other pods are unaffected: they still receive events through NOTIFY/polling
+"""
+
+import uuid
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from tarsy.services.events.base import EventListener
+
+# Payload key identifying the process that published a NOTIFY
+ORIGIN_KEY = "_origin"
+
+# Unique per process (pod)
+LOCAL_ORIGIN_ID = uuid.uuid4().hex
+
+_local_listener: Optional["EventListener"] = None
+
+
+def attach_local_listener(listener: Optional["EventListener"]) -> None:
+    """Enable local delivery through this listener (None disables it)."""
+    global _local_listener
+    _local_listener = listener
+
+
+def get_local_listener() -> Optional["EventListener"]:
+    """Listener receiving locally published events, or None if disabled."""
+    return _local_listener
+
+
+async def deliver_locally(channel: str, event: dict) -> None:
+    """
+    Dispatch a just-published event to this pod's subscribers.
+
+    Args:
+        channel: Channel the event was published to
+        event: Event exactly as remote listeners receive it
+    """
+    if _local_listener is not None:
+        await _local_listener.dispatch_local(channel, event)
+
+
+def claim_local_event(event_id: int) -> None:
+    """Claim a flushed persisted event for local delivery (see EventListener.claim_local_event)."""
+    if _local_listener is not None:
+        _local_listener.claim_local_event(event_id)
+
+
+def release_local_event(event_id: int) -> None:
+    """Release the claim on an event whose transaction was rolled back."""
+    if _local_listener is not None:
+        _local_listener.release_local_event(event_id)
@@ -5,6 +5,7 @@ from typing import Callable, Optional
 from tarsy.services.events.base import EventListener
 from tarsy.services.events.cleanup import EventCleanupService
 from tarsy.services.events.factory import create_event_listener
+from tarsy.services.events.local_delivery import attach_local_listener
 from tarsy.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +25,7 @@ class EventSystemManager:
         db_session_factory: Callable,
         event_retention_hours: int = 24,
         event_cleanup_interval_hours: int = 6,
+        local_delivery: bool = True,
     ):
         """
         Initialize event system manager.
@@ -33,11 +35,14 @@ class EventSystemManager:
             db_session_factory: Factory for database sessions
             event_retention_hours: Event retention period (hours)
             event_cleanup_interval_hours: Cleanup interval (hours)
+            local_delivery: Deliver events published by this process to its
+                own subscribers in-process, without the NOTIFY/poll round trip
         """
         self.database_url = database_url
         self.db_session_factory = db_session_factory
         self.event_retention_hours = event_retention_hours
         self.event_cleanup_interval_hours = event_cleanup_interval_hours
+        self.local_delivery = local_delivery
 
         self.event_listener: Optional[EventListener] = None
         self.cleanup_service: Optional[EventCleanupService] = None
@@ -50,6 +55,8 @@ class EventSystemManager:
         # 1. Create and start event listener (PostgreSQL or SQLite)
         self.event_listener = create_event_listener(self.database_url)
         await self.event_listener.start()
+        if self.local_delivery:
+            attach_local_listener(self.event_listener)
 
         # 2. Start cleanup service
         self.cleanup_service = EventCleanupService(
@@ -69,6 +76,7 @@ class EventSystemManager:
             await self.cleanup_service.stop()
 
         if self.event_listener:
+            attach_local_listener(None)
             await self.event_listener.stop()
 
         logger.info("Event system stopped")
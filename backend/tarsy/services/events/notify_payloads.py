@@ -0,0 +1,195 @@
+"""
+NOTIFY payload encoding that never exceeds PostgreSQL's payload size limit.
+
+PostgreSQL rejects NOTIFY payloads of 8000 bytes or more, so events are
+encoded according to their size.
+
+Logic:
+- Small events are sent as-is (event JSON, plus "id" for persisted events)
+- Large persisted events are "spilled": NOTIFY carries only {id, channel, type,
+  spilled} and listeners fetch the body from the events table by id
+- Large transient events (not in the events table) are split into numbered
+  parts sent in the same transaction and reassembled by listeners
+
+With NOTIFY sharding enabled (EVENT_NOTIFY_SHARD_COUNT > 0) events are sent on a
+small fixed set of physical channels (tarsy_events_0..N-1, chosen by hashing
+the logical channel) and carry their logical channel in "_channel", so
+listeners LISTEN once per shard and route in memory.
+"""
+
+import time
+import uuid
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from tarsy.services.events.codec import dumps, loads
+
+# PostgreSQL limit is 8000 bytes; keep headroom for the chunk envelope
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+# Envelope overhead reserved for each part of a chunked transient event
+_CHUNK_ENVELOPE_BYTES = 200
+
+# Incomplete chunked events are discarded after this many seconds
+CHUNK_ASSEMBLY_TIMEOUT_SECONDS = 60.0
+
+# Payload key carrying the logical channel when NOTIFY sharding is enabled
+ROUTING_KEY = "_channel"
+
+NOTIFY_SHARD_PREFIX = "tarsy_events_"
+
+_notify_shard_count = 0
+
+
+def configure_notify_shards(shard_count: int) -> None:
+    """
+    Set the number of physical NOTIFY channels (0 = one per logical channel).
+
+    Must be the same on every pod and set before the event system starts.
+    """
+    global _notify_shard_count
+    _notify_shard_count = shard_count
+
+
+def get_notify_shard_count() -> int:
+    """Number of physical NOTIFY channels (0 if sharding is disabled)."""
+    return _notify_shard_count
+
+
+def notify_shard_channels() -> List[str]:
+    """All physical NOTIFY channels listeners must LISTEN on in sharded mode."""
+    return [f"{NOTIFY_SHARD_PREFIX}{index}" for index in range(_notify_shard_count)]
+
+
+def notify_channel(channel: str) -> str:
+    """Physical NOTIFY channel for a logical event channel."""
+    if _notify_shard_count <= 0:
+        return channel
+    return f"{NOTIFY_SHARD_PREFIX}{zlib.crc32(channel.encode('utf-8')) % _notify_shard_count}"
+
+
+def _with_routing(channel: str, payload: dict) -> dict:
+    """Add the logical channel to a payload when NOTIFY is sharded."""
+    if _notify_shard_count <= 0:
+        return payload
+    return {**payload, ROUTING_KEY: channel}
+
+
+def _payload_size(payload_json: str) -> int:
+    return len(payload_json.encode("utf-8"))
+
+
+def build_persisted_notify_payload(channel: str, event_dict: dict, event_id: int) -> str:
+    """
+    Encode a persisted event for NOTIFY.
+
+    Args:
+        channel: Channel the event was published to
+        event_dict: Serialized event
+        event_id: ID of the persisted event row
+
+    Returns:
+        Full event JSON, or a spill reference if the event is too large
+    """
+    payload_json = dumps(_with_routing(channel, {**event_dict, "id": event_id}))
+    if _payload_size(payload_json) <= MAX_NOTIFY_PAYLOAD_BYTES:
+        return payload_json
+    return dumps(_with_routing(channel, {
+        "id": event_id,
+        "channel": channel,
+        "type": event_dict.get("type"),
+        "spilled": True,
+    }))
+
+
+def build_transient_notify_payloads(channel: str, event_dict: dict) -> List[str]:
+    """
+    Encode a transient event for NOTIFY, splitting it into parts if too large.
+
+    Args:
+        channel: Channel the event is published to
+        event_dict: Serialized event
+
+    Returns:
+        NOTIFY payloads to send in order (a single one for small events)
+    """
+    payload_json = dumps(_with_routing(channel, event_dict))
+    if _payload_size(payload_json) <= MAX_NOTIFY_PAYLOAD_BYTES:
+        return [payload_json]
+
+    budget = MAX_NOTIFY_PAYLOAD_BYTES - _CHUNK_ENVELOPE_BYTES
+    pieces: List[str] = []
+    remaining = payload_json
+    while remaining:
+        piece = remaining[:budget]
+        # Escaping inside the envelope can inflate a piece - shrink until it fits
+        encoded_size = _payload_size(dumps(piece))
+        while encoded_size > budget:
+            piece = piece[:max(1, min(len(piece) - 1, len(piece) * budget // encoded_size))]
+            encoded_size = _payload_size(dumps(piece))
+        pieces.append(piece)
+        remaining = remaining[len(piece):]
+
+    message_id = uuid.uuid4().hex
+    return [
+        dumps(_with_routing(channel, {
+            "chunked": {"id": message_id, "index": index, "count": len(pieces)},
+            "data": piece,
+        }))
+        for index, piece in enumerate(pieces)
+    ]
+
+
+def is_spilled(event: dict) -> bool:
+    """Whether a NOTIFY payload is a reference to a persisted event body."""
+    return event.get("spilled") is True and "id" in event
+
+
+def is_chunk(event: dict) -> bool:
+    """Whether a NOTIFY payload is one part of a chunked transient event."""
+    return isinstance(event.get("chunked"), dict)
+
+
+class NotifyChunkAssembler:
+    """Reassembles chunked transient events from their NOTIFY parts."""
+
+    def __init__(self, timeout_seconds: float = CHUNK_ASSEMBLY_TIMEOUT_SECONDS) -> None:
+        self.timeout_seconds = timeout_seconds
+        # message id -> (first seen, parts received so far)
+        self._partial: Dict[str, Tuple[float, Dict[int, str]]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of chunked events still missing parts."""
+        return len(self._partial)
+
+    def add(self, part: dict) -> Optional[dict]:
+        """
+        Add one part of a chunked event.
+
+        Args:
+            part: Decoded NOTIFY payload (see is_chunk)
+
+        Returns:
+            The reassembled event once all parts arrived, otherwise None
+        """
+        info = part["chunked"]
+        message_id = info["id"]
+        now = time.monotonic()
+
+        if message_id not in self._partial:
+            self._discard_expired(now)
+            self._partial[message_id] = (now, {})
+        parts = self._partial[message_id][1]
+        parts[info["index"]] = part["data"]
+
+        if len(parts) < info["count"]:
+            return None
+        del self._partial[message_id]
+        return loads("".join(parts[i] for i in range(info["count"])))
+
+    def _discard_expired(self, now: float) -> None:
+        """Drop chunked events whose remaining parts never arrived."""
+        for message_id, (first_seen, _) in list(self._partial.items()):
+            if now - first_seen > self.timeout_seconds:
+                del self._partial[message_id]
@@ -1,13 +1,25 @@
 """PostgreSQL LISTEN/NOTIFY event listener."""
 
 import asyncio
-import json
 import logging
-from typing import Optional
+from collections import deque
+from contextlib import suppress
+from typing import Deque, Dict, List, Optional, Tuple
 
 import asyncpg
 
+from tarsy.database.pool_manager import ConnectionPoolManager, get_pool_manager
+
 from .base import EventListener
+from .codec import EncodedEvent, loads
+from .local_delivery import ORIGIN_KEY
+from .notify_payloads import (
+    ROUTING_KEY,
+    NotifyChunkAssembler,
+    is_chunk,
+    is_spilled,
+    notify_shard_channels,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,24 +29,54 @@ class PostgreSQLEventListener(EventListener):
     PostgreSQL LISTEN/NOTIFY event listener.
 
     Maintains dedicated connection for real-time notifications.
+
+    Oversized events (see notify_payloads) are resolved before dispatch: chunked
+    transient events are reassembled, and spilled persisted events are fetched
+    from the events table in batches. Events received while a fetch is pending
+    are queued behind it so per-channel ordering is preserved.
+
+    With NOTIFY sharding enabled the listener LISTENs on every shard channel at
+    start and routes events by the logical channel in their payload, so
+    subscribing and unsubscribing never touch the database.
     """
 
     def __init__(self, database_url: str):
         super().__init__()
         self.database_url = database_url
         self.listener_conn: Optional[asyncpg.Connection] = None
+        self._pool_manager: Optional[ConnectionPoolManager] = None
+        self._chunk_assembler = NotifyChunkAssembler()
+        # (channel, event) waiting for spilled bodies to be fetched, in arrival order
+        self._ordered_backlog: Deque[Tuple[str, dict]] = deque()
+        self._spill_task: Optional[asyncio.Task] = None
+        # The listener connection also runs LISTEN and spill fetches - one at a time
+        self._conn_lock = asyncio.Lock()
+        # Physical shard channels LISTENed on (empty: one LISTEN per logical channel)
+        self._shard_channels: List[str] = []
 
     async def start(self) -> None:
         """Create dedicated connection for LISTEN."""
         try:
             # Create separate connection (not from pool) with timeout
             # Timeout prevents hanging during startup if DB is unreachable
-            self.listener_conn = await asyncio.wait_for(
-                asyncpg.connect(self.database_url),
-                timeout=10.0  # 10 second timeout
-            )
+            self._pool_manager = get_pool_manager(self.database_url)
+            if self._pool_manager is not None:
+                # Counted against the event listening budget
+                self.listener_conn = await self._pool_manager.connect_listener(timeout=10.0)
+            else:
+                self.listener_conn = await asyncio.wait_for(
+                    asyncpg.connect(self.database_url),
+                    timeout=10.0  # 10 second timeout
+                )
             self.running = True
             
+            self._shard_channels = notify_shard_channels()
+            for shard_channel in self._shard_channels:
+                async with self._conn_lock:
+                    await self.listener_conn.add_listener(shard_channel, self._handle_notification)
+            if self._shard_channels:
+                logger.info(f"Listening on {len(self._shard_channels)} NOTIFY shard channel(s)")
+            
             # Start the universal cleanup task from base class
             await self._start_cleanup_task()
             
@@ -56,23 +98,38 @@ class PostgreSQLEventListener(EventListener):
         # Stop the universal cleanup task from base class
         await self._stop_cleanup_task()
         
+        if self._spill_task:
+            self._spill_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._spill_task
+            self._spill_task = None
+        self._ordered_backlog.clear()
+        
         if self.listener_conn:
-            await self.listener_conn.close()
+            if self._pool_manager is not None:
+                await self._pool_manager.release_listener(self.listener_conn)
+            else:
+                await self.listener_conn.close()
             logger.info("PostgreSQL event listener connection closed")
 
     async def _register_channel(self, channel: str) -> None:
         """Add PostgreSQL listener for channel."""
         if not self.listener_conn:
             raise RuntimeError("Listener not initialized")
+        if self._shard_channels:
+            # Sharded mode: shards are LISTENed at start, routing is in memory
+            return
 
-        await self.listener_conn.add_listener(channel, self._handle_notification)
+        async with self._conn_lock:
+            await self.listener_conn.add_listener(channel, self._handle_notification)
         logger.debug(f"Subscribed to PostgreSQL channel: {channel}")
     
     async def _cleanup_channel(self, channel: str) -> None:
         """Remove PostgreSQL listener for channel."""
-        if self.listener_conn:
+        if self.listener_conn and not self._shard_channels:
             try:
-                await self.listener_conn.remove_listener(channel, self._handle_notification)
+                async with self._conn_lock:
+                    await self.listener_conn.remove_listener(channel, self._handle_notification)
                 logger.debug(f"Unsubscribed from PostgreSQL channel: {channel}")
             except Exception as e:
                 logger.warning(f"Failed to remove PostgreSQL listener for {channel}: {e}")
@@ -94,13 +151,82 @@ class PostgreSQLEventListener(EventListener):
             payload: JSON string payload
         """
         try:
-            event = json.loads(payload)
+            event = loads(payload)
+            if is_chunk(event):
+                event = self._chunk_assembler.add(event)
+                if event is None:
+                    return  # Wait for the remaining parts
+            elif ROUTING_KEY not in event and ORIGIN_KEY not in event and not is_spilled(event):
+                # The payload is the event exactly as clients receive it - reuse its text
+                event = EncodedEvent(event, text=payload)
+            routed_channel = event.pop(ROUTING_KEY, None)
+            if routed_channel is not None:
+                channel = routed_channel
+                if channel not in self.callbacks:
+                    return  # Shard traffic for a channel nobody on this pod watches
+            if self._is_local_echo(event):
+                return  # Already delivered in-process by the publisher
             logger.debug(f"Received event on {channel}: {event.get('type', 'unknown')}")
 
+            if self._ordered_backlog or is_spilled(event):
+                # Keep ordering behind events whose body is still being fetched
+                self._ordered_backlog.append((channel, event))
+                if self._spill_task is None or self._spill_task.done():
+                    self._spill_task = asyncio.create_task(self._drain_ordered_backlog())
+                return
+
             # Dispatch to callbacks (async)
             asyncio.create_task(self._dispatch_to_callbacks(channel, event))
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Invalid JSON in notification: {e}")
         except Exception as e:
             logger.error(f"Error handling notification: {e}", exc_info=True)
 
+    async def _drain_ordered_backlog(self) -> None:
+        """Fetch spilled event bodies in batches and dispatch the backlog in order."""
+        while self._ordered_backlog:
+            event_ids = [event["id"] for _, event in self._ordered_backlog if is_spilled(event)]
+            bodies = await self._fetch_event_payloads(event_ids) if event_ids else {}
+            requested = set(event_ids)
+
+            while self._ordered_backlog:
+                channel, event = self._ordered_backlog[0]
+                if is_spilled(event):
+                    if event["id"] not in requested:
+                        break  # Arrived during the fetch - next batch
+                    body = bodies.get(event["id"])
+                    self._ordered_backlog.popleft()
+                    if body is None:
+                        logger.warning(
+                            f"Dropping spilled event {event['id']} on {channel}: body not found"
+                        )
+                        continue
+                    event = {**body, "id": event["id"]}
+                else:
+                    self._ordered_backlog.popleft()
+                asyncio.create_task(self._dispatch_to_callbacks(channel, event))
+
+    async def _fetch_event_payloads(self, event_ids: List[int]) -> Dict[int, dict]:
+        """
+        Fetch persisted event bodies in one query.
+
+        Returns:
+            Mapping of event ID to payload (missing IDs are absent, and every
+            ID is absent if the fetch fails)
+        """
+        if not self.listener_conn:
+            return {}
+        try:
+            async with self._conn_lock:
+                rows = await self.listener_conn.fetch(
+                    "SELECT id, payload FROM events WHERE id = ANY($1::int[])", event_ids
+                )
+        except Exception as e:
+            logger.error(f"Failed to fetch {len(event_ids)} spilled event(s): {e}")
+            return {}
+
+        payloads: Dict[int, dict] = {}
+        for row in rows:
+            payload = row["payload"]
+            payloads[row["id"]] = loads(payload) if isinstance(payload, str) else payload
+        return payloads
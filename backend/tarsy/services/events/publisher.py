@@ -1,16 +1,84 @@
 """Type-safe event publishing for cross-pod event distribution."""
 
-import json
 import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tarsy.models.event_models import BaseEvent
 from tarsy.repositories.event_repository import EventRepository
+from tarsy.services.events.codec import EncodedEvent
+from tarsy.services.events.local_delivery import (
+    LOCAL_ORIGIN_ID,
+    ORIGIN_KEY,
+    claim_local_event,
+    deliver_locally,
+    get_local_listener,
+    release_local_event,
+)
+from tarsy.services.events.notify_payloads import (
+    build_persisted_notify_payload,
+    build_transient_notify_payloads,
+    notify_channel,
+)
 
 logger = logging.getLogger(__name__)
 
+# Session whose commit is deferred to the enclosing event_transaction()
+_transaction_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "event_transaction_session", default=None
+)
+
+# In-process deliveries held back until the enclosing event_transaction() commits
+_pending_local_deliveries: ContextVar[Optional[List[Tuple[str, dict]]]] = ContextVar(
+    "event_transaction_local_deliveries", default=None
+)
+
+
+@asynccontextmanager
+async def event_transaction(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Publish several events in one transaction.
+
+    Events published on ``session`` inside the block are inserted and NOTIFYed
+    without committing; the block commits once on exit (or rolls back on
+    error). PostgreSQL delivers the NOTIFYs together at commit, and same-pod
+    subscribers receive the events right after it. Nested blocks on the same
+    session join the outer transaction.
+
+    Example:
+        ```python
+        async with event_transaction(session):
+            await publish_event(session, EventChannel.SESSIONS, event)
+            await publish_event(session, EventChannel.session_details(session_id), event)
+        ```
+    """
+    if _transaction_session.get() is session:
+        yield session
+        return
+
+    token = _transaction_session.set(session)
+    deliveries: List[Tuple[str, dict]] = []
+    deliveries_token = _pending_local_deliveries.set(deliveries)
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        for _, event_payload in deliveries:
+            if event_payload.get("id") is not None:
+                release_local_event(event_payload["id"])
+        raise
+    finally:
+        _transaction_session.reset(token)
+        _pending_local_deliveries.reset(deliveries_token)
+
+    for channel, event_payload in deliveries:
+        await deliver_locally(channel, event_payload)
+
 
 class EventPublisher:
     """
@@ -18,6 +86,15 @@ class EventPublisher:
 
     Uses EventRepository for type-safe persistence, with PostgreSQL NOTIFY
     for real-time broadcast. SQLite mode relies on polling for delivery.
+
+    NOTIFY payloads are kept under PostgreSQL's size limit: large persisted
+    events are sent as a reference fetched by listeners, large transient events
+    are split into parts (see notify_payloads).
+
+    With local delivery enabled, this pod's subscribers get each event
+    in-process right after the commit; persisted events are claimed with the
+    listener before it, so its own poll/NOTIFY never delivers them twice
+    (see local_delivery).
     """
 
     def __init__(self, event_repo: EventRepository) -> None:
@@ -63,34 +140,34 @@ class EventPublisher:
             channel=channel, payload=event_dict
         )
 
-        # 2. Broadcast via NOTIFY (PostgreSQL only)
-        # Detect database type to choose appropriate delivery mechanism
-        db_dialect = self.event_repo.session.bind.dialect.name
-
-        if db_dialect == "postgresql":
-            # PostgreSQL: Use NOTIFY for real-time broadcast
-            # Add event ID to payload for event catchup
-            notify_payload = {**event_dict, "id": db_event.id}
-            notify_payload_json = json.dumps(notify_payload)
-
-            # NOTIFY is database-specific, no ORM abstraction exists
-            # Using text() is the standard SQLAlchemy approach
-            # Security: Properly escape both channel identifier and payload
-            # 1. Channel: Quote as identifier and escape internal double quotes (SQL identifier rules)
-            # 2. Payload: Escape single quotes for string literal (NOTIFY doesn't support parameters)
-            channel_escaped = channel.replace('"', '""')
-            payload_escaped = notify_payload_json.replace("'", "''")
-            notify_sql = text(f'''NOTIFY "{channel_escaped}", '{payload_escaped}' ''')
-            await self.event_repo.session.execute(notify_sql)
-            # Note: No try/except - NOTIFY failures on PostgreSQL are real errors
-        else:
-            # SQLite: Polling handles delivery (see SQLiteEventListener)
-            logger.debug(
-                f"Event {db_event.id} created on '{channel}' (SQLite polling mode)"
-            )
-
-        # Commit transaction (event creation + NOTIFY if PostgreSQL)
-        await self.event_repo.session.commit()
+        # Claimed before the commit so listeners can't deliver it ahead of us
+        claim_local_event(db_event.id)
+
+        try:
+            # 2. Broadcast via NOTIFY (PostgreSQL only)
+            # Detect database type to choose appropriate delivery mechanism
+            db_dialect = self.event_repo.session.bind.dialect.name
+
+            if db_dialect == "postgresql":
+                # PostgreSQL: Use NOTIFY for real-time broadcast
+                # Event ID is added to the payload for event catchup (or is the
+                # only reference to the body if the event is too large to embed)
+                await self._notify(
+                    channel, build_persisted_notify_payload(channel, self._tag_origin(event_dict), db_event.id)
+                )
+                # Note: No try/except - NOTIFY failures on PostgreSQL are real errors
+            else:
+                # SQLite: Polling handles delivery (see SQLiteEventListener)
+                logger.debug(
+                    f"Event {db_event.id} created on '{channel}' (SQLite polling mode)"
+                )
+
+            # Commit transaction (event creation + NOTIFY if PostgreSQL)
+            await self._commit()
+        except BaseException:
+            release_local_event(db_event.id)
+            raise
+        await self._deliver_locally(channel, EncodedEvent({**event_dict, "id": db_event.id}))
 
         logger.debug(f"Published event to '{channel}': {event.type} (id={db_event.id})")
 
@@ -111,17 +188,65 @@ class EventPublisher:
         db_dialect = self.event_repo.session.bind.dialect.name
         
         if db_dialect == "postgresql":
-            # Direct NOTIFY without INSERT
-            notify_payload_json = json.dumps(event_dict)
-            channel_escaped = channel.replace('"', '""')
-            payload_escaped = notify_payload_json.replace("'", "''")
-            notify_sql = text(f'''NOTIFY "{channel_escaped}", '{payload_escaped}' ''')
-            await self.event_repo.session.execute(notify_sql)
-            await self.event_repo.session.commit()
+            # Direct NOTIFY without INSERT (oversized events are sent in parts,
+            # committed together so listeners receive them back to back)
+            for notify_payload_json in build_transient_notify_payloads(channel, self._tag_origin(event_dict)):
+                await self._notify(channel, notify_payload_json)
+            await self._commit()
             logger.debug(f"Published transient event to '{channel}': {event.type}")
         else:
-            # SQLite: Skip streaming (no NOTIFY support)
-            logger.debug(f"Skipping transient event in SQLite mode: {event.type}")
+            # SQLite: No NOTIFY support - only same-pod subscribers can receive it
+            logger.debug(f"Skipping transient event NOTIFY in SQLite mode: {event.type}")
+        await self._deliver_locally(channel, EncodedEvent(event_dict))
+
+    async def publish_many(self, events: Sequence[Tuple[str, BaseEvent]]) -> List[int]:
+        """
+        Publish several events with one commit.
+
+        Args:
+            events: (channel, event) pairs, published in order
+
+        Returns:
+            Event IDs in the same order
+        """
+        async with event_transaction(self.event_repo.session):
+            return [await self.publish(channel, event) for channel, event in events]
+
+    @staticmethod
+    def _tag_origin(event_dict: dict) -> dict:
+        """Mark NOTIFY payloads with this process's origin if it delivers locally."""
+        if get_local_listener() is None:
+            return event_dict
+        return {**event_dict, ORIGIN_KEY: LOCAL_ORIGIN_ID}
+
+    async def _deliver_locally(self, channel: str, event_payload: dict) -> None:
+        """Hand the event to same-pod subscribers once it is committed."""
+        if get_local_listener() is None:
+            return
+        if _transaction_session.get() is self.event_repo.session:
+            pending = _pending_local_deliveries.get()
+            if pending is not None:
+                pending.append((channel, event_payload))
+                return
+        await deliver_locally(channel, event_payload)
+
+    async def _commit(self) -> None:
+        """Commit unless an enclosing event_transaction() owns the commit."""
+        if _transaction_session.get() is not self.event_repo.session:
+            await self.event_repo.session.commit()
+
+    async def _notify(self, channel: str, payload_json: str) -> None:
+        """Send one NOTIFY in the current transaction (on the channel's shard if sharded)."""
+        # NOTIFY is database-specific, no ORM abstraction exists
+        # Using text() is the standard SQLAlchemy approach
+        # Security: Properly escape both channel identifier and payload
+        # 1. Channel: Quote as identifier and escape internal double quotes (SQL identifier rules)
+        # 2. Payload: Escape single quotes for string literal (NOTIFY doesn't support parameters),
+        #    and colons so compact JSON such as "id":42 is not taken for a bind parameter
+        channel_escaped = notify_channel(channel).replace('"', '""')
+        payload_escaped = payload_json.replace("'", "''").replace(":", "\\:")
+        notify_sql = text(f'''NOTIFY "{channel_escaped}", '{payload_escaped}' ''')
+        await self.event_repo.session.execute(notify_sql)
 
 
 async def publish_event(
@@ -163,6 +288,24 @@ async def publish_event(
     return await publisher.publish(channel, event)
 
 
+async def publish_events(
+    session: AsyncSession, events: Sequence[Tuple[str, BaseEvent]]
+) -> List[int]:
+    """
+    Publish several events (INSERTs and NOTIFYs) in one transaction.
+
+    Args:
+        session: Database session
+        events: (channel, event) pairs, published in order
+
+    Returns:
+        Event IDs in the same order
+    """
+    event_repo = EventRepository(session)
+    publisher = EventPublisher(event_repo)
+    return await publisher.publish_many(events)
+
+
 async def publish_transient_event(
     session: AsyncSession, channel: str, event: BaseEvent
 ) -> None:
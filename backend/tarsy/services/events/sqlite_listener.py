@@ -1,4 +1,16 @@
-"""SQLite polling event listener for development mode."""
+"""
+SQLite polling event listener for development mode.
+
+Logic:
+- One indexed query per poll fetches new events for all subscribed channels,
+  starting from the lowest per-channel watermark; events are demultiplexed to
+  their channels in memory
+- The poll interval adapts: it tightens to poll_interval while events flow
+  (and polls again immediately after a full batch), and doubles up to
+  max_poll_interval while idle
+- Subscribing to a new channel resets the interval and wakes the poller, so
+  new subscribers don't wait out an idle back-off
+"""
 
 import asyncio
 import logging
@@ -6,29 +18,50 @@ from typing import Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
+from tarsy.database.pool_manager import PoolPurpose, get_pool_manager
+
 from .base import EventListener
 
 logger = logging.getLogger(__name__)
 
+# Idle polling backs off up to this interval (seconds)
+DEFAULT_MAX_POLL_INTERVAL = 2.0
+
+# Maximum events fetched per poll
+POLL_BATCH_SIZE = 500
+
 
 class SQLiteEventListener(EventListener):
     """SQLite-based event listener using polling (for dev/testing)."""
 
-    def __init__(self, database_url: str, poll_interval: float = 0.5):
+    def __init__(
+        self,
+        database_url: str,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        batch_size: int = POLL_BATCH_SIZE,
+    ):
         """
         Initialize SQLite event listener.
 
         Args:
             database_url: SQLite database URL
-            poll_interval: Polling interval in seconds (default: 0.5)
+            poll_interval: Polling interval in seconds while events flow (default: 0.5)
+            max_poll_interval: Polling interval in seconds after backing off when idle
+            batch_size: Maximum events fetched per poll
         """
         super().__init__()
         self.database_url = database_url
         self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.batch_size = batch_size
+        self.current_poll_interval = poll_interval
         self.running = False
         self.polling_task: Optional[asyncio.Task] = None
         self.last_event_id: Dict[str, int] = {}
+        self._wakeup = asyncio.Event()
         self.engine: Optional[AsyncEngine] = None
+        self._owns_engine: bool = True
 
     async def start(self) -> None:
         """Start polling background task."""
@@ -41,7 +74,14 @@ class SQLiteEventListener(EventListener):
             elif async_url.startswith('sqlite://'):
                 async_url = async_url.replace('sqlite://', 'sqlite+aiosqlite://')
         
-        self.engine = create_async_engine(async_url)
+        pool_manager = get_pool_manager(self.database_url)
+        if pool_manager is not None:
+            # Polling uses the single-connection event listening pool
+            self.engine = pool_manager.get_async_engine(PoolPurpose.EVENT_LISTENING)
+            self._owns_engine = False
+        else:
+            self.engine = create_async_engine(async_url)
+            self._owns_engine = True
         self.running = True
         self.polling_task = asyncio.create_task(self._poll_loop())
         
@@ -49,7 +89,7 @@ class SQLiteEventListener(EventListener):
         await self._start_cleanup_task()
 
         logger.warning(
-            f"Using SQLite polling for events (interval: {self.poll_interval}s). "
+            f"Using SQLite polling for events (interval: {self.poll_interval}s-{self.max_poll_interval}s). "
             "For production, use PostgreSQL"
         )
 
@@ -67,7 +107,8 @@ class SQLiteEventListener(EventListener):
             except asyncio.CancelledError:
                 pass
 
-        if self.engine:
+        # Pooled engines are disposed by the pool manager
+        if self.engine and self._owns_engine:
             await self.engine.dispose()
 
         logger.info("SQLite event listener stopped")
@@ -75,6 +116,8 @@ class SQLiteEventListener(EventListener):
     async def _register_channel(self, channel: str) -> None:
         """Initialize tracking for new channel."""
         self.last_event_id[channel] = 0
+        self.current_poll_interval = self.poll_interval
+        self._wakeup.set()
         logger.info(f"Subscribed to SQLite channel: {channel} (polling)")
     
     async def _cleanup_channel(self, channel: str) -> None:
@@ -87,23 +130,50 @@ class SQLiteEventListener(EventListener):
         """Background task that polls database periodically."""
         while self.running:
             try:
-                await self._poll_events()
-                await asyncio.sleep(self.poll_interval)
+                # Subscriptions made during this poll wake the next wait right away
+                self._wakeup.clear()
+                events_fetched = await self._poll_events()
+                self._adapt_poll_interval(events_fetched)
+                await self._wait_for_next_poll()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}", exc_info=True)
                 await asyncio.sleep(5)  # Back off on errors
 
-    async def _poll_events(self) -> None:
-        """Poll database for new events on all channels using repository."""
+    async def _wait_for_next_poll(self) -> None:
+        """Sleep for the current poll interval, or until a new channel is subscribed."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.current_poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    def _adapt_poll_interval(self, events_fetched: Optional[int]) -> None:
+        """Tighten the poll interval while events flow, back off while idle."""
+        if not events_fetched:
+            backed_off = max(self.current_poll_interval, self.poll_interval) * 2
+            self.current_poll_interval = min(backed_off, self.max_poll_interval)
+        elif events_fetched >= self.batch_size:
+            self.current_poll_interval = 0  # More events waiting - poll again right away
+        else:
+            self.current_poll_interval = self.poll_interval
+
+    async def _poll_events(self) -> int:
+        """
+        Poll database for new events on all channels with a single query.
+
+        Returns:
+            Number of events fetched
+        """
         if not self.engine:
-            return
+            return 0
+
+        channels = [ch for ch in self.callbacks.keys() if self.callbacks.get(ch)]
+        if not channels:
+            return 0
+        logger.debug(f"Polling {len(channels)} active channel(s): {channels}")
 
-        # Log active channel count for monitoring connection leaks
-        active_channels = [ch for ch in self.callbacks.keys() if self.callbacks.get(ch)]
-        if active_channels:
-            logger.debug(f"Polling {len(active_channels)} active channel(s): {active_channels}")
+        after_id = min(self.last_event_id.get(channel, 0) for channel in channels)
 
         async with self.engine.begin() as conn:
             # Create async session from connection
@@ -112,30 +182,35 @@ class SQLiteEventListener(EventListener):
             async_session = AsyncSession(bind=conn, expire_on_commit=False)
             event_repo = EventRepository(async_session)
 
-            for channel in list(self.callbacks.keys()):  # Use list() for safe iteration during deletion
-                # Skip channels with no callbacks (safety check)
-                if not self.callbacks.get(channel):
-                    logger.warning(f"Found channel '{channel}' with no callbacks - skipping")
-                    continue
-                    
-                last_id = self.last_event_id.get(channel, 0)
-
-                try:
-                    # Query for new events using repository (type-safe)
-                    events = await event_repo.get_events_after(
-                        channel=channel, after_id=last_id, limit=100
-                    )
-
-                    # Process new events
-                    for event in events:
-                        # Event.payload already contains the event dict
-                        event_data = event.payload
-                        # Include event_id for client tracking
-                        event_data["id"] = event.id
-
-                        await self._dispatch_to_callbacks(channel, event_data)
-                        self.last_event_id[channel] = event.id
-
-                except Exception as e:
-                    logger.error(f"Error polling events on '{channel}': {e}", exc_info=True)
-
+            try:
+                events = await event_repo.get_events_after_for_channels(
+                    channels=channels, after_id=after_id, limit=self.batch_size
+                )
+            except Exception as e:
+                logger.error(f"Error polling events on {len(channels)} channel(s): {e}", exc_info=True)
+                return 0
+
+        for event in events:
+            channel = event.channel
+            # Skip channels unsubscribed meanwhile and events below the channel's watermark
+            if channel not in self.last_event_id or event.id <= self.last_event_id[channel]:
+                continue
+
+            # Event.payload already contains the event dict
+            event_data = event.payload
+            # Include event_id for client tracking
+            event_data["id"] = event.id
+
+            # Skip events this process already delivered in-process
+            if not self._is_local_echo(event_data):
+                await self._dispatch_to_callbacks(channel, event_data)
+            self.last_event_id[channel] = event.id
+
+        if events:
+            # Every event up to the last fetched ID has been seen on all polled channels
+            highest_id = events[-1].id
+            for channel in channels:
+                if channel in self.last_event_id and self.last_event_id[channel] < highest_id:
+                    self.last_event_id[channel] = highest_id
+
+        return len(events)
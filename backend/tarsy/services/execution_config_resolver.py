@@ -9,7 +9,7 @@ Resolves settings across the configuration hierarchy:
 system → agent → chain → stage → parallel agent (highest precedence)
 """
 
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 from tarsy.config.settings import Settings
 from tarsy.models.agent_config import (
@@ -109,6 +109,12 @@ class ExecutionConfigResolver:
             max_iterations=max_iterations,
             force_conclusion=force_conclusion,
             mcp_servers=mcp_servers,
+            interaction_models=ExecutionConfigResolver._resolve_interaction_models(
+                chain_config=chain_config,
+                llm_provider=llm_provider,
+            ),
+            # Agent token budgets are per agent definition (chain budgets cover the whole session)
+            token_budget=agent_config.token_budget if agent_config is not None else None,
         )
         
         logger.info(
@@ -116,7 +122,9 @@ class ExecutionConfigResolver:
             f"iteration_strategy={config.iteration_strategy}, "
             f"max_iterations={config.max_iterations}, "
             f"force_conclusion={config.force_conclusion}, "
-            f"mcp_servers={config.mcp_servers}"
+            f"mcp_servers={config.mcp_servers}, "
+            f"interaction_models={config.interaction_models}, "
+            f"token_budget={config.token_budget}"
         )
         
         return config
@@ -165,6 +173,37 @@ class ExecutionConfigResolver:
         
         return llm_provider
     
+    @staticmethod
+    def _resolve_interaction_models(
+        chain_config: Optional[ChainConfigModel],
+        llm_provider: Optional[str],
+    ) -> Optional[Dict[str, str]]:
+        """
+        Resolve interaction-type model routing for the resolved LLM provider.
+        
+        Interaction-type model routing is only configurable per chain, and its model
+        names belong to the chain's provider. A stage or parallel agent that overrides
+        the provider with a different one keeps that provider's own routing.
+        
+        Args:
+            chain_config: Optional chain-level configuration
+            llm_provider: LLM provider resolved for this execution
+            
+        Returns:
+            The chain's interaction models, or None (the provider's routing will be used)
+        """
+        if chain_config is None or not chain_config.interaction_models:
+            return None
+        
+        if llm_provider != chain_config.llm_provider:
+            logger.debug(
+                f"Ignoring chain interaction_models: provider '{llm_provider}' "
+                f"overrides chain provider '{chain_config.llm_provider}'"
+            )
+            return None
+        
+        return chain_config.interaction_models
+    
     @staticmethod
     def _resolve_iteration_strategy(
         agent_config: Optional[AgentConfigModel] = None,
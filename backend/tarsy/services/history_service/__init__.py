@@ -50,4 +50,21 @@ def get_history_service() -> HistoryService:
         return service
 
 
-__all__ = ["HistoryService", "HistoryServiceInitializationError", "get_history_service"]
+def shutdown_history_service() -> None:
+    """Shut down the global history service instance, if it was initialized."""
+    global _history_service
+
+    with _history_service_lock:
+        service = _history_service
+        _history_service = None
+
+    if service is not None:
+        service.shutdown()
+
+
+__all__ = [
+    "HistoryService",
+    "HistoryServiceInitializationError",
+    "get_history_service",
+    "shutdown_history_service",
+]
@@ -1,6 +1,7 @@
 """Base infrastructure for history service operations."""
 
 import asyncio
+import contextvars
 import logging
 import random
 import time
@@ -10,6 +11,8 @@ from typing import Callable, Final, Generator, Optional, TypeVar
 from sqlalchemy.exc import DBAPIError
 
 from tarsy.config.settings import Settings, get_settings
+from tarsy.database.pool_manager import PoolPurpose
+from tarsy.database.sqlite_writer import SQLiteWriteQueue, create_sqlite_writer_engine
 from tarsy.repositories.base_repository import DatabaseManager
 from tarsy.repositories.history_repository import HistoryRepository
 
@@ -62,6 +65,16 @@ POSTGRESQL_RETRYABLE_SQLSTATES: Final[frozenset[str]] = frozenset({
 
 POSTGRESQL_RETRYABLE_SQLSTATE_CLASS: Final[str] = '08'  # Connection exception class
 
+# Operation name prefixes of read-only operations; these use the dashboard read
+# pool, everything else uses the alert write pool (or the SQLite writer in
+# single-writer mode)
+READ_OPERATION_PREFIXES: Final[tuple[str, ...]] = ('get_', 'has_', 'test_')
+
+# Pool purpose of the operation currently running; copied into asyncio.to_thread
+_current_pool_purpose: contextvars.ContextVar[PoolPurpose] = contextvars.ContextVar(
+    "history_pool_purpose", default=PoolPurpose.ALERT_WRITES
+)
+
 
 class _NoInteractionsSentinel:
     """Sentinel to distinguish 'no interactions found' from database failures."""
@@ -78,6 +91,7 @@ class BaseHistoryInfra:
     def __init__(self) -> None:
         self.settings: Settings = get_settings()
         self.db_manager: Optional[DatabaseManager] = None
+        self.write_queue: Optional[SQLiteWriteQueue] = None
         self._initialization_attempted: bool = False
         self._is_healthy: bool = False
         self.max_retries: int = 3
@@ -109,6 +123,7 @@ class BaseHistoryInfra:
             self.db_manager = DatabaseManager(self.settings.database_url)
             self.db_manager.initialize()
             self.db_manager.create_tables()
+            self._start_sqlite_writer()
             self._is_healthy = True
             logger.info("History service initialized successfully")
             return True
@@ -119,6 +134,56 @@ class BaseHistoryInfra:
             self._is_healthy = False
             return False
     
+    def _start_sqlite_writer(self) -> None:
+        """Start the single-writer queue if enabled for a file-based SQLite database."""
+        if not self.settings.sqlite_single_writer:
+            return
+        url = self.settings.database_url
+        if not url.startswith('sqlite') or ':memory:' in url:
+            logger.info("SQLite single-writer mode only applies to file-based SQLite databases, ignoring")
+            return
+        self.write_queue = SQLiteWriteQueue(
+            create_sqlite_writer_engine(url),
+            max_batch_size=self.settings.sqlite_writer_max_batch_size,
+        )
+        self.write_queue.start()
+    
+    def shutdown(self) -> None:
+        """Stop the SQLite writer (flushing queued writes) and close database connections."""
+        if self.write_queue is not None:
+            self.write_queue.stop()
+            self.write_queue = None
+        if self.db_manager is not None:
+            self.db_manager.close()
+    
+    def _uses_write_queue(self, operation_name: str) -> bool:
+        """Check whether an operation must be serialized through the SQLite writer."""
+        return (
+            self.write_queue is not None
+            and not operation_name.startswith(READ_OPERATION_PREFIXES)
+        )
+    
+    @contextmanager
+    def _pool_purpose(self, operation_name: str) -> Generator[None, None, None]:
+        """Route repository sessions opened by an operation to its connection pool."""
+        purpose = (
+            PoolPurpose.DASHBOARD_READS
+            if operation_name.startswith(READ_OPERATION_PREFIXES)
+            else PoolPurpose.ALERT_WRITES
+        )
+        token = _current_pool_purpose.set(purpose)
+        try:
+            yield
+        finally:
+            _current_pool_purpose.reset(token)
+    
+    def _run_operation(self, operation_name: str, operation_func: Callable[[], T]) -> T:
+        """Run an operation once, on the SQLite writer for writes in single-writer mode."""
+        if self._uses_write_queue(operation_name):
+            return self.write_queue.submit(operation_func).result()
+        with self._pool_purpose(operation_name):
+            return operation_func()
+    
     def _is_postgresql(self) -> bool:
         """Check if the database backend is PostgreSQL."""
         if not self.db_manager or not self.db_manager.database_url:
@@ -200,7 +265,11 @@ class BaseHistoryInfra:
                 yield None
                 return
                 
-            session = self.db_manager.get_session()
+            # Inside a single-writer batch, join the batch transaction
+            if self.write_queue is not None:
+                session = self.write_queue.get_session()
+            if session is None:
+                session = self.db_manager.get_session(_current_pool_purpose.get())
             repository = HistoryRepository(session)
             yield repository
             
@@ -229,7 +298,7 @@ class BaseHistoryInfra:
         
         for attempt in range(self.max_retries + 1):
             try:
-                result = operation_func()
+                result = self._run_operation(operation_name, operation_func)
                 if result is not None:
                     return result
                 if treat_none_as_success:
@@ -271,7 +340,11 @@ class BaseHistoryInfra:
         last_exception = None
         for attempt in range(self.max_retries + 1):
             try:
-                result = await asyncio.to_thread(operation_func)
+                if self._uses_write_queue(operation_name):
+                    result = await asyncio.wrap_future(self.write_queue.submit(operation_func))
+                else:
+                    with self._pool_purpose(operation_name):
+                        result = await asyncio.to_thread(operation_func)
                 if result is not None:
                     return result
                 if treat_none_as_success:
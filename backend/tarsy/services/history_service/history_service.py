@@ -1,6 +1,6 @@
 """History Service - Main Facade."""
 
-from typing import Any, ContextManager, Dict, List, Optional, Tuple
+from typing import Any, ContextManager, Dict, List, Optional, Sequence, Tuple
 
 from tarsy.models.agent_config import ChainConfigModel
 from tarsy.models.db_models import AlertSession, Chat, ChatUserMessage, StageExecution
@@ -46,6 +46,10 @@ class HistoryService:
         """Initialize database connection."""
         return self._infra.initialize()
     
+    def shutdown(self) -> None:
+        """Flush queued writes and close database connections."""
+        self._infra.shutdown()
+    
     def get_repository(self) -> ContextManager[HistoryRepository | None]:
         """Get repository context manager (delegates to _infra)."""
         return self._infra.get_repository()
@@ -71,6 +75,23 @@ class HistoryService:
             final_analysis_summary, executive_summary_error, pause_metadata
         )
     
+    def transition_session_status(
+        self,
+        session_id: str,
+        from_statuses: Optional[Sequence[str]],
+        status: str,
+        error_message: Optional[str] = None,
+        final_analysis: Optional[str] = None,
+        final_analysis_summary: Optional[str] = None,
+        executive_summary_error: Optional[str] = None,
+        pause_metadata: Optional[dict] = None
+    ) -> bool:
+        """Update session status only if it is currently in one of from_statuses."""
+        return self._sessions.transition_session_status(
+            session_id, from_statuses, status, error_message, final_analysis,
+            final_analysis_summary, executive_summary_error, pause_metadata
+        )
+    
     def get_session(self, session_id: str) -> Optional[AlertSession]:
         """Get session by ID."""
         return self._sessions.get_session(session_id)
@@ -88,6 +109,24 @@ class HistoryService:
         """Update an existing stage execution record."""
         return await self._stages.update_stage_execution(stage_execution)
     
+    async def transition_stage_execution(
+        self,
+        execution_id: str,
+        from_statuses: Sequence[str],
+        values: Dict[str, Any],
+        *,
+        preserve_started_at: bool = False,
+        completed_from_pause: bool = False,
+    ) -> Optional[StageExecution]:
+        """Apply a guarded stage status transition in a single statement."""
+        return await self._stages.transition_stage_execution(
+            execution_id,
+            from_statuses,
+            values,
+            preserve_started_at=preserve_started_at,
+            completed_from_pause=completed_from_pause,
+        )
+    
     async def update_session_current_stage(self, session_id: str, current_stage_index: int, current_stage_id: str) -> bool:
         """Update the current stage information for a session."""
         return await self._stages.update_session_current_stage(session_id, current_stage_index, current_stage_id)
@@ -108,6 +147,12 @@ class HistoryService:
         """Get all child stage executions for a parallel stage parent."""
         return await self._stages.get_parallel_stage_children(parent_execution_id)
     
+    async def get_parallel_stage_group(
+        self, parent_execution_id: str
+    ) -> Tuple[Optional[StageExecution], List[StageExecution]]:
+        """Get a parallel stage parent and its children in one query."""
+        return await self._stages.get_parallel_stage_group(parent_execution_id)
+    
     async def get_paused_stages(self, session_id: str) -> List[StageExecution]:
         """Get all paused stage executions for a session."""
         return await self._stages.get_paused_stages(session_id)
@@ -28,7 +28,8 @@ class QueryOperations:
         
         Args:
             filters: Optional dictionary of filter criteria. Supported keys:
-                status, agent_type, alert_type, search, start_date_us, end_date_us.
+                status, agent_type, alert_type, search, start_date_us, end_date_us,
+                alert_data (dict of alert_data key -> value or list of values).
             page: Page number for pagination (1-indexed). Defaults to 1.
             page_size: Number of results per page. Defaults to 20.
             sort_by: Field name to sort by.
@@ -55,7 +56,8 @@ class QueryOperations:
                     page=page,
                     page_size=page_size,
                     sort_by=sort_by,
-                    sort_order=sort_order
+                    sort_order=sort_order,
+                    alert_data_filters=filters_local.get('alert_data')
                 )
                 
                 if paginated_sessions and filters_local:
@@ -137,8 +139,8 @@ class QueryOperations:
     def get_filter_options(self) -> Optional[FilterOptions]:
         """Get available filter options for the dashboard.
         
-        Retrieves distinct values for filterable fields to populate
-        filter dropdowns in the UI.
+        Retrieves distinct values for filterable fields, including the
+        configured alert_data facets, to populate filter dropdowns in the UI.
         
         Returns:
             FilterOptions containing available filter values,
@@ -149,7 +151,7 @@ class QueryOperations:
                 if not repo:
                     raise RuntimeError("History repository unavailable - cannot retrieve filter options")
                 
-                return repo.get_filter_options()
+                return repo.get_filter_options(facet_keys=self._infra.settings.alert_data_facets)
         
         return self._infra._retry_database_operation(
             "get_filter_options",
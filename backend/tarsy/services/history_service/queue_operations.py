@@ -49,7 +49,10 @@ class QueueOperations:
         Returns:
             The claimed AlertSession if one was available, None otherwise.
         """
-        with self._infra.get_repository() as repo:
-            if not repo:
-                return None
-            return repo.claim_next_pending_session(pod_id)
+        def _claim_operation() -> Optional[AlertSession]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    return None
+                return repo.claim_next_pending_session(pod_id)
+        
+        return self._infra._run_operation("claim_next_pending_session", _claim_operation)
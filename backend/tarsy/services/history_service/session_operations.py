@@ -1,7 +1,7 @@
 """Session lifecycle operations."""
 
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence
 
 from tarsy.models.agent_config import ChainConfigModel
 from tarsy.models.constants import AlertSessionStatus
@@ -66,42 +66,65 @@ class SessionOperations:
         pause_metadata: Optional[dict] = None
     ) -> bool:
         """Update session processing status."""
+        return self.transition_session_status(
+            session_id,
+            None,
+            status,
+            error_message=error_message,
+            final_analysis=final_analysis,
+            final_analysis_summary=final_analysis_summary,
+            executive_summary_error=executive_summary_error,
+            pause_metadata=pause_metadata,
+        )
+    
+    def transition_session_status(
+        self,
+        session_id: str,
+        from_statuses: Optional[Sequence[str]],
+        status: str,
+        error_message: Optional[str] = None,
+        final_analysis: Optional[str] = None,
+        final_analysis_summary: Optional[str] = None,
+        executive_summary_error: Optional[str] = None,
+        pause_metadata: Optional[dict] = None
+    ) -> bool:
+        """Update session status in one guarded statement; False if the guard did not match."""
         if not session_id:
             return False
         
-        def _update_status_operation() -> bool:
+        values: Dict[str, Any] = {"status": status}
+        if error_message:
+            values["error_message"] = error_message
+        if final_analysis:
+            values["final_analysis"] = final_analysis
+        if final_analysis_summary:
+            values["final_analysis_summary"] = final_analysis_summary
+        if executive_summary_error:
+            values["executive_summary_error"] = executive_summary_error
+        values["pause_metadata"] = pause_metadata if status == AlertSessionStatus.PAUSED.value else None
+        if status in AlertSessionStatus.terminal_values():
+            values["completed_at_us"] = now_us()
+        
+        def _transition_status_operation() -> bool:
             with self._infra.get_repository() as repo:
                 if not repo:
                     raise RuntimeError("History repository unavailable - cannot update session status")
                 
-                session = repo.get_alert_session(session_id)
-                if not session:
-                    logger.warning(f"Session {session_id} not found for status update")
+                updated_session = repo.transition_alert_session(session_id, from_statuses, values)
+                if not updated_session:
+                    if from_statuses is None:
+                        logger.warning(f"Session {session_id} not found for status update")
+                    else:
+                        logger.info(
+                            f"Session {session_id} status transition to {status} skipped - "
+                            f"session not in {list(from_statuses)}"
+                        )
                     return False
                 
-                session.status = status
-                if error_message:
-                    session.error_message = error_message
-                if final_analysis:
-                    session.final_analysis = final_analysis
-                if final_analysis_summary:
-                    session.final_analysis_summary = final_analysis_summary
-                if executive_summary_error:
-                    session.executive_summary_error = executive_summary_error
-                if status == AlertSessionStatus.PAUSED.value:
-                    session.pause_metadata = pause_metadata
-                else:
-                    session.pause_metadata = None
-                if status in AlertSessionStatus.terminal_values():
-                    session.completed_at_us = now_us()
-                
-                success = repo.update_alert_session(session)
-                if success:
-                    logger.debug(f"Updated session {session_id} status to {status}")
-                        
-                return success
+                logger.debug(f"Updated session {session_id} status to {status}")
+                return True
         
-        result = self._infra._retry_database_operation("update_session_status", _update_status_operation)
+        result = self._infra._retry_database_operation("update_session_status", _transition_status_operation)
         return result if result is not None else False
     
     def get_session(self, session_id: str) -> Optional[AlertSession]:
@@ -131,25 +154,22 @@ class SessionOperations:
                 if not repo:
                     raise RuntimeError("History repository unavailable")
                 
+                # Single guarded UPDATE - idempotent for sessions that are already CANCELING
+                updated_session = repo.transition_alert_session(
+                    session_id,
+                    AlertSessionStatus.active_values(),
+                    {"status": AlertSessionStatus.CANCELING.value},
+                )
+                if updated_session:
+                    logger.info(f"Updated session {session_id} to CANCELING")
+                    return (True, AlertSessionStatus.CANCELING.value)
+                
+                # Guard did not match - read once to report why
                 session = repo.get_alert_session(session_id)
                 if not session:
                     return (False, "not_found")
                 
-                if session.status in AlertSessionStatus.terminal_values():
-                    logger.info(f"Session {session_id} already terminal: {session.status}")
-                    return (False, session.status)
-                
-                if session.status == AlertSessionStatus.CANCELING.value:
-                    logger.info(f"Session {session_id} already canceling")
-                    return (True, session.status)
-                
-                session.status = AlertSessionStatus.CANCELING.value
-                success = repo.update_alert_session(session)
-                
-                if success:
-                    logger.info(f"Updated session {session_id} to CANCELING")
-                    return (True, AlertSessionStatus.CANCELING.value)
-                
+                logger.info(f"Session {session_id} already terminal: {session.status}")
                 return (False, session.status)
         
         result = self._infra._retry_database_operation("update_to_canceling", _update_operation)
@@ -1,13 +1,12 @@
 """Stage execution operations."""
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from tarsy.models.constants import StageStatus
 from tarsy.models.db_models import StageExecution
 from tarsy.models.history_models import ChainStatistics, SessionStats
 from tarsy.services.history_service.base_infrastructure import BaseHistoryInfra
-from tarsy.utils.timestamp import now_us
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +41,34 @@ class StageOperations:
         result = await self._infra._retry_database_operation_async("update_stage_execution", _update_stage_operation)
         return result if result is not None else False
     
+    async def transition_stage_execution(
+        self,
+        execution_id: str,
+        from_statuses: Sequence[str],
+        values: Dict[str, Any],
+        *,
+        preserve_started_at: bool = False,
+        completed_from_pause: bool = False,
+    ) -> Optional[StageExecution]:
+        """Apply a guarded status transition; returns None if the guard did not match."""
+        def _transition_stage_operation() -> Optional[StageExecution]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    raise RuntimeError("History repository unavailable - cannot transition stage execution")
+                return repo.transition_stage_execution(
+                    execution_id,
+                    from_statuses,
+                    values,
+                    preserve_started_at=preserve_started_at,
+                    completed_from_pause=completed_from_pause,
+                )
+        
+        return await self._infra._retry_database_operation_async(
+            "transition_stage_execution",
+            _transition_stage_operation,
+            treat_none_as_success=True,
+        )
+    
     async def update_session_current_stage(
         self, 
         session_id: str, 
@@ -183,6 +210,22 @@ class StageOperations:
         )
         return result or []
     
+    async def get_parallel_stage_group(
+        self, parent_execution_id: str
+    ) -> Tuple[Optional[StageExecution], List[StageExecution]]:
+        """Get a parallel stage parent and its children in one query."""
+        def _get_group_operation() -> Tuple[Optional[StageExecution], List[StageExecution]]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    raise RuntimeError("History repository unavailable - cannot retrieve parallel stage group")
+                return repo.get_parallel_stage_group(parent_execution_id)
+        
+        result = await self._infra._retry_database_operation_async(
+            "get_parallel_stage_group",
+            _get_group_operation,
+        )
+        return result or (None, [])
+    
     async def get_paused_stages(self, session_id: str) -> List[StageExecution]:
         """Get all paused stage executions for a session, including parallel children."""
         def _get_paused_stages_operation() -> List[StageExecution]:
@@ -207,19 +250,18 @@ class StageOperations:
     
     async def cancel_all_paused_stages(self, session_id: str) -> int:
         """Cancel all paused stages for a session."""
-        paused_stages = await self.get_paused_stages(session_id)
-        if not paused_stages:
-            return 0
+        def _cancel_paused_stages_operation() -> List[StageExecution]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    raise RuntimeError("History repository unavailable - cannot cancel paused stages")
+                return repo.cancel_paused_stage_executions(session_id, "Cancelled by user")
         
-        current_time = now_us()
-        for stage in paused_stages:
-            stage.status = StageStatus.CANCELLED.value
-            stage.error_message = "Cancelled by user"
-            stage.completed_at_us = stage.paused_at_us or current_time
-            if stage.started_at_us and stage.completed_at_us:
-                duration_us = stage.completed_at_us - stage.started_at_us
-                stage.duration_ms = int(duration_us / 1000)
-            await self.update_stage_execution(stage)
+        cancelled_stages = await self._infra._retry_database_operation_async(
+            "cancel_all_paused_stages",
+            _cancel_paused_stages_operation,
+        )
+        if not cancelled_stages:
+            return 0
         
-        logger.info(f"Cancelled {len(paused_stages)} paused stages for session {session_id}")
-        return len(paused_stages)
+        logger.info(f"Cancelled {len(cancelled_stages)} paused stages for session {session_id}")
+        return len(cancelled_stages)
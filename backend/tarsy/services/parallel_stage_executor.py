@@ -720,10 +720,14 @@ class ParallelStageExecutor:
         """
         logger.info(f"Resuming parallel stage '{paused_parent_stage.stage_name}'")
         
-        # 1. Load all child stage executions
-        children = await history_service.get_parallel_stage_children(
+        # 1. Load all child stage executions (from memory when this pod tracks the session)
+        children = self.stage_manager.stage_cache.get_parallel_stage_children(
             paused_parent_stage.execution_id
         )
+        if children is None:
+            children = await history_service.get_parallel_stage_children(
+                paused_parent_stage.execution_id
+            )
         
         # 2. Separate children by status
         completed_children = [c for c in children if c.status == StageStatus.COMPLETED.value]
@@ -7,7 +7,7 @@ This module handles all session management operations including:
 - Handling session errors
 """
 
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Sequence, TYPE_CHECKING
 
 from tarsy.models.constants import AlertSessionStatus
 from tarsy.utils.logger import get_module_logger
@@ -122,6 +122,39 @@ class SessionManager:
             pause_metadata=pause_metadata
         )
     
+    def transition_session_status(
+        self,
+        session_id: Optional[str],
+        from_statuses: Sequence[str],
+        status: str,
+        error_message: Optional[str] = None,
+    ) -> bool:
+        """
+        Update history session status only if it is currently in one of from_statuses.
+        
+        The check and the update happen in a single guarded UPDATE statement, so a
+        concurrent transition (e.g. user cancel vs. completion) cannot be overwritten.
+        
+        Args:
+            session_id: Session ID to update
+            from_statuses: Statuses the session must currently be in
+            status: New status
+            error_message: Optional error message if failed
+            
+        Returns:
+            True if the transition was applied, False if the session was not in
+            one of from_statuses (or history is unavailable)
+        """
+        if not session_id or not self.history_service:
+            return False
+        
+        return self.history_service.transition_session_status(
+            session_id=session_id,
+            from_statuses=from_statuses,
+            status=status,
+            error_message=error_message,
+        )
+    
     def update_session_error(self, session_id: Optional[str], error_message: str):
         """
         Mark history session as failed with error.
@@ -8,15 +8,17 @@ This module handles all stage execution lifecycle operations including:
 - Verifying stage execution persistence
 """
 
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Union
 
 from tarsy.models.agent_execution_result import AgentExecutionResult, ParallelStageResult
 from tarsy.models.constants import ParallelType, StageStatus
+from tarsy.services.stage_state_cache import StageStateCache
 from tarsy.utils.logger import get_module_logger
 from tarsy.utils.timestamp import now_us
 
 if TYPE_CHECKING:
     from tarsy.models.agent_config import ChainStageConfigModel
+    from tarsy.models.db_models import StageExecution
     from tarsy.services.history_service import HistoryService
 else:
     # Import for runtime use
@@ -31,9 +33,10 @@ class StageExecutionManager:
     
     This class handles:
     - Creating stage execution records in the database
-    - Status transitions (pending→active→completed/failed/paused)
+    - Guarded status transitions (pending→active→completed/failed/paused)
     - Triggering hooks for history and dashboard updates
     - Verifying database persistence
+    - Keeping written stage state in memory for sessions executing on this pod
     """
     
     def __init__(self, history_service: "HistoryService"):
@@ -44,6 +47,43 @@ class StageExecutionManager:
             history_service: History service for database operations
         """
         self.history_service = history_service
+        self.stage_cache = StageStateCache()
+    
+    def track_session(
+        self,
+        session_id: str,
+        stage_executions: Optional[Iterable["StageExecution"]] = None
+    ) -> None:
+        """
+        Keep stage state of a session executing on this pod in memory.
+        
+        Args:
+            session_id: Session ID
+            stage_executions: Database snapshot when resuming or continuing a session
+        """
+        self.stage_cache.track_session(session_id, stage_executions)
+    
+    def untrack_session(self, session_id: str) -> None:
+        """Drop in-memory stage state once the session's execution run ends."""
+        self.stage_cache.untrack_session(session_id)
+    
+    async def get_stage_executions(self, session_id: str) -> List["StageExecution"]:
+        """
+        Get top-level stage executions for a session.
+        
+        Served from memory for sessions executing on this pod; queries the
+        database otherwise.
+        
+        Args:
+            session_id: Session ID
+            
+        Returns:
+            Stage executions in chain order
+        """
+        cached_stages = self.stage_cache.get_stage_executions(session_id)
+        if cached_stages is not None:
+            return cached_stages
+        return await self.history_service.get_stage_executions(session_id)
     
     async def create_stage_execution(
         self,
@@ -130,6 +170,7 @@ class StageExecutionManager:
                 )
                 
             logger.debug(f"Verified stage execution {stage_execution.execution_id} exists in database")
+            self.stage_cache.put(verified_stage)
             
         except Exception as e:
             logger.error(f"Failed to verify stage execution in database: {e}")
@@ -172,62 +213,118 @@ class StageExecutionManager:
                 f"Database persistence is required for stage tracking. Error: {str(e)}"
             ) from e
     
-    async def update_stage_execution_completed(
-        self, 
-        stage_execution_id: str, 
-        stage_result: Union[AgentExecutionResult, ParallelStageResult]
-    ) -> None:
+    async def _transition_stage_execution(
+        self,
+        stage_execution_id: str,
+        operation_name: str,
+        values: Dict[str, Any],
+        *,
+        preserve_started_at: bool = False,
+    ) -> Optional["StageExecution"]:
         """
-        Update stage execution as completed.
+        Apply a guarded status transition and trigger notification hooks.
+        
+        The transition is a single ``UPDATE ... WHERE status IN (...) RETURNING`` round trip,
+        so concurrent transitions (e.g. cancel vs. complete) cannot overwrite each other.
+        Only stages that are still pending, active or paused can transition.
         
         Args:
             stage_execution_id: Stage execution ID
-            stage_result: Stage processing result (AgentExecutionResult or ParallelStageResult)
+            operation_name: Operation name for logging ("started", "completed", ...)
+            values: Column values to set
+            preserve_started_at: Keep an existing started_at_us (resumed stages)
+            
+        Returns:
+            Updated stage execution, or None if the stage had already reached a
+            final status (the concurrent transition won)
             
         Raises:
-            RuntimeError: If stage execution cannot be updated to completed status
+            RuntimeError: If stage execution cannot be updated
         """
         if not self.history_service:
             raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} as completed: History service is unavailable. "
+                f"Cannot update stage execution {stage_execution_id} as {operation_name}: History service is unavailable. "
                 "All alert processing must be done with proper stage tracking."
             )
         
+        from_statuses = StageStatus.active_values()
         try:
-            # Get the existing stage execution record
-            existing_stage = await self.history_service.get_stage_execution(stage_execution_id)
-            if not existing_stage:
-                raise RuntimeError(
-                    f"Stage execution {stage_execution_id} not found in database for completion update. "
-                    "This indicates a critical bug in stage lifecycle management."
-                )
+            updated_stage = await self.history_service.transition_stage_execution(
+                stage_execution_id,
+                from_statuses,
+                values,
+                preserve_started_at=preserve_started_at,
+            )
             
-            # Update only the completion-related fields
-            existing_stage.status = stage_result.status.value
-            existing_stage.completed_at_us = stage_result.timestamp_us
-            # Serialize result to JSON-compatible dict for database storage
-            existing_stage.stage_output = stage_result.model_dump(mode='json')
-            # Preserve error message from stage result (both AgentExecutionResult and ParallelStageResult have this)
-            existing_stage.error_message = stage_result.error_message
+            if updated_stage is None:
+                # Guard did not match - read once to tell a lost race from a missing record
+                current_stage = await self.history_service.get_stage_execution(stage_execution_id)
+                if not current_stage:
+                    raise RuntimeError(
+                        f"Stage execution {stage_execution_id} not found in database for {operation_name} update. "
+                        "This indicates a critical bug in stage lifecycle management."
+                    )
+                if current_stage.status in from_statuses:
+                    raise RuntimeError(
+                        f"Stage execution {stage_execution_id} transition to {operation_name} was not applied "
+                        f"(current status: {current_stage.status})"
+                    )
+                logger.info(
+                    f"Skipping {operation_name} transition for stage execution {stage_execution_id}: "
+                    f"already {current_stage.status}"
+                )
+                self.stage_cache.put(current_stage)
+                return None
             
-            # Calculate duration if we have started_at_us
-            if existing_stage.started_at_us and existing_stage.completed_at_us:
-                existing_stage.duration_ms = int((existing_stage.completed_at_us - existing_stage.started_at_us) / 1000)
+            self.stage_cache.put(updated_stage)
             
-            # Trigger stage execution hooks (history + dashboard) via context manager
+            # Stage is already persisted - only notification hooks (dashboard events) run
             from tarsy.hooks.hook_context import stage_execution_context
-            async with stage_execution_context(existing_stage):
-                # Context automatically triggers hooks when exiting
+            async with stage_execution_context(updated_stage, already_persisted=True):
                 pass
-            logger.debug(f"Triggered stage hooks for stage completion {existing_stage.stage_index}: {existing_stage.stage_id}")
+            logger.debug(
+                "Triggered stage hooks for stage %s %s: %s",
+                operation_name,
+                updated_stage.stage_index,
+                updated_stage.stage_id,
+            )
+            return updated_stage
             
         except Exception as e:
-            logger.error(f"Failed to update stage execution as completed: {str(e)}")
+            logger.error(f"Failed to update stage execution as {operation_name}: {str(e)}")
             raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} to completed status. "
-                f"Database persistence is required for audit trail. Error: {str(e)}"
+                f"Cannot update stage execution {stage_execution_id} to {operation_name} status. "
+                f"Database persistence is required for stage tracking. Error: {str(e)}"
             ) from e
     
+    async def update_stage_execution_completed(
+        self, 
+        stage_execution_id: str, 
+        stage_result: Union[AgentExecutionResult, ParallelStageResult]
+    ) -> None:
+        """
+        Update stage execution as completed.
+        
+        Args:
+            stage_execution_id: Stage execution ID
+            stage_result: Stage processing result (AgentExecutionResult or ParallelStageResult)
+            
+        Raises:
+            RuntimeError: If stage execution cannot be updated to completed status
+        """
+        await self._transition_stage_execution(
+            stage_execution_id,
+            "completed",
+            {
+                "status": stage_result.status.value,
+                "completed_at_us": stage_result.timestamp_us,
+                # Serialize result to JSON-compatible dict for database storage
+                "stage_output": stage_result.model_dump(mode='json'),
+                # Both AgentExecutionResult and ParallelStageResult carry error_message
+                "error_message": stage_result.error_message,
+            },
+        )
+    
     async def _update_stage_execution_terminal(
         self,
         stage_execution_id: str,
@@ -247,47 +344,16 @@ class StageExecutionManager:
         Raises:
             RuntimeError: If stage execution cannot be updated to terminal status
         """
-        if not self.history_service:
-            raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} as {operation_name}: History service is unavailable. "
-                "All alert processing must be done with proper stage tracking."
-            )
-
-        try:
-            existing_stage = await self.history_service.get_stage_execution(stage_execution_id)
-            if not existing_stage:
-                raise RuntimeError(
-                    f"Stage execution {stage_execution_id} not found in database for {operation_name} update. "
-                    "This indicates a critical bug in stage lifecycle management."
-                )
-
-            existing_stage.status = status.value
-            existing_stage.completed_at_us = now_us()
-            existing_stage.stage_output = None
-            existing_stage.error_message = error_message
-
-            if existing_stage.started_at_us and existing_stage.completed_at_us:
-                existing_stage.duration_ms = int(
-                    (existing_stage.completed_at_us - existing_stage.started_at_us) / 1000
-                )
-
-            from tarsy.hooks.hook_context import stage_execution_context
-
-            async with stage_execution_context(existing_stage):
-                pass
-            logger.debug(
-                "Triggered stage hooks for stage %s %s: %s",
-                operation_name,
-                existing_stage.stage_index,
-                existing_stage.stage_id,
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to update stage execution as {operation_name}: {str(e)}")
-            raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} to {operation_name} status. "
-                f"Database persistence is required for audit trail. Error: {str(e)}"
-            ) from e
+        await self._transition_stage_execution(
+            stage_execution_id,
+            operation_name,
+            {
+                "status": status.value,
+                "completed_at_us": now_us(),
+                "stage_output": None,
+                "error_message": error_message,
+            },
+        )
 
     async def update_stage_execution_failed(self, stage_execution_id: str, error_message: str) -> None:
         """
@@ -351,47 +417,21 @@ class StageExecutionManager:
         Raises:
             RuntimeError: If stage execution cannot be updated to paused status
         """
-        if not self.history_service:
-            raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} as paused: History service is unavailable. "
-                "All alert processing must be done with proper stage tracking."
-            )
-        
-        try:
-            # Get the existing stage execution record
-            existing_stage = await self.history_service.get_stage_execution(stage_execution_id)
-            if not existing_stage:
-                raise RuntimeError(
-                    f"Stage execution {stage_execution_id} not found in database for pause update. "
-                    "This indicates a critical bug in stage lifecycle management."
-                )
-            
-            # Update to paused status with iteration count
-            existing_stage.status = StageStatus.PAUSED.value
-            existing_stage.current_iteration = iteration
-            existing_stage.paused_at_us = now_us()  # Track when paused for accurate duration calculation
-            # Don't set completed_at_us - stage is not complete
-            # IMPORTANT: Save conversation state so resume can continue from where it left off
-            if paused_result:
-                existing_stage.stage_output = paused_result.model_dump(mode='json')
-                logger.info(f"Saved conversation state for paused stage {existing_stage.stage_name}")
-            else:
-                existing_stage.stage_output = None
-            existing_stage.error_message = None
-            
-            # Trigger stage execution hooks (history + dashboard) via context manager
-            from tarsy.hooks.hook_context import stage_execution_context
-            async with stage_execution_context(existing_stage):
-                # Context automatically triggers hooks when exiting
-                pass
-            logger.debug(f"Triggered stage hooks for stage pause {existing_stage.stage_index}: {existing_stage.stage_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to update stage execution as paused: {str(e)}")
-            raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} to paused status. "
-                f"Database persistence is required for conversation state preservation. Error: {str(e)}"
-            ) from e
+        # Don't set completed_at_us - stage is not complete.
+        # IMPORTANT: Save conversation state so resume can continue from where it left off
+        paused_stage = await self._transition_stage_execution(
+            stage_execution_id,
+            "paused",
+            {
+                "status": StageStatus.PAUSED.value,
+                "current_iteration": iteration,
+                "paused_at_us": now_us(),  # Track when paused for accurate duration calculation
+                "stage_output": paused_result.model_dump(mode='json') if paused_result else None,
+                "error_message": None,
+            },
+        )
+        if paused_stage and paused_result:
+            logger.info(f"Saved conversation state for paused stage {paused_stage.stage_name}")
     
     async def update_stage_execution_started(self, stage_execution_id: str) -> None:
         """
@@ -407,48 +447,16 @@ class StageExecutionManager:
         Raises:
             RuntimeError: If stage execution cannot be updated to started status
         """
-        if not self.history_service:
-            raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} as started: History service is unavailable. "
-                "All alert processing must be done with proper stage tracking."
-            )
-        
-        try:
-            # Get the existing stage execution record
-            existing_stage = await self.history_service.get_stage_execution(stage_execution_id)
-            if not existing_stage:
-                raise RuntimeError(
-                    f"Stage execution {stage_execution_id} not found in database for start update. "
-                    "This indicates a critical bug in stage lifecycle management."
-                )
-            
-            # Capture previous status before mutating for proper start time handling
-            previous_status = existing_stage.status
-            
-            # Update to active status
-            existing_stage.status = StageStatus.ACTIVE.value
-            
-            # Set started_at_us ONLY for new starts (PENDING→ACTIVE or no start time yet)
-            # For PAUSED→ACTIVE (resumed), preserve original start time for accurate duration tracking
-            if previous_status == StageStatus.PENDING.value or existing_stage.started_at_us is None:
-                existing_stage.started_at_us = now_us()
-            
-            # Clear current_iteration for both new and resumed executions
-            # Agent will set this during execution
-            existing_stage.current_iteration = None
-            
-            # Trigger stage execution hooks (history + dashboard) via context manager
-            from tarsy.hooks.hook_context import stage_execution_context
-            async with stage_execution_context(existing_stage):
-                # Context automatically triggers hooks when exiting
-                # History hook will update DB record and dashboard hook will broadcast
-                pass
-            logger.debug(f"Triggered stage hooks for stage start {existing_stage.stage_index}: {existing_stage.stage_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to update stage execution as started: {str(e)}")
-            raise RuntimeError(
-                f"Cannot update stage execution {stage_execution_id} to started status. "
-                f"Database persistence is required for stage tracking. Error: {str(e)}"
-            ) from e
-
+        # started_at_us is only set when none is stored yet (PENDING→ACTIVE); for
+        # PAUSED→ACTIVE (resumed) the original start time is preserved for accurate durations.
+        # current_iteration is cleared for both - the agent sets it during execution.
+        await self._transition_stage_execution(
+            stage_execution_id,
+            "started",
+            {
+                "status": StageStatus.ACTIVE.value,
+                "started_at_us": now_us(),
+                "current_iteration": None,
+            },
+            preserve_started_at=True,
+        )
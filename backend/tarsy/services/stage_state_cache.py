@@ -0,0 +1,108 @@
+"""
+Stage State Cache - in-memory stage execution state for sessions executing on this pod.
+
+While a chain runs, the executing pod is the only writer of that session's stage
+execution rows. Instead of re-querying the database to rediscover rows it just
+wrote, the chain loop and parallel executor read stage state from this cache.
+
+Logic:
+- Writes always go to the database first; the cache only stores the rows the
+  database returned (write-through), so it never holds unpersisted state
+- A session is tracked from the start of an execution run (new alert, resume,
+  continuation) until the run ends
+- Resume and continuation seed the cache from a database snapshot, since they may
+  run on a different pod than the one that originally executed the session
+- Untracked sessions are never cached - callers fall back to the database
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from tarsy.utils.logger import get_module_logger
+
+if TYPE_CHECKING:
+    from tarsy.models.db_models import StageExecution
+
+logger = get_module_logger(__name__)
+
+
+def _stage_sort_key(stage: "StageExecution") -> tuple:
+    """Sort like the history repository: regular stages first, then by index."""
+    return (
+        1 if stage.chat_id is not None else 0,
+        stage.stage_index,
+        stage.parallel_index,
+        stage.started_at_us or 0,
+    )
+
+
+class StageStateCache:
+    """Per-session stage execution state for sessions executing on this pod."""
+
+    def __init__(self) -> None:
+        # session_id -> {execution_id -> StageExecution}
+        self._sessions: Dict[str, Dict[str, "StageExecution"]] = {}
+
+    def track_session(
+        self,
+        session_id: str,
+        stage_executions: Optional[Iterable["StageExecution"]] = None,
+    ) -> None:
+        """
+        Start tracking a session, replacing any previous state.
+
+        Args:
+            session_id: Session ID
+            stage_executions: Database snapshot of the session's stages. Parallel
+                              children embedded as ``parallel_executions`` are included.
+        """
+        stages: Dict[str, "StageExecution"] = {}
+        for stage in stage_executions or ():
+            stages[stage.execution_id] = stage
+            for child in getattr(stage, "parallel_executions", None) or ():
+                stages[child.execution_id] = child
+        self._sessions[session_id] = stages
+        logger.debug(f"Tracking stage state for session {session_id} ({len(stages)} stages)")
+
+    def untrack_session(self, session_id: str) -> None:
+        """Stop tracking a session and drop its cached stage state."""
+        if self._sessions.pop(session_id, None) is not None:
+            logger.debug(f"Stopped tracking stage state for session {session_id}")
+
+    def is_tracked(self, session_id: str) -> bool:
+        """Check whether a session's stage state is held in memory."""
+        return session_id in self._sessions
+
+    def put(self, stage_execution: "StageExecution") -> None:
+        """Store a persisted stage execution row; ignored for untracked sessions."""
+        stages = self._sessions.get(stage_execution.session_id)
+        if stages is not None:
+            stages[stage_execution.execution_id] = stage_execution
+
+    def get_stage_executions(self, session_id: str) -> Optional[List["StageExecution"]]:
+        """
+        Get top-level stage executions (single stages and parallel parents) for a session.
+
+        Returns:
+            Stages in chain order, or None if the session is not tracked
+        """
+        stages = self._sessions.get(session_id)
+        if stages is None:
+            return None
+        top_level = [s for s in stages.values() if s.parent_stage_execution_id is None]
+        return sorted(top_level, key=_stage_sort_key)
+
+    def get_parallel_stage_children(self, parent_execution_id: str) -> Optional[List["StageExecution"]]:
+        """
+        Get the children of a parallel parent stage.
+
+        Returns:
+            Children ordered by parallel_index, or None if the parent is not cached
+        """
+        for stages in self._sessions.values():
+            if parent_execution_id in stages:
+                children = [
+                    s for s in stages.values()
+                    if s.parent_stage_execution_id == parent_execution_id
+                ]
+                return sorted(children, key=lambda s: s.parallel_index)
+        return None
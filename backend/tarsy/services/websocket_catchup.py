@@ -0,0 +1,207 @@
+"""
+Catch-up for WebSocket clients that reconnect after missing events.
+
+Previously a catchup request replayed at most 100 raw events after the
+client's last_event_id, silently dropping anything older and replaying every
+redundant progress update of a busy session.
+
+Logic:
+- "events" mode (default) replays the missed events in pages of
+  CATCHUP_PAGE_SIZE, up to CATCHUP_MAX_EVENTS per request; catchup.complete
+  reports has_more so the client can continue from its last event ID
+- "snapshot" mode sends one catchup.snapshot message with the current state
+  of the channel - the session and its stages for session:{id}, the active
+  sessions for "sessions" - taken at the channel's latest event ID, followed
+  only by the events after that point
+- "events" mode switches to a snapshot when more than CATCHUP_MAX_EVENTS were
+  missed on a channel that supports snapshots
+- Channels without a snapshot (e.g. cancellations) always replay events
+- Messages are sent as pre-encoded text (see events.codec)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from tarsy.models.db_models import Event
+from tarsy.repositories.event_repository import EventRepository
+from tarsy.services.events.channels import EventChannel
+from tarsy.services.events.codec import dumps
+from tarsy.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CATCHUP_MODE_EVENTS = "events"
+CATCHUP_MODE_SNAPSHOT = "snapshot"
+
+# Events fetched per query while replaying
+CATCHUP_PAGE_SIZE = 100
+
+# Events replayed per catchup request
+CATCHUP_MAX_EVENTS = 1000
+
+_SESSION_CHANNEL_PREFIX = EventChannel.session_details("")
+
+SendText = Callable[[str], Awaitable[None]]
+
+
+def _session_snapshot_fields(session: Any) -> Dict[str, Any]:
+    return {
+        "session_id": session.session_id,
+        "agent_type": session.agent_type,
+        "alert_type": session.alert_type,
+        "status": session.status,
+        "chain_id": session.chain_id,
+        "current_stage_index": session.current_stage_index,
+        "current_stage_id": session.current_stage_id,
+        "started_at_us": session.started_at_us,
+        "completed_at_us": session.completed_at_us,
+        "error_message": session.error_message,
+        "pause_metadata": session.pause_metadata,
+    }
+
+
+def _stage_snapshot_fields(stage: Any) -> Dict[str, Any]:
+    return {
+        "execution_id": stage.execution_id,
+        "stage_id": stage.stage_id,
+        "stage_index": stage.stage_index,
+        "stage_name": stage.stage_name,
+        "agent": stage.agent,
+        "status": stage.status,
+        "started_at_us": stage.started_at_us,
+        "completed_at_us": stage.completed_at_us,
+        "error_message": stage.error_message,
+        "chat_id": stage.chat_id,
+        "parent_stage_execution_id": stage.parent_stage_execution_id,
+        "parallel_index": stage.parallel_index,
+        "expected_parallel_count": stage.expected_parallel_count,
+    }
+
+
+def supports_snapshot(channel: str) -> bool:
+    """Whether a compact state snapshot can be built for a channel."""
+    return channel == EventChannel.SESSIONS or (
+        channel.startswith(_SESSION_CHANNEL_PREFIX) and len(channel) > len(_SESSION_CHANNEL_PREFIX)
+    )
+
+
+async def build_channel_snapshot(channel: str) -> Optional[Dict[str, Any]]:
+    """
+    Build the current state of a channel from the history database.
+
+    Args:
+        channel: "sessions" or a session:{id} channel
+
+    Returns:
+        Snapshot dict, or None if the channel has no snapshot or the session
+        does not exist
+    """
+    from tarsy.services.history_service import get_history_service
+
+    history_service = get_history_service()
+
+    if channel == EventChannel.SESSIONS:
+        active_sessions = await asyncio.to_thread(history_service.get_active_sessions)
+        return {"active_sessions": [_session_snapshot_fields(s) for s in active_sessions]}
+
+    if not supports_snapshot(channel):
+        return None
+
+    session_id = channel[len(_SESSION_CHANNEL_PREFIX):]
+    session = await asyncio.to_thread(history_service.get_session, session_id)
+    if session is None:
+        return None
+    stages = await history_service.get_stage_executions(session_id)
+    return {
+        "session": _session_snapshot_fields(session),
+        "stages": [_stage_snapshot_fields(stage) for stage in stages],
+    }
+
+
+async def _fetch_events_after(
+    event_repo: EventRepository, channel: str, after_id: int, max_events: int
+) -> List[Event]:
+    """Fetch up to max_events events after after_id, page by page."""
+    events: List[Event] = []
+    while len(events) < max_events:
+        page = await event_repo.get_events_after(
+            channel=channel, after_id=after_id, limit=CATCHUP_PAGE_SIZE
+        )
+        events.extend(page)
+        if len(page) < CATCHUP_PAGE_SIZE:
+            break
+        after_id = page[-1].id
+    return events
+
+
+async def _send_events(
+    send_text: SendText, channel: str, events: List[Event], after_id: int, snapshot: bool
+) -> None:
+    """Send replayed events (at most CATCHUP_MAX_EVENTS) and the completion marker."""
+    has_more = len(events) > CATCHUP_MAX_EVENTS
+    events = events[:CATCHUP_MAX_EVENTS]
+    for event in events:
+        # Inject event id into payload so clients can track last_event_id
+        await send_text(dumps({**event.payload, "id": event.id}))
+    await send_text(dumps({
+        "type": "catchup.complete",
+        "channel": channel,
+        "last_event_id": events[-1].id if events else after_id,
+        "events": len(events),
+        "has_more": has_more,
+        "snapshot": snapshot,
+    }))
+
+
+async def send_catchup(
+    send_text: SendText,
+    event_repo: EventRepository,
+    channel: str,
+    last_event_id: int = 0,
+    mode: str = CATCHUP_MODE_EVENTS,
+) -> None:
+    """
+    Send a client what it missed on a channel since last_event_id.
+
+    Args:
+        send_text: Sends one JSON text message to the client
+        event_repo: Event repository for the request's database session
+        channel: Channel to catch up on
+        last_event_id: Last event ID the client received (0 if none)
+        mode: CATCHUP_MODE_EVENTS or CATCHUP_MODE_SNAPSHOT
+    """
+    snapshot_wanted = mode == CATCHUP_MODE_SNAPSHOT and supports_snapshot(channel)
+
+    if not snapshot_wanted:
+        # One extra event tells us whether more were missed than we replay
+        events = await _fetch_events_after(event_repo, channel, last_event_id, CATCHUP_MAX_EVENTS + 1)
+        if len(events) <= CATCHUP_MAX_EVENTS or not supports_snapshot(channel):
+            await _send_events(send_text, channel, events, last_event_id, snapshot=False)
+            logger.debug(f"Sent {min(len(events), CATCHUP_MAX_EVENTS)} catchup events on '{channel}'")
+            return
+        logger.info(
+            f"More than {CATCHUP_MAX_EVENTS} events missed on '{channel}' - sending snapshot instead"
+        )
+
+    # Snapshot point first: the state read afterwards includes at least these events
+    snapshot_event_id = max(await event_repo.get_latest_event_id(channel), last_event_id)
+    snapshot = await build_channel_snapshot(channel)
+    if snapshot is None:
+        # Nothing to snapshot (e.g. unknown session) - replay what exists
+        snapshot_event_id = last_event_id
+    else:
+        message: Dict[str, Any] = {
+            "type": "catchup.snapshot",
+            "channel": channel,
+            "last_event_id": snapshot_event_id,
+            "snapshot": snapshot,
+        }
+        if "session" in snapshot:
+            message["session_id"] = snapshot["session"]["session_id"]
+        await send_text(dumps(message))
+
+    events = await _fetch_events_after(event_repo, channel, snapshot_event_id, CATCHUP_MAX_EVENTS + 1)
+    await _send_events(send_text, channel, events, snapshot_event_id, snapshot=snapshot is not None)
+    logger.debug(
+        f"Sent catchup on '{channel}': snapshot at event {snapshot_event_id} and {len(events)} event(s)"
+    )
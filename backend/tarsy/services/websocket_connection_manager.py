@@ -1,26 +1,315 @@
-"""WebSocket connection manager for real-time event distribution."""
+"""
+WebSocket connection manager for real-time event distribution.
 
-import json
-from typing import Dict, Set
+Broadcasting never awaits an individual client: each connection has its own
+bounded send queue drained by a dedicated writer task, so one slow browser
+cannot delay delivery to everyone else or back up the event listener.
+
+Logic:
+- broadcast_to_channel serializes the event once and enqueues it for every
+  subscriber of the channel
+- A streaming chunk (llm.stream.chunk) is merged into a queued chunk of the same
+  stream (coalescing), so each stream has at most one chunk waiting per client
+- Above the high-water mark, new streaming chunks are dropped (final chunks are
+  always kept); other events are still queued
+- Above the maximum queue size the consumer is considered hopeless: its queue is
+  discarded and the socket is closed, so the client reconnects and catches up
+- Per-connection lag metrics (queue depth, age of the oldest queued message,
+  drops, coalesced chunks) are exposed via get_metrics()
+- Control replies and catch-up replays go through the same queue (send()), so
+  they are ordered with live events; send() waits while the queue is above the
+  high-water mark instead of dropping
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
+from tarsy.services.events.codec import dumps, encode_event
 from tarsy.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Event type of transient LLM streaming chunks (see LLMStreamChunkEvent)
+STREAM_CHUNK_EVENT_TYPE = "llm.stream.chunk"
+
+# Close code sent to consumers that fall too far behind ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+DEFAULT_SEND_QUEUE_HIGH_WATER = 100
+DEFAULT_SEND_QUEUE_MAX_SIZE = 1000
+
+StreamKey = Tuple[Optional[str], ...]
+
+
+def _stream_key(event: dict) -> Optional[StreamKey]:
+    """Identify the stream a chunk belongs to, or None for non-chunk events."""
+    if event.get("type") != STREAM_CHUNK_EVENT_TYPE:
+        return None
+    return (
+        event.get("session_id"),
+        event.get("stage_execution_id"),
+        event.get("llm_interaction_id"),
+        event.get("mcp_event_id"),
+        event.get("stream_type"),
+    )
+
+
+def merge_stream_chunks(queued: dict, newer: dict) -> dict:
+    """
+    Merge two consecutive chunks of one stream into a single equivalent chunk.
+
+    Chunks are splices (keep ``text[:offset]``, append ``chunk``); snapshots replace
+    the whole text. The merged chunk carries the newer sequence number.
+    """
+    if newer.get("is_snapshot", True):
+        return newer
+    queued_offset = queued.get("offset", 0)
+    newer_offset = newer.get("offset", 0)
+    if newer_offset >= queued_offset:
+        chunk = queued.get("chunk", "")[:newer_offset - queued_offset] + newer.get("chunk", "")
+        offset = queued_offset
+    else:
+        chunk = newer.get("chunk", "")
+        offset = newer_offset
+    if queued.get("is_snapshot", True):
+        # Splicing into a snapshot yields a snapshot
+        chunk = queued.get("chunk", "")[:newer_offset] + newer.get("chunk", "")
+        offset = 0
+    return {**newer, "chunk": chunk, "offset": offset, "is_snapshot": queued.get("is_snapshot", True)}
+
+
+@dataclass
+class _QueuedMessage:
+    """Serialized message waiting in a connection's send queue."""
+    text: str
+    enqueued_at: float
+    stream_key: Optional[StreamKey] = None
+    event: Optional[dict] = None  # Kept for streaming chunks so they can be merged
+
+
+class ConnectionSendQueue:
+    """Bounded send queue and writer task for one WebSocket connection."""
+
+    def __init__(
+        self,
+        connection_id: str,
+        websocket: WebSocket,
+        high_water: int = DEFAULT_SEND_QUEUE_HIGH_WATER,
+        max_size: int = DEFAULT_SEND_QUEUE_MAX_SIZE,
+    ) -> None:
+        """
+        Initialize send queue.
+
+        Args:
+            connection_id: Connection this queue belongs to
+            websocket: WebSocket to write to
+            high_water: Queue depth above which new streaming chunks are dropped
+            max_size: Queue depth at which the consumer is disconnected
+        """
+        self.connection_id = connection_id
+        self.websocket = websocket
+        self.high_water = high_water
+        self.max_size = max_size
+
+        self._messages: Deque[_QueuedMessage] = deque()
+        # stream key -> queued chunk of that stream (for coalescing)
+        self._pending_chunks: Dict[StreamKey, _QueuedMessage] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+        self.slow_consumer: bool = False
+
+        # Metrics
+        self.sent: int = 0
+        self.failed: int = 0
+        self.dropped: int = 0
+        self.coalesced: int = 0
+        self.max_depth: int = 0
+        self.last_delivery_lag_seconds: float = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Messages currently waiting to be sent."""
+        return len(self._messages)
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name=f"websocket-writer-{self.connection_id}"
+            )
+
+    def stop(self) -> None:
+        """Stop the writer task and discard queued messages."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._messages.clear()
+        self._pending_chunks.clear()
+        self._idle.set()
+
+    def enqueue(self, text: str, event: dict) -> bool:
+        """
+        Queue a serialized event without waiting for it to be sent.
+
+        Args:
+            text: Serialized event
+            event: The event itself (used to recognize streaming chunks)
+
+        Returns:
+            True if the message was queued or merged into a queued chunk
+        """
+        if self.slow_consumer:
+            return False
+
+        stream_key = _stream_key(event)
+        if stream_key is not None:
+            pending = self._pending_chunks.get(stream_key)
+            if pending is not None:
+                pending.event = merge_stream_chunks(pending.event, event)
+                pending.text = text if pending.event is event else dumps(pending.event)
+                self.coalesced += 1
+                return True
+            if len(self._messages) >= self.high_water and not event.get("is_complete"):
+                self.dropped += 1
+                return False
+
+        if len(self._messages) >= self.max_size:
+            self._mark_slow_consumer()
+            return False
+
+        message = _QueuedMessage(
+            text=text,
+            enqueued_at=time.monotonic(),
+            stream_key=stream_key,
+            event=event if stream_key is not None else None,
+        )
+        self._messages.append(message)
+        if stream_key is not None:
+            self._pending_chunks[stream_key] = message
+        self.max_depth = max(self.max_depth, len(self._messages))
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def send(self, text: str) -> None:
+        """
+        Queue a control or catch-up message, waiting while the queue is above the high-water mark.
+
+        Args:
+            text: Serialized message
+        """
+        while len(self._messages) >= self.high_water and not self.slow_consumer:
+            await self._idle.wait()
+        # Not a streaming chunk, so it is never coalesced or dropped
+        self.enqueue(text, {})
+
+    def _mark_slow_consumer(self) -> None:
+        """Discard the backlog and let the writer close the connection."""
+        self.dropped += len(self._messages) + 1
+        self._messages.clear()
+        self._pending_chunks.clear()
+        self.slow_consumer = True
+        self._wakeup.set()
+        logger.warning(
+            f"WebSocket {self.connection_id} exceeded send queue limit "
+            f"({self.max_size}), disconnecting slow consumer"
+        )
+
+    async def wait_idle(self) -> None:
+        """Wait until every queued message has been written."""
+        await self._idle.wait()
+
+    async def _run(self) -> None:
+        """Writer loop: send queued messages one at a time."""
+        while True:
+            if self.slow_consumer:
+                self._idle.set()
+                try:
+                    await self.websocket.close(
+                        code=SLOW_CONSUMER_CLOSE_CODE, reason="Consumer too slow"
+                    )
+                except Exception as e:
+                    logger.debug(f"Error closing slow WebSocket {self.connection_id}: {e}")
+                return
+
+            if not self._messages:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            message = self._messages.popleft()
+            if message.stream_key is not None and self._pending_chunks.get(message.stream_key) is message:
+                del self._pending_chunks[message.stream_key]
+
+            try:
+                await self.websocket.send_text(message.text)
+                self.sent += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Failed to send to {self.connection_id}: {e}")
+                # Don't disconnect here - let the WebSocket endpoint handle it
+            self.last_delivery_lag_seconds = time.monotonic() - message.enqueued_at
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get lag and throughput counters for this connection."""
+        oldest_age = time.monotonic() - self._messages[0].enqueued_at if self._messages else 0.0
+        return {
+            "queue_depth": len(self._messages),
+            "max_queue_depth": self.max_depth,
+            "lag_ms": round(oldest_age * 1000, 3),
+            "last_delivery_lag_ms": round(self.last_delivery_lag_seconds * 1000, 3),
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "slow_consumer": self.slow_consumer,
+        }
+
 
 class WebSocketConnectionManager:
     """Manages WebSocket connections and channel subscriptions."""
 
-    def __init__(self) -> None:
-        """Initialize connection manager."""
+    def __init__(
+        self,
+        send_queue_high_water: int = DEFAULT_SEND_QUEUE_HIGH_WATER,
+        send_queue_max_size: int = DEFAULT_SEND_QUEUE_MAX_SIZE,
+    ) -> None:
+        """
+        Initialize connection manager.
+
+        Args:
+            send_queue_high_water: Per-connection queue depth above which streaming chunks are dropped
+            send_queue_max_size: Per-connection queue depth at which a slow consumer is disconnected
+        """
         # connection_id -> WebSocket
         self.connections: Dict[str, WebSocket] = {}
         # connection_id -> set of subscribed channels
         self.subscriptions: Dict[str, Set[str]] = {}
         # channel -> set of connection_ids
         self.channel_subscribers: Dict[str, Set[str]] = {}
+        # connection_id -> send queue
+        self.send_queues: Dict[str, ConnectionSendQueue] = {}
+        self.send_queue_high_water = send_queue_high_water
+        self.send_queue_max_size = send_queue_max_size
+
+    def configure_send_queues(self, high_water: int, max_size: int) -> None:
+        """
+        Set send queue limits for connections accepted from now on.
+
+        Args:
+            high_water: Queue depth above which streaming chunks are dropped
+            max_size: Queue depth at which a slow consumer is disconnected
+        """
+        self.send_queue_high_water = high_water
+        self.send_queue_max_size = max_size
 
     async def connect(self, connection_id: str, websocket: WebSocket) -> None:
         """
@@ -33,6 +322,14 @@ class WebSocketConnectionManager:
         await websocket.accept()
         self.connections[connection_id] = websocket
         self.subscriptions[connection_id] = set()
+        send_queue = ConnectionSendQueue(
+            connection_id,
+            websocket,
+            high_water=self.send_queue_high_water,
+            max_size=self.send_queue_max_size,
+        )
+        send_queue.start()
+        self.send_queues[connection_id] = send_queue
         logger.debug(f"WebSocket connected: {connection_id}")
 
     def disconnect(self, connection_id: str) -> None:
@@ -51,6 +348,11 @@ class WebSocketConnectionManager:
                         del self.channel_subscribers[channel]
             del self.subscriptions[connection_id]
 
+        # Stop the writer task
+        send_queue = self.send_queues.pop(connection_id, None)
+        if send_queue is not None:
+            send_queue.stop()
+
         # Remove connection
         if connection_id in self.connections:
             del self.connections[connection_id]
@@ -99,6 +401,9 @@ class WebSocketConnectionManager:
         """
         Broadcast event to all subscribers of a channel.
 
+        Only enqueues the event on each subscriber's send queue; delivery happens
+        on the per-connection writer tasks.
+
         Args:
             channel: Channel to broadcast to
             event: Event data to send
@@ -107,14 +412,35 @@ class WebSocketConnectionManager:
             return
 
         subscribers = list(self.channel_subscribers[channel])
-        event_json = json.dumps(event)
+        # Encoded once (or not at all if the listener kept the NOTIFY text) for all subscribers
+        event_json = encode_event(event)
 
         for connection_id in subscribers:
-            websocket = self.connections.get(connection_id)
-            if websocket:
-                try:
-                    await websocket.send_text(event_json)
-                except Exception as e:
-                    logger.error(f"Failed to send to {connection_id}: {e}")
-                    # Don't disconnect here - let the WebSocket endpoint handle it
+            send_queue = self.send_queues.get(connection_id)
+            if send_queue:
+                send_queue.enqueue(event_json, event)
 
+    async def flush(self) -> None:
+        """Wait until every connection's queued messages have been written."""
+        await asyncio.gather(*(q.wait_idle() for q in list(self.send_queues.values())))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get send queue metrics.
+
+        Returns:
+            Totals across connections plus per-connection lag metrics
+        """
+        per_connection = {
+            connection_id: send_queue.get_metrics()
+            for connection_id, send_queue in self.send_queues.items()
+        }
+        return {
+            "connections": len(self.connections),
+            "channels": len(self.channel_subscribers),
+            "max_lag_ms": max((m["lag_ms"] for m in per_connection.values()), default=0.0),
+            "dropped": sum(m["dropped"] for m in per_connection.values()),
+            "coalesced": sum(m["coalesced"] for m in per_connection.values()),
+            "slow_consumers": sum(1 for m in per_connection.values() if m["slow_consumer"]),
+            "per_connection": per_connection,
+        }
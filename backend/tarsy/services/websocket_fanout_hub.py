@@ -0,0 +1,167 @@
+"""
+WebSocket fan-out hub between the EventListener and WebSocket connections.
+
+Previously every WebSocket connection registered its own EventListener callback
+for each channel it subscribed to, and every callback broadcast to all of the
+channel's subscribers - with N dashboard tabs on a channel each event was sent
+N×N times. The hub owns the listener side instead.
+
+Logic:
+- Exactly one EventListener callback per channel per pod, registered when the
+  first connection subscribes and released when the last one leaves
+- Each event received from the listener is delivered once to every connection
+  subscribed to the channel, using the connection manager's routing table
+- Subscribing or unsubscribing any further connection only updates the
+  in-memory routing table; the EventListener is not touched
+- A connection is routed before the callback registration is awaited, so it
+  can't be released mid-flight; concurrent subscribers wait for the pending
+  registration and all fail if it fails
+"""
+
+import asyncio
+from typing import Dict, Set, Tuple
+
+from tarsy.services.events.base import AsyncCallback, EventListener
+from tarsy.services.events.manager import get_event_system
+from tarsy.services.websocket_connection_manager import WebSocketConnectionManager
+from tarsy.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class WebSocketFanoutHub:
+    """Routes events from one listener callback per channel to all subscribed connections."""
+
+    def __init__(self, connection_manager: WebSocketConnectionManager) -> None:
+        """
+        Initialize fan-out hub.
+
+        Args:
+            connection_manager: Connection manager holding the channel routing table
+        """
+        self.connection_manager = connection_manager
+        # channel -> (listener, callback) registered for that channel
+        self._registrations: Dict[str, Tuple[EventListener, AsyncCallback]] = {}
+        # channel -> registration in progress, awaited by concurrent subscribers
+        self._pending_registrations: Dict[str, asyncio.Future] = {}
+
+    @property
+    def channels(self) -> Set[str]:
+        """Channels that currently have a listener callback registered."""
+        return set(self._registrations)
+
+    def _make_callback(self, channel: str) -> AsyncCallback:
+        """Create the single listener callback for a channel."""
+        async def deliver(event: dict) -> None:
+            await self.connection_manager.broadcast_to_channel(channel, event)
+
+        return deliver
+
+    async def subscribe(self, connection_id: str, channel: str) -> bool:
+        """
+        Subscribe a connection to a channel.
+
+        Registers the channel's listener callback if this is the first
+        subscriber on the pod.
+
+        Args:
+            connection_id: Connection to subscribe
+            channel: Channel name to subscribe to
+
+        Returns:
+            False if the connection was already subscribed to the channel
+        """
+        if channel in self.connection_manager.subscriptions.get(connection_id, set()):
+            return False
+
+        # Route first: a concurrent release then sees a subscriber and keeps the callback
+        self.connection_manager.subscribe(connection_id, channel)
+        try:
+            await self._ensure_registered(channel)
+        except BaseException:
+            self.connection_manager.unsubscribe(connection_id, channel)
+            raise
+
+        if channel not in self.connection_manager.subscriptions.get(connection_id, set()):
+            # Disconnected while the callback was being registered
+            await self._release_if_unused(channel)
+        return True
+
+    async def _ensure_registered(self, channel: str) -> None:
+        """Register the channel's listener callback, or wait for a registration in progress."""
+        pending = self._pending_registrations.get(channel)
+        if pending is not None:
+            # Shielded so a cancelled subscriber doesn't cancel the others' registration
+            await asyncio.shield(pending)
+            return
+        if channel in self._registrations:
+            return
+
+        event_listener = get_event_system().get_listener()
+        callback = self._make_callback(channel)
+        pending = asyncio.get_running_loop().create_future()
+        self._pending_registrations[channel] = pending
+        try:
+            await event_listener.subscribe(channel, callback)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                pending.set_exception(e)
+                # Retrieved here so it isn't reported when nobody else was waiting
+                pending.exception()
+            else:
+                pending.cancel()
+            raise
+        else:
+            self._registrations[channel] = (event_listener, callback)
+            pending.set_result(None)
+            logger.debug(f"Registered fan-out callback for channel '{channel}'")
+        finally:
+            del self._pending_registrations[channel]
+
+    async def unsubscribe(self, connection_id: str, channel: str) -> None:
+        """
+        Unsubscribe a connection from a channel.
+
+        Releases the channel's listener callback if no subscribers remain.
+
+        Args:
+            connection_id: Connection to unsubscribe
+            channel: Channel name to unsubscribe from
+        """
+        self.connection_manager.unsubscribe(connection_id, channel)
+        await self._release_if_unused(channel)
+
+    async def disconnect(self, connection_id: str) -> None:
+        """
+        Remove a connection and release channels it was the last subscriber of.
+
+        The connection is always removed from the connection manager, even if
+        releasing listener callbacks fails.
+
+        Args:
+            connection_id: Connection to disconnect
+        """
+        channels = set(self.connection_manager.subscriptions.get(connection_id, set()))
+        self.connection_manager.disconnect(connection_id)
+
+        for channel in channels:
+            try:
+                await self._release_if_unused(channel)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to release fan-out callback for '{channel}' "
+                    f"after disconnecting {connection_id}: {e}"
+                )
+
+    async def _release_if_unused(self, channel: str) -> None:
+        """Unregister the channel's listener callback if it has no subscribers left."""
+        if self.connection_manager.channel_subscribers.get(channel):
+            return
+
+        registration = self._registrations.pop(channel, None)
+        if registration is None:
+            return
+
+        event_listener, callback = registration
+        await event_listener.unsubscribe(channel, callback)
+        logger.debug(f"Released fan-out callback for channel '{channel}'")
@@ -71,6 +71,9 @@ def mock_settings():
     # History/Database settings - use in-memory database for integration tests
     settings.database_url = "sqlite:///:memory:"
     
+    # No session token budget for integration tests
+    settings.session_token_budget = None
+    
     # Updated LLM providers configuration to match EP-0013
     settings.llm_providers = {
         "google-default": {"model": "gemini-2.5-flash", "api_key_env": "GOOGLE_API_KEY", "type": "google"},
@@ -931,6 +934,7 @@ async def alert_service(ensure_integration_test_isolation, mock_settings, mock_r
         return mock_stage
     
     mock_history_service.get_stage_execution = AsyncMock(side_effect=lambda _: create_mock_stage_execution())
+    mock_history_service.transition_stage_execution = AsyncMock(side_effect=lambda *_args, **_kwargs: create_mock_stage_execution())
     mock_history_service.update_stage_execution = Mock()
     mock_history_service.record_session_interaction = AsyncMock()
     
@@ -1032,6 +1036,7 @@ def alert_service_with_mocks(
         return mock_stage
     
     mock_history_service.get_stage_execution = AsyncMock(side_effect=lambda _: create_mock_stage_execution_2())
+    mock_history_service.transition_stage_execution = AsyncMock(side_effect=lambda *_args, **_kwargs: create_mock_stage_execution_2())
     mock_history_service.update_stage_execution = Mock()
     
     # Mock get_repository to support stage execution verification - must be a context manager
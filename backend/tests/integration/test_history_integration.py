@@ -614,6 +614,7 @@ class TestAlertServiceHistoryIntegration:
         settings.alert_processing_timeout = 900  # Default 15 minute timeout
         settings.llm_iteration_timeout = 210  # Default 3.5 minute iteration timeout
         settings.mcp_tool_call_timeout = 70  # Default 70 second tool timeout
+        settings.session_token_budget = None  # No session token budget
         settings.slack_bot_token = None
         settings.slack_channel = None
         return settings
@@ -697,6 +698,9 @@ class TestAlertServiceHistoryIntegration:
                 current_iteration=None
             )
         mock_history_service.get_stage_execution = AsyncMock(side_effect=create_mock_stage_execution)
+        mock_history_service.transition_stage_execution = AsyncMock(
+            side_effect=lambda execution_id, *args, **kwargs: create_mock_stage_execution(execution_id)
+        )
         mock_history_service.update_session_current_stage = AsyncMock()
         # Mock database verification for stage creation
         mock_history_service._retry_database_operation_async = AsyncMock(return_value=True)
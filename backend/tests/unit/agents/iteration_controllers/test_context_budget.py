@@ -0,0 +1,209 @@
+"""
+Unit tests for conversation compaction in iteration controllers.
+
+Tests that conversations exceeding the context budget have their oldest
+observations collapsed into references while the system prompt, the alert
+and the latest turns are kept, and that compactions are recorded.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from tarsy.agents.iteration_controllers import context_budget
+from tarsy.agents.iteration_controllers.context_budget import (
+    COMPACTED_MARKER,
+    DEFAULT_CONTEXT_WINDOW_TOKENS,
+    ContextBudgetManager,
+)
+from tarsy.agents.iteration_controllers.react_base_controller import ReactController
+from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
+
+
+@pytest.fixture(autouse=True)
+def mock_encoding():
+    """Mock tiktoken with a whitespace tokenizer to avoid real model dependencies in tests."""
+    with patch('tarsy.utils.token_counter.tiktoken') as mock_tiktoken, \
+         patch.object(context_budget, "_token_counter", None), \
+         patch.object(context_budget, "_message_token_counts", context_budget.OrderedDict()):
+        encoding = MagicMock()
+        encoding.encode.side_effect = lambda text: text.split()
+        mock_tiktoken.encoding_for_model.return_value = encoding
+        yield encoding
+
+
+def make_settings(**overrides):
+    values = dict(
+        llm_context_compaction_enabled=True,
+        llm_context_compaction_threshold=0.8,
+        llm_context_keep_recent_messages=4,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def make_conversation(observations: int, observation_chars: int = 4000) -> LLMConversation:
+    """System prompt, alert and `observations` ReAct turns with large observations."""
+    messages = [
+        LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE assistant. " * 50),
+        LLMMessage(role=MessageRole.USER, content="Alert: pod crash looping. " * 50),
+    ]
+    for i in range(observations):
+        messages.append(LLMMessage(role=MessageRole.ASSISTANT, content=f"Thought: check step {i}\nAction: kubectl.get"))
+        messages.append(LLMMessage(role=MessageRole.USER, content=f"Observation: step {i} " + "x " * (observation_chars // 2)))
+    return LLMConversation(messages=messages)
+
+
+def count_tokens(conversation: LLMConversation) -> int:
+    counter = context_budget._get_token_counter()
+    return sum(counter.count_tokens(m.content) for m in conversation.messages)
+
+
+@pytest.mark.unit
+class TestContextBudgetManager:
+    """Test compacting conversations to the context budget."""
+
+    def test_budget_from_context_window(self):
+        """Test the budget is the threshold fraction of the context window."""
+        assert ContextBudgetManager(make_settings(), 100000).token_budget == 80000
+        assert ContextBudgetManager(make_settings(), None).token_budget == int(DEFAULT_CONTEXT_WINDOW_TOKENS * 0.8)
+
+    def test_conversation_within_budget_is_untouched(self):
+        """Test that nothing changes below the budget."""
+        conversation = make_conversation(observations=3)
+        original = [m.content for m in conversation.messages]
+
+        assert ContextBudgetManager(make_settings(), 1000000).compact(conversation) is None
+
+        assert [m.content for m in conversation.messages] == original
+        assert conversation.compactions == []
+
+    def test_oldest_observations_are_compacted(self):
+        """Test that the oldest observations are collapsed until below the target."""
+        conversation = make_conversation(observations=10)
+        tokens_before = count_tokens(conversation)
+        manager = ContextBudgetManager(make_settings(), int(tokens_before / 0.8 * 0.9))
+
+        compaction = manager.compact(conversation)
+
+        assert compaction is not None
+        assert compaction.tokens_before == tokens_before
+        assert compaction.tokens_after == count_tokens(conversation)
+        assert compaction.tokens_after <= manager.token_budget * context_budget.COMPACTION_TARGET
+        assert conversation.compactions == [compaction]
+
+        compacted = [i for i, m in enumerate(conversation.messages) if COMPACTED_MARKER in m.content]
+        assert len(compacted) == compaction.compacted_messages
+        # Oldest first: observations at indices 3, 5, 7, ...
+        assert compacted == list(range(3, 3 + 2 * len(compacted), 2))
+        assert conversation.messages[3].content.startswith("Observation: " + COMPACTED_MARKER)
+        assert "step 0" in conversation.messages[3].content
+
+    def test_protected_messages_are_kept(self):
+        """Test that the system prompt, alert and latest messages are never compacted."""
+        conversation = make_conversation(observations=10)
+        original = [m.content for m in conversation.messages]
+
+        ContextBudgetManager(make_settings(), 1000).compact(conversation)
+
+        assert conversation.messages[0].content == original[0]
+        assert conversation.messages[1].content == original[1]
+        assert [m.content for m in conversation.messages[-4:]] == original[-4:]
+        # Thoughts are kept, all other observations are compacted
+        for message in conversation.messages[2:-4]:
+            assert (COMPACTED_MARKER in message.content) == (message.role == MessageRole.USER)
+
+    def test_nothing_left_to_compact(self):
+        """Test that an over-budget conversation without compactable observations isn't recorded."""
+        conversation = make_conversation(observations=2)
+
+        assert ContextBudgetManager(make_settings(), 100).compact(conversation) is None
+        assert conversation.compactions == []
+
+    def test_compacted_observations_are_not_compacted_again(self):
+        """Test that a second compaction only touches new observations."""
+        conversation = make_conversation(observations=6)
+        manager = ContextBudgetManager(make_settings(), 1000)
+        first = manager.compact(conversation)
+
+        for i in range(6, 9):
+            conversation.append_assistant_message(f"Thought: check step {i}")
+            conversation.append_observation(f"Observation: step {i} " + "y " * 2000)
+        second = manager.compact(conversation)
+
+        assert second.compacted_messages == 3
+        assert conversation.compactions == [first, second]
+        assert all(m.content.count(COMPACTED_MARKER) <= 1 for m in conversation.messages)
+
+    def test_message_token_counts_are_reused(self, mock_encoding):
+        """Test that later iterations only tokenize messages added since the last check."""
+        conversation = make_conversation(observations=2)
+        manager = ContextBudgetManager(make_settings(), 100000)
+        manager.token_budget = 100
+        manager.compact(conversation)
+        mock_encoding.encode.reset_mock()
+
+        conversation.append_assistant_message("Thought: check step 2\nAction: kubectl.get")
+        manager.compact(conversation)
+
+        mock_encoding.encode.assert_called_once_with("Thought: check step 2\nAction: kubectl.get")
+
+    def test_compactions_survive_serialization(self):
+        """Test that compactions are stored with the conversation (history, paused sessions)."""
+        conversation = make_conversation(observations=6)
+        ContextBudgetManager(make_settings(), 1000).compact(conversation)
+
+        restored = LLMConversation.model_validate(conversation.model_dump())
+
+        assert restored.compactions == conversation.compactions
+
+
+class CompactingReactController(ReactController):
+    def build_initial_conversation(self, context):
+        return make_conversation(observations=0)
+
+
+@pytest.mark.unit
+class TestControllerCompaction:
+    """Test compaction from the iteration controllers."""
+
+    def make_controller(self, context_window):
+        llm_manager = Mock()
+        llm_manager.get_context_window_tokens.return_value = context_window
+        controller = CompactingReactController(llm_manager, Mock())
+        controller.set_llm_provider("google-default")
+        return controller
+
+    def test_compacts_with_provider_context_window(self):
+        """Test that the provider's context window sets the budget."""
+        controller = self.make_controller(context_window=1000)
+        conversation = make_conversation(observations=6)
+
+        with patch("tarsy.config.settings.get_settings", return_value=make_settings()):
+            controller._compact_conversation(conversation)
+
+        controller.llm_manager.get_context_window_tokens.assert_called_once_with("google-default")
+        assert len(conversation.compactions) == 1
+
+    def test_compaction_disabled(self):
+        """Test that compaction can be turned off."""
+        controller = self.make_controller(context_window=1000)
+        conversation = make_conversation(observations=6)
+
+        with patch("tarsy.config.settings.get_settings",
+                   return_value=make_settings(llm_context_compaction_enabled=False)):
+            controller._compact_conversation(conversation)
+
+        assert conversation.compactions == []
+
+    def test_compaction_errors_do_not_fail_the_iteration(self):
+        """Test that a failing compaction leaves the conversation as it is."""
+        controller = self.make_controller(context_window=1000)
+        conversation = make_conversation(observations=6)
+
+        with patch("tarsy.config.settings.get_settings", return_value=make_settings()), \
+             patch.object(ContextBudgetManager, "compact", side_effect=RuntimeError("tokenizer failed")):
+            controller._compact_conversation(conversation)
+
+        assert conversation.compactions == []
@@ -592,3 +592,125 @@ class TestProviderConsistency:
         providers_used = [call.kwargs.get('provider') for call in calls]
         assert all(p is None for p in providers_used), \
             f"Expected all calls to use provider=None (global default), but got: {providers_used}"
+
+
+@pytest.mark.unit
+class TestTokenBudgetConclusion:
+    """Test forced conclusion and hard stop on session/agent token budgets."""
+    
+    @pytest.fixture
+    def mock_prompt_builder(self):
+        """Create mock prompt builder."""
+        builder = Mock()
+        builder.build_react_forced_conclusion_prompt.return_value = "Please conclude now."
+        return builder
+    
+    @pytest.fixture
+    def sample_context(self):
+        """Create sample context with room for more iterations than the budget allows."""
+        from tarsy.models.alert import ProcessingAlert
+        from tarsy.utils.timestamp import now_us
+        
+        mock_agent = Mock()
+        mock_agent.max_iterations = 10
+        mock_agent.get_current_stage_execution_id.return_value = "stage-789"
+        
+        processing_alert = ProcessingAlert(
+            alert_type="test",
+            severity="warning",
+            timestamp=now_us(),
+            environment="production",
+            alert_data={"alert": "TestAlert"}
+        )
+        chain_context = ChainContext.from_processing_alert(
+            processing_alert=processing_alert,
+            session_id="test-session",
+            current_stage_name="analysis"
+        )
+        chain_context.chat_context = None
+        
+        return StageContext(
+            chain_context=chain_context,
+            available_tools=AvailableTools(tools=[]),
+            agent=mock_agent
+        )
+    
+    def make_llm_manager(self, tokens_per_call: int):
+        """Mock LLM manager that enforces and records token usage like LLMManager and LLMClient."""
+        from tarsy.integrations.llm.token_budget import (
+            ensure_token_budget,
+            record_token_usage,
+        )
+        
+        async def mock_generate(conversation, session_id, stage_execution_id=None, **kwargs):
+            ensure_token_budget()
+            record_token_usage(tokens_per_call)
+            updated_conversation = LLMConversation(messages=conversation.messages.copy())
+            if kwargs.get('interaction_type') == LLMInteractionType.FORCED_CONCLUSION.value:
+                updated_conversation.append_assistant_message("Final Answer: Concluded within budget.")
+            else:
+                updated_conversation.append_assistant_message("Thought: Still investigating...")
+            return updated_conversation
+        
+        manager = AsyncMock()
+        manager.generate_response = AsyncMock(side_effect=mock_generate)
+        return manager
+    
+    @staticmethod
+    def interaction_types(manager):
+        return [call.kwargs.get('interaction_type') for call in manager.generate_response.call_args_list]
+    
+    @pytest.mark.asyncio
+    async def test_nearly_used_budget_forces_conclusion(self, mock_prompt_builder, sample_context):
+        """Test that the investigation concludes once 90% of the budget is used."""
+        from tarsy.integrations.llm.token_budget import TokenBudget, token_budget_scope
+        
+        manager = self.make_llm_manager(tokens_per_call=4500)
+        controller = TestReactController(manager, mock_prompt_builder)
+        
+        with token_budget_scope(TokenBudget("session", 10000)) as budget:
+            result = await controller.execute_analysis_loop(sample_context)
+        
+        # Two investigation calls use 9,000 tokens, then the agent concludes
+        assert self.interaction_types(manager) == [None, None, LLMInteractionType.FORCED_CONCLUSION.value]
+        mock_prompt_builder.build_react_forced_conclusion_prompt.assert_called_once_with(2)
+        assert "Concluded within budget" in result
+        assert budget.used == 13500
+    
+    @pytest.mark.asyncio
+    async def test_used_up_budget_stops_the_investigation(self, mock_prompt_builder, sample_context):
+        """Test the hard stop when the budget is used up before the conclusion."""
+        from tarsy.integrations.llm.token_budget import (
+            TokenBudget,
+            TokenBudgetExceededError,
+            token_budget_scope,
+        )
+        
+        manager = self.make_llm_manager(tokens_per_call=6000)
+        controller = TestReactController(manager, mock_prompt_builder)
+        
+        with token_budget_scope(TokenBudget("agent", 10000)):
+            with pytest.raises(TokenBudgetExceededError):
+                await controller.execute_analysis_loop(sample_context)
+        
+        # The forced conclusion was attempted but no LLM call went past the budget
+        assert self.interaction_types(manager) == [None, None, LLMInteractionType.FORCED_CONCLUSION.value]
+    
+    @pytest.mark.asyncio
+    async def test_budget_error_is_not_retried_as_iteration_failure(self, mock_prompt_builder, sample_context):
+        """Test that a budget used up by another agent ends the loop instead of retrying."""
+        from tarsy.integrations.llm.token_budget import (
+            TokenBudget,
+            TokenBudgetExceededError,
+        )
+        
+        manager = AsyncMock()
+        manager.generate_response = AsyncMock(
+            side_effect=TokenBudgetExceededError(TokenBudget("session", 1000, used=1000))
+        )
+        controller = TestReactController(manager, mock_prompt_builder)
+        
+        with pytest.raises(TokenBudgetExceededError):
+            await controller.execute_analysis_loop(sample_context)
+        
+        assert manager.generate_response.call_count == 1
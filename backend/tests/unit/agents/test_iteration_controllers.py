@@ -16,6 +16,7 @@ from tarsy.agents.iteration_controllers.react_final_analysis_controller import (
 from tarsy.agents.iteration_controllers.react_stage_controller import (
     ReactStageController,
 )
+from tarsy.agents.parsers.react_parser import ReActParser
 from tarsy.models.constants import IterationStrategy
 from tarsy.models.processing_context import AvailableTools, ChainContext, StageContext
 from tarsy.models.unified_interactions import LLMConversation, MessageRole
@@ -124,6 +125,15 @@ class TestSimpleReActController:
         system_message = conversation_arg.messages[0]
         assert "ReAct" in system_message.content
     
+    @pytest.mark.asyncio
+    async def test_execute_analysis_loop_passes_stop_sequences(self, controller, sample_context, mock_llm_manager):
+        """Test that ReAct calls end the response at a hallucinated observation."""
+        await controller.execute_analysis_loop(sample_context)
+        
+        call_kwargs = mock_llm_manager.generate_response.call_args.kwargs
+        assert call_kwargs['stop_sequences'] == ReActParser.STOP_SEQUENCES
+        assert "\nObservation:" in ReActParser.STOP_SEQUENCES
+    
     @pytest.mark.asyncio
     async def test_execute_analysis_loop_no_agent(self, controller):
         """Test ReAct analysis loop with missing agent reference."""
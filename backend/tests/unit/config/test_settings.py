@@ -686,6 +686,8 @@ class TestSettingsDatabaseURL:
             settings = Settings()
             
             assert settings.postgres_pool_size == 5
+            assert settings.postgres_dashboard_pool_size == 3
+            assert settings.postgres_event_pool_size == 5
             assert settings.postgres_max_overflow == 10
             assert settings.postgres_pool_timeout == 30
             assert settings.postgres_pool_recycle == 3600
@@ -707,6 +709,58 @@ class TestSettingsDatabaseURL:
         assert settings.postgres_pool_recycle == 7200
         assert settings.postgres_pool_pre_ping is False
 
+    def test_sqlite_single_writer_settings(self):
+        """Test SQLite single-writer settings defaults and validation."""
+        settings = Settings()
+        assert settings.sqlite_single_writer is False
+        assert settings.sqlite_writer_max_batch_size == 50
+        
+        settings = Settings(sqlite_single_writer=True, sqlite_writer_max_batch_size=10)
+        assert settings.sqlite_single_writer is True
+        assert settings.sqlite_writer_max_batch_size == 10
+        
+        with pytest.raises(ValueError, match="sqlite_writer_max_batch_size must be an integer greater than 0"):
+            Settings(sqlite_writer_max_batch_size=0)
+
+    def test_websocket_send_queue_settings(self):
+        """Test WebSocket send queue limit defaults and validation."""
+        settings = Settings()
+        assert settings.websocket_send_queue_high_water == 100
+        assert settings.websocket_send_queue_max_size == 1000
+        
+        with pytest.raises(ValueError, match="websocket_send_queue_max_size must be an integer greater than 0"):
+            Settings(websocket_send_queue_max_size=0)
+
+    def test_event_publish_batch_window_ms(self):
+        """Test event batch window default and validation."""
+        assert Settings().event_publish_batch_window_ms == 0
+        assert Settings(event_publish_batch_window_ms=5).event_publish_batch_window_ms == 5
+        
+        with pytest.raises(ValueError, match="event_publish_batch_window_ms must be an integer >= 0"):
+            Settings(event_publish_batch_window_ms=-1)
+        
+        assert Settings().event_notify_shard_count == 0
+        with pytest.raises(ValueError, match="event_notify_shard_count must be an integer >= 0"):
+            Settings(event_notify_shard_count=-2)
+
+    def test_llm_streaming_snapshot_interval(self):
+        """Test streaming snapshot interval default and validation."""
+        assert Settings().llm_streaming_snapshot_interval == 50
+        
+        with pytest.raises(ValueError, match="llm_streaming_snapshot_interval must be an integer greater than 0"):
+            Settings(llm_streaming_snapshot_interval=0)
+
+    def test_alert_data_facets_settings(self):
+        """Test alert_data facet keys parsing and validation."""
+        settings = Settings()
+        assert settings.alert_data_facets == ["cluster", "namespace", "severity"]
+        
+        settings = Settings(alert_data_facets="cluster, team ,")
+        assert settings.alert_data_facets == ["cluster", "team"]
+        
+        with pytest.raises(ValueError, match="alert_data_facets keys may only contain"):
+            Settings(alert_data_facets="cluster,bad'key")
+
     def test_database_url_composed_from_components(self):
         """Test database URL composed from separate components."""
         with patch('tarsy.config.settings.is_testing', return_value=False):
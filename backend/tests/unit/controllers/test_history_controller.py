@@ -231,6 +231,57 @@ class TestHistoryControllerEndpoints:
         assert set(filters["status"]) == {"completed", "failed"}  # Multiple status values
         assert filters["agent_type"] == "KubernetesAgent"
 
+    @pytest.mark.unit
+    def test_get_sessions_list_with_alert_data_facets(self, app, client, mock_history_service):
+        """Test that facet query parameters are grouped into alert_data filters."""
+        from tarsy.models.history_models import PaginatedSessions, PaginationInfo
+        mock_history_service.get_sessions_list.return_value = PaginatedSessions(
+            sessions=[],
+            pagination=PaginationInfo(page=1, page_size=20, total_pages=0, total_items=0),
+            filters_applied={}
+        )
+        app.dependency_overrides[get_history_service] = lambda: mock_history_service
+        
+        with patch("tarsy.controllers.history_controller.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.alert_data_facets = ["cluster", "severity"]
+            response = client.get(
+                "/api/v1/history/sessions",
+                params=[
+                    ("facet", "cluster:prod-east"),
+                    ("facet", "severity:critical"),
+                    ("facet", "severity:warning")
+                ]
+            )
+        
+        app.dependency_overrides.clear()
+        
+        assert response.status_code == 200
+        filters = mock_history_service.get_sessions_list.call_args.kwargs["filters"]
+        assert filters["alert_data"] == {
+            "cluster": ["prod-east"],
+            "severity": ["critical", "warning"]
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("facet,expected_detail", [
+        ("cluster", "expected 'key:value'"),
+        ("cluster:", "expected 'key:value'"),
+        ("team:core", "Unsupported facet 'team'"),
+    ])
+    def test_get_sessions_list_invalid_facet(self, app, client, mock_history_service, facet, expected_detail):
+        """Test that malformed or unconfigured facets are rejected with 400."""
+        app.dependency_overrides[get_history_service] = lambda: mock_history_service
+        
+        with patch("tarsy.controllers.history_controller.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.alert_data_facets = ["cluster", "severity"]
+            response = client.get("/api/v1/history/sessions", params={"facet": facet})
+        
+        app.dependency_overrides.clear()
+        
+        assert response.status_code == 400
+        assert expected_detail in response.json()["detail"]
+        mock_history_service.get_sessions_list.assert_not_called()
+
     @pytest.mark.unit 
     def test_get_sessions_list_multiple_status_historical_use_case(self, app, client, mock_history_service):
         """Test the specific use case for historical alerts (completed + failed)."""
@@ -0,0 +1,125 @@
+"""
+Unit tests for the SQLite single-writer queue.
+
+Tests batching of queued write operations into one transaction, per-operation
+SAVEPOINT isolation and inline execution of nested writes.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from tarsy.database.sqlite_writer import SQLiteWriteQueue, create_sqlite_writer_engine
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    """File-based SQLite database with a simple items table."""
+    url = f"sqlite:///{tmp_path / 'writer.db'}"
+    engine = create_sqlite_writer_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)"))
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def write_queue(database_url):
+    """Running write queue; stopped after the test."""
+    queue = SQLiteWriteQueue(create_sqlite_writer_engine(database_url), max_batch_size=10)
+    queue.start()
+    yield queue
+    queue.stop()
+
+
+def insert_item(write_queue: SQLiteWriteQueue, name: str):
+    """Build a write operation inserting one item through a batch session."""
+    def _operation() -> str:
+        session = write_queue.get_session()
+        try:
+            session.execute(text("INSERT INTO items (name) VALUES (:name)"), {"name": name})
+            session.commit()
+            return name
+        finally:
+            session.close()
+    return _operation
+
+
+def item_names(database_url: str) -> list[str]:
+    """Read committed item names through an independent connection."""
+    engine = create_sqlite_writer_engine(database_url)
+    try:
+        with engine.connect() as conn:
+            return [row[0] for row in conn.execute(text("SELECT name FROM items ORDER BY name"))]
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.unit
+class TestSQLiteWriteQueue:
+    """Test SQLiteWriteQueue behavior."""
+
+    def test_concurrent_writes_are_committed(self, write_queue, database_url):
+        """Test that writes submitted from many threads are all persisted without lock errors."""
+        names = [f"item-{i:02d}" for i in range(40)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = list(pool.map(lambda n: write_queue.submit(insert_item(write_queue, n)), names))
+        results = [f.result(timeout=10) for f in futures]
+
+        assert results == names
+        assert item_names(database_url) == names
+
+    def test_failed_operation_does_not_roll_back_batch(self, write_queue, database_url):
+        """Test that a failing operation only rolls back its own savepoint."""
+        gate = threading.Event()
+        blocker = write_queue.submit(lambda: gate.wait(timeout=5))
+
+        # Queued while the writer is blocked, so they land in the same batch
+        first = write_queue.submit(insert_item(write_queue, "alpha"))
+        duplicate = write_queue.submit(insert_item(write_queue, "alpha"))
+        second = write_queue.submit(insert_item(write_queue, "beta"))
+        gate.set()
+
+        assert blocker.result(timeout=10) is True
+        assert first.result(timeout=10) == "alpha"
+        with pytest.raises(IntegrityError):
+            duplicate.result(timeout=10)
+        assert second.result(timeout=10) == "beta"
+        assert item_names(database_url) == ["alpha", "beta"]
+
+    def test_nested_submit_runs_inline(self, write_queue, database_url):
+        """Test that a write triggered from the writer thread does not deadlock."""
+        def _outer() -> str:
+            nested = write_queue.submit(insert_item(write_queue, "nested"))
+            return nested.result(timeout=1)
+
+        assert write_queue.submit(_outer).result(timeout=10) == "nested"
+        assert item_names(database_url) == ["nested"]
+
+    def test_get_session_outside_batch_returns_none(self, write_queue):
+        """Test that only operations running on the writer get a batch session."""
+        assert write_queue.get_session() is None
+
+    def test_submit_when_not_running_fails(self, database_url):
+        """Test that submitting to a stopped writer fails instead of hanging."""
+        queue = SQLiteWriteQueue(create_sqlite_writer_engine(database_url))
+
+        future = queue.submit(lambda: True)
+
+        with pytest.raises(RuntimeError, match="not running"):
+            future.result(timeout=1)
+
+    def test_stop_drains_queued_operations(self, database_url):
+        """Test that operations queued before stop are still committed."""
+        queue = SQLiteWriteQueue(create_sqlite_writer_engine(database_url))
+        queue.start()
+        futures = [queue.submit(insert_item(queue, f"item-{i}")) for i in range(5)]
+
+        queue.stop()
+
+        assert all(f.done() for f in futures)
+        assert len(item_names(database_url)) == 5
@@ -361,6 +361,32 @@ class TestHookManagerRegistration:
         assert "test_stage_hook" in hook_manager.stage_hooks
         assert hook_manager.stage_hooks["test_stage_hook"] is hook
 
+    @pytest.mark.asyncio
+    async def test_trigger_stage_hooks_skips_persistence_hooks_when_already_persisted(self, hook_manager):
+        """Test that persistence hooks are skipped for stages written by a guarded transition."""
+        executed = []
+
+        class PersistingStageHook(BaseHook[StageExecution]):
+            persists_data = True
+
+            async def execute(self, stage_execution: StageExecution) -> None:
+                executed.append(self.name)
+
+        class NotifyingStageHook(BaseHook[StageExecution]):
+            async def execute(self, stage_execution: StageExecution) -> None:
+                executed.append(self.name)
+
+        hook_manager.register_stage_hook(PersistingStageHook("history"))
+        hook_manager.register_stage_hook(NotifyingStageHook("events"))
+        stage_execution = Mock(spec=StageExecution)
+
+        await hook_manager.trigger_stage_hooks(stage_execution, already_persisted=True)
+        assert executed == ["events"]
+
+        executed.clear()
+        await hook_manager.trigger_stage_hooks(stage_execution)
+        assert sorted(executed) == ["events", "history"]
+
 
 class TestInteractionHookContextCompletion:
     """Test completion flows in InteractionHookContext."""
@@ -679,7 +705,9 @@ class TestStageExecutionHookContext:
             pass
         
         # Hook was still called
-        mock_hook_manager.trigger_stage_hooks.assert_called_once_with(stage_execution)
+        mock_hook_manager.trigger_stage_hooks.assert_called_once_with(
+            stage_execution, already_persisted=False
+        )
     
     @pytest.mark.asyncio
     async def test_aexit_does_not_suppress_body_exceptions(
@@ -700,7 +728,9 @@ class TestStageExecutionHookContext:
         async with StageExecutionHookContext(stage_execution, mock_hook_manager):
             pass
         
-        mock_hook_manager.trigger_stage_hooks.assert_called_once_with(stage_execution)
+        mock_hook_manager.trigger_stage_hooks.assert_called_once_with(
+            stage_execution, already_persisted=False
+        )
 
 
 @pytest.mark.unit
@@ -16,6 +16,7 @@ from tarsy.integrations.llm.gemini_client import (
     NativeThinkingResponse,
     NativeThinkingToolCall,
 )
+from tarsy.integrations.llm.http_pool import get_llm_http_pool
 from tarsy.models.llm_models import LLMProviderConfig, LLMProviderType
 from tarsy.models.mcp_selection_models import NativeToolsConfig
 from tarsy.models.processing_context import ToolWithServer
@@ -141,6 +142,23 @@ class TestGeminiNativeThinkingClientInit:
 
         assert client.provider_name == "gemini-2.5-flash"
 
+    @patch('tarsy.integrations.llm.gemini_client.genai.Client')
+    def test_init_uses_shared_http_clients(self, mock_genai_client: MagicMock) -> None:
+        """Test that the native client uses the shared LLM HTTP pool."""
+        config = LLMProviderConfig(
+            type=LLMProviderType.GOOGLE,
+            model="gemini-2.5-flash",
+            api_key_env="GOOGLE_API_KEY",
+            api_key="test-api-key",
+        )
+
+        GeminiNativeThinkingClient(config)
+
+        http_pool = get_llm_http_pool()
+        http_options = mock_genai_client.call_args.kwargs["http_options"]
+        assert http_options.httpx_client is http_pool.get_client(verify=True)
+        assert http_options.httpx_async_client is http_pool.get_async_client(verify=True)
+
     def test_init_with_non_google_provider_raises_valueerror(self) -> None:
         """Test that initialization with non-Google provider raises ValueError."""
         config = LLMProviderConfig(
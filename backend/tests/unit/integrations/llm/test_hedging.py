@@ -0,0 +1,266 @@
+"""
+Unit tests for hedged and failover LLM requests.
+
+Tests the hedge deadline, racing the primary and fallback providers,
+cancelling the loser and switching to the fallback on high error rates.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from tarsy.integrations.llm import hedging
+from tarsy.integrations.llm.hedging import LLMRequestHedger, ProviderHealth
+from tarsy.integrations.llm.manager import LLMManager
+from tarsy.models.constants import CancellationReason
+from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
+
+
+class FakeClient:
+    """LLM client answering after configurable first-token and completion delays."""
+
+    def __init__(self, provider_name: str, first_token_after: float = 0.0,
+                 complete_after: float = 0.0, error: Optional[Exception] = None):
+        self.provider_name = provider_name
+        self.first_token_after = first_token_after
+        self.complete_after = complete_after
+        self.error = error
+        self.calls: List[LLMConversation] = []
+        self.cancel_reasons: List[str] = []
+
+    async def generate_response(self, conversation, on_first_token=None, **request):
+        self.calls.append(conversation)
+        try:
+            await asyncio.sleep(self.first_token_after)
+            if self.error:
+                raise self.error
+            if on_first_token:
+                on_first_token()
+            await asyncio.sleep(self.complete_after)
+        except asyncio.CancelledError as e:
+            self.cancel_reasons.append(e.args[0] if e.args else None)
+            raise
+        conversation.append_assistant_message(f"answer from {self.provider_name}")
+        return conversation
+
+
+def make_settings(**overrides):
+    """Hedging settings with short delays."""
+    values = dict(
+        llm_fallback_provider="fallback",
+        llm_hedging_enabled=True,
+        llm_hedge_latency_percentile=95.0,
+        llm_hedge_min_delay_seconds=0.01,
+        llm_hedge_max_delay_seconds=0.05,
+        llm_failover_error_rate=0.5,
+        llm_failover_cooldown_seconds=300,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def make_conversation() -> LLMConversation:
+    return LLMConversation(messages=[
+        LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE assistant."),
+        LLMMessage(role=MessageRole.USER, content="Investigate the alert."),
+    ])
+
+
+def answer(conversation: LLMConversation) -> str:
+    return conversation.get_latest_assistant_message().content
+
+
+@pytest.mark.unit
+class TestProviderHealth:
+    """Test rolling provider statistics."""
+
+    def test_latency_percentile(self):
+        """Test nearest-rank percentile once enough latencies are known."""
+        health = ProviderHealth()
+        for seconds in range(1, hedging.MIN_LATENCY_SAMPLES):
+            health.record_first_token(float(seconds))
+        assert health.latency_percentile(95) is None
+
+        health.record_first_token(10.0)
+
+        assert health.latency_percentile(95) == 10.0
+        assert health.latency_percentile(50) == 5.0
+
+    def test_error_rate(self):
+        """Test the error rate over recent requests."""
+        health = ProviderHealth()
+        for i in range(hedging.MIN_FAILOVER_REQUESTS):
+            assert health.error_rate() is None
+            health.record_outcome(i % 4 != 0)
+
+        assert health.error_rate() == pytest.approx(0.3)
+
+    def test_hedge_delay_is_clamped(self):
+        """Test that the percentile deadline stays within the configured bounds."""
+        hedger = LLMRequestHedger(make_settings(llm_hedge_min_delay_seconds=2.0, llm_hedge_max_delay_seconds=20.0))
+        assert hedger.hedge_delay("primary") == 20.0
+
+        for _ in range(hedging.MIN_LATENCY_SAMPLES):
+            hedger.health("primary").record_first_token(0.5)
+        assert hedger.hedge_delay("primary") == 2.0
+
+        for _ in range(hedging.HEALTH_WINDOW):
+            hedger.health("primary").record_first_token(8.0)
+        assert hedger.hedge_delay("primary") == 8.0
+
+
+@pytest.mark.unit
+class TestLLMRequestHedger:
+    """Test racing and failing over LLM requests."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        """Test that a first token within the deadline keeps the request on the primary."""
+        hedger = LLMRequestHedger(make_settings())
+        primary = FakeClient("primary", first_token_after=0.0, complete_after=0.1)
+        fallback = FakeClient("fallback")
+        conversation = make_conversation()
+
+        result = await hedger.run(primary, fallback, conversation, session_id="s1")
+
+        assert result is conversation
+        assert answer(result) == "answer from primary"
+        assert fallback.calls == []
+        assert len(hedger.health("primary").first_token_latencies) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        """Test that the fallback answers a slow request and the primary is cancelled."""
+        hedger = LLMRequestHedger(make_settings())
+        primary = FakeClient("primary", first_token_after=5.0)
+        fallback = FakeClient("fallback")
+        conversation = make_conversation()
+
+        result = await hedger.run(primary, fallback, conversation, session_id="s1")
+
+        assert answer(result) == "answer from fallback"
+        # The hedge works on a copy - the caller's conversation is untouched
+        assert fallback.calls[0] is not conversation
+        assert conversation.get_latest_assistant_message() is None
+        assert primary.cancel_reasons == [CancellationReason.HEDGE_LOST.value]
+        # The primary's latency is recorded as at least the time it took the fallback
+        assert hedger.health("primary").first_token_latencies[-1] >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_primary_wins_after_hedge(self):
+        """Test that a slow primary finishing first cancels the hedge."""
+        hedger = LLMRequestHedger(make_settings())
+        primary = FakeClient("primary", first_token_after=0.08)
+        fallback = FakeClient("fallback", first_token_after=5.0)
+
+        result = await hedger.run(primary, fallback, make_conversation(), session_id="s1")
+
+        assert answer(result) == "answer from primary"
+        assert fallback.cancel_reasons == [CancellationReason.HEDGE_LOST.value]
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_waits_for_hedge(self):
+        """Test that a primary error after hedging doesn't fail the request."""
+        hedger = LLMRequestHedger(make_settings())
+        primary = FakeClient("primary", first_token_after=0.08, error=Exception("500 internal error"))
+        fallback = FakeClient("fallback", first_token_after=0.1)
+
+        result = await hedger.run(primary, fallback, make_conversation(), session_id="s1")
+
+        assert answer(result) == "answer from fallback"
+        assert list(hedger.health("primary").outcomes) == [False]
+
+    @pytest.mark.asyncio
+    async def test_both_attempts_fail(self):
+        """Test that the primary's error is raised when both providers fail."""
+        hedger = LLMRequestHedger(make_settings())
+        primary = FakeClient("primary", first_token_after=0.08, error=Exception("primary down"))
+        fallback = FakeClient("fallback", error=Exception("fallback down"))
+
+        with pytest.raises(Exception, match="primary down"):
+            await hedger.run(primary, fallback, make_conversation(), session_id="s1")
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_cancels_attempts(self):
+        """Test that cancelling the request (e.g. iteration timeout) cancels both attempts."""
+        hedger = LLMRequestHedger(make_settings())
+        primary = FakeClient("primary", first_token_after=5.0)
+        fallback = FakeClient("fallback", first_token_after=5.0)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(hedger.run(primary, fallback, make_conversation(), session_id="s1"), timeout=0.1)
+
+        assert len(primary.cancel_reasons) == 1
+        assert len(fallback.cancel_reasons) == 1
+        assert CancellationReason.HEDGE_LOST.value not in primary.cancel_reasons + fallback.cancel_reasons
+
+    @pytest.mark.asyncio
+    async def test_hedging_disabled(self):
+        """Test that only the primary is used when hedging is disabled."""
+        hedger = LLMRequestHedger(make_settings(llm_hedging_enabled=False))
+        primary = FakeClient("primary", first_token_after=0.1)
+        fallback = FakeClient("fallback")
+
+        result = await hedger.run(primary, fallback, make_conversation(), session_id="s1")
+
+        assert answer(result) == "answer from primary"
+        assert fallback.calls == []
+
+    @pytest.mark.asyncio
+    async def test_failover_on_high_error_rate(self):
+        """Test that a failing primary is skipped until the cooldown ends."""
+        hedger = LLMRequestHedger(make_settings(llm_hedging_enabled=False))
+        primary = FakeClient("primary", error=Exception("503 unavailable"))
+        fallback = FakeClient("fallback")
+        for _ in range(hedging.MIN_FAILOVER_REQUESTS):
+            with pytest.raises(Exception, match="503"):
+                await hedger.run(primary, fallback, make_conversation(), session_id="s1")
+
+        assert hedger.health("primary").in_failover()
+        result = await hedger.run(primary, fallback, make_conversation(), session_id="s1")
+
+        assert answer(result) == "answer from fallback"
+        assert len(primary.calls) == hedging.MIN_FAILOVER_REQUESTS
+
+        hedger.health("primary").failover_until = 0.0
+        primary.error = None
+        result = await hedger.run(primary, fallback, make_conversation(), session_id="s1")
+        assert answer(result) == "answer from primary"
+
+
+@pytest.mark.unit
+class TestLLMManagerFallbackClient:
+    """Test choosing the fallback provider in LLMManager."""
+
+    @pytest.fixture
+    def manager(self):
+        """LLMManager with two available clients and no provider initialization."""
+        settings = Mock(llm_providers={}, llm_provider="primary", llm_fallback_provider="fallback")
+        manager = LLMManager(settings)
+        manager.clients = {
+            "primary": Mock(provider_name="primary", available=True),
+            "fallback": Mock(provider_name="fallback", available=True),
+        }
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_fallback_client(self, manager):
+        """Test that requests to other providers get the fallback client."""
+        assert await manager._get_fallback_client(manager.clients["primary"]) is manager.clients["fallback"]
+
+    @pytest.mark.asyncio
+    async def test_no_fallback_for_fallback_provider(self, manager):
+        """Test that requests to the fallback provider itself are not hedged."""
+        assert await manager._get_fallback_client(manager.clients["fallback"]) is None
+
+    @pytest.mark.asyncio
+    async def test_no_fallback_when_unavailable_or_unset(self, manager):
+        """Test that hedging is off without an available fallback provider."""
+        manager.clients["fallback"].available = False
+        assert await manager._get_fallback_client(manager.clients["primary"]) is None
+
+        manager.settings.llm_fallback_provider = None
+        assert await manager._get_fallback_client(manager.clients["primary"]) is None
@@ -0,0 +1,119 @@
+"""
+Unit tests for the shared LLM HTTP connection pool.
+
+Tests that provider clients share one httpx client per SSL verification mode,
+and the connection reuse metrics reported in the health endpoint.
+"""
+
+import httpx
+import pytest
+
+from tarsy.integrations.llm import http_pool
+from tarsy.integrations.llm.http_pool import (
+    MAX_CONNECTIONS,
+    LLMHTTPPool,
+    close_llm_http_pool,
+    get_llm_http_pool,
+)
+
+
+@pytest.mark.unit
+class TestLLMHTTPPoolClients:
+    """Test sharing httpx clients."""
+
+    def test_clients_are_shared_per_verify_mode(self):
+        """Test one sync and one async client per SSL verification mode."""
+        pool = LLMHTTPPool()
+
+        assert pool.get_client() is pool.get_client(verify=True)
+        assert pool.get_async_client() is pool.get_async_client(verify=True)
+        assert pool.get_client(verify=False) is not pool.get_client(verify=True)
+        assert pool.get_async_client(verify=False) is not pool.get_async_client(verify=True)
+
+    def test_client_limits(self):
+        """Test the tuned connection limits."""
+        client = LLMHTTPPool().get_async_client()
+
+        assert client._transport._pool._max_connections == MAX_CONNECTIONS
+
+    @pytest.mark.asyncio
+    async def test_closed_clients_are_recreated(self):
+        """Test that closing the pool closes its clients and new ones are created on demand."""
+        pool = LLMHTTPPool()
+        client = pool.get_client()
+        async_client = pool.get_async_client()
+
+        await pool.aclose()
+
+        assert client.is_closed
+        assert async_client.is_closed
+        assert pool.get_client() is not client
+        assert pool.get_async_client() is not async_client
+
+    @pytest.mark.asyncio
+    async def test_process_wide_pool(self):
+        """Test the process-wide pool and its shutdown."""
+        pool = get_llm_http_pool()
+        assert get_llm_http_pool() is pool
+
+        await close_llm_http_pool()
+
+        assert http_pool._llm_http_pool is None
+        assert get_llm_http_pool() is not pool
+
+
+@pytest.mark.unit
+class TestLLMHTTPPoolMetrics:
+    """Test connection reuse metrics."""
+
+    @pytest.mark.asyncio
+    async def test_requests_and_new_connections_are_counted(self):
+        """Test counting requests, new connections and TLS handshakes via the trace extension."""
+        pool = LLMHTTPPool()
+        for index in range(4):
+            request = httpx.Request("POST", "https://api.example.com/v1/chat")
+            await pool._on_async_request(request)
+            trace = request.extensions["trace"]
+            if index == 0:
+                await trace("connection.connect_tcp.started", {})
+                await trace("connection.connect_tcp.complete", {})
+                await trace("connection.start_tls.complete", {})
+            await trace("http11.send_request_headers.complete", {})
+
+        metrics = pool.get_metrics()
+
+        assert metrics["requests"] == 4
+        assert metrics["new_connections"] == 1
+        assert metrics["tls_handshakes"] == 1
+        assert metrics["connection_reuse_ratio"] == 0.75
+
+    def test_sync_requests_are_counted(self):
+        """Test the synchronous client's hooks."""
+        pool = LLMHTTPPool()
+        request = httpx.Request("POST", "https://api.example.com/v1/chat")
+
+        pool._on_request(request)
+        request.extensions["trace"]("connection.connect_tcp.complete", {})
+
+        assert pool.get_metrics()["requests"] == 1
+        assert pool.get_metrics()["connection_reuse_ratio"] == 0.0
+
+    def test_existing_trace_extension_is_kept(self):
+        """Test that a caller's own trace callback is not replaced."""
+        pool = LLMHTTPPool()
+        def own_trace(event_name, info):
+            return None
+        request = httpx.Request("GET", "https://api.example.com", extensions={"trace": own_trace})
+
+        pool._on_request(request)
+
+        assert request.extensions["trace"] is own_trace
+        assert pool.get_metrics()["requests"] == 1
+
+    def test_no_requests_yet(self):
+        """Test metrics before the first request."""
+        metrics = LLMHTTPPool().get_metrics()
+
+        assert metrics["requests"] == 0
+        assert metrics["connection_reuse_ratio"] is None
+        assert isinstance(metrics["http2"], bool)
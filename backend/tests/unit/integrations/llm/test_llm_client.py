@@ -5,6 +5,7 @@ Tests the unified LLM client that handles communication with different
 LLM providers using LangChain and the new typed hook system.
 """
 
+import threading
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 
@@ -12,9 +13,12 @@ import pytest
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 from tarsy.hooks.hook_context import llm_interaction_context
+from tarsy.integrations.llm import client as llm_client_module
 from tarsy.integrations.llm.client import LLM_PROVIDERS, LLMClient
+from tarsy.integrations.llm.http_pool import get_llm_http_pool
 from tarsy.integrations.llm.manager import LLMManager
-from tarsy.models.llm_models import GoogleNativeTool, LLMProviderConfig
+from tarsy.integrations.llm.token_budget import TokenBudget, token_budget_scope
+from tarsy.models.llm_models import GoogleNativeTool, LLMProviderConfig, LLMProviderType
 from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
 
 # Import shared test helpers from conftest
@@ -170,7 +174,9 @@ class TestLLMClientInitialization:
                 model="gpt-4",
                 temperature=0.7,
                 api_key="test-api-key",
-                stream_usage=True
+                stream_usage=True,
+                http_client=get_llm_http_pool().get_client(),
+                http_async_client=get_llm_http_pool().get_async_client()
             )
     
     def test_initialization_google_success(self, mock_config):
@@ -204,7 +210,9 @@ class TestLLMClientInitialization:
             mock_xai.assert_called_once_with(
                 model="gpt-4",
                 api_key="test-api-key",
-                temperature=0.7
+                temperature=0.7,
+                http_client=get_llm_http_pool().get_client(),
+                http_async_client=get_llm_http_pool().get_async_client()
             )
     
     def test_initialization_anthropic_success(self, mock_config):
@@ -244,7 +252,9 @@ class TestLLMClientInitialization:
                 model_name="claude-sonnet-4-5@20250929",
                 project="my-project",
                 location="us-east5",
-                temperature=0.7
+                temperature=0.7,
+                http_client=get_llm_http_pool().get_client(),
+                async_http_client=get_llm_http_pool().get_async_client()
             )
     
     def test_initialization_vertexai_success_default_location(self, mock_config):
@@ -267,7 +277,9 @@ class TestLLMClientInitialization:
                 model_name="claude-sonnet-4-5@20250929",
                 project="my-project",
                 location="",  # Empty string passed through
-                temperature=0.7
+                temperature=0.7,
+                http_client=get_llm_http_pool().get_client(),
+                async_http_client=get_llm_http_pool().get_async_client()
             )
 
     def test_llm_client_stores_vertexai_project_and_location(self, mock_config):
@@ -353,7 +365,9 @@ class TestLLMClientInitialization:
                 model="gpt-4",  # model from config
                 temperature=None,     # BaseModel default temperature (None = use model default)
                 api_key="test-key",
-                stream_usage=True    # Enabled for token tracking
+                stream_usage=True,   # Enabled for token tracking
+                http_client=get_llm_http_pool().get_client(),
+                http_async_client=get_llm_http_pool().get_async_client()
             )
     
     def test_initialization_handles_langchain_error(self, mock_config):
@@ -712,6 +726,120 @@ class TestLLMClientResponseGeneration:
             assert len(request_data["messages"]) == 2
 
 
+@pytest.mark.unit
+class TestLLMClientStopSequences:
+    """Test ending ReAct responses at stop sequences."""
+    
+    ACTION = "Thought: check pods\nAction: kubernetes.get_pods\nAction Input: namespace: prod"
+    PROVIDER_CLASSES = {"openai": "ChatOpenAI", "anthropic": "ChatAnthropic", "vertexai": "ChatAnthropicVertex"}
+    
+    def make_client(self, provider_type, stream_closed, **config_overrides):
+        """Client whose model streams an action followed by a hallucinated observation."""
+        async def stream():
+            try:
+                for token in [self.ACTION, "\nObservation: pods ok", "\nFinal Answer: done"]:
+                    yield MockChunk(token)
+            finally:
+                stream_closed.append(True)
+        
+        mock_llm_client = AsyncMock()
+        mock_llm_client.astream = Mock(side_effect=lambda *_args, **_kwargs: stream())
+        with patch(f'tarsy.integrations.llm.client.{self.PROVIDER_CLASSES[provider_type]}'):
+            client = LLMClient(provider_type, create_test_config(provider_type, **config_overrides))
+        client.llm_client = mock_llm_client
+        client.available = True
+        return client
+    
+    async def generate(self, client, interaction=None, **kwargs):
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="You are a helpful assistant."),
+            LLMMessage(role=MessageRole.USER, content="Investigate")
+        ])
+        with patch('tarsy.integrations.llm.client.llm_interaction_context') as mock_context:
+            mock_ctx = AsyncMock()
+            mock_ctx.get_request_id.return_value = "req-123"
+            if interaction is not None:
+                mock_ctx.interaction = interaction
+            mock_context.return_value.__aenter__.return_value = mock_ctx
+            result = await client.generate_response(conversation, "test-session-123", **kwargs)
+        return result.messages[-1].content
+    
+    @pytest.mark.asyncio
+    async def test_stream_is_cancelled_at_stop_sequence(self):
+        """Test that providers without stop sequences have the stream cut off client-side."""
+        stream_closed = []
+        client = self.make_client("openai", stream_closed)
+        
+        content = await self.generate(client, stop_sequences=["\nObservation:"])
+        
+        assert content == self.ACTION
+        assert stream_closed == [True]
+        assert 'stop' not in client.llm_client.astream.call_args.kwargs
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_stream_usage_is_estimated_and_charged(self):
+        """Test that a stream cancelled before its usage chunk still counts against token budgets."""
+        client = self.make_client("openai", [])
+        interaction = Mock(input_tokens=None, output_tokens=None, total_tokens=None)
+        budget = TokenBudget("session", 100000)
+        
+        with patch('tarsy.integrations.llm.client.TokenCounter') as mock_counter_class, \
+             token_budget_scope(budget):
+            mock_counter_class.return_value.count_tokens.side_effect = lambda text: len(text.split())
+            await self.generate(client, interaction=interaction, stop_sequences=["\nObservation:"])
+        
+        # Prompt: "You are a helpful assistant." + "Investigate"; output: the trimmed action
+        assert interaction.input_tokens == 6
+        assert interaction.output_tokens == len(self.ACTION.split())
+        assert interaction.total_tokens == 6 + len(self.ACTION.split())
+        assert budget.used == interaction.total_tokens
+    
+    @pytest.mark.asyncio
+    async def test_provider_usage_is_kept_after_cancelled_stream(self):
+        """Test that usage reported before the stop sequence is not replaced by an estimate."""
+        async def stream():
+            yield MockChunk(self.ACTION, usage_metadata={"input_tokens": 40, "output_tokens": 10, "total_tokens": 50})
+            yield MockChunk("\nObservation: pods ok")
+        
+        client = self.make_client("openai", [])
+        client.llm_client.astream = Mock(side_effect=lambda *_args, **_kwargs: stream())
+        interaction = Mock(input_tokens=None, output_tokens=None, total_tokens=None)
+        budget = TokenBudget("session", 100000)
+        
+        with patch('tarsy.integrations.llm.client.TokenCounter') as mock_counter_class, \
+             token_budget_scope(budget):
+            await self.generate(client, interaction=interaction, stop_sequences=["\nObservation:"])
+        
+        mock_counter_class.assert_not_called()
+        assert interaction.total_tokens == 50
+        assert budget.used == 50
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider_type", ["anthropic", "vertexai"])
+    async def test_stop_sequences_are_sent_to_supporting_providers(self, provider_type):
+        """Test that providers supporting stop sequences get them with the request."""
+        client = self.make_client(provider_type, [])
+        
+        content = await self.generate(client, stop_sequences=["\nObservation:"])
+        
+        assert client.llm_client.astream.call_args.kwargs['stop'] == ["\nObservation:"]
+        assert content == self.ACTION
+    
+    def test_provider_support_can_be_configured(self):
+        """Test that supports_stop_sequences overrides the provider type default."""
+        assert self.make_client("openai", [], supports_stop_sequences=True).native_stop_sequences
+        assert not self.make_client("anthropic", [], supports_stop_sequences=False).native_stop_sequences
+    
+    @pytest.mark.asyncio
+    async def test_no_stop_sequences(self):
+        """Test that responses are complete without stop sequences."""
+        client = self.make_client("openai", [])
+        
+        content = await self.generate(client)
+        
+        assert content == self.ACTION + "\nObservation: pods ok\nFinal Answer: done"
+        assert 'stop' not in client.llm_client.astream.call_args.kwargs
+
 @pytest.mark.unit
 class TestLLMProviderMappings:
     """Test LLM provider mappings."""
@@ -767,23 +895,19 @@ class TestLLMClientSSLAndBaseURL:
             disable_ssl_verification=True
         )
         
-        with patch('tarsy.integrations.llm.client.ChatOpenAI') as mock_openai, \
-             patch('tarsy.integrations.llm.client.httpx.Client') as mock_client, \
-             patch('tarsy.integrations.llm.client.httpx.AsyncClient') as mock_async_client:
+        with patch('tarsy.integrations.llm.client.ChatOpenAI') as mock_openai:
             
             client = LLMClient("openai", config)
             
             # Verify SSL warning was logged
             assert client.available is True
             
-            # Verify httpx clients were created with verify=False
-            mock_client.assert_called_with(verify=False)
-            mock_async_client.assert_called_with(verify=False)
-            
-            # Verify the clients were passed to ChatOpenAI
+            # Verify the shared clients without SSL verification were passed to ChatOpenAI
+            http_pool = get_llm_http_pool()
             call_args = mock_openai.call_args[1]  # keyword arguments
-            assert 'http_client' in call_args
-            assert 'http_async_client' in call_args
+            assert call_args['http_client'] is http_pool.get_client(verify=False)
+            assert call_args['http_async_client'] is http_pool.get_async_client(verify=False)
+            assert call_args['http_client'] is not http_pool.get_client(verify=True)
     
     def test_initialization_with_custom_base_url(self):
         """Test client initialization with custom base URL."""
@@ -1374,9 +1498,77 @@ class TestLLMClientTokenUsageTracking:
                 
                 # Verify token usage from streaming chunk was stored (priority over callback)
                 assert mock_ctx.interaction.input_tokens == 150
-                assert mock_ctx.interaction.output_tokens == 60  
+                assert mock_ctx.interaction.output_tokens == 60
                 assert mock_ctx.interaction.total_tokens == 210
-    
+
+    @pytest.mark.asyncio
+    async def test_generate_response_captures_cached_input_tokens(self, client, mock_llm_client):
+        """Test that prompt cache hits reported in usage metadata are stored."""
+        final_chunk = MockChunk(
+            content="Done",
+            usage_metadata={
+                'input_tokens': 5000,
+                'output_tokens': 20,
+                'total_tokens': 5020,
+                'input_token_details': {'cache_read': 4096, 'cache_creation': 0}
+            }
+        )
+
+        async def mock_astream(*args, **kwargs):
+            yield final_chunk
+
+        mock_llm_client.astream = mock_astream
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="You are a helpful assistant."),
+            LLMMessage(role=MessageRole.USER, content="Test question")
+        ])
+
+        with patch('tarsy.integrations.llm.client.llm_interaction_context') as mock_context:
+            mock_ctx = Mock()
+            mock_ctx.get_request_id.return_value = "req-127"
+            mock_ctx.interaction = Mock()
+            mock_ctx.complete_success = AsyncMock()
+            mock_context.return_value.__aenter__.return_value = mock_ctx
+            mock_context.return_value.__aexit__.return_value = None
+
+            await client.generate_response(conversation, "test-session-123")
+
+            assert mock_ctx.interaction.input_tokens == 5000
+            assert mock_ctx.interaction.cached_input_tokens == 4096
+
+    @pytest.mark.asyncio
+    async def test_anthropic_request_marks_cache_breakpoints(self):
+        """Test that Anthropic requests carry cache_control on the stable prefix."""
+        with patch('tarsy.integrations.llm.client.ChatAnthropic'):
+            client = LLMClient("anthropic", create_test_config("anthropic", api_key="test"))
+        captured = {}
+
+        async def mock_astream(messages, **kwargs):
+            captured["messages"] = messages
+            yield MockChunk(content="Final Answer: ok")
+
+        client.llm_client = Mock()
+        client.llm_client.astream = mock_astream
+        client.available = True
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="System prompt"),
+            LLMMessage(role=MessageRole.USER, content="Alert and runbook"),
+            LLMMessage(role=MessageRole.ASSISTANT, content="Thought: check\nAction: k8s.get_pods"),
+            LLMMessage(role=MessageRole.USER, content="Observation: pods")
+        ])
+
+        with patch('tarsy.integrations.llm.client.llm_interaction_context') as mock_context:
+            mock_ctx = Mock()
+            mock_ctx.complete_success = AsyncMock()
+            mock_context.return_value.__aenter__.return_value = mock_ctx
+            mock_context.return_value.__aexit__.return_value = None
+
+            await client.generate_response(conversation, "test-session")
+
+        marked = [isinstance(m.content, list) and "cache_control" in m.content[-1] for m in captured["messages"]]
+        assert marked == [True, True, False, True]
+        assert captured["messages"][0].content[-1]["text"] == "System prompt"
+
     @pytest.mark.asyncio
     async def test_generate_response_with_llm_config(self, client, mock_llm_client):
         """Test that max_tokens parameter is properly passed to astream."""
@@ -1562,6 +1754,139 @@ class TestLLMManager:
         assert result is None  # Client handles invalid values, manager just passes through
 
 
+@pytest.mark.unit
+class TestLLMManagerLazyInitialization:
+    """Test creating provider clients on first use."""
+    
+    @pytest.fixture
+    def mock_settings(self):
+        """Settings with three providers with auth, one without and one invalid config."""
+        configs = {
+            name: Mock(is_auth_configured=Mock(return_value=name != "no-auth"))
+            for name in ["openai-default", "google-default", "vertexai-default", "no-auth"]
+        }
+        
+        def get_llm_config(name):
+            if name == "invalid":
+                raise ValueError("Invalid provider type")
+            return configs[name]
+        
+        mock_settings = Mock(llm_provider="openai-default", llm_fallback_provider=None)
+        mock_settings.llm_providers = {name: {} for name in [*configs, "invalid"]}
+        mock_settings.get_llm_config.side_effect = get_llm_config
+        return mock_settings
+    
+    @pytest.fixture
+    def client_class(self):
+        with patch('tarsy.integrations.llm.manager.LLMClient') as client_class:
+            client_class.side_effect = lambda name, config, settings: Mock(provider_name=name, available=True)
+            yield client_class
+    
+    def test_only_default_provider_is_created_at_startup(self, mock_settings, client_class):
+        """Test that configs are validated but only the default provider's client is created."""
+        manager = LLMManager(mock_settings)
+        
+        assert list(manager.clients) == ["openai-default"]
+        assert manager.list_available_providers() == ["openai-default", "google-default", "vertexai-default"]
+        assert manager.get_availability_status() == {
+            "openai-default": True, "google-default": True, "vertexai-default": True
+        }
+        assert manager.is_available()
+        client_class.assert_called_once()
+    
+    def test_provider_client_is_created_on_first_use(self, mock_settings, client_class):
+        """Test that other providers' clients are created once, when first requested."""
+        manager = LLMManager(mock_settings)
+        
+        client = manager.get_client("google-default")
+        
+        assert client.provider_name == "google-default"
+        assert manager.get_client("google-default") is client
+        assert "vertexai-default" not in manager.clients
+        assert client_class.call_count == 2
+    
+    def test_unusable_providers_are_not_created(self, mock_settings, client_class):
+        """Test that providers without auth or with invalid config are unavailable."""
+        manager = LLMManager(mock_settings)
+        
+        assert manager.get_client("no-auth") is None
+        assert manager.get_client("invalid") is None
+        assert manager.get_failed_providers() == {}
+        client_class.assert_called_once()
+    
+    def test_concurrent_first_use_creates_one_client(self, mock_settings, client_class):
+        """Test that concurrent callers share one client per provider."""
+        manager = LLMManager(mock_settings)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(manager.get_client("vertexai-default")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+        assert client_class.call_count == 2
+    
+    def test_failed_client_creation_is_tracked(self, mock_settings, client_class):
+        """Test that a provider whose client can't be created is reported and removed."""
+        manager = LLMManager(mock_settings)
+        client_class.side_effect = Exception("Invalid base_url")
+        
+        assert manager.get_client("google-default") is None
+        assert manager.get_failed_providers() == {"google-default": "Invalid base_url"}
+        assert "google-default" not in manager.list_available_providers()
+    
+    @pytest.mark.asyncio
+    async def test_first_use_from_event_loop_creates_client_in_thread(self, mock_settings, client_class):
+        """Test that requests create a provider's first client (and import its SDK) off the event loop."""
+        manager = LLMManager(mock_settings)
+        creating_threads = []
+        
+        def create_client(name, config, settings):
+            creating_threads.append(threading.current_thread())
+            return Mock(provider_name=name, available=True, generate_response=AsyncMock(return_value="response"))
+        
+        client_class.side_effect = create_client
+        conversation = Mock()
+        
+        result = await manager.generate_response(conversation, "session-1", provider="google-default")
+        
+        assert result == "response"
+        assert creating_threads and creating_threads[0] is not threading.main_thread()
+        manager.clients["google-default"].generate_response.assert_awaited_once()
+    
+    def test_provider_config_lookups_do_not_create_clients(self, mock_settings, client_class):
+        """Test that context window and native thinking checks only need the provider config."""
+        mock_settings.get_llm_config.side_effect = None
+        mock_settings.get_llm_config.return_value = Mock(
+            type=LLMProviderType.OPENAI, context_window_tokens=200000,
+            is_auth_configured=Mock(return_value=True)
+        )
+        manager = LLMManager(mock_settings)
+        
+        assert manager.get_context_window_tokens("google-default") == 200000
+        assert manager.get_native_thinking_client("google-default") is None
+        assert list(manager.clients) == ["openai-default"]
+    
+    def test_provider_sdk_is_imported_on_first_use(self, monkeypatch):
+        """Test that LangChain provider classes are imported when first needed."""
+        monkeypatch.delitem(llm_client_module.__dict__, "ChatXAI", raising=False)
+        
+        with patch('tarsy.integrations.llm.client.importlib.import_module') as import_module:
+            try:
+                provider_class = llm_client_module._provider_class("ChatXAI")
+                assert llm_client_module._provider_class("ChatXAI") is provider_class
+            finally:
+                llm_client_module.__dict__.pop("ChatXAI", None)
+        
+        import_module.assert_called_once_with("langchain_xai")
+        assert provider_class is import_module.return_value.ChatXAI
+
+
 @pytest.mark.unit
 class TestLLMClientFinalAnswerDetection:
     """Test _contains_final_answer method that determines interaction_type.
@@ -61,6 +61,8 @@ class TestLLMClientSummarizationStreaming:
                 published_chunks.append({
                     "stream_type": event.stream_type,
                     "chunk": event.chunk,
+                    "offset": event.offset,
+                    "is_snapshot": event.is_snapshot,
                     "is_complete": event.is_complete,
                     "mcp_event_id": event.mcp_event_id
                 })
@@ -98,7 +100,15 @@ class TestLLMClientSummarizationStreaming:
         
         # Last chunk should be complete
         assert published_chunks[-1]["is_complete"] is True
-        assert published_chunks[-1]["chunk"] == summary_text
+        
+        # Reassembling the deltas yields the full summary
+        content = ""
+        for chunk in published_chunks:
+            if chunk["is_snapshot"]:
+                content = chunk["chunk"]
+            else:
+                content = content[:chunk["offset"]] + chunk["chunk"]
+        assert content == summary_text
     
     @pytest.mark.asyncio
     async def test_summarization_streams_as_plain_text(self, client):
@@ -0,0 +1,142 @@
+"""
+Unit tests for interaction-type model routing in LLMManager.
+
+Tests that summarization / executive summary requests go to the model
+configured for their interaction type, with chain-level overrides and
+fallback to the provider's default model.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tarsy.integrations.llm.manager import LLMManager
+from tarsy.models.constants import LLMInteractionType
+from tarsy.models.llm_models import LLMProviderConfig
+
+
+def make_client(config: LLMProviderConfig, available: bool = True) -> Mock:
+    """Mock LLMClient exposing the attributes used for routing."""
+    client = Mock(provider_name="openai-default", config=config, model=config.model, available=available)
+    client.generate_response = AsyncMock(return_value=Mock())
+    return client
+
+
+@pytest.mark.unit
+class TestLLMManagerModelRouting:
+    """Test routing LLM requests to a model per interaction type."""
+
+    @pytest.fixture
+    def config(self):
+        return LLMProviderConfig(
+            type="openai",
+            model="gpt-5",
+            api_key_env="OPENAI_API_KEY",
+            interaction_models={LLMInteractionType.SUMMARIZATION.value: "gpt-5-mini"}
+        )
+
+    @pytest.fixture
+    def manager(self, config):
+        """LLMManager with one provider and no provider initialization."""
+        settings = Mock(llm_providers={}, llm_provider="openai-default", llm_fallback_provider=None)
+        manager = LLMManager(settings)
+        manager.clients = {"openai-default": make_client(config)}
+        return manager
+
+    @pytest.fixture
+    def routed_client_class(self):
+        with patch("tarsy.integrations.llm.manager.LLMClient") as client_class:
+            client_class.side_effect = lambda name, config, settings: make_client(config)
+            yield client_class
+
+    @pytest.mark.asyncio
+    async def test_summarization_uses_routed_model(self, manager, routed_client_class):
+        """Test that summarization requests use the provider's summarization model."""
+        await manager.generate_response(
+            Mock(), "session-1", interaction_type=LLMInteractionType.SUMMARIZATION.value
+        )
+
+        routed = manager._routed_clients[("openai-default", "gpt-5-mini")]
+        routed.generate_response.assert_called_once()
+        manager.clients["openai-default"].generate_response.assert_not_called()
+
+        # The routed client keeps the provider's settings, with only the model swapped
+        name, routed_config, _ = routed_client_class.call_args.args
+        assert name == "openai-default"
+        assert routed_config.model == "gpt-5-mini"
+        assert routed_config.api_key_env == "OPENAI_API_KEY"
+        assert routed_config.interaction_models is None
+
+    @pytest.mark.asyncio
+    async def test_routed_client_is_reused(self, manager, routed_client_class):
+        """Test that one client is created per routed model."""
+        for _ in range(3):
+            await manager.generate_response(
+                Mock(), "session-1", interaction_type=LLMInteractionType.SUMMARIZATION.value
+            )
+
+        assert routed_client_class.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unrouted_interaction_types_use_default_model(self, manager, routed_client_class):
+        """Test that investigation requests stay on the provider's model."""
+        await manager.generate_response(
+            Mock(), "session-1", interaction_type=LLMInteractionType.INVESTIGATION.value
+        )
+        await manager.generate_response(Mock(), "session-1")
+
+        assert manager.clients["openai-default"].generate_response.call_count == 2
+        routed_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_explicit_model_overrides_provider_routing(self, manager, routed_client_class):
+        """Test that a chain-level model takes precedence over the provider's routing."""
+        await manager.generate_response(
+            Mock(), "session-1",
+            interaction_type=LLMInteractionType.SUMMARIZATION.value,
+            model="gpt-5-nano"
+        )
+
+        assert ("openai-default", "gpt-5-nano") in manager._routed_clients
+        assert ("openai-default", "gpt-5-mini") not in manager._routed_clients
+
+    @pytest.mark.asyncio
+    async def test_unavailable_routed_model_falls_back_to_default(self, manager):
+        """Test that requests use the provider's model if the routed client can't be used."""
+        with patch("tarsy.integrations.llm.manager.LLMClient") as client_class:
+            client_class.side_effect = lambda name, config, settings: make_client(config, available=False)
+            await manager.generate_response(
+                Mock(), "session-1", interaction_type=LLMInteractionType.SUMMARIZATION.value
+            )
+
+        manager.clients["openai-default"].generate_response.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_requests_create_one_routed_client(self, manager):
+        """Test that concurrent first requests share one routed client created off the event loop."""
+        def slow_client(name, config, settings):
+            time.sleep(0.05)  # Slow SDK import/initialization
+            return make_client(config)
+
+        with patch("tarsy.integrations.llm.manager.LLMClient", side_effect=slow_client) as client_class:
+            await asyncio.gather(*(
+                manager.generate_response(
+                    Mock(), "session-1", interaction_type=LLMInteractionType.SUMMARIZATION.value
+                )
+                for _ in range(5)
+            ))
+
+        assert client_class.call_count == 1
+        routed = manager._routed_clients[("openai-default", "gpt-5-mini")]
+        assert routed.generate_response.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_same_model_is_not_routed(self, manager):
+        """Test that routing to the provider's own model returns the default client."""
+        client = manager.clients["openai-default"]
+
+        routed = await manager._route_client(client, LLMInteractionType.FINAL_ANALYSIS.value, model="gpt-5")
+
+        assert routed is client
@@ -0,0 +1,93 @@
+"""
+Unit tests for provider-side prompt caching helpers.
+
+Tests cache breakpoint placement and cache-hit token extraction.
+"""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from tarsy.integrations.llm.prompt_cache import (
+    CACHE_CONTROL,
+    apply_cache_breakpoints,
+    get_cached_input_tokens,
+    uses_cache_breakpoints,
+)
+from tarsy.models.llm_models import LLMProviderType
+
+
+def has_breakpoint(message) -> bool:
+    """Whether a message's last content block carries cache_control."""
+    return isinstance(message.content, list) and message.content[-1].get("cache_control") == CACHE_CONTROL
+
+
+@pytest.mark.unit
+class TestApplyCacheBreakpoints:
+    """Test marking the stable conversation prefix."""
+
+    def test_marks_system_first_user_and_last_message(self):
+        """Test breakpoint placement in a multi-iteration ReAct conversation."""
+        messages = [
+            SystemMessage(content="instructions and tools"),
+            HumanMessage(content="alert data and runbook"),
+            AIMessage(content="Thought: check pods\nAction: k8s.get_pods"),
+            HumanMessage(content="Observation: 3 pods"),
+            AIMessage(content="Thought: check logs\nAction: k8s.get_logs"),
+            HumanMessage(content="Observation: OOMKilled"),
+        ]
+
+        marked = apply_cache_breakpoints(messages)
+
+        assert [has_breakpoint(m) for m in marked] == [True, True, False, False, False, True]
+        assert marked[0].content == [
+            {"type": "text", "text": "instructions and tools", "cache_control": CACHE_CONTROL}
+        ]
+        assert marked[2] is messages[2]
+        # The input messages are not modified
+        assert messages[0].content == "instructions and tools"
+
+    def test_first_iteration(self):
+        """Test that a system + user conversation gets two breakpoints."""
+        marked = apply_cache_breakpoints([SystemMessage(content="s"), HumanMessage(content="u")])
+
+        assert [has_breakpoint(m) for m in marked] == [True, True]
+
+    def test_existing_content_blocks(self):
+        """Test that the last of several content blocks is marked."""
+        message = HumanMessage(content=[{"type": "text", "text": "a"}, {"type": "text", "text": "b"}])
+
+        marked = apply_cache_breakpoints([message])[0]
+
+        assert "cache_control" not in marked.content[0]
+        assert marked.content[1]["cache_control"] == CACHE_CONTROL
+
+    def test_empty_content_is_not_marked(self):
+        """Test that empty messages are left alone."""
+        message = HumanMessage(content="")
+
+        assert apply_cache_breakpoints([message])[0] is message
+        assert apply_cache_breakpoints([]) == []
+
+    def test_providers_with_breakpoints(self):
+        """Test which providers need explicit breakpoints."""
+        assert uses_cache_breakpoints(LLMProviderType.ANTHROPIC) is True
+        assert uses_cache_breakpoints(LLMProviderType.VERTEXAI) is True
+        assert uses_cache_breakpoints(LLMProviderType.OPENAI) is False
+        assert uses_cache_breakpoints(LLMProviderType.GOOGLE) is False
+
+
+@pytest.mark.unit
+class TestGetCachedInputTokens:
+    """Test extracting cache-hit tokens from usage metadata."""
+
+    @pytest.mark.parametrize("usage_metadata,expected", [
+        ({"input_tokens": 100, "input_token_details": {"cache_read": 80}}, 80),
+        ({"input_tokens": 100, "input_token_details": {"cache_read": 0}}, None),
+        ({"input_tokens": 100, "input_token_details": {"cache_creation": 100}}, None),
+        ({"input_tokens": 100}, None),
+        ({"input_token_details": {"cache_read": "bad"}}, None),
+        (None, None),
+    ])
+    def test_cached_input_tokens(self, usage_metadata, expected):
+        """Test cache_read extraction."""
+        assert get_cached_input_tokens(usage_metadata) == expected
@@ -0,0 +1,312 @@
+"""
+Unit tests for the per-provider LLM rate limiter.
+
+Tests token buckets, priority ordering, the shared database budget and its
+local-only fallback, and token estimate settlement.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tarsy.integrations.llm import rate_limiter
+from tarsy.integrations.llm.rate_limiter import (
+    ProviderRateLimiter,
+    TokenBucket,
+    estimate_request_tokens,
+    get_rate_limiter,
+    request_priority,
+    set_llm_priority,
+)
+from tarsy.models.constants import LLMInteractionType
+from tarsy.models.llm_models import LLMProviderConfig
+from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def mock_session_factory():
+    """Async session factory whose sessions are plain mocks."""
+    session_context = MagicMock()
+    session_context.__aenter__ = AsyncMock(return_value=MagicMock())
+    session_context.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session_context)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    """Keep the process-wide limiter registry and sharing flag isolated between tests."""
+    rate_limiter._rate_limiters.clear()
+    yield
+    rate_limiter._rate_limiters.clear()
+    rate_limiter.configure_rate_limit_sharing(True)
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test continuous token bucket refill."""
+
+    def test_wait_and_refill(self):
+        """Test waiting for an empty bucket to refill."""
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock=clock)  # 1 per second
+
+        assert bucket.wait_time(60) == 0.0
+        bucket.consume(60)
+        assert bucket.wait_time(1) == pytest.approx(1.0)
+
+        clock.now = 30.0
+        assert bucket.wait_time(30) == 0.0
+        assert bucket.wait_time(31) == pytest.approx(1.0)
+
+    def test_oversized_amount_waits_for_full_bucket(self):
+        """Test that amounts above capacity are allowed from a full bucket and leave debt."""
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock=clock)
+
+        assert bucket.wait_time(100) == 0.0
+        bucket.consume(100)
+        assert bucket.tokens == -40
+        assert bucket.wait_time(1) == pytest.approx(41.0)
+
+    def test_refund_is_capped_at_capacity(self):
+        """Test that negative amounts don't overfill the bucket."""
+        bucket = TokenBucket(60, clock=FakeClock())
+
+        bucket.consume(-100)
+
+        assert bucket.tokens == 60
+
+
+@pytest.mark.unit
+class TestProviderRateLimiter:
+    """Test acquiring provider budget."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_budget(self):
+        """Test that calls within the budget don't wait."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=60, tokens_per_minute=10000, shared=False)
+
+        grant = await limiter.acquire(500)
+
+        assert grant.window_start is None
+        assert limiter._request_bucket.tokens == pytest.approx(59, abs=0.1)
+        assert limiter._token_bucket.tokens == pytest.approx(9500, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_served_first(self):
+        """Test that waiting calls are served by priority, then arrival order."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=600, shared=False)
+        order = []
+
+        async def call(name: str, priority: float):
+            await limiter.acquire(10, priority=priority)
+            order.append(name)
+
+        limiter._serving = True  # Hold the queue while calls arrive
+        tasks = [
+            asyncio.create_task(call("new", 0.0)),
+            asyncio.create_task(call("concluding", 1.5)),
+            asyncio.create_task(call("halfway", 0.5)),
+            asyncio.create_task(call("new-2", 0.0)),
+        ]
+        await asyncio.sleep(0)
+        async with limiter._condition:
+            limiter._serving = False
+            limiter._condition.notify_all()
+        await asyncio.gather(*tasks)
+
+        assert order == ["concluding", "halfway", "new", "new-2"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test that a cancelled call doesn't block the calls behind it."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=600, shared=False)
+        limiter._serving = True
+        first = asyncio.create_task(limiter.acquire(10, priority=1.0))
+        second = asyncio.create_task(limiter.acquire(10))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        async with limiter._condition:
+            limiter._serving = False
+            limiter._condition.notify_all()
+
+        await asyncio.wait_for(second, timeout=1)
+        assert limiter._waiters == []
+
+    @pytest.mark.asyncio
+    async def test_penalize_holds_calls(self):
+        """Test that a provider rate limit pauses the limiter."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=600, shared=False)
+
+        limiter.penalize(5)
+
+        assert limiter._local_wait_time(10) == pytest.approx(5, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_shared_window_full_waits_for_next_window(self):
+        """Test that a denied shared reservation retries in the next window."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=600)
+
+        with patch.object(limiter, "_reserve_shared", AsyncMock(side_effect=[False, True])), \
+             patch("tarsy.integrations.llm.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            grant = await limiter.acquire(10)
+
+        mock_sleep.assert_awaited_once()
+        assert 0 < mock_sleep.await_args[0][0] <= rate_limiter.WINDOW_SECONDS
+        assert grant.window_start % rate_limiter.WINDOW_SECONDS == 0
+        # Local budget is only used once the shared reservation succeeded
+        assert limiter._request_bucket.tokens == pytest.approx(599, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_shared_reservation_uses_repository(self):
+        """Test reserving in the llm_rate_budgets table."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=60, tokens_per_minute=10000)
+        mock_repository = MagicMock()
+        mock_repository.reserve = AsyncMock(return_value=True)
+
+        with patch("tarsy.database.init_db.get_async_session_factory", return_value=mock_session_factory()), \
+             patch("tarsy.repositories.llm_rate_budget_repository.LLMRateBudgetRepository", return_value=mock_repository):
+            grant = await limiter.acquire(500)
+
+        provider, window_start, tokens, rpm, tpm = mock_repository.reserve.await_args[0]
+        assert (provider, tokens, rpm, tpm) == ("openai", 500, 60, 10000)
+        assert grant.window_start == window_start
+
+    @pytest.mark.asyncio
+    async def test_sharing_disabled(self):
+        """Test that the database is not used when sharing is turned off."""
+        rate_limiter.configure_rate_limit_sharing(False)
+        limiter = ProviderRateLimiter("openai", requests_per_minute=60)
+
+        with patch("tarsy.database.init_db.get_async_session_factory") as mock_factory:
+            grant = await limiter.acquire(10)
+
+        mock_factory.assert_not_called()
+        assert grant.window_start is None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_without_database(self):
+        """Test local-only limiting when the async database is not initialized."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=60)
+
+        with patch("tarsy.database.init_db.get_async_session_factory",
+                   side_effect=RuntimeError("Async database not initialized")):
+            grant = await limiter.acquire(10)
+
+        assert grant.window_start is None
+        assert limiter.shared is False
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_on_database_error(self):
+        """Test that database errors don't block LLM calls."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=60)
+        mock_repository = MagicMock()
+        mock_repository.reserve = AsyncMock(side_effect=Exception("connection refused"))
+
+        with patch("tarsy.database.init_db.get_async_session_factory", return_value=mock_session_factory()), \
+             patch("tarsy.repositories.llm_rate_budget_repository.LLMRateBudgetRepository", return_value=mock_repository):
+            grant = await limiter.acquire(10)
+
+        assert grant.window_start is None
+        assert limiter.shared is True  # Retried on the next call
+
+
+@pytest.mark.unit
+class TestRateLimitGrantSettle:
+    """Test correcting token estimates with actual usage."""
+
+    @pytest.mark.asyncio
+    async def test_settle_local(self):
+        """Test that unused estimated tokens go back to the bucket."""
+        limiter = ProviderRateLimiter("openai", tokens_per_minute=10000, shared=False)
+        grant = await limiter.acquire(3000)
+
+        await grant.settle(1000)
+
+        assert limiter._token_bucket.tokens == pytest.approx(9000, abs=1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("actual_tokens", [None, "1000", True])
+    async def test_unknown_usage_keeps_estimate(self, actual_tokens):
+        """Test that missing or invalid usage leaves the estimate in place."""
+        limiter = ProviderRateLimiter("openai", tokens_per_minute=10000, shared=False)
+        grant = await limiter.acquire(3000)
+
+        await grant.settle(actual_tokens)
+
+        assert limiter._token_bucket.tokens == pytest.approx(7000, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_settle_shared_once(self):
+        """Test that the shared window is corrected exactly once."""
+        limiter = ProviderRateLimiter("openai", tokens_per_minute=10000)
+        grant = rate_limiter.RateLimitGrant(limiter, 3000, window_start=1200)
+        mock_repository = MagicMock()
+        mock_repository.adjust_tokens = AsyncMock()
+
+        with patch("tarsy.database.init_db.get_async_session_factory", return_value=mock_session_factory()), \
+             patch("tarsy.repositories.llm_rate_budget_repository.LLMRateBudgetRepository", return_value=mock_repository):
+            await grant.settle(4500)
+            await grant.settle(4500)
+
+        mock_repository.adjust_tokens.assert_awaited_once_with("openai", 1200, 1500)
+
+
+@pytest.mark.unit
+class TestRateLimiterRegistry:
+    """Test process-wide limiters and request priorities."""
+
+    def test_no_limiter_without_limits(self):
+        """Test that providers without limits are not rate limited."""
+        config = LLMProviderConfig(type="openai", model="gpt-4", api_key_env="OPENAI_API_KEY")
+
+        assert get_rate_limiter("openai", config) is None
+
+    def test_limiter_shared_per_provider(self):
+        """Test that clients of the same provider share one limiter."""
+        config = LLMProviderConfig(
+            type="openai", model="gpt-4", api_key_env="OPENAI_API_KEY", requests_per_minute=60
+        )
+
+        limiter = get_rate_limiter("openai", config)
+
+        assert limiter is get_rate_limiter("openai", config)
+        assert limiter is not get_rate_limiter("openai-2", config)
+        changed = config.model_copy(update={"tokens_per_minute": 10000})
+        assert get_rate_limiter("openai", changed) is not limiter
+
+    @pytest.mark.asyncio
+    async def test_request_priority(self):
+        """Test chain progress priority and the concluding call boost."""
+        async def in_session():
+            set_llm_priority(0.5)
+            return (
+                request_priority(LLMInteractionType.INVESTIGATION.value),
+                request_priority(LLMInteractionType.FINAL_ANALYSIS.value),
+            )
+
+        assert await asyncio.create_task(in_session()) == (0.5, 1.5)
+        # Priority is set per session task
+        assert request_priority(None) == 0.0
+
+    def test_estimate_request_tokens(self):
+        """Test prompt characters / 4 plus the completion allowance."""
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="s" * 400),
+            LLMMessage(role=MessageRole.USER, content="u" * 400),
+        ])
+
+        assert estimate_request_tokens(conversation, max_tokens=500) == 700
+        assert estimate_request_tokens(conversation) == 200 + rate_limiter.DEFAULT_COMPLETION_TOKENS
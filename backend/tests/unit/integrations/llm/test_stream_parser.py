@@ -0,0 +1,213 @@
+"""
+Unit tests for the incremental ReAct stream parser.
+
+Tests thought / final answer / summarization streaming, markers split across
+tokens, the streaming cadence, and stopping at stop sequences.
+"""
+
+import pytest
+
+from tarsy.integrations.llm.stream_parser import (
+    FINAL_ANSWER_CHUNK_SIZE,
+    ReActStreamParser,
+    StreamUpdate,
+)
+from tarsy.models.constants import StreamingEventType
+
+
+def feed_all(parser: ReActStreamParser, tokens) -> list:
+    """Feed tokens and finish, returning every update."""
+    updates = []
+    for token in tokens:
+        updates.extend(parser.feed(token))
+    updates.extend(parser.finish())
+    return updates
+
+
+def completed(updates: list) -> list:
+    """(stream type, content) of the complete updates."""
+    return [(u.stream_type, u.content) for u in updates if u.is_complete]
+
+
+@pytest.mark.unit
+class TestReActStreamParser:
+    """Test ReAct response parsing."""
+
+    def test_thought_then_action(self):
+        """Test that the thought streams until Action: and nothing streams after it."""
+        text = "Thought: I need to check the pods.\nAction: kubernetes.get_pods\nAction Input: {}"
+        parser = ReActStreamParser()
+
+        updates = feed_all(parser, text)
+
+        assert completed(updates) == [(StreamingEventType.THOUGHT, "I need to check the pods.")]
+        assert {u.stream_type for u in updates} == {StreamingEventType.THOUGHT}
+        assert all("Action" not in u.content for u in updates if u.is_complete)
+        assert parser.content == text
+
+    def test_thought_then_final_answer(self):
+        """Test that a final answer streams after the thought and completes at the end."""
+        text = "Thought: I know the answer.\nFinal Answer: The pod is **OOMKilled**.  "
+        updates = feed_all(ReActStreamParser(), text)
+
+        assert completed(updates) == [
+            (StreamingEventType.THOUGHT, "I know the answer."),
+            (StreamingEventType.FINAL_ANSWER, "The pod is **OOMKilled**."),
+        ]
+        partial_answers = [u.content for u in updates
+                           if u.stream_type == StreamingEventType.FINAL_ANSWER and not u.is_complete]
+        assert partial_answers and all("The pod is **OOMKilled**.".startswith(a.rstrip()) for a in partial_answers)
+
+    def test_markers_in_one_token(self):
+        """Test a response delivered as a single token."""
+        updates = feed_all(ReActStreamParser(), ["Thought: done\nFinal Answer: ok"])
+
+        assert completed(updates) == [
+            (StreamingEventType.THOUGHT, "done"),
+            (StreamingEventType.FINAL_ANSWER, "ok"),
+        ]
+
+    @pytest.mark.parametrize("split", [1, 2, 3, 5, 7])
+    def test_markers_split_across_tokens(self, split):
+        """Test that markers straddling token boundaries are found."""
+        text = "Preamble.\nThought: look at logs\nFinal Answer: disk full"
+        tokens = [text[i:i + split] for i in range(0, len(text), split)]
+
+        assert completed(feed_all(ReActStreamParser(), tokens)) == [
+            (StreamingEventType.THOUGHT, "look at logs"),
+            (StreamingEventType.FINAL_ANSWER, "disk full"),
+        ]
+
+    def test_final_answer_without_thought_is_not_streamed(self):
+        """Test that a final answer before any thought disables streaming."""
+        updates = feed_all(ReActStreamParser(), "Final Answer: x\nThought: y")
+
+        assert updates == []
+
+    def test_no_markers(self):
+        """Test that plain text outside summarization is not streamed."""
+        parser = ReActStreamParser()
+
+        assert feed_all(parser, ["just ", "text"]) == []
+        assert parser.content == "just text"
+
+    def test_unfinished_thought_completes_on_finish(self):
+        """Test that a thought still streaming when the response ends is completed."""
+        parser = ReActStreamParser()
+        for token in ["Thought:", " still ", "thinking  "]:
+            parser.feed(token)
+
+        assert parser.finish() == [StreamUpdate(StreamingEventType.THOUGHT, "still thinking", is_complete=True)]
+        assert parser.finish() == []
+
+    def test_empty_thought_sends_completion_marker(self):
+        """Test that an empty thought is completed with empty content."""
+        updates = feed_all(ReActStreamParser(), ["Thought:", "\nAction: x"])
+
+        assert completed(updates) == [(StreamingEventType.THOUGHT, "")]
+
+    def test_final_answer_cadence(self):
+        """Test that final answer updates are sent every FINAL_ANSWER_CHUNK_SIZE tokens."""
+        parser = ReActStreamParser()
+        parser.feed("Thought: t\nFinal Answer:")
+
+        sent = [bool(parser.feed(f" w{i}")) for i in range(FINAL_ANSWER_CHUNK_SIZE * 2)]
+
+        assert sent.count(True) == 2
+        assert sent[FINAL_ANSWER_CHUNK_SIZE - 1] is True
+
+    def test_empty_tokens_count_towards_cadence(self):
+        """Test that chunks without text still count towards the chunk size."""
+        parser = ReActStreamParser()
+        parser.feed("Thought: t\nFinal Answer: a")
+
+        assert parser.feed("") == []
+        assert parser.feed("") == []
+        assert parser.feed("") == [StreamUpdate(StreamingEventType.FINAL_ANSWER, "a", is_complete=False)]
+
+
+STOP = ["\nObservation:"]
+ACTION = "Thought: check pods\nAction: kubernetes.get_pods\nAction Input: namespace: prod"
+HALLUCINATED = "\nObservation: all pods running\nThought: fine\nFinal Answer: nothing wrong"
+
+
+@pytest.mark.unit
+class TestStopSequences:
+    """Test ending the response at a stop sequence."""
+
+    @pytest.mark.parametrize("split", [1, 3, 4, 13, 1000])
+    def test_text_after_action_input_is_dropped(self, split):
+        """Test that the response ends before a hallucinated observation, wherever tokens split."""
+        text = ACTION + HALLUCINATED
+        tokens = [text[i:i + split] for i in range(0, len(text), split)]
+        parser = ReActStreamParser(stop_sequences=STOP)
+
+        fed = 0
+        for token in tokens:
+            parser.feed(token)
+            fed += 1
+            if parser.stopped:
+                break
+
+        assert parser.stopped
+        assert parser.content == ACTION
+        # Stopped at the token completing the stop sequence
+        stop_end = len(ACTION) + len(STOP[0])
+        assert len("".join(tokens[:fed - 1])) < stop_end <= len("".join(tokens[:fed]))
+
+    def test_no_stop_sequence(self):
+        """Test that responses without the stop sequence are untouched."""
+        parser = ReActStreamParser(stop_sequences=STOP)
+
+        feed_all(parser, ACTION)
+
+        assert not parser.stopped
+        assert parser.content == ACTION
+
+    def test_tokens_after_stop_are_ignored(self):
+        """Test that nothing is added or published once stopped."""
+        parser = ReActStreamParser(stop_sequences=STOP)
+        parser.feed(ACTION + "\nObservation:")
+
+        assert parser.feed(" more") == []
+        assert parser.content == ACTION
+
+    def test_final_answer_ends_at_stop_sequence(self):
+        """Test that a streamed final answer completes without the text after the stop sequence."""
+        parser = ReActStreamParser(stop_sequences=STOP)
+        tokens = ["Thought: done\nFinal Answer: disk", " full\nObserv", "ation: x"]
+
+        updates = feed_all(parser, tokens)
+
+        assert parser.stopped
+        assert completed(updates) == [
+            (StreamingEventType.THOUGHT, "done"),
+            (StreamingEventType.FINAL_ANSWER, "disk full"),
+        ]
+        assert parser.content == "Thought: done\nFinal Answer: disk full"
+
+
+@pytest.mark.unit
+class TestSummarizationStreamParser:
+    """Test plain text summarization parsing."""
+
+    def test_streams_whole_response(self):
+        """Test that summaries stream as a whole and ignore ReAct markers."""
+        parser = ReActStreamParser(summarization=True)
+
+        updates = feed_all(parser, [" Thought: ", "pods ok. ", "Final Answer: none "])
+
+        assert [u.content for u in updates] == [
+            "Thought:",
+            "Thought: pods ok.",
+            "Thought: pods ok. Final Answer: none",
+            "Thought: pods ok. Final Answer: none",
+        ]
+        assert {u.stream_type for u in updates} == {StreamingEventType.SUMMARIZATION}
+        assert [u.is_complete for u in updates] == [False, False, False, True]
+
+    def test_empty_summary_sends_completion_marker(self):
+        """Test that an empty summary is completed with empty content."""
+        assert feed_all(ReActStreamParser(summarization=True), ["  "]) == [
+            StreamUpdate(StreamingEventType.SUMMARIZATION, "", is_complete=True)
+        ]
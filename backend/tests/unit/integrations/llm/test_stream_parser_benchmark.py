@@ -0,0 +1,105 @@
+"""
+Micro-benchmark for the incremental ReAct stream parser.
+
+Compares ReActStreamParser with the previous approach (append to one string and
+re-scan it for markers on every chunk) on 10k, 50k and 200k character
+responses. Run with -s to see the timings.
+"""
+
+import time
+
+import pytest
+
+from tarsy.integrations.llm.stream_parser import ReActStreamParser
+
+RESPONSE_SIZES = (10_000, 50_000, 200_000)
+
+# The previous approach takes ~15s on 200k-character thoughts - not run beyond this
+LEGACY_MAX_SIZE = 50_000
+
+TOKEN_SIZE = 4
+
+
+def make_tokens(kind: str, size: int) -> list:
+    """Tokens of a response with a long thought or a long final answer."""
+    body = ("word " * (size // 5 + 1))[:size]
+    if kind == "thought":
+        text = f"Thought: {body}\nAction: kubernetes.get_pods\nAction Input: {{}}"
+    else:
+        text = f"Thought: I know the answer.\nFinal Answer: {body}"
+    return [text[i:i + TOKEN_SIZE] for i in range(0, len(text), TOKEN_SIZE)]
+
+
+def parse_legacy(tokens: list) -> str:
+    """Marker detection and section extraction as previously done in LLMClient.generate_response."""
+    accumulated_content = ""
+    is_streaming_thought = False
+    is_streaming_final_answer = False
+    token_count_since_last_send = 0
+    for token in tokens:
+        accumulated_content += token
+        if not is_streaming_thought and not is_streaming_final_answer:
+            if "Thought:" in accumulated_content and "Final Answer:" not in accumulated_content:
+                is_streaming_thought = True
+        if is_streaming_thought and ("Action:" in accumulated_content or "Final Answer:" in accumulated_content):
+            thought_start_idx = accumulated_content.find("Thought:")
+            stop_idx = (accumulated_content.find("Action:") if "Action:" in accumulated_content
+                        else accumulated_content.find("Final Answer:"))
+            accumulated_content[thought_start_idx + len("Thought:"):stop_idx].strip()
+            is_streaming_thought = False
+            if "Final Answer:" in accumulated_content:
+                is_streaming_final_answer = True
+            continue
+        if is_streaming_thought:
+            thought_start_idx = accumulated_content.find("Thought:")
+            current_thought = accumulated_content[thought_start_idx + len("Thought:"):].lstrip()
+            if "Action:" in current_thought:
+                current_thought = current_thought[:current_thought.find("Action:")].strip()
+            elif "Final Answer:" in current_thought:
+                current_thought = current_thought[:current_thought.find("Final Answer:")].strip()
+        elif is_streaming_final_answer:
+            token_count_since_last_send += 1
+            if token_count_since_last_send >= 3:
+                final_answer_start_idx = accumulated_content.find("Final Answer:")
+                accumulated_content[final_answer_start_idx + len("Final Answer:"):].lstrip()
+                token_count_since_last_send = 0
+    return accumulated_content
+
+
+def parse_incremental(tokens: list) -> str:
+    """Same work with ReActStreamParser."""
+    parser = ReActStreamParser()
+    for token in tokens:
+        parser.feed(token)
+    parser.finish()
+    return parser.content
+
+
+def elapsed(parse, tokens: list) -> float:
+    """Wall time of parsing a response, in seconds."""
+    start = time.perf_counter()
+    parse(tokens)
+    return time.perf_counter() - start
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+class TestStreamParserBenchmark:
+    """Benchmark response parsing."""
+
+    @pytest.mark.parametrize("kind", ["thought", "final_answer"])
+    def test_benchmark(self, kind):
+        """Time both approaches and check the parser beats re-scanning on long thoughts."""
+        print(f"\n{kind} response: size, legacy (s), incremental (s)")
+        for size in RESPONSE_SIZES:
+            tokens = make_tokens(kind, size)
+            assert parse_incremental(tokens) == "".join(tokens)
+
+            incremental = elapsed(parse_incremental, tokens)
+            legacy = elapsed(parse_legacy, tokens) if size <= LEGACY_MAX_SIZE else None
+            legacy_text = f"{legacy:.4f}" if legacy is not None else "-"
+            print(f"  {size:>7}  {legacy_text:>8}  {incremental:.4f}")
+
+            if kind == "thought" and size == LEGACY_MAX_SIZE:
+                # Re-scanning is quadratic; the parser copies only the published thought text
+                assert incremental < legacy
@@ -0,0 +1,129 @@
+"""
+Unit tests for the delta streaming protocol of StreamingPublisher.
+
+Tests sequence numbering, splice offsets, periodic snapshots and stream
+state cleanup.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from tarsy.integrations.llm.streaming import (
+    DEFAULT_SNAPSHOT_INTERVAL,
+    StreamingPublisher,
+    common_prefix_length,
+)
+
+STREAM = ("session-1", "stage-1", "thought", "int-1", None)
+
+
+def apply(content: str, update) -> str:
+    """Apply an update the way the dashboard does."""
+    _, offset, chunk, is_snapshot = update
+    return chunk if is_snapshot else content[:offset] + chunk
+
+
+@pytest.mark.unit
+class TestCommonPrefixLength:
+    """Test common prefix computation."""
+
+    @pytest.mark.parametrize(
+        "a,b,expected",
+        [
+            ("", "abc", 0),
+            ("abc", "abcdef", 3),
+            ("abcdef", "abc", 3),
+            ("abcXef", "abcYef", 3),
+            ("xyz", "abc", 0),
+            ("same", "same", 4),
+        ],
+    )
+    def test_common_prefix_length(self, a, b, expected):
+        """Test prefix length for appends, truncations and rewrites."""
+        assert common_prefix_length(a, b) == expected
+
+
+@pytest.mark.unit
+class TestStreamingPublisherDeltas:
+    """Test delta computation for accumulated stream text."""
+
+    def test_first_update_is_snapshot(self):
+        """Test that a stream starts with a full snapshot."""
+        publisher = StreamingPublisher()
+
+        assert publisher._next_update(STREAM, "Hello", is_complete=False) == (1, 0, "Hello", True)
+
+    def test_appended_text_sent_as_delta(self):
+        """Test that only new text is sent, at the end of the previous text."""
+        publisher = StreamingPublisher()
+        publisher._next_update(STREAM, "Hello", is_complete=False)
+
+        assert publisher._next_update(STREAM, "Hello world", is_complete=False) == (2, 5, " world", False)
+
+    def test_rewritten_tail_spliced_at_common_prefix(self):
+        """Test that a shortened or rewritten text splices at the common prefix."""
+        publisher = StreamingPublisher()
+        publisher._next_update(STREAM, "Thought: checking  ", is_complete=False)
+
+        update = publisher._next_update(STREAM, "Thought: checking", is_complete=True)
+
+        assert update == (2, 17, "", False)
+        assert apply("Thought: checking  ", update) == "Thought: checking"
+
+    def test_unchanged_text_not_published(self):
+        """Test that an unchanged, incomplete stream produces no event."""
+        publisher = StreamingPublisher()
+        publisher._next_update(STREAM, "Hello", is_complete=False)
+
+        assert publisher._next_update(STREAM, "Hello", is_complete=False) is None
+        assert publisher._next_update(STREAM, "Hello", is_complete=True) == (2, 5, "", False)
+
+    def test_periodic_snapshots(self):
+        """Test that every Nth event carries the full text."""
+        settings = Mock()
+        settings.llm_streaming_snapshot_interval = 3
+        publisher = StreamingPublisher(settings)
+
+        text = ""
+        snapshots = []
+        for i in range(7):
+            text += f"token{i} "
+            sequence, _, _, is_snapshot = publisher._next_update(STREAM, text, is_complete=False)
+            if is_snapshot:
+                snapshots.append(sequence)
+
+        assert snapshots == [1, 3, 6]
+
+    def test_deltas_reassemble_full_text(self):
+        """Test that applying every update in order reproduces the final text."""
+        publisher = StreamingPublisher()
+        tokens = [f"word{i} " for i in range(DEFAULT_SNAPSHOT_INTERVAL + 10)]
+
+        content = ""
+        text = ""
+        for token in tokens:
+            text += token
+            content = apply(content, publisher._next_update(STREAM, text, is_complete=False))
+        content = apply(content, publisher._next_update(STREAM, text.strip(), is_complete=True))
+
+        assert content == text.strip()
+
+    def test_state_dropped_on_completion(self):
+        """Test that a completed stream is forgotten and a new one restarts at 1."""
+        publisher = StreamingPublisher()
+        publisher._next_update(STREAM, "Done", is_complete=False)
+        publisher._next_update(STREAM, "Done", is_complete=True)
+
+        assert publisher._streams == {}
+        assert publisher._next_update(STREAM, "Again", is_complete=False) == (1, 0, "Again", True)
+
+    def test_streams_tracked_independently(self):
+        """Test that sequence numbers are per stream."""
+        publisher = StreamingPublisher()
+        other = ("session-1", "stage-1", "final_answer", "int-1", None)
+
+        publisher._next_update(STREAM, "a", is_complete=False)
+        publisher._next_update(STREAM, "ab", is_complete=False)
+
+        assert publisher._next_update(other, "x", is_complete=False) == (1, 0, "x", True)
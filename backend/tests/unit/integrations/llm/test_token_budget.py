@@ -0,0 +1,155 @@
+"""
+Unit tests for session and agent token budgets.
+
+Tests tracking LLM token usage against the active budgets, the hard stop
+once a budget is used up, and that a spent budget stops LLMManager requests
+before they reach a provider.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from tarsy.integrations.llm.manager import LLMManager
+from tarsy.integrations.llm.token_budget import (
+    TokenBudget,
+    TokenBudgetExceededError,
+    ensure_token_budget,
+    get_exhausting_token_budget,
+    get_tightest_token_budget,
+    record_token_usage,
+    token_budget_scope,
+)
+
+
+@pytest.mark.unit
+class TestTokenBudget:
+    """Test TokenBudget accounting."""
+
+    def test_remaining_and_exceeded(self):
+        """Test remaining tokens and the exceeded state."""
+        budget = TokenBudget("session", 1000, used=400)
+
+        assert budget.remaining == 600
+        assert not budget.exceeded
+
+        budget.used = 1200
+        assert budget.remaining == 0
+        assert budget.exceeded
+
+    def test_nearly_exhausted(self):
+        """Test the conclusion threshold."""
+        budget = TokenBudget("agent", 1000, used=899)
+
+        assert not budget.nearly_exhausted(0.9)
+        budget.used = 900
+        assert budget.nearly_exhausted(0.9)
+
+    def test_to_dict(self):
+        """Test the progress event representation."""
+        assert TokenBudget("session", 1000, used=250).to_dict() == {
+            "scope": "session", "limit": 1000, "used": 250, "remaining": 750
+        }
+
+
+@pytest.mark.unit
+class TestTokenBudgetScope:
+    """Test tracking usage against the active budgets."""
+
+    def test_usage_is_recorded_on_all_active_budgets(self):
+        """Test that nested session and agent budgets both count a call."""
+        session = TokenBudget("session", 10000)
+        agent = TokenBudget("agent", 5000)
+
+        with token_budget_scope(session):
+            record_token_usage(1000)
+            with token_budget_scope(agent):
+                record_token_usage(500)
+            record_token_usage(200)
+
+        assert session.used == 1700
+        assert agent.used == 500
+
+    def test_usage_outside_a_scope_is_ignored(self):
+        """Test that calls without a budget are not tracked."""
+        budget = TokenBudget("session", 1000)
+
+        with token_budget_scope(budget):
+            pass
+        record_token_usage(5000)
+
+        assert budget.used == 0
+        assert get_tightest_token_budget() is None
+
+    def test_no_budget_scope(self):
+        """Test that a None budget activates nothing."""
+        with token_budget_scope(None) as budget:
+            record_token_usage(5000)
+            ensure_token_budget()
+
+        assert budget is None
+
+    def test_ensure_raises_once_a_budget_is_used_up(self):
+        """Test the hard stop."""
+        session = TokenBudget("session", 10000)
+        agent = TokenBudget("agent", 1000)
+
+        with token_budget_scope(session), token_budget_scope(agent):
+            record_token_usage(999)
+            ensure_token_budget()
+
+            record_token_usage(1)
+            with pytest.raises(TokenBudgetExceededError) as exc_info:
+                ensure_token_budget()
+
+        assert exc_info.value.budget is agent
+        assert "agent budget of 1,000 tokens" in str(exc_info.value)
+
+    def test_tightest_and_exhausting_budget(self):
+        """Test selecting the budget closest to its limit."""
+        session = TokenBudget("session", 10000, used=8000)
+        agent = TokenBudget("agent", 5000, used=1000)
+
+        with token_budget_scope(session), token_budget_scope(agent):
+            assert get_tightest_token_budget() is session
+            assert get_exhausting_token_budget(0.9) is None
+            record_token_usage(1000)
+            assert get_exhausting_token_budget(0.9) is session
+
+    @pytest.mark.asyncio
+    async def test_parallel_tasks_share_the_session_budget(self):
+        """Test that parallel agents count against one session budget and their own agent budgets."""
+        session = TokenBudget("session", 10000)
+        agents = [TokenBudget("agent", 5000), TokenBudget("agent", 5000)]
+
+        async def run_agent(agent_budget: TokenBudget, tokens: int):
+            with token_budget_scope(agent_budget):
+                await asyncio.sleep(0)
+                record_token_usage(tokens)
+
+        with token_budget_scope(session):
+            await asyncio.gather(run_agent(agents[0], 1000), run_agent(agents[1], 2000))
+
+        assert session.used == 3000
+        assert [agent.used for agent in agents] == [1000, 2000]
+
+
+@pytest.mark.unit
+class TestLLMManagerTokenBudget:
+    """Test that LLMManager enforces the active budgets."""
+
+    @pytest.mark.asyncio
+    async def test_used_up_budget_stops_requests(self):
+        """Test that no provider is called once the budget is used up."""
+        settings = Mock(llm_providers={}, llm_provider="openai-default", llm_fallback_provider=None)
+        manager = LLMManager(settings)
+        client = Mock(provider_name="openai-default", available=True)
+        client.generate_response = AsyncMock()
+        manager.clients = {"openai-default": client}
+
+        with token_budget_scope(TokenBudget("session", 1000, used=1000)):
+            with pytest.raises(TokenBudgetExceededError):
+                await manager.generate_response(Mock(), "session-1")
+
+        client.generate_response.assert_not_called()
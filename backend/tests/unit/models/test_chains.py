@@ -235,8 +235,10 @@ class TestChainConfigModel:
             'description': 'Test serialization',
             'chat': {'enabled': True, 'agent': 'ChatAgent', 'iteration_strategy': None, 'llm_provider': None, 'mcp_servers': None, 'max_iterations': None},
             'llm_provider': None,
+            'interaction_models': None,
             'max_iterations': None,
             'force_conclusion_at_max_iterations': None,
+            'token_budget': None,
             'mcp_servers': None
         }
         
@@ -261,8 +263,10 @@ class TestChainConfigModel:
             'description': None,
             'chat': {'enabled': True, 'agent': 'ChatAgent', 'iteration_strategy': None, 'llm_provider': None, 'mcp_servers': None, 'max_iterations': None},
             'llm_provider': None,
+            'interaction_models': None,
             'max_iterations': None,
             'force_conclusion_at_max_iterations': None,
+            'token_budget': None,
             'mcp_servers': None
         }
         
@@ -338,8 +342,10 @@ class TestChainConfigModel:
             'description': None,
             'chat': {'enabled': True, 'agent': 'ChatAgent', 'iteration_strategy': None, 'llm_provider': None, 'mcp_servers': None, 'max_iterations': None},
             'llm_provider': 'google-default',
+            'interaction_models': None,
             'max_iterations': None,
             'force_conclusion_at_max_iterations': None,
+            'token_budget': None,
             'mcp_servers': None
         }
         
@@ -3,6 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
+from tarsy.models.constants import LLMInteractionType
 from tarsy.models.llm_models import GoogleNativeTool, LLMProviderConfig, LLMProviderType
 
 
@@ -440,6 +441,56 @@ class TestLLMProviderConfigValidation:
         assert config.api_key == "test-key-value"
         assert config.disable_ssl_verification is False
 
+@pytest.mark.unit
+class TestLLMProviderConfigInteractionModels:
+    """Test interaction-type model routing configuration."""
+
+    def test_interaction_models_defaults_to_none(self) -> None:
+        """Test that all interaction types use the provider's model by default."""
+        config = LLMProviderConfig(type="openai", model="gpt-5", api_key_env="OPENAI_API_KEY")
+
+        assert config.interaction_models is None
+
+    def test_interaction_models_can_be_configured(self) -> None:
+        """Test that models are keyed by interaction type value."""
+        config = LLMProviderConfig(
+            type="openai",
+            model="gpt-5",
+            api_key_env="OPENAI_API_KEY",
+            interaction_models={
+                LLMInteractionType.SUMMARIZATION: " gpt-5-mini ",
+                "final_analysis_summary": "gpt-5-mini",
+            }
+        )
+
+        assert config.interaction_models == {
+            "summarization": "gpt-5-mini",
+            "final_analysis_summary": "gpt-5-mini",
+        }
+
+    def test_interaction_models_rejects_unknown_interaction_types(self) -> None:
+        """Test that unknown interaction types are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            LLMProviderConfig(
+                type="openai",
+                model="gpt-5",
+                api_key_env="OPENAI_API_KEY",
+                interaction_models={"summary": "gpt-5-mini"}
+            )
+
+        assert "summary" in str(exc_info.value.errors()[0]["ctx"]["error"])
+
+    def test_interaction_models_rejects_empty_model_names(self) -> None:
+        """Test that routed model names cannot be empty."""
+        with pytest.raises(ValidationError):
+            LLMProviderConfig(
+                type="openai",
+                model="gpt-5",
+                api_key_env="OPENAI_API_KEY",
+                interaction_models={"summarization": "  "}
+            )
+
+
 @pytest.mark.unit
 class TestLLMProviderConfigIsAuthConfigured:
     """Test cases for is_auth_configured() method."""
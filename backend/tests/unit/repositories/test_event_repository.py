@@ -195,6 +195,83 @@ class TestEventRepositoryGetEventsAfter:
             await repository.get_events_after("test.channel", 10)
 
 
+@pytest.mark.unit
+class TestEventRepositoryGetEventsAfterForChannels:
+    """Test EventRepository.get_events_after_for_channels method."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock database session."""
+        session = AsyncMock(spec=AsyncSession)
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create EventRepository with mocked session."""
+        return EventRepository(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_get_events_after_for_channels_single_query(self, repository, mock_session):
+        """Test that events of all channels are fetched with one ordered query."""
+        mock_events = [
+            Event(id=11, channel="a", payload={}, created_at=datetime.now(timezone.utc)),
+            Event(id=12, channel="b", payload={}, created_at=datetime.now(timezone.utc)),
+        ]
+        mock_result = AsyncMock()
+        mock_result.scalars = Mock(return_value=Mock(all=Mock(return_value=mock_events)))
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        events = await repository.get_events_after_for_channels(["a", "b"], 10)
+
+        assert [e.id for e in events] == [11, 12]
+        mock_session.execute.assert_awaited_once()
+        statement = str(mock_session.execute.call_args[0][0])
+        assert "events.channel IN" in statement
+        assert "ORDER BY events.id ASC" in statement
+
+    @pytest.mark.asyncio
+    async def test_get_events_after_for_channels_database_error(self, repository, mock_session):
+        """Test handling of database errors during retrieval."""
+        mock_session.execute.side_effect = OperationalError("DB connection lost", None, None)
+
+        with pytest.raises(OperationalError, match="DB connection lost"):
+            await repository.get_events_after_for_channels(["a"], 10)
+
+
+@pytest.mark.unit
+class TestEventRepositoryGetLatestEventId:
+    """Test EventRepository.get_latest_event_id method."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock database session."""
+        session = AsyncMock(spec=AsyncSession)
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create EventRepository with mocked session."""
+        return EventRepository(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_get_latest_event_id(self, repository, mock_session):
+        """Test retrieving the newest event ID on a channel."""
+        mock_result = Mock()
+        mock_result.scalar = Mock(return_value=57)
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        assert await repository.get_latest_event_id("sessions") == 57
+
+    @pytest.mark.asyncio
+    async def test_get_latest_event_id_empty_channel(self, repository, mock_session):
+        """Test that a channel without events returns 0."""
+        mock_result = Mock()
+        mock_result.scalar = Mock(return_value=None)
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        assert await repository.get_latest_event_id("sessions") == 0
+
+
 @pytest.mark.unit
 class TestEventRepositoryDeleteEventsBefore:
     """Test EventRepository.delete_events_before method."""
@@ -816,6 +816,45 @@ class TestHistoryRepository:
         assert len(result.sessions) == 1
         assert result.sessions[0].session_id == session2.session_id
     
+    @pytest.mark.unit
+    def test_get_alert_sessions_with_alert_data_facets(self, repository):
+        """Test facet filters on indexed and non-indexed alert_data keys."""
+        from tarsy.utils.timestamp import now_us
+        
+        facet_data = [
+            ("facet-1", {"cluster": "prod-east", "namespace": "payments", "severity": "critical", "team": "core"}),
+            ("facet-2", {"cluster": "prod-east", "namespace": "search", "severity": "warning", "team": "infra"}),
+            ("facet-3", {"cluster": "staging", "namespace": "payments", "severity": "critical"}),
+        ]
+        for session_id, alert_data in facet_data:
+            repository.create_alert_session(AlertSession(
+                session_id=session_id,
+                alert_data=alert_data,
+                agent_type="KubernetesAgent",
+                alert_type="PodCrashLooping",
+                status="completed",
+                started_at_us=now_us(),
+                chain_id=f"chain-{session_id}"
+            ))
+        
+        result = repository.get_alert_sessions(alert_data_filters={"cluster": "prod-east"})
+        assert {s.session_id for s in result.sessions} == {"facet-1", "facet-2"}
+        assert result.pagination.total_items == 2
+        
+        # Multiple values of one key are OR-ed, different keys are AND-ed
+        result = repository.get_alert_sessions(
+            alert_data_filters={"namespace": ["payments", "search"], "severity": "critical"}
+        )
+        assert {s.session_id for s in result.sessions} == {"facet-1", "facet-3"}
+        
+        # Keys without a dedicated index still filter correctly
+        result = repository.get_alert_sessions(alert_data_filters={"team": "infra"})
+        assert [s.session_id for s in result.sessions] == ["facet-2"]
+        
+        # Keys are inlined into SQL, so anything but a plain identifier is rejected
+        with pytest.raises(ValueError, match="Invalid alert_data facet key"):
+            repository.get_alert_sessions(alert_data_filters={"cluster') OR 1=1 --": "x"})
+    
     @pytest.mark.unit
     def test_get_alert_sessions_with_search_case_insensitive(self, repository):
         """Test that search is case-insensitive."""
@@ -1921,6 +1960,166 @@ class TestHistoryRepository:
         with pytest.raises(ValueError, match="Stage execution with id non-existent-id not found"):
             repository.update_stage_execution(stage_execution)
 
+    @staticmethod
+    def _add_stage(repository, execution_id, session_id, status, **fields):
+        """Persist a stage execution for transition tests."""
+        stage_execution = StageExecution(
+            execution_id=execution_id,
+            session_id=session_id,
+            stage_id="test-stage",
+            stage_index=0,
+            stage_name="Test Stage",
+            agent="TestAgent",
+            status=status,
+            **fields
+        )
+        repository.session.add(stage_execution)
+        repository.session.commit()
+        return stage_execution
+
+    @pytest.mark.unit
+    def test_transition_stage_execution_applies_when_guard_matches(self, repository, sample_alert_session):
+        """Test guarded stage transition computes duration from stored start time."""
+        from tarsy.models.constants import StageStatus
+        
+        repository.create_alert_session(sample_alert_session)
+        self._add_stage(
+            repository, "stage-1", sample_alert_session.session_id,
+            StageStatus.ACTIVE.value, started_at_us=1_000_000
+        )
+        
+        updated = repository.transition_stage_execution(
+            "stage-1",
+            StageStatus.active_values(),
+            {"status": StageStatus.COMPLETED.value, "completed_at_us": 3_500_000},
+        )
+        
+        assert updated is not None
+        assert updated.status == StageStatus.COMPLETED.value
+        assert updated.completed_at_us == 3_500_000
+        assert updated.duration_ms == 2500
+
+    @pytest.mark.unit
+    def test_transition_stage_execution_skipped_when_guard_misses(self, repository, sample_alert_session):
+        """Test guarded stage transition does not overwrite a terminal status."""
+        from tarsy.models.constants import StageStatus
+        
+        repository.create_alert_session(sample_alert_session)
+        self._add_stage(repository, "stage-1", sample_alert_session.session_id, StageStatus.CANCELLED.value)
+        
+        updated = repository.transition_stage_execution(
+            "stage-1",
+            StageStatus.active_values(),
+            {"status": StageStatus.COMPLETED.value},
+        )
+        
+        assert updated is None
+        assert repository.get_stage_execution("stage-1").status == StageStatus.CANCELLED.value
+
+    @pytest.mark.unit
+    def test_transition_stage_execution_preserves_start_and_uses_pause_time(self, repository, sample_alert_session):
+        """Test preserve_started_at and completed_from_pause use stored timestamps."""
+        from tarsy.models.constants import StageStatus
+        
+        repository.create_alert_session(sample_alert_session)
+        self._add_stage(
+            repository, "stage-1", sample_alert_session.session_id,
+            StageStatus.PAUSED.value, started_at_us=1_000_000, paused_at_us=2_000_000
+        )
+        
+        resumed = repository.transition_stage_execution(
+            "stage-1",
+            [StageStatus.PAUSED.value],
+            {"status": StageStatus.ACTIVE.value, "started_at_us": 9_000_000},
+            preserve_started_at=True,
+        )
+        assert resumed.started_at_us == 1_000_000
+        
+        repository.session.execute(
+            StageExecution.__table__.update()
+            .where(StageExecution.execution_id == "stage-1")
+            .values(status=StageStatus.PAUSED.value)
+        )
+        cancelled = repository.transition_stage_execution(
+            "stage-1",
+            [StageStatus.PAUSED.value],
+            {"status": StageStatus.CANCELLED.value, "completed_at_us": 9_000_000},
+            completed_from_pause=True,
+        )
+        assert cancelled.completed_at_us == 2_000_000
+        assert cancelled.duration_ms == 1000
+
+    @pytest.mark.unit
+    def test_cancel_paused_stage_executions(self, repository, sample_alert_session):
+        """Test that all paused stages of a session are cancelled in one statement."""
+        from tarsy.models.constants import StageStatus
+        
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        self._add_stage(
+            repository, "paused-1", session_id, StageStatus.PAUSED.value,
+            started_at_us=1_000_000, paused_at_us=4_000_000
+        )
+        self._add_stage(repository, "paused-2", session_id, StageStatus.PAUSED.value)
+        self._add_stage(repository, "done-1", session_id, StageStatus.COMPLETED.value)
+        
+        cancelled = repository.cancel_paused_stage_executions(session_id, "Cancelled by user")
+        
+        assert {stage.execution_id for stage in cancelled} == {"paused-1", "paused-2"}
+        first = repository.get_stage_execution("paused-1")
+        assert first.status == StageStatus.CANCELLED.value
+        assert first.error_message == "Cancelled by user"
+        assert first.completed_at_us == 4_000_000
+        assert first.duration_ms == 3000
+        # Without paused_at_us the current time is used as completion time
+        assert repository.get_stage_execution("paused-2").completed_at_us is not None
+        assert repository.get_stage_execution("done-1").status == StageStatus.COMPLETED.value
+
+    @pytest.mark.unit
+    def test_transition_alert_session_guarded(self, repository, sample_alert_session):
+        """Test guarded session transition applies only from the expected statuses."""
+        from tarsy.models.constants import AlertSessionStatus
+        
+        sample_alert_session.status = AlertSessionStatus.PAUSED.value
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        
+        missed = repository.transition_alert_session(
+            session_id,
+            [AlertSessionStatus.IN_PROGRESS.value],
+            {"status": AlertSessionStatus.COMPLETED.value},
+        )
+        assert missed is None
+        
+        resumed = repository.transition_alert_session(
+            session_id,
+            [AlertSessionStatus.PAUSED.value],
+            {"status": AlertSessionStatus.IN_PROGRESS.value},
+        )
+        assert resumed.status == AlertSessionStatus.IN_PROGRESS.value
+
+    @pytest.mark.unit
+    def test_get_parallel_stage_group(self, repository, sample_alert_session):
+        """Test that parent and children are returned from one query."""
+        from tarsy.models.constants import StageStatus
+        
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        self._add_stage(repository, "parent-1", session_id, StageStatus.PAUSED.value)
+        self._add_stage(
+            repository, "child-2", session_id, StageStatus.PAUSED.value,
+            parent_stage_execution_id="parent-1", parallel_index=2
+        )
+        self._add_stage(
+            repository, "child-1", session_id, StageStatus.COMPLETED.value,
+            parent_stage_execution_id="parent-1", parallel_index=1
+        )
+        
+        parent, children = repository.get_parallel_stage_group("parent-1")
+        
+        assert parent.execution_id == "parent-1"
+        assert [child.execution_id for child in children] == ["child-1", "child-2"]
+
 
 class TestHistoryRepositoryErrorHandling:
     """Test suite for HistoryRepository error handling scenarios."""
@@ -2145,6 +2344,31 @@ class TestHistoryRepositoryPerformance:
         assert hasattr(result, 'time_ranges')
         assert len(result.time_ranges) == 5
     
+    @pytest.mark.unit
+    def test_get_filter_options_alert_data_facets(self, db_session):
+        """Test distinct values are returned for requested alert_data facets."""
+        repo = HistoryRepository(db_session)
+        
+        sessions = [
+            AlertSession(session_id="1", agent_type="kubernetes", alert_type="PodCrashLooping", status="completed", alert_data={"cluster": "prod", "severity": "critical"}, chain_id="test-chain-1"),
+            AlertSession(session_id="2", agent_type="kubernetes", alert_type="PodCrashLooping", status="completed", alert_data={"cluster": "dev", "severity": "critical"}, chain_id="test-chain-2"),
+            AlertSession(session_id="3", agent_type="kubernetes", alert_type="PodCrashLooping", status="completed", alert_data={"cluster": "prod"}, chain_id="test-chain-3")
+        ]
+        for session in sessions:
+            db_session.add(session)
+        db_session.commit()
+        
+        result = repo.get_filter_options(facet_keys=["cluster", "severity", "namespace"])
+        
+        assert result.alert_data_facets == {
+            "cluster": ["dev", "prod"],
+            "severity": ["critical"],
+            "namespace": []
+        }
+        
+        # No facets requested - no facet values
+        assert repo.get_filter_options().alert_data_facets == {}
+    
     @pytest.mark.unit
     def test_get_filter_options_empty_database(self, db_session):
         """Test filter options with empty database."""
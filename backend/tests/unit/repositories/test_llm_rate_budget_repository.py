@@ -0,0 +1,107 @@
+"""Unit tests for LLMRateBudgetRepository."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tarsy.models.db_models import LLMRateBudget
+from tarsy.repositories.llm_rate_budget_repository import LLMRateBudgetRepository
+
+
+def make_session(window_exists: bool, rowcount: int = 1):
+    """Mock session whose window lookup and conditional update return the given results."""
+    session = AsyncMock(spec=AsyncSession)
+    session.add = Mock()
+    session.flush = AsyncMock()
+    session.rollback = AsyncMock()
+    session.commit = AsyncMock()
+
+    lookup = Mock()
+    lookup.first.return_value = ("openai",) if window_exists else None
+    update_result = Mock(rowcount=rowcount)
+    results = [lookup] if window_exists else [lookup, Mock()]
+    session.execute = AsyncMock(side_effect=results + [update_result])
+    return session
+
+
+@pytest.mark.unit
+class TestLLMRateBudgetRepositoryReserve:
+    """Test LLMRateBudgetRepository.reserve method."""
+
+    @pytest.mark.asyncio
+    async def test_reserve_in_existing_window(self):
+        """Test that a reservation is a conditional update of the existing window."""
+        session = make_session(window_exists=True)
+
+        reserved = await LLMRateBudgetRepository(session).reserve("openai", 1200, 500, 60, 100000)
+
+        assert reserved is True
+        session.add.assert_not_called()
+        assert session.execute.await_count == 2
+        update_sql = str(session.execute.await_args_list[1][0][0])
+        assert "UPDATE llm_rate_budgets" in update_sql
+        assert "requests_used" in update_sql and "tokens_used" in update_sql
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_new_window_is_created_and_old_windows_deleted(self):
+        """Test the first reservation of a window."""
+        session = make_session(window_exists=False)
+
+        reserved = await LLMRateBudgetRepository(session).reserve("openai", 1200, 500, 60, None)
+
+        assert reserved is True
+        added = session.add.call_args[0][0]
+        assert isinstance(added, LLMRateBudget)
+        assert (added.provider, added.window_start) == ("openai", 1200)
+        session.flush.assert_awaited_once()
+        delete_sql = str(session.execute.await_args_list[1][0][0])
+        assert "DELETE FROM llm_rate_budgets" in delete_sql
+
+    @pytest.mark.asyncio
+    async def test_window_created_concurrently(self):
+        """Test that losing the insert race to another pod still reserves."""
+        session = make_session(window_exists=False)
+        session.execute.side_effect = [Mock(first=Mock(return_value=None)), Mock(rowcount=1)]
+        session.flush.side_effect = IntegrityError("INSERT", {}, Exception("duplicate key"))
+
+        reserved = await LLMRateBudgetRepository(session).reserve("openai", 1200, 500, 60, 100000)
+
+        assert reserved is True
+        session.rollback.assert_awaited_once()
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_full_window_is_denied(self):
+        """Test that no matching row means the window has no room."""
+        session = make_session(window_exists=True, rowcount=0)
+
+        reserved = await LLMRateBudgetRepository(session).reserve("openai", 1200, 500, 60, 100000)
+
+        assert reserved is False
+
+
+@pytest.mark.unit
+class TestLLMRateBudgetRepositoryAdjustTokens:
+    """Test LLMRateBudgetRepository.adjust_tokens method."""
+
+    @pytest.mark.asyncio
+    async def test_adjust_tokens(self):
+        """Test correcting a window's token count."""
+        session = AsyncMock(spec=AsyncSession)
+
+        await LLMRateBudgetRepository(session).adjust_tokens("openai", 1200, -300)
+
+        assert "UPDATE llm_rate_budgets" in str(session.execute.await_args[0][0])
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_zero_delta_is_skipped(self):
+        """Test that exact estimates don't touch the database."""
+        session = AsyncMock(spec=AsyncSession)
+
+        await LLMRateBudgetRepository(session).adjust_tokens("openai", 1200, 0)
+
+        session.execute.assert_not_called()
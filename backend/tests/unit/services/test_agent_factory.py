@@ -973,6 +973,44 @@ class TestAgentFactoryLLMProvider:
         mock_agent_instance.set_llm_provider.assert_called_once_with("openai-default")
         assert agent == mock_agent_instance
     
+    @patch('tarsy.agents.kubernetes_agent.KubernetesAgent')
+    def test_get_agent_with_interaction_models(self, mock_kubernetes_agent, mock_dependencies):
+        """Test get_agent_with_config applies the chain's interaction-type model routing."""
+        factory = AgentFactory(
+            llm_manager=mock_dependencies['llm_manager'],
+            mcp_registry=mock_dependencies['mcp_registry']
+        )
+        
+        mock_agent_instance = Mock()
+        mock_kubernetes_agent.return_value = mock_agent_instance
+        
+        factory.get_agent_with_config(
+            agent_identifier="KubernetesAgent",
+            mcp_client=mock_dependencies['mcp_client'],
+            execution_config=AgentExecutionConfig(interaction_models={"summarization": "gpt-5-mini"})
+        )
+        
+        mock_agent_instance.set_interaction_models.assert_called_once_with({"summarization": "gpt-5-mini"})
+    
+    @patch('tarsy.agents.kubernetes_agent.KubernetesAgent')
+    def test_get_agent_with_token_budget(self, mock_kubernetes_agent, mock_dependencies):
+        """Test get_agent_with_config applies the agent's token budget."""
+        factory = AgentFactory(
+            llm_manager=mock_dependencies['llm_manager'],
+            mcp_registry=mock_dependencies['mcp_registry']
+        )
+        
+        mock_agent_instance = Mock()
+        mock_kubernetes_agent.return_value = mock_agent_instance
+        
+        factory.get_agent_with_config(
+            agent_identifier="KubernetesAgent",
+            mcp_client=mock_dependencies['mcp_client'],
+            execution_config=AgentExecutionConfig(token_budget=200000)
+        )
+        
+        mock_agent_instance.set_token_budget.assert_called_once_with(200000)
+    
     @patch('tarsy.agents.kubernetes_agent.KubernetesAgent')
     def test_get_agent_with_none_provider(self, mock_kubernetes_agent, mock_dependencies):
         """Test get_agent_with_config with explicit None provider (uses global default)."""
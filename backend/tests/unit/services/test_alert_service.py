@@ -374,6 +374,9 @@ class TestAlertProcessing:
                 current_iteration=None
             )
         mock_history_service.get_stage_execution = AsyncMock(side_effect=create_mock_stage_execution)
+        mock_history_service.transition_stage_execution = AsyncMock(
+            side_effect=lambda execution_id, *args, **kwargs: create_mock_stage_execution(execution_id)
+        )
         # Mock database verification for stage creation
         mock_history_service._infra = Mock()
         mock_history_service._infra._retry_database_operation_async = AsyncMock(return_value=True)
@@ -1232,6 +1235,7 @@ class TestEnhancedChainExecution:
         service.history_service.update_stage_execution = AsyncMock(return_value=True)
         service.history_service.update_session_current_stage = AsyncMock(return_value=True)
         service.history_service.get_stage_execution = AsyncMock()
+        service.history_service.transition_stage_execution = AsyncMock()
         service.history_service.get_stage_executions = AsyncMock(return_value=[])
         service.history_service.record_session_interaction = AsyncMock()
         service.history_service.start_session_processing = AsyncMock(return_value=True)
@@ -1510,6 +1514,13 @@ class TestEnhancedChainExecution:
 
         service.history_service.get_stage_execution = AsyncMock(return_value=stage_record)
 
+        def _apply_transition(_execution_id, _from_statuses, values, **_kwargs):
+            for field, value in values.items():
+                setattr(stage_record, field, value)
+            return stage_record
+
+        service.history_service.transition_stage_execution = AsyncMock(side_effect=_apply_transition)
+
         cancelled_agent = AsyncMock()
 
         async def _raise_cancel(*_args, **_kwargs):
@@ -1526,7 +1537,7 @@ class TestEnhancedChainExecution:
         session_mcp_client = AsyncMock()
 
         @asynccontextmanager
-        async def _noop_stage_execution_context(_stage):
+        async def _noop_stage_execution_context(_stage, **_kwargs):
             yield
 
         with patch(
@@ -1594,6 +1605,9 @@ class TestFullErrorPropagation:
                 current_iteration=None
             )
         service.history_service.get_stage_execution = AsyncMock(side_effect=create_mock_stage_execution)
+        service.history_service.transition_stage_execution = AsyncMock(
+            side_effect=lambda execution_id, *args, **kwargs: create_mock_stage_execution(execution_id)
+        )
         # Mock database verification for stage creation
         service.history_service._infra = Mock()
         service.history_service._infra._retry_database_operation_async = AsyncMock(return_value=True)
@@ -50,6 +50,24 @@ def create_mock_stage_execution(
     return mock
 
 
+def configure_stage_group(
+    alert_service: AlertService,
+    child_stage: MagicMock,
+    parent_stage: MagicMock,
+    children: list[MagicMock],
+) -> None:
+    """Wire history service mocks for the child lookup, guarded transitions and group query."""
+    alert_service.history_service.get_stage_execution = AsyncMock(return_value=child_stage)
+    alert_service.history_service.transition_stage_execution = AsyncMock(
+        side_effect=lambda execution_id, *args, **kwargs: (
+            child_stage if execution_id == child_stage.execution_id else parent_stage
+        )
+    )
+    alert_service.history_service.get_parallel_stage_group = AsyncMock(
+        return_value=(parent_stage, children)
+    )
+
+
 def create_mock_session(
     session_id: str = "session-123",
     status: str = AlertSessionStatus.PAUSED.value,
@@ -195,11 +213,10 @@ class TestCancelAgentStatusUpdate:
         return service
 
     @pytest.mark.asyncio
-    async def test_cancel_agent_sets_cancelled_status(
+    async def test_cancel_agent_uses_guarded_cancel_transition(
         self, alert_service: AlertService
     ) -> None:
-        """Test that cancelled agent has CANCELLED status set."""
-        # Setup
+        """Test that the child is cancelled with a single PAUSED→CANCELLED transition."""
         mock_session = create_mock_session()
         alert_service.history_service.get_session.return_value = mock_session
 
@@ -210,14 +227,7 @@ class TestCancelAgentStatusUpdate:
             status=StageStatus.PAUSED.value,
             stage_output={"metadata": {"success_policy": "any"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
-        )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage]
-        )
-        alert_service.history_service.update_stage_execution = AsyncMock()
+        configure_stage_group(alert_service, child_stage, parent_stage, [child_stage])
 
         # Mock aggregation to return FAILED (all cancelled = failed with ANY policy)
         alert_service.parallel_executor.aggregate_status.return_value = StageStatus.FAILED
@@ -227,65 +237,53 @@ class TestCancelAgentStatusUpdate:
              patch('tarsy.services.events.event_helpers.publish_agent_cancelled', new=AsyncMock()):
             await alert_service.cancel_agent("session-123", "stage-exec-1")
 
-        # Verify child stage was updated to CANCELLED
-        assert child_stage.status == StageStatus.CANCELLED.value
-        assert child_stage.error_message == "Cancelled by user"
+        child_call = alert_service.history_service.transition_stage_execution.call_args_list[0]
+        execution_id, from_statuses, values = child_call.args
+        assert execution_id == "stage-exec-1"
+        assert from_statuses == [StageStatus.PAUSED.value]
+        assert values["status"] == StageStatus.CANCELLED.value
+        assert values["error_message"] == "Cancelled by user"
+        # paused_at_us is preferred over the fallback completion time
+        assert child_call.kwargs["completed_from_pause"] is True
+        assert current_time_close(values["completed_at_us"])
+
+        # Parent and siblings are loaded with one query, not re-fetched individually
+        alert_service.history_service.get_parallel_stage_group.assert_awaited_once_with("parent-exec-1")
+        alert_service.history_service.get_stage_execution.assert_awaited_once_with("stage-exec-1")
 
     @pytest.mark.asyncio
-    async def test_cancel_agent_uses_paused_at_us_for_completed_at(
+    async def test_cancel_agent_rejects_when_child_no_longer_paused(
         self, alert_service: AlertService
     ) -> None:
-        """Test that paused_at_us is used as completed_at_us."""
+        """Test that a lost race (child resumed concurrently) is reported, not overwritten."""
         mock_session = create_mock_session()
         alert_service.history_service.get_session.return_value = mock_session
 
-        paused_timestamp = now_us() - 10000000  # 10 seconds ago
-        child_stage = create_mock_stage_execution(paused_at_us=paused_timestamp)
-        parent_stage = create_mock_stage_execution(
-            execution_id="parent-exec-1",
-            parent_stage_execution_id=None,
-            stage_output={"metadata": {"success_policy": "any"}}
-        )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
-        )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage]
-        )
-        alert_service.history_service.update_stage_execution = AsyncMock()
-        alert_service.parallel_executor.aggregate_status.return_value = StageStatus.FAILED
+        child_stage = create_mock_stage_execution()
+        alert_service.history_service.get_stage_execution = AsyncMock(return_value=child_stage)
+        alert_service.history_service.transition_stage_execution = AsyncMock(return_value=None)
+        alert_service.history_service.get_parallel_stage_group = AsyncMock()
 
-        with patch('tarsy.hooks.hook_context.stage_execution_context', mock_stage_execution_context), \
-             patch('tarsy.services.events.event_helpers.publish_session_cancelled', new=AsyncMock()), \
-             patch('tarsy.services.events.event_helpers.publish_agent_cancelled', new=AsyncMock()):
+        with pytest.raises(ValueError, match="no longer paused"):
             await alert_service.cancel_agent("session-123", "stage-exec-1")
 
-        # Verify completed_at_us matches paused_at_us
-        assert child_stage.completed_at_us == paused_timestamp
+        alert_service.history_service.get_parallel_stage_group.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_cancel_agent_fallback_when_paused_at_us_is_none(
+    async def test_cancel_agent_parent_transition_guarded_from_paused(
         self, alert_service: AlertService
     ) -> None:
-        """Test that now_us() is used when paused_at_us is None."""
+        """Test that the parent stage transition only applies while it is still paused."""
         mock_session = create_mock_session()
         alert_service.history_service.get_session.return_value = mock_session
 
-        child_stage = create_mock_stage_execution(paused_at_us=None)
+        child_stage = create_mock_stage_execution()
         parent_stage = create_mock_stage_execution(
             execution_id="parent-exec-1",
             parent_stage_execution_id=None,
             stage_output={"metadata": {"success_policy": "any"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
-        )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage]
-        )
-        alert_service.history_service.update_stage_execution = AsyncMock()
+        configure_stage_group(alert_service, child_stage, parent_stage, [child_stage])
         alert_service.parallel_executor.aggregate_status.return_value = StageStatus.FAILED
 
         with patch('tarsy.hooks.hook_context.stage_execution_context', mock_stage_execution_context), \
@@ -293,50 +291,44 @@ class TestCancelAgentStatusUpdate:
              patch('tarsy.services.events.event_helpers.publish_agent_cancelled', new=AsyncMock()):
             await alert_service.cancel_agent("session-123", "stage-exec-1")
 
-        # Verify completed_at_us is set (fallback to now_us() since paused_at_us was None)
-        assert child_stage.completed_at_us is not None
-        # The completed_at_us should be a recent timestamp (within last second)
-        current_time = now_us()
-        assert current_time - child_stage.completed_at_us < 1000000  # Within 1 second
+        parent_call = alert_service.history_service.transition_stage_execution.call_args_list[1]
+        execution_id, from_statuses, values = parent_call.args
+        assert execution_id == "parent-exec-1"
+        assert from_statuses == [StageStatus.PAUSED.value]
+        assert values["status"] == StageStatus.FAILED.value
+        assert values["error_message"] == "Parallel stage failed after agent cancellation"
+        assert "completed_at_us" in values
 
     @pytest.mark.asyncio
-    async def test_cancel_agent_calculates_duration_correctly(
+    async def test_cancel_agent_skips_session_update_when_parent_already_moved(
         self, alert_service: AlertService
     ) -> None:
-        """Test that duration is calculated from started_at_us to completed_at_us."""
+        """Test that a concurrent parent transition wins and the session is left alone."""
         mock_session = create_mock_session()
         alert_service.history_service.get_session.return_value = mock_session
 
-        started_at = now_us() - 5000000  # 5 seconds ago
-        paused_at = now_us() - 1000000   # 1 second ago
-        expected_duration_ms = (paused_at - started_at) // 1000
-
-        child_stage = create_mock_stage_execution(
-            started_at_us=started_at,
-            paused_at_us=paused_at
-        )
+        child_stage = create_mock_stage_execution()
         parent_stage = create_mock_stage_execution(
             execution_id="parent-exec-1",
             parent_stage_execution_id=None,
             stage_output={"metadata": {"success_policy": "any"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
-        )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage]
+        configure_stage_group(alert_service, child_stage, parent_stage, [child_stage])
+        alert_service.history_service.transition_stage_execution = AsyncMock(
+            side_effect=[child_stage, None]
         )
-        alert_service.history_service.update_stage_execution = AsyncMock()
-        alert_service.parallel_executor.aggregate_status.return_value = StageStatus.FAILED
+        alert_service.parallel_executor.aggregate_status.return_value = StageStatus.COMPLETED
 
-        with patch('tarsy.hooks.hook_context.stage_execution_context', mock_stage_execution_context), \
-             patch('tarsy.services.events.event_helpers.publish_session_cancelled', new=AsyncMock()), \
-             patch('tarsy.services.events.event_helpers.publish_agent_cancelled', new=AsyncMock()):
-            await alert_service.cancel_agent("session-123", "stage-exec-1")
+        with patch('tarsy.hooks.hook_context.stage_execution_context', mock_stage_execution_context):
+            result = await alert_service.cancel_agent("session-123", "stage-exec-1")
+
+        alert_service.session_manager.transition_session_status.assert_not_called()
+        assert result.session_status == AlertSessionStatus.PAUSED.value
 
-        # Verify duration is calculated correctly
-        assert child_stage.duration_ms == expected_duration_ms
+
+def current_time_close(timestamp_us: int) -> bool:
+    """Check that a timestamp is within one second of now."""
+    return now_us() - timestamp_us < 1000000
 
 
 @pytest.mark.unit
@@ -380,14 +372,9 @@ class TestCancelAgentPolicyEvaluation:
             status=StageStatus.PAUSED.value,
             stage_output={"metadata": {"success_policy": "any"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
-        )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage, completed_sibling]
+        configure_stage_group(
+            alert_service, child_stage, parent_stage, [child_stage, completed_sibling]
         )
-        alert_service.history_service.update_stage_execution = AsyncMock()
 
         # With one completed and one cancelled, ANY policy = COMPLETED
         alert_service.parallel_executor.aggregate_status.return_value = StageStatus.COMPLETED
@@ -397,9 +384,9 @@ class TestCancelAgentPolicyEvaluation:
              patch.object(alert_service, '_continue_after_parallel_completion', new=AsyncMock()):
             result = await alert_service.cancel_agent("session-123", "stage-exec-1")
 
-        # Verify session status changed to IN_PROGRESS
-        alert_service.session_manager.update_session_status.assert_called_with(
-            "session-123", AlertSessionStatus.IN_PROGRESS.value
+        # Verify session status changed PAUSED → IN_PROGRESS via a guarded transition
+        alert_service.session_manager.transition_session_status.assert_called_with(
+            "session-123", [AlertSessionStatus.PAUSED.value], AlertSessionStatus.IN_PROGRESS.value
         )
         mock_resumed.assert_called_once_with("session-123")
 
@@ -408,6 +395,33 @@ class TestCancelAgentPolicyEvaluation:
         assert result.session_status == AlertSessionStatus.IN_PROGRESS.value
         assert result.stage_status == StageStatus.COMPLETED.value
 
+    @pytest.mark.asyncio
+    async def test_cancel_agent_does_not_continue_when_session_no_longer_paused(
+        self, alert_service: AlertService
+    ) -> None:
+        """Test that chain continuation is not started if the session was cancelled concurrently."""
+        mock_session = create_mock_session()
+        alert_service.history_service.get_session.return_value = mock_session
+
+        child_stage = create_mock_stage_execution()
+        parent_stage = create_mock_stage_execution(
+            execution_id="parent-exec-1",
+            parent_stage_execution_id=None,
+            stage_output={"metadata": {"success_policy": "any"}}
+        )
+        configure_stage_group(alert_service, child_stage, parent_stage, [child_stage])
+        alert_service.parallel_executor.aggregate_status.return_value = StageStatus.COMPLETED
+        alert_service.session_manager.transition_session_status.return_value = False
+
+        with patch('tarsy.hooks.hook_context.stage_execution_context', mock_stage_execution_context), \
+             patch('tarsy.services.events.event_helpers.publish_session_resumed', new=AsyncMock()) as mock_resumed, \
+             patch.object(alert_service, '_continue_after_parallel_completion', new=AsyncMock()) as mock_continue:
+            result = await alert_service.cancel_agent("session-123", "stage-exec-1")
+
+        mock_resumed.assert_not_called()
+        mock_continue.assert_not_called()
+        assert result.session_status == AlertSessionStatus.PAUSED.value
+
     @pytest.mark.asyncio
     async def test_cancel_agent_with_policy_any_all_cancelled_results_in_session_cancelled(
         self, alert_service: AlertService
@@ -416,11 +430,11 @@ class TestCancelAgentPolicyEvaluation:
         mock_session = create_mock_session()
         alert_service.history_service.get_session.return_value = mock_session
 
+        # After cancel, both will be CANCELLED
         child_stage = create_mock_stage_execution(
             execution_id="stage-exec-1",
-            status=StageStatus.PAUSED.value
+            status=StageStatus.CANCELLED.value
         )
-        # After cancel, both will be CANCELLED
         cancelled_sibling = create_mock_stage_execution(
             execution_id="stage-exec-2",
             status=StageStatus.CANCELLED.value
@@ -430,15 +444,13 @@ class TestCancelAgentPolicyEvaluation:
             parent_stage_execution_id=None,
             stage_output={"metadata": {"success_policy": "any"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
+        configure_stage_group(
+            alert_service, child_stage, parent_stage, [child_stage, cancelled_sibling]
         )
-        # Return children with the child_stage status changed to CANCELLED
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage, cancelled_sibling]
+        # Child was paused when validated
+        alert_service.history_service.get_stage_execution = AsyncMock(
+            return_value=create_mock_stage_execution(execution_id="stage-exec-1")
         )
-        alert_service.history_service.update_stage_execution = AsyncMock()
 
         # All cancelled = FAILED
         alert_service.parallel_executor.aggregate_status.return_value = StageStatus.FAILED
@@ -463,7 +475,7 @@ class TestCancelAgentPolicyEvaluation:
 
         child_stage = create_mock_stage_execution(
             execution_id="stage-exec-1",
-            status=StageStatus.PAUSED.value
+            status=StageStatus.CANCELLED.value
         )
         completed_sibling = create_mock_stage_execution(
             execution_id="stage-exec-2",
@@ -474,14 +486,12 @@ class TestCancelAgentPolicyEvaluation:
             parent_stage_execution_id=None,
             stage_output={"metadata": {"success_policy": "all"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
+        configure_stage_group(
+            alert_service, child_stage, parent_stage, [child_stage, completed_sibling]
         )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage, completed_sibling]
+        alert_service.history_service.get_stage_execution = AsyncMock(
+            return_value=create_mock_stage_execution(execution_id="stage-exec-1")
         )
-        alert_service.history_service.update_stage_execution = AsyncMock()
 
         # With ALL policy and one cancelled = FAILED (aggregated status)
         # But session status is CANCELLED since no actual failures, only cancellations
@@ -518,14 +528,9 @@ class TestCancelAgentPolicyEvaluation:
             parent_stage_execution_id=None,
             stage_output={"metadata": {"success_policy": "any"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
+        configure_stage_group(
+            alert_service, child_stage, parent_stage, [child_stage, paused_sibling]
         )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage, paused_sibling]
-        )
-        alert_service.history_service.update_stage_execution = AsyncMock()
 
         # One cancelled, one still paused = PAUSED
         alert_service.parallel_executor.aggregate_status.return_value = StageStatus.PAUSED
@@ -534,10 +539,11 @@ class TestCancelAgentPolicyEvaluation:
              patch('tarsy.services.events.event_helpers.publish_agent_cancelled', new=AsyncMock()) as mock_agent_cancelled:
             result = await alert_service.cancel_agent("session-123", "stage-exec-1")
 
-        # Verify session status stays PAUSED
+        # Verify session status stays PAUSED and parent is not transitioned
         assert result.success is True
         assert result.session_status == AlertSessionStatus.PAUSED.value
         assert result.stage_status == StageStatus.PAUSED.value
+        assert alert_service.history_service.transition_stage_execution.await_count == 1
 
         # Verify agent cancelled event was still published
         mock_agent_cancelled.assert_called_once()
@@ -572,7 +578,7 @@ class TestCancelAgentMixedStatuses:
 
         child_stage = create_mock_stage_execution(
             execution_id="stage-exec-1",
-            status=StageStatus.PAUSED.value
+            status=StageStatus.CANCELLED.value
         )
         failed_sibling = create_mock_stage_execution(
             execution_id="stage-exec-2",
@@ -583,14 +589,12 @@ class TestCancelAgentMixedStatuses:
             parent_stage_execution_id=None,
             stage_output={"metadata": {"success_policy": "any"}}
         )
-
-        alert_service.history_service.get_stage_execution = AsyncMock(
-            side_effect=[child_stage, parent_stage]
+        configure_stage_group(
+            alert_service, child_stage, parent_stage, [child_stage, failed_sibling]
         )
-        alert_service.history_service.get_parallel_stage_children = AsyncMock(
-            return_value=[child_stage, failed_sibling]
+        alert_service.history_service.get_stage_execution = AsyncMock(
+            return_value=create_mock_stage_execution(execution_id="stage-exec-1")
         )
-        alert_service.history_service.update_stage_execution = AsyncMock()
 
         # All failed/cancelled = FAILED
         alert_service.parallel_executor.aggregate_status.return_value = StageStatus.FAILED
@@ -603,4 +607,3 @@ class TestCancelAgentMixedStatuses:
         # Session should be FAILED (not CANCELLED because there are actual failures)
         mock_failed.assert_called_once_with("session-123")
         assert result.session_status == AlertSessionStatus.FAILED.value
-
@@ -0,0 +1,144 @@
+"""
+Unit tests for EventBatcher.
+
+Tests coalescing of concurrent submissions into one publish transaction,
+distribution of event IDs and error propagation.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tarsy.models.event_models import SessionStartedEvent, StageStartedEvent
+from tarsy.services.events import batcher as batcher_module
+from tarsy.services.events.batcher import (
+    EventBatcher,
+    get_event_batcher,
+    initialize_event_batcher,
+    shutdown_event_batcher,
+)
+
+
+@pytest.fixture
+def mock_session_factory():
+    """Async session factory yielding a mock session."""
+    mock_session = AsyncMock()
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=False)
+    with patch(
+        "tarsy.services.events.batcher.get_async_session_factory",
+        return_value=Mock(return_value=mock_session),
+    ):
+        yield mock_session
+
+
+@pytest.fixture(autouse=True)
+def reset_event_batcher():
+    """Make sure no process-wide batcher leaks between tests."""
+    yield
+    batcher_module._event_batcher = None
+
+
+@pytest.mark.unit
+class TestEventBatcher:
+    """Test coalescing of event bursts."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_share_one_transaction(self, mock_session_factory):
+        """Test that updates submitted within the window are published together, in order."""
+        batcher = EventBatcher(window_ms=5)
+        started = SessionStartedEvent(session_id="s-1", alert_type="test")
+        stage = StageStartedEvent(session_id="s-1", stage_id="st-1", stage_name="analysis")
+
+        with patch(
+            "tarsy.services.events.batcher.publish_events",
+            new_callable=AsyncMock,
+            return_value=[10, 11, 12],
+        ) as mock_publish:
+            results = await asyncio.gather(
+                batcher.publish([("sessions", started), ("session:s-1", started)]),
+                batcher.publish([("session:s-1", stage)]),
+            )
+
+        mock_publish.assert_awaited_once()
+        assert mock_publish.call_args[0][0] is mock_session_factory
+        assert mock_publish.call_args[0][1] == [
+            ("sessions", started),
+            ("session:s-1", started),
+            ("session:s-1", stage),
+        ]
+        assert results == [[10, 11], [12]]
+        assert batcher.flushes == 1
+        assert batcher.events_published == 3
+
+    @pytest.mark.asyncio
+    async def test_flush_error_raised_to_every_caller(self, mock_session_factory):
+        """Test that a failed flush fails every update in the batch."""
+        batcher = EventBatcher(window_ms=1)
+        event = SessionStartedEvent(session_id="s-1", alert_type="test")
+
+        with patch(
+            "tarsy.services.events.batcher.publish_events",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("DB down"),
+        ):
+            results = await asyncio.gather(
+                batcher.publish([("sessions", event)]),
+                batcher.publish([("session:s-1", event)]),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert batcher.flushes == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_during_flush_is_flushed_next(self, mock_session_factory):
+        """Test that an update submitted while a flush is writing gets its own flush."""
+        batcher = EventBatcher(window_ms=1)
+        event = SessionStartedEvent(session_id="s-1", alert_type="test")
+        writing = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_publish(session, items):
+            if not writing.is_set():
+                writing.set()
+                await release.wait()
+                return [1]
+            return [2]
+
+        with patch("tarsy.services.events.batcher.publish_events", side_effect=slow_publish):
+            first = asyncio.create_task(batcher.publish([("sessions", event)]))
+            await writing.wait()
+            second = asyncio.create_task(batcher.publish([("session:s-1", event)]))
+            await asyncio.sleep(0)
+            release.set()
+
+            results = await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+
+        assert results == [[1], [2]]
+        assert batcher.flushes == 2
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_pending(self, mock_session_factory):
+        """Test that shutdown publishes events still waiting for the window."""
+        initialize_event_batcher(60000)
+        event = SessionStartedEvent(session_id="s-1", alert_type="test")
+
+        with patch(
+            "tarsy.services.events.batcher.publish_events",
+            new_callable=AsyncMock,
+            return_value=[1],
+        ) as mock_publish:
+            pending = asyncio.create_task(get_event_batcher().publish([("sessions", event)]))
+            await asyncio.sleep(0)
+            await shutdown_event_batcher()
+
+            assert await pending == [1]
+        mock_publish.assert_awaited_once()
+        assert get_event_batcher() is None
+
+    def test_zero_window_disables_batching(self):
+        """Test that a zero window leaves batching disabled."""
+        assert initialize_event_batcher(0) is None
+        assert get_event_batcher() is None
@@ -0,0 +1,72 @@
+"""
+Unit tests for event JSON encoding.
+
+Tests compact encoding with and without orjson and cached event encodings.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tarsy.services.events import codec
+from tarsy.services.events.codec import EncodedEvent, dumps, encode_event, loads
+
+
+@pytest.mark.unit
+class TestDumpsLoads:
+    """Test encoding and decoding."""
+
+    def test_compact_round_trip(self):
+        """Test that output is compact JSON that decodes to the same value."""
+        event = {"type": "llm.stream.chunk", "chunk": "héllo: 'x'", "id": 42, "nested": [1, None, True]}
+
+        text = dumps(event)
+
+        assert isinstance(text, str)
+        assert ": " not in text.replace("héllo: ", "")
+        assert loads(text) == event
+        assert loads(text.encode("utf-8")) == event
+
+    def test_stdlib_fallback_matches(self):
+        """Test that the stdlib fallback produces the same text."""
+        event = {"type": "session.created", "session_id": "s-1", "chunk": "ünïcode", "n": 1.5}
+        expected = dumps(event)
+
+        with patch.object(codec, "orjson", None):
+            assert dumps(event) == expected
+            assert loads(expected) == event
+
+    def test_big_integers_fall_back_to_stdlib(self):
+        """Test that values orjson cannot encode are still encoded."""
+        event = {"value": 2 ** 70}
+
+        assert json.loads(dumps(event)) == event
+
+
+@pytest.mark.unit
+class TestEncodedEvent:
+    """Test events carrying their cached encoding."""
+
+    def test_encodes_once(self):
+        """Test that the encoding is computed once and reused."""
+        event = EncodedEvent({"type": "t", "id": 1})
+
+        with patch.object(codec, "dumps", wraps=codec.dumps) as mock_dumps:
+            first = encode_event(event)
+            second = encode_event(event)
+
+        assert first is second
+        assert mock_dumps.call_count == 1
+        assert json.loads(first) == {"type": "t", "id": 1}
+
+    def test_given_text_is_used(self):
+        """Test that a provided encoding (e.g. the NOTIFY payload) is used as-is."""
+        event = EncodedEvent({"type": "t"}, text='{"type": "t"}')
+
+        assert encode_event(event) == '{"type": "t"}'
+        assert event == {"type": "t"}
+
+    def test_plain_dict(self):
+        """Test that plain dicts are encoded on each call."""
+        assert encode_event({"type": "t"}) == '{"type":"t"}'
@@ -855,3 +855,39 @@ class TestPublishAgentCancelled:
                 agent_name="KubernetesAgent",
                 parent_stage_execution_id="parent-exec-789"
             )
+
+
+@pytest.mark.unit
+class TestEventHelperTransactions:
+    """Test that each helper publishes one logical update per transaction."""
+
+    @pytest.mark.asyncio
+    async def test_both_channels_committed_once(self):
+        """Test that publishing to two channels uses one session and one commit."""
+        mock_session = AsyncMock()
+        mock_session_factory = Mock(return_value=mock_session)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock()
+
+        with patch("tarsy.services.events.event_helpers.get_async_session_factory", return_value=mock_session_factory), \
+             patch("tarsy.services.events.event_helpers.publish_event", new_callable=AsyncMock) as mock_publish:
+            await publish_session_started("test-session-123", "alert-type-1")
+
+        assert mock_publish.call_count == 2
+        mock_session_factory.assert_called_once()
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_uses_event_batcher_when_configured(self):
+        """Test that helpers hand their update to the event batcher when batching is enabled."""
+        mock_batcher = Mock()
+        mock_batcher.publish = AsyncMock(return_value=[1, 2])
+
+        with patch("tarsy.services.events.event_helpers.get_event_batcher", return_value=mock_batcher), \
+             patch("tarsy.services.events.event_helpers.get_async_session_factory") as mock_factory:
+            await publish_session_completed("test-session-123")
+
+        mock_factory.assert_not_called()
+        items = mock_batcher.publish.call_args[0][0]
+        assert [channel for channel, _ in items] == [EventChannel.SESSIONS, "session:test-session-123"]
+        assert items[0][1].type == "session.completed"
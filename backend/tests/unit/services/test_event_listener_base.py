@@ -5,6 +5,7 @@ This module tests the abstract EventListener base class behaviors,
 particularly edge cases in the cleanup logic.
 """
 
+import asyncio
 import time
 from typing import Dict
 from unittest.mock import AsyncMock
@@ -12,6 +13,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from tarsy.services.events.base import EventListener
+from tarsy.services.events.local_delivery import LOCAL_ORIGIN_ID, ORIGIN_KEY
 
 
 class ConcreteEventListener(EventListener):
@@ -219,3 +221,44 @@ class TestEventListenerUnsubscribe:
         assert len(listener.callbacks["test_channel"]) == 1
         assert "test_channel" not in listener.cleaned_up_channels
 
+
+
+@pytest.mark.unit
+class TestEventListenerLocalDelivery:
+    """Test in-process delivery of locally published events."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_local_reaches_subscribers(self):
+        """Test that a local event is dispatched immediately and its echo is skipped."""
+        listener = ConcreteEventListener()
+        callback = AsyncMock()
+        await listener.subscribe("test_channel", callback)
+
+        listener.claim_local_event(7)
+        await listener.dispatch_local("test_channel", {"type": "stage.started", "id": 7})
+        await asyncio.sleep(0.01)
+
+        callback.assert_called_once_with({"type": "stage.started", "id": 7})
+        assert listener._is_local_echo({"type": "stage.started", "id": 7}) is True
+        # The echo is only suppressed once
+        assert listener._is_local_echo({"type": "stage.started", "id": 7}) is False
+
+    def test_released_claim_is_not_skipped(self):
+        """Test that an event whose transaction rolled back is left to NOTIFY/polling."""
+        listener = ConcreteEventListener()
+
+        listener.claim_local_event(7)
+        listener.release_local_event(7)
+        listener.release_local_event(7)
+
+        assert listener._is_local_echo({"type": "stage.started", "id": 7}) is False
+
+    def test_is_local_echo_by_origin(self):
+        """Test that the origin tag identifies echoes and is stripped from the event."""
+        listener = ConcreteEventListener()
+        own = {"type": "llm.stream.chunk", ORIGIN_KEY: LOCAL_ORIGIN_ID}
+        remote = {"type": "llm.stream.chunk", ORIGIN_KEY: "another-pod"}
+
+        assert listener._is_local_echo(own) is True
+        assert listener._is_local_echo(remote) is False
+        assert remote == {"type": "llm.stream.chunk"}
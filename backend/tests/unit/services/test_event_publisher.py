@@ -1,5 +1,6 @@
 """Unit tests for EventPublisher."""
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -10,13 +11,30 @@ from sqlalchemy.exc import OperationalError
 from tarsy.models.db_models import Event
 from tarsy.models.event_models import (
     LLMInteractionEvent,
+    LLMStreamChunkEvent,
     MCPToolCallEvent,
     SessionCreatedEvent,
     SessionStartedEvent,
     StageStartedEvent,
 )
 from tarsy.repositories.event_repository import EventRepository
-from tarsy.services.events.publisher import EventPublisher, publish_event
+from tarsy.services.events.local_delivery import LOCAL_ORIGIN_ID, attach_local_listener
+from tarsy.services.events.notify_payloads import (
+    MAX_NOTIFY_PAYLOAD_BYTES,
+    configure_notify_shards,
+    notify_channel,
+)
+from tarsy.services.events.publisher import (
+    EventPublisher,
+    event_transaction,
+    publish_event,
+)
+
+
+def notify_payload(notify_sql: str) -> dict:
+    """Decode the payload of a NOTIFY statement built by EventPublisher."""
+    literal = notify_sql.split(", '", 1)[1].rsplit("'", 1)[0]
+    return json.loads(literal.replace("''", "'").replace("\\:", ":"))
 
 
 @pytest.mark.unit
@@ -556,3 +574,226 @@ class TestEventPublisherChannelHandling:
         call_args = mock_event_repo.create_event.call_args
         assert call_args[1]["channel"] == "session:sess-xyz"
 
+
+@pytest.mark.unit
+class TestEventPublisherOversizedPayloads:
+    """Test that oversized events never exceed the NOTIFY payload limit."""
+
+    @pytest.fixture
+    def mock_event_repo(self):
+        """Create a mock EventRepository on PostgreSQL."""
+        repo = Mock(spec=EventRepository)
+        repo.create_event = AsyncMock()
+        repo.session = Mock()
+        repo.session.bind = Mock()
+        repo.session.bind.dialect.name = "postgresql"
+        repo.session.execute = AsyncMock()
+        repo.session.commit = AsyncMock()
+        return repo
+
+    @pytest.fixture
+    def publisher(self, mock_event_repo):
+        """Create EventPublisher with mocked repository."""
+        return EventPublisher(mock_event_repo)
+
+    @pytest.mark.asyncio
+    async def test_large_persisted_event_notifies_reference(self, publisher, mock_event_repo):
+        """Test that a large persisted event is stored in full but NOTIFY carries only its ID."""
+        mock_event_repo.create_event.return_value = Event(
+            id=42, channel="sessions", payload={}, created_at=datetime.now(timezone.utc)
+        )
+        event = SessionCreatedEvent(session_id="sess-abc", alert_type="x" * 20000)
+
+        await publisher.publish("sessions", event)
+
+        assert mock_event_repo.create_event.call_args[1]["payload"]["alert_type"] == "x" * 20000
+        notify_sql = str(mock_event_repo.session.execute.call_args[0][0])
+        payload = notify_payload(notify_sql)
+        assert payload["spilled"] is True
+        assert payload["id"] == 42
+        assert len(notify_sql) < MAX_NOTIFY_PAYLOAD_BYTES
+        mock_event_repo.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sharded_notify_uses_shard_channel(self, publisher, mock_event_repo):
+        """Test that with sharding enabled NOTIFY goes to the channel's shard with routing info."""
+        mock_event_repo.create_event.return_value = Event(
+            id=5, channel="session:sess-abc", payload={}, created_at=datetime.now(timezone.utc)
+        )
+        configure_notify_shards(8)
+        try:
+            await publisher.publish("session:sess-abc", SessionStartedEvent(session_id="sess-abc", alert_type="t"))
+            shard = notify_channel("session:sess-abc")
+        finally:
+            configure_notify_shards(0)
+
+        notify_sql = str(mock_event_repo.session.execute.call_args[0][0])
+        assert f'NOTIFY "{shard}"' in notify_sql
+        assert notify_payload(notify_sql)["_channel"] == "session:sess-abc"
+
+    @pytest.mark.asyncio
+    async def test_large_transient_event_sent_in_parts(self, publisher, mock_event_repo):
+        """Test that a large transient event is split across NOTIFYs committed together."""
+        event = LLMStreamChunkEvent(
+            session_id="sess-abc", chunk="y" * 20000, stream_type="final_answer"
+        )
+
+        await publisher.publish_transient("session:sess-abc", event)
+
+        assert mock_event_repo.session.execute.await_count == 3
+        for call in mock_event_repo.session.execute.call_args_list:
+            assert len(str(call[0][0])) < MAX_NOTIFY_PAYLOAD_BYTES + 100
+            assert '"chunked"' in str(call[0][0])
+        mock_event_repo.session.commit.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestEventTransaction:
+    """Test publishing several events with one commit."""
+
+    @pytest.fixture
+    def mock_event_repo(self):
+        """Create a mock EventRepository on PostgreSQL with sequential event IDs."""
+        repo = Mock(spec=EventRepository)
+        ids = iter(range(1, 100))
+        repo.create_event = AsyncMock(
+            side_effect=lambda channel, payload: Event(
+                id=next(ids), channel=channel, payload=payload, created_at=datetime.now(timezone.utc)
+            )
+        )
+        repo.session = Mock()
+        repo.session.bind = Mock()
+        repo.session.bind.dialect.name = "postgresql"
+        repo.session.execute = AsyncMock()
+        repo.session.commit = AsyncMock()
+        repo.session.rollback = AsyncMock()
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_publish_many_commits_once(self, mock_event_repo):
+        """Test that all INSERTs and NOTIFYs share one commit."""
+        publisher = EventPublisher(mock_event_repo)
+        event = SessionStartedEvent(session_id="sess-1", alert_type="test")
+
+        event_ids = await publisher.publish_many([("sessions", event), ("session:sess-1", event)])
+
+        assert event_ids == [1, 2]
+        assert mock_event_repo.session.execute.await_count == 2
+        mock_event_repo.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nested_transaction_joins_outer(self, mock_event_repo):
+        """Test that publish_many inside event_transaction leaves the commit to the outer block."""
+        publisher = EventPublisher(mock_event_repo)
+        event = SessionStartedEvent(session_id="sess-1", alert_type="test")
+
+        async with event_transaction(mock_event_repo.session):
+            await publisher.publish_many([("sessions", event)])
+            await publisher.publish_transient("session:sess-1", event)
+            mock_event_repo.session.commit.assert_not_awaited()
+
+        mock_event_repo.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolled_back_on_error(self, mock_event_repo):
+        """Test that a failing NOTIFY rolls back the whole update."""
+        publisher = EventPublisher(mock_event_repo)
+        mock_event_repo.session.execute.side_effect = [None, OperationalError("NOTIFY", {}, Exception("boom"))]
+        event = SessionStartedEvent(session_id="sess-1", alert_type="test")
+
+        with pytest.raises(OperationalError):
+            await publisher.publish_many([("sessions", event), ("session:sess-1", event)])
+
+        mock_event_repo.session.commit.assert_not_awaited()
+        mock_event_repo.session.rollback.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestEventPublisherLocalDelivery:
+    """Test in-process delivery to this pod's subscribers."""
+
+    @pytest.fixture
+    def mock_event_repo(self):
+        """Create a mock EventRepository on PostgreSQL."""
+        repo = Mock(spec=EventRepository)
+        repo.create_event = AsyncMock(
+            return_value=Event(id=9, channel="sessions", payload={}, created_at=datetime.now(timezone.utc))
+        )
+        repo.session = Mock()
+        repo.session.bind = Mock()
+        repo.session.bind.dialect.name = "postgresql"
+        repo.session.execute = AsyncMock()
+        repo.session.commit = AsyncMock()
+        repo.session.rollback = AsyncMock()
+        return repo
+
+    @pytest.fixture
+    def local_listener(self):
+        """Attach a mock listener for local delivery."""
+        listener = Mock()
+        listener.dispatch_local = AsyncMock()
+        attach_local_listener(listener)
+        yield listener
+        attach_local_listener(None)
+
+    @pytest.mark.asyncio
+    async def test_persisted_event_delivered_after_commit(self, mock_event_repo, local_listener):
+        """Test that a published event reaches local subscribers with its ID and NOTIFY is tagged."""
+        publisher = EventPublisher(mock_event_repo)
+        local_listener.dispatch_local.side_effect = lambda *args: mock_event_repo.session.commit.assert_awaited_once()
+        local_listener.claim_local_event.side_effect = lambda *args: mock_event_repo.session.commit.assert_not_awaited()
+
+        await publisher.publish("sessions", SessionStartedEvent(session_id="sess-1", alert_type="test"))
+
+        local_listener.claim_local_event.assert_called_once_with(9)
+
+        channel, event = local_listener.dispatch_local.call_args[0]
+        assert channel == "sessions"
+        assert event["id"] == 9
+        assert event["session_id"] == "sess-1"
+        assert LOCAL_ORIGIN_ID in str(mock_event_repo.session.execute.call_args[0][0])
+
+    @pytest.mark.asyncio
+    async def test_transient_event_delivered_in_sqlite_mode(self, mock_event_repo, local_listener):
+        """Test that streaming chunks reach same-pod subscribers even without NOTIFY."""
+        mock_event_repo.session.bind.dialect.name = "sqlite"
+        publisher = EventPublisher(mock_event_repo)
+        event = LLMStreamChunkEvent(session_id="sess-1", chunk="Hello", stream_type="thought")
+
+        await publisher.publish_transient("session:sess-1", event)
+
+        channel, delivered = local_listener.dispatch_local.call_args[0]
+        assert channel == "session:sess-1"
+        assert delivered["chunk"] == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_transaction_delivers_after_commit_only(self, mock_event_repo, local_listener):
+        """Test that events published in a transaction are delivered after it commits, never on rollback."""
+        publisher = EventPublisher(mock_event_repo)
+        event = SessionStartedEvent(session_id="sess-1", alert_type="test")
+
+        async with event_transaction(mock_event_repo.session):
+            await publisher.publish("sessions", event)
+            local_listener.dispatch_local.assert_not_called()
+        local_listener.dispatch_local.assert_awaited_once()
+
+        local_listener.dispatch_local.reset_mock()
+        with pytest.raises(RuntimeError):
+            async with event_transaction(mock_event_repo.session):
+                await publisher.publish("sessions", event)
+                raise RuntimeError("boom")
+        local_listener.dispatch_local.assert_not_called()
+        local_listener.release_local_event.assert_called_once_with(9)
+
+    @pytest.mark.asyncio
+    async def test_claim_released_when_commit_fails(self, mock_event_repo, local_listener):
+        """Test that a claimed event is released if its commit fails."""
+        publisher = EventPublisher(mock_event_repo)
+        mock_event_repo.session.commit.side_effect = OperationalError("COMMIT", {}, Exception("boom"))
+
+        with pytest.raises(OperationalError):
+            await publisher.publish("sessions", SessionStartedEvent(session_id="sess-1", alert_type="test"))
+
+        local_listener.claim_local_event.assert_called_once_with(9)
+        local_listener.release_local_event.assert_called_once_with(9)
+        local_listener.dispatch_local.assert_not_called()
@@ -89,6 +89,80 @@ class TestExecutionConfigResolver:
         assert config.max_iterations == 25  # Chain overrides agent
         assert config.mcp_servers == ["chain-server"]  # Chain overrides agent
         assert config.llm_provider == "chain-provider"
+        assert config.interaction_models is None
+    
+    def test_resolve_config_with_chain_interaction_models(self, settings):
+        """Test that the chain's interaction-type model routing is passed to the agent."""
+        chain_config = ChainConfigModel(
+            chain_id="test-chain",
+            alert_types=["test"],
+            stages=[ChainStageConfigModel(name="dummy-stage", agent="TestAgent")],
+            interaction_models={"summarization": "cheap-model"}
+        )
+        
+        config = ExecutionConfigResolver.resolve_config(
+            system_settings=settings,
+            chain_config=chain_config
+        )
+        
+        assert config.interaction_models == {"summarization": "cheap-model"}
+    
+    @pytest.mark.parametrize(
+        "stage_provider,parallel_provider,expected",
+        [
+            ("chain-provider", None, {"summarization": "cheap-model"}),
+            ("other-provider", None, None),
+            (None, "other-provider", None),
+        ],
+    )
+    def test_resolve_config_interaction_models_only_for_chain_provider(
+        self, settings, stage_provider, parallel_provider, expected
+    ):
+        """Test that the chain's model names are not applied to another provider."""
+        stage_config = ChainStageConfigModel(
+            name="dummy-stage", agent="TestAgent", llm_provider=stage_provider
+        )
+        chain_config = ChainConfigModel(
+            chain_id="test-chain",
+            alert_types=["test"],
+            stages=[stage_config],
+            llm_provider="chain-provider",
+            interaction_models={"summarization": "cheap-model"}
+        )
+        parallel_agent_config = (
+            ParallelAgentConfig(name="TestAgent", llm_provider=parallel_provider)
+            if parallel_provider else None
+        )
+        
+        config = ExecutionConfigResolver.resolve_config(
+            system_settings=settings,
+            chain_config=chain_config,
+            stage_config=stage_config,
+            parallel_agent_config=parallel_agent_config,
+        )
+        
+        assert config.interaction_models == expected
+    
+    def test_resolve_config_with_agent_token_budget(self, settings):
+        """Test that the agent's token budget is passed on and the chain's is not."""
+        agent_config = AgentConfigModel(
+            mcp_servers=["agent-server"],
+            token_budget=200000
+        )
+        chain_config = ChainConfigModel(
+            chain_id="test-chain",
+            alert_types=["test"],
+            stages=[ChainStageConfigModel(name="dummy-stage", agent="TestAgent")],
+            token_budget=1000000
+        )
+        
+        config = ExecutionConfigResolver.resolve_config(
+            system_settings=settings,
+            agent_config=agent_config,
+            chain_config=chain_config
+        )
+        
+        assert config.token_budget == 200000
     
     def test_resolve_config_with_stage_level_overrides(self, settings):
         """Test resolution with stage-level overrides."""
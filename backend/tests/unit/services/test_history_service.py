@@ -6,6 +6,7 @@ MCP communication tracking, and timeline reconstruction with graceful
 degradation when database operations fail.
 """
 
+from concurrent.futures import Future
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -248,21 +249,19 @@ class TestHistoryService:
             created_session = call_args[0][0]  # First positional argument
             assert created_session.mcp_selection == expected_serialized
     
-    @pytest.mark.parametrize("status,error_message,final_analysis,existing_analysis,expected_status,expected_analysis,expected_completion", [
-        ("completed", None, None, None, "completed", None, True),  # Basic completion
-        ("completed", None, "# Alert Analysis\n\nSuccessfully resolved the Kubernetes issue.", None, 
-         "completed", "# Alert Analysis\n\nSuccessfully resolved the Kubernetes issue.", True),  # With final analysis
-        ("in_progress", None, None, "Existing analysis", "in_progress", "Existing analysis", False),  # Preserve existing analysis
+    @pytest.mark.parametrize("status,error_message,final_analysis,expected_analysis,expected_completion", [
+        ("completed", None, None, None, True),  # Basic completion
+        ("completed", None, "# Alert Analysis\n\nSuccessfully resolved the Kubernetes issue.",
+         "# Alert Analysis\n\nSuccessfully resolved the Kubernetes issue.", True),  # With final analysis
+        ("in_progress", None, None, None, False),  # Existing analysis is not overwritten
     ])
     @pytest.mark.unit
-    def test_update_session_status_scenarios(self, history_service, status, error_message, final_analysis, existing_analysis, expected_status, expected_analysis, expected_completion):
+    def test_update_session_status_scenarios(self, history_service, status, error_message, final_analysis, expected_analysis, expected_completion):
         """Test session status update for various scenarios."""
         dependencies = MockFactory.create_mock_history_service_dependencies()
-        mock_session = SessionFactory.create_test_session(
-            status=status,
-            final_analysis=existing_analysis
+        dependencies['repository'].transition_alert_session.return_value = SessionFactory.create_test_session(
+            status=status
         )
-        dependencies['repository'].get_alert_session.return_value = mock_session
         
         with patch.object(history_service._infra, 'get_repository') as mock_get_repo:
             mock_get_repo.return_value.__enter__.return_value = dependencies['repository']
@@ -276,12 +275,36 @@ class TestHistoryService:
             )
             
             assert result == True
-            assert mock_session.status == expected_status
+            # Single UPDATE without a status guard; no read-modify-write
+            session_id, from_statuses, values = dependencies['repository'].transition_alert_session.call_args.args
+            assert session_id == "test-session-id"
+            assert from_statuses is None
+            assert values["status"] == status
             if expected_analysis:
-                assert mock_session.final_analysis == expected_analysis
-            if expected_completion:
-                assert mock_session.completed_at_us is not None
-            dependencies['repository'].update_alert_session.assert_called_once_with(mock_session)
+                assert values["final_analysis"] == expected_analysis
+            else:
+                assert "final_analysis" not in values
+            assert ("completed_at_us" in values) == expected_completion
+            dependencies['repository'].get_alert_session.assert_not_called()
+    
+    @pytest.mark.unit
+    def test_transition_session_status_guard_miss(self, history_service):
+        """Test that a guarded transition reports False when the session moved on."""
+        dependencies = MockFactory.create_mock_history_service_dependencies()
+        dependencies['repository'].transition_alert_session.return_value = None
+        
+        with patch.object(history_service._infra, 'get_repository') as mock_get_repo:
+            mock_get_repo.return_value.__enter__.return_value = dependencies['repository']
+            mock_get_repo.return_value.__exit__.return_value = None
+            
+            result = history_service.transition_session_status(
+                session_id="test-session-id",
+                from_statuses=["paused"],
+                status="in_progress"
+            )
+            
+            assert result is False
+            assert dependencies['repository'].transition_alert_session.call_args.args[1] == ["paused"]
     
     @pytest.mark.parametrize("interaction_type,interaction_data", [
         ("llm", {
@@ -1431,6 +1454,104 @@ class TestHistoryServiceRetryLogicDuplicatePrevention:
         assert len(none_warnings) >= 3, "Should log warnings for each retry when None is treated as failure" 
 
 
+@pytest.mark.unit
+class TestHistoryServiceSQLiteSingleWriter:
+    """Test routing of write operations through the SQLite single-writer queue."""
+    
+    @pytest.fixture
+    def history_service(self):
+        """Create HistoryService instance with a mocked write queue."""
+        with patch('tarsy.services.history_service.base_infrastructure.get_settings') as mock_settings:
+            mock_settings.return_value.database_url = "sqlite:///test.db"
+            
+            service = HistoryService()
+            service._infra._set_healthy_for_testing()
+            write_queue = Mock()
+            write_queue.submit.side_effect = lambda func: _completed_future(func())
+            service._infra.write_queue = write_queue
+            return service
+    
+    def test_uses_write_queue_only_for_writes(self, history_service):
+        """Test that reads bypass the writer and everything else is serialized."""
+        infra = history_service._infra
+        
+        assert infra._uses_write_queue("update_session_status") is True
+        assert infra._uses_write_queue("claim_next_pending_session") is True
+        assert infra._uses_write_queue("get_session_details") is False
+        assert infra._uses_write_queue("has_llm_interactions") is False
+        assert infra._uses_write_queue("test_database_connection") is False
+        
+        infra.write_queue = None
+        assert infra._uses_write_queue("update_session_status") is False
+    
+    def test_sync_retry_routes_writes_through_queue(self, history_service):
+        """Test that sync write operations run on the writer."""
+        result = history_service._infra._retry_database_operation("store_llm_interaction", lambda: True)
+        
+        assert result is True
+        history_service._infra.write_queue.submit.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_async_retry_routes_writes_through_queue(self, history_service):
+        """Test that async write operations run on the writer and reads do not."""
+        infra = history_service._infra
+        
+        assert await infra._retry_database_operation_async("update_stage_execution", lambda: True) is True
+        assert await infra._retry_database_operation_async("get_stage_execution", lambda: "stage") == "stage"
+        
+        infra.write_queue.submit.assert_called_once()
+    
+    def test_retry_when_writer_batch_fails(self, history_service):
+        """Test that a failed batch commit is retried like any transient error."""
+        infra = history_service._infra
+        infra.base_delay = 0
+        infra.write_queue.submit.side_effect = [
+            _failed_future(Exception("database is locked")),
+            _completed_future(True),
+        ]
+        
+        assert infra._retry_database_operation("update_session_status", lambda: True) is True
+        assert infra.write_queue.submit.call_count == 2
+    
+    def test_writer_not_started_for_in_memory_database(self, isolated_test_settings):
+        """Test that single-writer mode is ignored for in-memory SQLite."""
+        isolated_test_settings.sqlite_single_writer = True
+        with patch('tarsy.services.history_service.base_infrastructure.get_settings', return_value=isolated_test_settings), \
+             patch('tarsy.services.history_service.base_infrastructure.DatabaseManager'), \
+             patch('tarsy.services.history_service.base_infrastructure.SQLiteWriteQueue') as mock_queue_class:
+            service = HistoryService()
+            
+            assert service.initialize() is True
+            assert service._infra.write_queue is None
+            mock_queue_class.assert_not_called()
+    
+    def test_shutdown_stops_writer(self, history_service):
+        """Test that shutdown flushes the writer and closes connections."""
+        write_queue = history_service._infra.write_queue
+        db_manager = Mock()
+        history_service._infra.db_manager = db_manager
+        
+        history_service.shutdown()
+        
+        write_queue.stop.assert_called_once()
+        db_manager.close.assert_called_once()
+        assert history_service._infra.write_queue is None
+
+
+def _completed_future(result):
+    """Create a future resolved with result."""
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def _failed_future(error):
+    """Create a future failed with error."""
+    future = Future()
+    future.set_exception(error)
+    return future
+
+
 @pytest.mark.unit
 class TestHistoryServicePostgreSQLRetryLogic:
     """Test HistoryService retry logic for PostgreSQL-specific error patterns."""
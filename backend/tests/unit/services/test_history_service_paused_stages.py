@@ -4,7 +4,7 @@ Unit tests for HistoryService paused stages methods.
 Tests get_paused_stages() and cancel_all_paused_stages() methods.
 """
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -273,75 +273,29 @@ class TestCancelAllPausedStages:
             return service
 
     @pytest.mark.asyncio
-    async def test_cancel_all_paused_stages_updates_status_to_cancelled(
+    async def test_cancel_all_paused_stages_uses_single_bulk_update(
         self, history_service: HistoryService
     ) -> None:
-        """Test that cancel_all_paused_stages updates status to CANCELLED."""
+        """Test that cancel_all_paused_stages cancels all paused stages in one repository call."""
         session_id = "test-session-123"
         
-        paused_stage = create_mock_stage_execution(
+        cancelled_stage = create_mock_stage_execution(
             execution_id="paused-1",
             session_id=session_id,
-            status=StageStatus.PAUSED.value
+            status=StageStatus.CANCELLED.value
         )
+        mock_repo = Mock()
+        mock_repo.cancel_paused_stage_executions.return_value = [cancelled_stage]
         
-        # Mock get_paused_stages to return our paused stage
-        history_service._stages.get_paused_stages = AsyncMock(return_value=[paused_stage])
-        history_service._stages.update_stage_execution = AsyncMock()
-        
-        count = await history_service.cancel_all_paused_stages(session_id)
+        with patch.object(history_service._infra, 'get_repository') as mock_get_repo:
+            mock_get_repo.return_value.__enter__.return_value = mock_repo
+            
+            count = await history_service.cancel_all_paused_stages(session_id)
         
         assert count == 1
-        assert paused_stage.status == StageStatus.CANCELLED.value
-        assert paused_stage.error_message == "Cancelled by user"
-        history_service._stages.update_stage_execution.assert_called_once_with(paused_stage)
-
-    @pytest.mark.asyncio
-    async def test_cancel_all_paused_stages_uses_paused_at_us_for_completed_at(
-        self, history_service: HistoryService
-    ) -> None:
-        """Test that cancel_all_paused_stages uses paused_at_us as completed_at_us."""
-        session_id = "test-session-123"
-        paused_timestamp = now_us() - 10000000  # 10 seconds ago
-        
-        paused_stage = create_mock_stage_execution(
-            execution_id="paused-1",
-            session_id=session_id,
-            status=StageStatus.PAUSED.value,
-            paused_at_us=paused_timestamp
-        )
-        
-        history_service._stages.get_paused_stages = AsyncMock(return_value=[paused_stage])
-        history_service._stages.update_stage_execution = AsyncMock()
-        
-        await history_service.cancel_all_paused_stages(session_id)
-        
-        assert paused_stage.completed_at_us == paused_timestamp
-
-    @pytest.mark.asyncio
-    async def test_cancel_all_paused_stages_calculates_duration(
-        self, history_service: HistoryService
-    ) -> None:
-        """Test that cancel_all_paused_stages calculates duration correctly."""
-        session_id = "test-session-123"
-        started_at = now_us() - 5000000  # 5 seconds ago
-        paused_at = now_us() - 1000000   # 1 second ago
-        expected_duration_ms = (paused_at - started_at) // 1000
-        
-        paused_stage = create_mock_stage_execution(
-            execution_id="paused-1",
-            session_id=session_id,
-            status=StageStatus.PAUSED.value,
-            started_at_us=started_at,
-            paused_at_us=paused_at
-        )
-        
-        history_service._stages.get_paused_stages = AsyncMock(return_value=[paused_stage])
-        history_service._stages.update_stage_execution = AsyncMock()
-        
-        await history_service.cancel_all_paused_stages(session_id)
-        
-        assert paused_stage.duration_ms == expected_duration_ms
+        mock_repo.cancel_paused_stage_executions.assert_called_once_with(session_id, "Cancelled by user")
+        # No per-stage read-modify-write
+        mock_repo.update_stage_execution.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_cancel_all_paused_stages_returns_count(
@@ -350,60 +304,35 @@ class TestCancelAllPausedStages:
         """Test that cancel_all_paused_stages returns correct count."""
         session_id = "test-session-123"
         
-        paused_stages = [
+        cancelled_stages = [
             create_mock_stage_execution(
                 execution_id=f"paused-{i}",
                 session_id=session_id,
-                status=StageStatus.PAUSED.value
+                status=StageStatus.CANCELLED.value
             )
             for i in range(3)
         ]
+        mock_repo = Mock()
+        mock_repo.cancel_paused_stage_executions.return_value = cancelled_stages
         
-        history_service._stages.get_paused_stages = AsyncMock(return_value=paused_stages)
-        history_service._stages.update_stage_execution = AsyncMock()
-        
-        count = await history_service.cancel_all_paused_stages(session_id)
+        with patch.object(history_service._infra, 'get_repository') as mock_get_repo:
+            mock_get_repo.return_value.__enter__.return_value = mock_repo
+            
+            count = await history_service.cancel_all_paused_stages(session_id)
         
         assert count == 3
-        assert history_service._stages.update_stage_execution.call_count == 3
 
     @pytest.mark.asyncio
     async def test_cancel_all_paused_stages_returns_zero_when_no_paused(
         self, history_service: HistoryService
     ) -> None:
         """Test that cancel_all_paused_stages returns 0 when no paused stages."""
-        session_id = "test-session-123"
-        
-        history_service._stages.get_paused_stages = AsyncMock(return_value=[])
-        history_service._stages.update_stage_execution = AsyncMock()
+        mock_repo = Mock()
+        mock_repo.cancel_paused_stage_executions.return_value = []
         
-        count = await history_service.cancel_all_paused_stages(session_id)
+        with patch.object(history_service._infra, 'get_repository') as mock_get_repo:
+            mock_get_repo.return_value.__enter__.return_value = mock_repo
+            
+            count = await history_service.cancel_all_paused_stages("test-session-123")
         
         assert count == 0
-        history_service._stages.update_stage_execution.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_cancel_all_paused_stages_fallback_when_paused_at_us_is_none(
-        self, history_service: HistoryService
-    ) -> None:
-        """Test that cancel_all_paused_stages uses current time when paused_at_us is None."""
-        session_id = "test-session-123"
-        
-        paused_stage = create_mock_stage_execution(
-            execution_id="paused-1",
-            session_id=session_id,
-            status=StageStatus.PAUSED.value,
-        )
-        paused_stage.paused_at_us = None  # Explicitly set to None
-        
-        history_service._stages.get_paused_stages = AsyncMock(return_value=[paused_stage])
-        history_service._stages.update_stage_execution = AsyncMock()
-        
-        before_cancel = now_us()
-        await history_service.cancel_all_paused_stages(session_id)
-        after_cancel = now_us()
-        
-        # Should use a recent timestamp as fallback
-        assert paused_stage.completed_at_us is not None
-        assert before_cancel <= paused_stage.completed_at_us <= after_cancel
-
@@ -0,0 +1,128 @@
+"""
+Unit tests for NOTIFY payload encoding.
+
+Tests that payloads stay under PostgreSQL's NOTIFY limit and that chunked
+transient events are reassembled exactly.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tarsy.services.events.codec import dumps
+from tarsy.services.events.notify_payloads import (
+    MAX_NOTIFY_PAYLOAD_BYTES,
+    ROUTING_KEY,
+    NotifyChunkAssembler,
+    build_persisted_notify_payload,
+    build_transient_notify_payloads,
+    configure_notify_shards,
+    is_chunk,
+    is_spilled,
+    notify_channel,
+    notify_shard_channels,
+)
+
+
+@pytest.fixture
+def sharded_notify():
+    """Enable NOTIFY sharding for one test."""
+    configure_notify_shards(4)
+    yield
+    configure_notify_shards(0)
+
+
+@pytest.mark.unit
+class TestPersistedNotifyPayload:
+    """Test encoding of persisted events."""
+
+    def test_small_event_embedded_with_id(self):
+        """Test that small events are sent in full with their ID."""
+        payload = json.loads(
+            build_persisted_notify_payload("sessions", {"type": "session.created", "session_id": "s-1"}, 7)
+        )
+
+        assert payload == {"type": "session.created", "session_id": "s-1", "id": 7}
+        assert not is_spilled(payload)
+
+    def test_large_event_spilled(self):
+        """Test that large events are replaced by a reference to the stored row."""
+        payload_json = build_persisted_notify_payload(
+            "session:s-1", {"type": "llm.interaction", "data": "x" * 10000}, 99
+        )
+        payload = json.loads(payload_json)
+
+        assert payload == {"id": 99, "channel": "session:s-1", "type": "llm.interaction", "spilled": True}
+        assert is_spilled(payload)
+
+
+@pytest.mark.unit
+class TestTransientNotifyPayloads:
+    """Test chunking and reassembly of transient events."""
+
+    def test_small_event_single_payload(self):
+        """Test that small events are sent unchanged."""
+        event = {"type": "llm.stream.chunk", "chunk": "hello"}
+
+        assert build_transient_notify_payloads("session:s-1", event) == [dumps(event)]
+
+    @pytest.mark.parametrize("text", ["a" * 30000, "ünïcødé 🚀 'quoted' \"text\"\n" * 800])
+    def test_large_event_round_trip(self, text):
+        """Test that every part fits the limit and the parts reassemble to the event."""
+        event = {"type": "llm.stream.chunk", "chunk": text}
+
+        payloads = build_transient_notify_payloads("session:s-1", event)
+
+        assert len(payloads) > 1
+        assert all(len(p.encode("utf-8")) <= MAX_NOTIFY_PAYLOAD_BYTES for p in payloads)
+
+        assembler = NotifyChunkAssembler()
+        results = [assembler.add(json.loads(p)) for p in payloads]
+        assert all(is_chunk(json.loads(p)) for p in payloads)
+        assert results[:-1] == [None] * (len(payloads) - 1)
+        assert results[-1] == event
+        assert assembler.pending == 0
+
+    def test_incomplete_events_expire(self):
+        """Test that parts of an event that never completes are eventually discarded."""
+        payloads = build_transient_notify_payloads("session:s-1", {"chunk": "z" * 20000})
+        assembler = NotifyChunkAssembler(timeout_seconds=10)
+
+        with patch("tarsy.services.events.notify_payloads.time.monotonic", return_value=100.0):
+            assembler.add(json.loads(payloads[0]))
+        assert assembler.pending == 1
+
+        other = build_transient_notify_payloads("session:s-1", {"chunk": "w" * 20000})
+        with patch("tarsy.services.events.notify_payloads.time.monotonic", return_value=200.0):
+            assembler.add(json.loads(other[0]))
+        assert assembler.pending == 1
+
+
+@pytest.mark.unit
+class TestNotifySharding:
+    """Test physical channel selection and routing keys."""
+
+    def test_unsharded_uses_logical_channel(self):
+        """Test that without sharding events NOTIFY on their own channel, unchanged."""
+        assert notify_channel("session:abc") == "session:abc"
+        assert notify_shard_channels() == []
+        assert ROUTING_KEY not in json.loads(build_persisted_notify_payload("sessions", {"type": "t"}, 1))
+
+    def test_sharded_channel_is_stable_and_bounded(self, sharded_notify):
+        """Test that a logical channel always maps to the same one of the shard channels."""
+        shards = notify_shard_channels()
+
+        assert len(shards) == 4
+        for i in range(50):
+            assert notify_channel(f"session:{i}") in shards
+        assert notify_channel("session:abc") == notify_channel("session:abc")
+
+    def test_sharded_payloads_carry_logical_channel(self, sharded_notify):
+        """Test that every payload, including chunk parts, carries the logical channel."""
+        persisted = json.loads(build_persisted_notify_payload("session:abc", {"type": "t"}, 1))
+        parts = [json.loads(p) for p in build_transient_notify_payloads("session:abc", {"chunk": "q" * 20000})]
+
+        assert persisted[ROUTING_KEY] == "session:abc"
+        assert all(part[ROUTING_KEY] == "session:abc" for part in parts)
+        assert NotifyChunkAssembler().add(parts[0]) is None
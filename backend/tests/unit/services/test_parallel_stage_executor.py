@@ -324,6 +324,7 @@ class TestExecutionConfigGeneration:
         
         chain_def = SimpleNamespace(
             llm_provider="default-provider",
+            interaction_models=None,
             max_iterations=None,
             force_conclusion_at_max_iterations=None,
             mcp_servers=None
@@ -420,6 +421,7 @@ class TestExecutionConfigGeneration:
         
         chain_def = SimpleNamespace(
             llm_provider=None,
+            interaction_models=None,
             max_iterations=None,
             force_conclusion_at_max_iterations=None,
             mcp_servers=None
@@ -518,6 +520,7 @@ class TestSynthesisParallelResultsCancellationHandling:
 
         chain_def = SimpleNamespace(
             llm_provider="openai",
+            interaction_models=None,
             max_iterations=None,
             force_conclusion_at_max_iterations=None,
             mcp_servers=None
@@ -612,6 +615,7 @@ class TestSynthesisParallelResultsCancellationHandling:
 
         chain_def = SimpleNamespace(
             llm_provider="openai",
+            interaction_models=None,
             max_iterations=None,
             force_conclusion_at_max_iterations=None,
             mcp_servers=None
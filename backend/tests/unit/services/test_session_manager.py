@@ -262,6 +262,57 @@ class TestUpdateSessionStatus:
             )
 
 
+@pytest.mark.unit
+class TestTransitionSessionStatus:
+    """Test guarded session status transitions."""
+
+    def test_transition_session_status_applied(self):
+        """Test that the guard statuses are passed through to the history service."""
+        history_service = Mock()
+        history_service.transition_session_status = Mock(return_value=True)
+
+        manager = SessionManager(history_service=history_service)
+
+        result = manager.transition_session_status(
+            "session-1",
+            [AlertSessionStatus.PAUSED.value],
+            AlertSessionStatus.IN_PROGRESS.value
+        )
+
+        assert result is True
+        history_service.transition_session_status.assert_called_once_with(
+            session_id="session-1",
+            from_statuses=[AlertSessionStatus.PAUSED.value],
+            status=AlertSessionStatus.IN_PROGRESS.value,
+            error_message=None
+        )
+
+    def test_transition_session_status_guard_missed(self):
+        """Test that a missed guard is reported as False."""
+        history_service = Mock()
+        history_service.transition_session_status = Mock(return_value=False)
+
+        manager = SessionManager(history_service=history_service)
+
+        assert manager.transition_session_status(
+            "session-1",
+            [AlertSessionStatus.PAUSED.value],
+            AlertSessionStatus.FAILED.value,
+            error_message="Stage failed"
+        ) is False
+
+    def test_transition_session_status_no_session_id(self):
+        """Test that transition is skipped when session_id is None."""
+        history_service = Mock()
+
+        manager = SessionManager(history_service=history_service)
+
+        assert manager.transition_session_status(
+            None, [AlertSessionStatus.PAUSED.value], AlertSessionStatus.IN_PROGRESS.value
+        ) is False
+        history_service.transition_session_status.assert_not_called()
+
+
 @pytest.mark.unit
 class TestUpdateSessionError:
     """Test session error handling."""
@@ -8,8 +8,12 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from tarsy.models.db_models import Event
+from tarsy.models.event_models import SessionStartedEvent
+from tarsy.services.events.local_delivery import attach_local_listener
+from tarsy.services.events.publisher import publish_event
 from tarsy.services.events.sqlite_listener import SQLiteEventListener
 
 
@@ -93,6 +97,31 @@ class TestSQLiteEventListenerLifecycle:
                 assert listener.polling_task.done()
                 mock_engine.dispose.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_start_uses_pool_manager_listening_engine(self):
+        """Test that polling uses the pool manager's listening pool, which it must not dispose."""
+        from tarsy.database.pool_manager import PoolPurpose
+
+        database_url = "sqlite:///test.db"
+        listener = SQLiteEventListener(database_url, poll_interval=10.0)
+
+        mock_engine = AsyncMock()
+        pool_manager = Mock()
+        pool_manager.get_async_engine.return_value = mock_engine
+
+        with patch(
+            "tarsy.services.events.sqlite_listener.get_pool_manager",
+            return_value=pool_manager,
+        ), patch("tarsy.services.events.sqlite_listener.create_async_engine") as mock_create:
+            with patch.object(listener, "_poll_loop", new_callable=AsyncMock):
+                await listener.start()
+                await listener.stop()
+
+        assert listener.engine is mock_engine
+        pool_manager.get_async_engine.assert_called_once_with(PoolPurpose.EVENT_LISTENING)
+        mock_create.assert_not_called()
+        mock_engine.dispose.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_stop_when_not_running(self):
         """Test that stop() when not running does nothing."""
@@ -228,7 +257,7 @@ class TestSQLiteEventListenerPolling:
                 listener.running = False
 
         with patch.object(listener, "_poll_events", side_effect=mock_poll):
-            with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(listener, "_wait_for_next_poll", new_callable=AsyncMock):
                 listener.running = True
                 await listener._poll_loop()
 
@@ -264,7 +293,8 @@ class TestSQLiteEventListenerPolling:
                 raise Exception("Test error")
             listener.running = False
 
-        with patch.object(listener, "_poll_events", side_effect=mock_poll):
+        with patch.object(listener, "_poll_events", side_effect=mock_poll), \
+             patch.object(listener, "_wait_for_next_poll", new_callable=AsyncMock):
             with patch("asyncio.sleep", new_callable=AsyncMock):
                 listener.running = True
                 await listener._poll_loop()
@@ -274,7 +304,7 @@ class TestSQLiteEventListenerPolling:
 
     @pytest.mark.asyncio
     async def test_poll_events_queries_all_channels(self):
-        """Test that _poll_events queries all channels."""
+        """Test that _poll_events queries all channels with one query from the lowest watermark."""
         database_url = "sqlite+aiosqlite:///test.db"
         listener = SQLiteEventListener(database_url)
 
@@ -288,15 +318,19 @@ class TestSQLiteEventListenerPolling:
         mock_engine.begin = MagicMock(return_value=mock_conn)
         listener.engine = mock_engine
 
+        listener.last_event_id["channel2"] = 15
+
         mock_repo = Mock()
-        mock_repo.get_events_after = AsyncMock(return_value=[])
+        mock_repo.get_events_after_for_channels = AsyncMock(return_value=[])
 
         with patch("tarsy.services.events.sqlite_listener.AsyncSession"):
             with patch("tarsy.repositories.event_repository.EventRepository", return_value=mock_repo):
                 await listener._poll_events()
 
-                # Should have queried both channels
-                assert mock_repo.get_events_after.call_count == 2
+                # Should have queried both channels at once
+                mock_repo.get_events_after_for_channels.assert_awaited_once_with(
+                    channels=["channel1", "channel2"], after_id=0, limit=listener.batch_size
+                )
 
     @pytest.mark.asyncio
     async def test_poll_events_updates_last_event_id(self):
@@ -309,10 +343,12 @@ class TestSQLiteEventListenerPolling:
         # Create mock events
         mock_event1 = Mock(spec=Event)
         mock_event1.id = 10
+        mock_event1.channel = "test_channel"
         mock_event1.payload = {"type": "test"}
 
         mock_event2 = Mock(spec=Event)
         mock_event2.id = 20
+        mock_event2.channel = "test_channel"
         mock_event2.payload = {"type": "test"}
 
         mock_conn = AsyncMock()
@@ -321,7 +357,7 @@ class TestSQLiteEventListenerPolling:
         listener.engine = mock_engine
 
         mock_repo = Mock()
-        mock_repo.get_events_after = AsyncMock(return_value=[mock_event1, mock_event2])
+        mock_repo.get_events_after_for_channels = AsyncMock(return_value=[mock_event1, mock_event2])
 
         with patch("tarsy.services.events.sqlite_listener.AsyncSession"):
             with patch("tarsy.repositories.event_repository.EventRepository", return_value=mock_repo):
@@ -332,8 +368,47 @@ class TestSQLiteEventListenerPolling:
                     assert listener.last_event_id["test_channel"] == 20
 
     @pytest.mark.asyncio
-    async def test_poll_events_handles_channel_errors(self):
-        """Test that _poll_events handles errors on individual channels."""
+    async def test_poll_events_skips_locally_delivered_events(self):
+        """Test that events already dispatched in-process are not dispatched again."""
+        database_url = "sqlite+aiosqlite:///test.db"
+        listener = SQLiteEventListener(database_url)
+
+        callback = AsyncMock()
+        await listener.subscribe("test_channel", callback)
+        listener.claim_local_event(10)
+        await listener.dispatch_local("test_channel", {"type": "test", "id": 10})
+        await asyncio.sleep(0.01)
+        callback.reset_mock()
+
+        mock_event1 = Mock(spec=Event)
+        mock_event1.id = 10
+        mock_event1.channel = "test_channel"
+        mock_event1.payload = {"type": "test"}
+
+        mock_event2 = Mock(spec=Event)
+        mock_event2.id = 11
+        mock_event2.channel = "test_channel"
+        mock_event2.payload = {"type": "remote"}
+
+        mock_conn = AsyncMock()
+        mock_engine = AsyncMock()
+        mock_engine.begin = MagicMock(return_value=mock_conn)
+        listener.engine = mock_engine
+
+        mock_repo = Mock()
+        mock_repo.get_events_after_for_channels = AsyncMock(return_value=[mock_event1, mock_event2])
+
+        with patch("tarsy.services.events.sqlite_listener.AsyncSession"):
+            with patch("tarsy.repositories.event_repository.EventRepository", return_value=mock_repo):
+                await listener._poll_events()
+        await asyncio.sleep(0.01)
+
+        callback.assert_called_once_with({"type": "remote", "id": 11})
+        assert listener.last_event_id["test_channel"] == 11
+
+    @pytest.mark.asyncio
+    async def test_poll_events_handles_query_errors(self):
+        """Test that _poll_events handles query errors."""
         database_url = "sqlite+aiosqlite:///test.db"
         listener = SQLiteEventListener(database_url)
 
@@ -345,12 +420,95 @@ class TestSQLiteEventListenerPolling:
         listener.engine = mock_engine
 
         mock_repo = Mock()
-        mock_repo.get_events_after = AsyncMock(side_effect=Exception("Query error"))
+        mock_repo.get_events_after_for_channels = AsyncMock(side_effect=Exception("Query error"))
 
         with patch("tarsy.services.events.sqlite_listener.AsyncSession"):
             with patch("tarsy.repositories.event_repository.EventRepository", return_value=mock_repo):
                 # Should not raise
-                await listener._poll_events()
+                assert await listener._poll_events() == 0
+
+    @pytest.mark.asyncio
+    async def test_poll_events_demultiplexes_by_channel(self):
+        """Test that one batch is routed per channel and every watermark advances."""
+        database_url = "sqlite+aiosqlite:///test.db"
+        listener = SQLiteEventListener(database_url)
+
+        callback1 = AsyncMock()
+        callback2 = AsyncMock()
+        await listener.subscribe("channel1", callback1)
+        await listener.subscribe("channel2", callback2)
+        await listener.subscribe("channel3", AsyncMock())
+        listener.last_event_id["channel2"] = 12
+
+        events = []
+        for event_id, channel in [(11, "channel1"), (12, "channel2"), (13, "channel2")]:
+            event = Mock(spec=Event)
+            event.id = event_id
+            event.channel = channel
+            event.payload = {"type": "test"}
+            events.append(event)
+
+        mock_conn = AsyncMock()
+        mock_engine = AsyncMock()
+        mock_engine.begin = MagicMock(return_value=mock_conn)
+        listener.engine = mock_engine
+
+        mock_repo = Mock()
+        mock_repo.get_events_after_for_channels = AsyncMock(return_value=events)
+
+        with patch("tarsy.services.events.sqlite_listener.AsyncSession"):
+            with patch("tarsy.repositories.event_repository.EventRepository", return_value=mock_repo):
+                assert await listener._poll_events() == 3
+        await asyncio.sleep(0.01)
+
+        callback1.assert_called_once_with({"type": "test", "id": 11})
+        # Event 12 was at channel2's watermark already
+        callback2.assert_called_once_with({"type": "test", "id": 13})
+        assert listener.last_event_id == {"channel1": 13, "channel2": 13, "channel3": 13}
+
+    @pytest.mark.asyncio
+    async def test_poll_events_skips_query_without_subscribers(self):
+        """Test that nothing is queried while no channel has subscribers."""
+        database_url = "sqlite+aiosqlite:///test.db"
+        listener = SQLiteEventListener(database_url)
+        mock_engine = AsyncMock()
+        listener.engine = mock_engine
+
+        assert await listener._poll_events() == 0
+        mock_engine.begin.assert_not_called()
+
+    def test_poll_interval_adapts_to_activity(self):
+        """Test that polling backs off while idle and tightens when events flow."""
+        database_url = "sqlite+aiosqlite:///test.db"
+        listener = SQLiteEventListener(database_url, poll_interval=0.5, max_poll_interval=2.0, batch_size=10)
+
+        listener._adapt_poll_interval(0)
+        assert listener.current_poll_interval == 1.0
+        listener._adapt_poll_interval(0)
+        listener._adapt_poll_interval(0)
+        assert listener.current_poll_interval == 2.0
+
+        listener._adapt_poll_interval(3)
+        assert listener.current_poll_interval == 0.5
+
+        listener._adapt_poll_interval(10)
+        assert listener.current_poll_interval == 0
+        listener._adapt_poll_interval(0)
+        assert listener.current_poll_interval == 1.0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_wakes_backed_off_poller(self):
+        """Test that a new subscription ends an idle back-off right away."""
+        database_url = "sqlite+aiosqlite:///test.db"
+        listener = SQLiteEventListener(database_url, poll_interval=0.1, max_poll_interval=30.0)
+        listener.current_poll_interval = 30.0
+
+        waiter = asyncio.create_task(listener._wait_for_next_poll())
+        await asyncio.sleep(0)
+        await listener.subscribe("sessions", AsyncMock())
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert listener.current_poll_interval == 0.1
 
 
 @pytest.mark.unit
@@ -441,3 +599,43 @@ class TestSQLiteEventListenerEdgeCases:
 
         # Should handle large IDs without issues
         assert listener.last_event_id["test"] == 9999999999
+
+
+@pytest.mark.unit
+class TestSQLiteEventListenerLocalDelivery:
+    """Test the poller against events published and delivered by this process."""
+
+    @pytest.mark.asyncio
+    async def test_poll_racing_publish_does_not_duplicate_event(self, tmp_path):
+        """Test that a poll between the publish commit and the local dispatch skips the event."""
+        database_url = f"sqlite+aiosqlite:///{tmp_path / 'events.db'}"
+        listener = SQLiteEventListener(database_url)
+        listener.engine = create_async_engine(database_url)
+        async with listener.engine.begin() as conn:
+            await conn.run_sync(Event.__table__.create)
+
+        callback = AsyncMock()
+        await listener.subscribe("sessions", callback)
+        attach_local_listener(listener)
+        try:
+            async with AsyncSession(listener.engine, expire_on_commit=False) as session:
+                commit = session.commit
+
+                async def commit_then_poll():
+                    await commit()
+                    # The poller sees the committed event before the publisher dispatches it
+                    assert await listener._poll_events() == 1
+
+                session.commit = commit_then_poll
+                event_id = await publish_event(
+                    session, "sessions", SessionStartedEvent(session_id="sess-1", alert_type="test")
+                )
+            await asyncio.sleep(0.01)
+        finally:
+            attach_local_listener(None)
+            await listener.engine.dispose()
+
+        callback.assert_called_once()
+        assert callback.call_args[0][0]["id"] == event_id
+        assert callback.call_args[0][0]["session_id"] == "sess-1"
+        assert listener.last_event_id["sessions"] == event_id
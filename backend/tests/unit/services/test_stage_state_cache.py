@@ -0,0 +1,104 @@
+"""
+Unit tests for StageStateCache.
+
+Tests per-session tracking, write-through updates and ordering of cached
+stage executions.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tarsy.services.stage_state_cache import StageStateCache
+
+
+def make_stage(
+    execution_id: str,
+    session_id: str = "session-1",
+    stage_index: int = 0,
+    parallel_index: int = 0,
+    parent_stage_execution_id: str | None = None,
+    status: str = "pending",
+    **extra,
+) -> SimpleNamespace:
+    """Create a minimal stage execution stand-in."""
+    return SimpleNamespace(
+        execution_id=execution_id,
+        session_id=session_id,
+        stage_index=stage_index,
+        parallel_index=parallel_index,
+        parent_stage_execution_id=parent_stage_execution_id,
+        status=status,
+        chat_id=None,
+        started_at_us=None,
+        **extra,
+    )
+
+
+@pytest.mark.unit
+class TestStageStateCache:
+    """Test StageStateCache behavior."""
+
+    def test_untracked_session_returns_none(self) -> None:
+        """Test that callers can distinguish untracked sessions from empty ones."""
+        cache = StageStateCache()
+
+        assert cache.get_stage_executions("session-1") is None
+        cache.track_session("session-1")
+        assert cache.get_stage_executions("session-1") == []
+
+    def test_put_ignored_for_untracked_session(self) -> None:
+        """Test that rows of sessions not executing on this pod are never cached."""
+        cache = StageStateCache()
+
+        cache.put(make_stage("exec-1"))
+
+        assert not cache.is_tracked("session-1")
+        assert cache.get_stage_executions("session-1") is None
+
+    def test_put_replaces_previous_row(self) -> None:
+        """Test that the latest persisted row wins."""
+        cache = StageStateCache()
+        cache.track_session("session-1")
+
+        cache.put(make_stage("exec-1", status="active"))
+        cache.put(make_stage("exec-1", status="completed"))
+
+        stages = cache.get_stage_executions("session-1")
+        assert len(stages) == 1
+        assert stages[0].status == "completed"
+
+    def test_top_level_stages_in_chain_order(self) -> None:
+        """Test that only single stages and parents are returned, ordered by stage index."""
+        cache = StageStateCache()
+        cache.track_session("session-1")
+
+        cache.put(make_stage("exec-2", stage_index=1))
+        cache.put(make_stage("exec-1", stage_index=0))
+        cache.put(make_stage("child-1", stage_index=1, parallel_index=1, parent_stage_execution_id="exec-2"))
+
+        stages = cache.get_stage_executions("session-1")
+        assert [s.execution_id for s in stages] == ["exec-1", "exec-2"]
+
+    def test_track_session_flattens_parallel_children(self) -> None:
+        """Test that a database snapshot with embedded children seeds children too."""
+        cache = StageStateCache()
+        child_2 = make_stage("child-2", parallel_index=2, parent_stage_execution_id="parent-1")
+        child_1 = make_stage("child-1", parallel_index=1, parent_stage_execution_id="parent-1")
+        parent = make_stage("parent-1", parallel_executions=[child_2, child_1])
+
+        cache.track_session("session-1", [parent])
+
+        children = cache.get_parallel_stage_children("parent-1")
+        assert [c.execution_id for c in children] == ["child-1", "child-2"]
+        assert cache.get_parallel_stage_children("unknown-parent") is None
+
+    def test_untrack_session_drops_state(self) -> None:
+        """Test that state is released once the execution run ends."""
+        cache = StageStateCache()
+        cache.track_session("session-1", [make_stage("exec-1")])
+
+        cache.untrack_session("session-1")
+        cache.untrack_session("session-1")  # Idempotent
+
+        assert cache.get_stage_executions("session-1") is None
@@ -0,0 +1,234 @@
+"""
+Unit tests for WebSocket catch-up.
+
+Tests paged event replay and snapshot-plus-delta catch-up.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tarsy.services import websocket_catchup
+from tarsy.services.websocket_catchup import (
+    CATCHUP_MODE_SNAPSHOT,
+    build_channel_snapshot,
+    send_catchup,
+    supports_snapshot,
+)
+
+
+def make_events(first_id: int, count: int) -> list:
+    """Create mock events with consecutive IDs."""
+    return [
+        SimpleNamespace(id=event_id, payload={"type": "session.progress_update"})
+        for event_id in range(first_id, first_id + count)
+    ]
+
+
+def make_event_repo(events: list, latest_event_id: int = 0) -> Mock:
+    """Create a mock event repository serving events by after_id/limit."""
+    async def get_events_after(channel, after_id, limit):
+        return [event for event in events if event.id > after_id][:limit]
+
+    repo = Mock()
+    repo.get_events_after = AsyncMock(side_effect=get_events_after)
+    repo.get_latest_event_id = AsyncMock(return_value=latest_event_id)
+    return repo
+
+
+@pytest.mark.unit
+class TestEventReplay:
+    """Test catch-up by replaying missed events."""
+
+    @pytest.mark.asyncio
+    async def test_replay_pages_beyond_one_query(self):
+        """Test that more missed events than one page are all replayed in order."""
+        send_text = AsyncMock()
+        repo = make_event_repo(make_events(11, 250))
+
+        await send_catchup(send_text, repo, "cancellations", last_event_id=10)
+
+        messages = [json.loads(call[0][0]) for call in send_text.call_args_list]
+        assert [m["id"] for m in messages[:-1]] == list(range(11, 261))
+        assert messages[-1] == {
+            "type": "catchup.complete",
+            "channel": "cancellations",
+            "last_event_id": 260,
+            "events": 250,
+            "has_more": False,
+            "snapshot": False,
+        }
+        assert repo.get_events_after.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_replay_capped_without_snapshot_support(self):
+        """Test that replay stops at the cap and reports more events."""
+        send_text = AsyncMock()
+        repo = make_event_repo(make_events(1, 1200))
+
+        with patch.object(websocket_catchup, "CATCHUP_MAX_EVENTS", 500):
+            await send_catchup(send_text, repo, "cancellations")
+
+        complete = json.loads(send_text.call_args_list[-1][0][0])
+        assert complete["events"] == 500
+        assert complete["last_event_id"] == 500
+        assert complete["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_too_many_missed_events_switch_to_snapshot(self):
+        """Test that a session channel far behind gets a snapshot instead of a long replay."""
+        send_text = AsyncMock()
+        repo = make_event_repo(make_events(1, 300), latest_event_id=300)
+        snapshot = {"session": {"session_id": "s-1", "status": "in_progress"}, "stages": []}
+
+        with patch.object(websocket_catchup, "CATCHUP_MAX_EVENTS", 200), \
+             patch.object(websocket_catchup, "build_channel_snapshot", AsyncMock(return_value=snapshot)):
+            await send_catchup(send_text, repo, "session:s-1")
+
+        messages = [json.loads(call[0][0]) for call in send_text.call_args_list]
+        assert [m["type"] for m in messages] == ["catchup.snapshot", "catchup.complete"]
+        assert messages[0]["last_event_id"] == 300
+        assert messages[0]["session_id"] == "s-1"
+        assert messages[1]["snapshot"] is True
+
+
+@pytest.mark.unit
+class TestSnapshotCatchup:
+    """Test catch-up with a current-state snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_followed_by_events_after_snapshot_point(self):
+        """Test that only events newer than the snapshot point are sent after it."""
+        send_text = AsyncMock()
+        repo = make_event_repo(make_events(1, 60), latest_event_id=58)
+        snapshot = {"active_sessions": []}
+
+        with patch.object(websocket_catchup, "build_channel_snapshot", AsyncMock(return_value=snapshot)):
+            await send_catchup(send_text, repo, "sessions", last_event_id=3, mode=CATCHUP_MODE_SNAPSHOT)
+
+        messages = [json.loads(call[0][0]) for call in send_text.call_args_list]
+        assert messages[0] == {
+            "type": "catchup.snapshot",
+            "channel": "sessions",
+            "last_event_id": 58,
+            "snapshot": snapshot,
+        }
+        assert [m["id"] for m in messages[1:-1]] == [59, 60]
+        assert messages[-1]["last_event_id"] == 60
+        repo.get_latest_event_id.assert_awaited_once_with("sessions")
+
+    @pytest.mark.asyncio
+    async def test_missing_session_falls_back_to_replay(self):
+        """Test that a snapshot request for an unknown session replays events instead."""
+        send_text = AsyncMock()
+        repo = make_event_repo(make_events(5, 2), latest_event_id=6)
+
+        with patch.object(websocket_catchup, "build_channel_snapshot", AsyncMock(return_value=None)):
+            await send_catchup(send_text, repo, "session:gone", last_event_id=4, mode=CATCHUP_MODE_SNAPSHOT)
+
+        messages = [json.loads(call[0][0]) for call in send_text.call_args_list]
+        assert [m.get("id") for m in messages[:-1]] == [5, 6]
+        assert messages[-1]["snapshot"] is False
+
+    @pytest.mark.asyncio
+    async def test_snapshot_mode_on_unsupported_channel_replays(self):
+        """Test that channels without snapshots replay events even in snapshot mode."""
+        send_text = AsyncMock()
+        repo = make_event_repo(make_events(1, 1))
+
+        await send_catchup(send_text, repo, "cancellations", mode=CATCHUP_MODE_SNAPSHOT)
+
+        repo.get_latest_event_id.assert_not_called()
+        assert json.loads(send_text.call_args_list[0][0][0])["id"] == 1
+
+    def test_supports_snapshot(self):
+        """Test which channels have snapshots."""
+        assert supports_snapshot("sessions") is True
+        assert supports_snapshot("session:abc") is True
+        assert supports_snapshot("session:") is False
+        assert supports_snapshot("cancellations") is False
+
+
+@pytest.mark.unit
+class TestBuildChannelSnapshot:
+    """Test snapshot contents built from the history database."""
+
+    @pytest.fixture
+    def history_service(self):
+        """Create a mock history service."""
+        session = SimpleNamespace(
+            session_id="s-1",
+            agent_type="KubernetesAgent",
+            alert_type="PodCrash",
+            status="in_progress",
+            chain_id="chain-1",
+            current_stage_index=1,
+            current_stage_id="analysis",
+            started_at_us=1000,
+            completed_at_us=None,
+            error_message=None,
+            pause_metadata=None,
+        )
+        stage = SimpleNamespace(
+            execution_id="exec-1",
+            stage_id="analysis",
+            stage_index=1,
+            stage_name="Analysis",
+            agent="KubernetesAgent",
+            status="active",
+            started_at_us=2000,
+            completed_at_us=None,
+            error_message=None,
+            chat_id=None,
+            parent_stage_execution_id=None,
+            parallel_index=0,
+            expected_parallel_count=None,
+        )
+        service = Mock()
+        service.get_session = Mock(return_value=session)
+        service.get_active_sessions = Mock(return_value=[session])
+        service.get_stage_executions = AsyncMock(return_value=[stage])
+        return service
+
+    @pytest.mark.asyncio
+    async def test_session_snapshot(self, history_service):
+        """Test that a session channel snapshot holds the session and its stages."""
+        with patch("tarsy.services.history_service.get_history_service", return_value=history_service):
+            snapshot = await build_channel_snapshot("session:s-1")
+
+        history_service.get_session.assert_called_once_with("s-1")
+        assert snapshot["session"]["status"] == "in_progress"
+        assert snapshot["session"]["current_stage_id"] == "analysis"
+        assert snapshot["stages"] == [{
+            "execution_id": "exec-1",
+            "stage_id": "analysis",
+            "stage_index": 1,
+            "stage_name": "Analysis",
+            "agent": "KubernetesAgent",
+            "status": "active",
+            "started_at_us": 2000,
+            "completed_at_us": None,
+            "error_message": None,
+            "chat_id": None,
+            "parent_stage_execution_id": None,
+            "parallel_index": 0,
+            "expected_parallel_count": None,
+        }]
+
+    @pytest.mark.asyncio
+    async def test_sessions_snapshot(self, history_service):
+        """Test that the sessions channel snapshot lists the active sessions."""
+        with patch("tarsy.services.history_service.get_history_service", return_value=history_service):
+            snapshot = await build_channel_snapshot("sessions")
+
+        assert [s["session_id"] for s in snapshot["active_sessions"]] == ["s-1"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_session(self, history_service):
+        """Test that no snapshot is built for a session that does not exist."""
+        history_service.get_session.return_value = None
+
+        with patch("tarsy.services.history_service.get_history_service", return_value=history_service):
+            assert await build_channel_snapshot("session:missing") is None
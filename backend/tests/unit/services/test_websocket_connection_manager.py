@@ -4,12 +4,17 @@ Unit tests for WebSocketConnectionManager.
 Tests connection lifecycle, subscription management, broadcasting, and error handling.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock
 
 import pytest
 
-from tarsy.services.websocket_connection_manager import WebSocketConnectionManager
+from tarsy.services.events.codec import EncodedEvent, dumps
+from tarsy.services.websocket_connection_manager import (
+    WebSocketConnectionManager,
+    merge_stream_chunks,
+)
 
 
 @pytest.mark.unit
@@ -289,11 +294,13 @@ class TestWebSocketConnectionManagerBroadcast:
 
         event = {"type": "test.event", "data": "hello"}
         await manager.broadcast_to_channel("test_channel", event)
+        await manager.flush()
 
-        expected_json = json.dumps(event)
+        expected_json = dumps(event)
         mock_ws1.send_text.assert_called_once_with(expected_json)
         mock_ws2.send_text.assert_called_once_with(expected_json)
         mock_ws3.send_text.assert_called_once_with(expected_json)
+        assert json.loads(expected_json) == event
 
     @pytest.mark.asyncio
     async def test_broadcast_to_nonexistent_channel(self):
@@ -302,6 +309,7 @@ class TestWebSocketConnectionManagerBroadcast:
 
         # Should handle gracefully without errors
         await manager.broadcast_to_channel("nonexistent_channel", {"type": "test"})
+        await manager.flush()
 
     @pytest.mark.asyncio
     async def test_broadcast_handles_send_errors(self):
@@ -322,6 +330,7 @@ class TestWebSocketConnectionManagerBroadcast:
 
         event = {"type": "test.event"}
         await manager.broadcast_to_channel("test_channel", event)
+        await manager.flush()
 
         # Both should be called, even though ws1 failed
         mock_ws1.send_text.assert_called_once()
@@ -346,6 +355,7 @@ class TestWebSocketConnectionManagerBroadcast:
 
         event = {"type": "test.event"}
         await manager.broadcast_to_channel("channel_a", event)
+        await manager.flush()
 
         # Only conn1 should receive the event
         mock_ws1.send_text.assert_called_once()
@@ -373,10 +383,26 @@ class TestWebSocketConnectionManagerBroadcast:
         }
 
         await manager.broadcast_to_channel("test_channel", complex_event)
+        await manager.flush()
 
         # Verify JSON serialization works correctly
-        expected_json = json.dumps(complex_event)
-        mock_websocket.send_text.assert_called_once_with(expected_json)
+        sent_json = mock_websocket.send_text.call_args[0][0]
+        assert json.loads(sent_json) == complex_event
+
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reuses_pre_encoded_event(self):
+        """Test that an event carrying its JSON text is sent without re-encoding."""
+        manager = WebSocketConnectionManager()
+        mock_websocket = AsyncMock()
+        await manager.connect("conn1", mock_websocket)
+        manager.subscribe("conn1", "test_channel")
+
+        event = EncodedEvent({"type": "test.event"}, text='{"type": "test.event"}')
+        await manager.broadcast_to_channel("test_channel", event)
+        await manager.flush()
+
+        mock_websocket.send_text.assert_called_once_with('{"type": "test.event"}')
 
 
 @pytest.mark.unit
@@ -427,9 +453,258 @@ class TestWebSocketConnectionManagerEdgeCases:
         # Simulate error during broadcast
         mock_websocket.send_text.side_effect = Exception("Send failed")
         await manager.broadcast_to_channel("channel1", {"type": "test"})
+        await manager.flush()
 
         # State should remain consistent
         assert "conn1" in manager.connections
         assert "channel1" in manager.subscriptions["conn1"]
         assert "conn1" in manager.channel_subscribers["channel1"]
 
+
+
+def make_blocked_websocket() -> tuple[AsyncMock, asyncio.Event]:
+    """Create a WebSocket whose sends block until the returned event is set."""
+    release = asyncio.Event()
+    websocket = AsyncMock()
+
+    async def send_text(text):
+        await release.wait()
+
+    websocket.send_text.side_effect = send_text
+    return websocket, release
+
+
+def stream_chunk(
+    chunk: str,
+    is_complete: bool = False,
+    interaction_id: str = "int-1",
+    sequence: int = 1,
+    offset: int = 0,
+    is_snapshot: bool = True,
+) -> dict:
+    """Create an llm.stream.chunk event (a full snapshot unless is_snapshot=False)."""
+    return {
+        "type": "llm.stream.chunk",
+        "session_id": "s-1",
+        "stage_execution_id": "stage-1",
+        "llm_interaction_id": interaction_id,
+        "stream_type": "thought",
+        "chunk": chunk,
+        "sequence": sequence,
+        "offset": offset,
+        "is_snapshot": is_snapshot,
+        "is_complete": is_complete,
+    }
+
+
+@pytest.mark.unit
+class TestWebSocketConnectionManagerSendQueues:
+    """Test per-connection send queues and slow-consumer handling."""
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_block_others(self):
+        """Test that broadcast returns while one client is stuck sending."""
+        manager = WebSocketConnectionManager()
+        slow_ws, release = make_blocked_websocket()
+        fast_ws = AsyncMock()
+
+        await manager.connect("slow", slow_ws)
+        await manager.connect("fast", fast_ws)
+        manager.subscribe("slow", "sessions")
+        manager.subscribe("fast", "sessions")
+
+        for i in range(3):
+            await asyncio.wait_for(
+                manager.broadcast_to_channel("sessions", {"type": "test.event", "n": i}),
+                timeout=1,
+            )
+        await asyncio.wait_for(manager.send_queues["fast"].wait_idle(), timeout=1)
+
+        assert fast_ws.send_text.call_count == 3
+        assert manager.get_metrics()["per_connection"]["slow"]["queue_depth"] == 2
+
+        release.set()
+        await asyncio.wait_for(manager.flush(), timeout=1)
+        assert slow_ws.send_text.call_count == 3
+        manager.disconnect("slow")
+        manager.disconnect("fast")
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_coalesced_while_queued(self):
+        """Test that a newer snapshot replaces a queued chunk of the same stream."""
+        manager = WebSocketConnectionManager()
+        websocket, release = make_blocked_websocket()
+        await manager.connect("conn1", websocket)
+        manager.subscribe("conn1", "session:s-1")
+
+        # First message occupies the writer, the rest queue up
+        await manager.broadcast_to_channel("session:s-1", {"type": "stage.started"})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_channel("session:s-1", stream_chunk("Thinking"))
+        await manager.broadcast_to_channel("session:s-1", stream_chunk("Thinking about"))
+        await manager.broadcast_to_channel("session:s-1", stream_chunk("Thinking about it", is_complete=True))
+
+        release.set()
+        await asyncio.wait_for(manager.flush(), timeout=1)
+
+        sent = [json.loads(call[0][0]) for call in websocket.send_text.call_args_list]
+        assert [event["type"] for event in sent] == ["stage.started", "llm.stream.chunk"]
+        assert sent[1]["chunk"] == "Thinking about it"
+        assert sent[1]["is_complete"] is True
+        assert manager.get_metrics()["per_connection"]["conn1"]["coalesced"] == 2
+        manager.disconnect("conn1")
+
+    @pytest.mark.asyncio
+    async def test_queued_deltas_merged(self):
+        """Test that deltas queued for one stream are merged into one equivalent delta."""
+        manager = WebSocketConnectionManager()
+        websocket, release = make_blocked_websocket()
+        await manager.connect("conn1", websocket)
+        manager.subscribe("conn1", "session:s-1")
+
+        await manager.broadcast_to_channel("session:s-1", {"type": "stage.started"})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_channel(
+            "session:s-1", stream_chunk(" about", sequence=2, offset=8, is_snapshot=False)
+        )
+        await manager.broadcast_to_channel(
+            "session:s-1", stream_chunk(" it", sequence=3, offset=14, is_snapshot=False, is_complete=True)
+        )
+
+        release.set()
+        await asyncio.wait_for(manager.flush(), timeout=1)
+
+        sent = json.loads(websocket.send_text.call_args_list[1][0][0])
+        assert sent["chunk"] == " about it"
+        assert sent["offset"] == 8
+        assert sent["sequence"] == 3
+        assert sent["is_snapshot"] is False
+        assert sent["is_complete"] is True
+        manager.disconnect("conn1")
+
+    @pytest.mark.asyncio
+    async def test_new_stream_chunks_dropped_above_high_water(self):
+        """Test that chunks are dropped above the high-water mark but final chunks and events are kept."""
+        manager = WebSocketConnectionManager(send_queue_high_water=2, send_queue_max_size=10)
+        websocket, release = make_blocked_websocket()
+        await manager.connect("conn1", websocket)
+        manager.subscribe("conn1", "session:s-1")
+
+        await manager.broadcast_to_channel("session:s-1", {"type": "stage.started"})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_channel("session:s-1", {"type": "mcp.tool_call"})
+        await manager.broadcast_to_channel("session:s-1", {"type": "mcp.tool_call"})
+        await manager.broadcast_to_channel("session:s-1", stream_chunk("partial", interaction_id="int-2"))
+        await manager.broadcast_to_channel("session:s-1", stream_chunk("done", is_complete=True, interaction_id="int-3"))
+        await manager.broadcast_to_channel("session:s-1", {"type": "stage.completed"})
+
+        metrics = manager.get_metrics()["per_connection"]["conn1"]
+        assert metrics["dropped"] == 1
+        assert metrics["queue_depth"] == 4
+
+        release.set()
+        await asyncio.wait_for(manager.flush(), timeout=1)
+        sent = [json.loads(call[0][0]) for call in websocket.send_text.call_args_list]
+        assert "partial" not in [event.get("chunk") for event in sent]
+        assert sent[-1]["type"] == "stage.completed"
+        manager.disconnect("conn1")
+
+    @pytest.mark.asyncio
+    async def test_hopeless_consumer_disconnected(self):
+        """Test that exceeding the max queue size closes the connection."""
+        manager = WebSocketConnectionManager(send_queue_high_water=2, send_queue_max_size=3)
+        websocket, release = make_blocked_websocket()
+        await manager.connect("conn1", websocket)
+        manager.subscribe("conn1", "sessions")
+
+        await manager.broadcast_to_channel("sessions", {"type": "test.event"})
+        await asyncio.sleep(0)
+        for _ in range(4):
+            await manager.broadcast_to_channel("sessions", {"type": "test.event"})
+
+        metrics = manager.get_metrics()
+        assert metrics["slow_consumers"] == 1
+        assert metrics["per_connection"]["conn1"]["queue_depth"] == 0
+
+        release.set()
+        await asyncio.wait_for(manager.flush(), timeout=1)
+        await asyncio.sleep(0)
+        websocket.close.assert_called_once()
+        assert websocket.close.call_args.kwargs["code"] == 1013
+
+        # Later events are not queued for the closed consumer
+        await manager.broadcast_to_channel("sessions", {"type": "test.event"})
+        assert manager.get_metrics()["per_connection"]["conn1"]["queue_depth"] == 0
+        manager.disconnect("conn1")
+
+    @pytest.mark.asyncio
+    async def test_send_waits_above_high_water_and_keeps_order(self):
+        """Test that catch-up/control sends wait for the backlog instead of dropping."""
+        manager = WebSocketConnectionManager(send_queue_high_water=2, send_queue_max_size=3)
+        websocket, release = make_blocked_websocket()
+        await manager.connect("conn1", websocket)
+        manager.subscribe("conn1", "sessions")
+        send_queue = manager.send_queues["conn1"]
+
+        await manager.broadcast_to_channel("sessions", {"type": "live", "n": 0})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_channel("sessions", {"type": "live", "n": 1})
+        await manager.broadcast_to_channel("sessions", {"type": "live", "n": 2})
+
+        # Queue is at the high-water mark: send() waits rather than exceeding it
+        replay = asyncio.create_task(send_queue.send(json.dumps({"type": "replay"})))
+        await asyncio.sleep(0)
+        assert not replay.done()
+        assert send_queue.depth == 2
+
+        release.set()
+        await asyncio.wait_for(replay, timeout=1)
+        await asyncio.wait_for(manager.flush(), timeout=1)
+
+        sent = [json.loads(call[0][0])["type"] for call in websocket.send_text.call_args_list]
+        assert sent == ["live", "live", "live", "replay"]
+        assert not send_queue.slow_consumer
+        manager.disconnect("conn1")
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self):
+        """Test that disconnect removes the send queue."""
+        manager = WebSocketConnectionManager()
+        await manager.connect("conn1", AsyncMock())
+
+        manager.disconnect("conn1")
+
+        assert "conn1" not in manager.send_queues
+        assert manager.get_metrics()["connections"] == 0
+
+
+@pytest.mark.unit
+class TestMergeStreamChunks:
+    """Test merging of queued streaming chunks."""
+
+    def test_delta_into_snapshot_stays_snapshot(self):
+        """Test that a delta applied to a queued snapshot yields a snapshot."""
+        merged = merge_stream_chunks(
+            stream_chunk("Hello wor"),
+            stream_chunk("world", sequence=2, offset=6, is_snapshot=False),
+        )
+
+        assert merged["chunk"] == "Hello world"
+        assert merged["offset"] == 0
+        assert merged["is_snapshot"] is True
+        assert merged["sequence"] == 2
+
+    def test_delta_rewriting_before_queued_offset(self):
+        """Test that a delta splicing before the queued delta supersedes it."""
+        merged = merge_stream_chunks(
+            stream_chunk("abc", sequence=2, offset=10, is_snapshot=False),
+            stream_chunk("X", sequence=3, offset=5, is_snapshot=False),
+        )
+
+        assert (merged["offset"], merged["chunk"], merged["is_snapshot"]) == (5, "X", False)
+
+    def test_newer_snapshot_replaces(self):
+        """Test that a newer snapshot replaces whatever is queued."""
+        newer = stream_chunk("Full text", sequence=50)
+
+        assert merge_stream_chunks(stream_chunk("abc", sequence=49, offset=3, is_snapshot=False), newer) is newer
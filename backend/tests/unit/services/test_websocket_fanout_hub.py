@@ -0,0 +1,228 @@
+"""
+Unit tests for WebSocketFanoutHub.
+
+Tests one-callback-per-channel registration, single delivery per connection
+and release of listener callbacks when channels become empty.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tarsy.services.websocket_connection_manager import WebSocketConnectionManager
+from tarsy.services.websocket_fanout_hub import WebSocketFanoutHub
+
+
+@pytest.fixture
+def mock_event_listener():
+    """EventListener mock that records registered callbacks."""
+    listener = AsyncMock()
+    listener.registered = {}
+
+    async def subscribe(channel, callback):
+        listener.registered.setdefault(channel, []).append(callback)
+
+    async def unsubscribe(channel, callback):
+        listener.registered[channel].remove(callback)
+
+    listener.subscribe.side_effect = subscribe
+    listener.unsubscribe.side_effect = unsubscribe
+    return listener
+
+
+@pytest.fixture
+def hub(mock_event_listener):
+    """Fan-out hub wired to a fresh connection manager and the mock listener."""
+    mock_event_system = Mock()
+    mock_event_system.get_listener.return_value = mock_event_listener
+    with patch(
+        "tarsy.services.websocket_fanout_hub.get_event_system",
+        return_value=mock_event_system,
+    ):
+        yield WebSocketFanoutHub(WebSocketConnectionManager())
+
+
+async def connect(hub: WebSocketFanoutHub, connection_id: str) -> AsyncMock:
+    """Connect a mock WebSocket to the hub's connection manager."""
+    websocket = AsyncMock()
+    await hub.connection_manager.connect(connection_id, websocket)
+    return websocket
+
+
+@pytest.mark.unit
+class TestWebSocketFanoutHubSubscribe:
+    """Test listener registration on subscribe."""
+
+    @pytest.mark.asyncio
+    async def test_one_listener_callback_per_channel(self, hub, mock_event_listener):
+        """Test that many subscribers on a channel share one listener callback."""
+        for i in range(5):
+            await connect(hub, f"conn-{i}")
+            assert await hub.subscribe(f"conn-{i}", "sessions") is True
+
+        mock_event_listener.subscribe.assert_called_once()
+        assert len(mock_event_listener.registered["sessions"]) == 1
+        assert hub.channels == {"sessions"}
+        assert len(hub.connection_manager.channel_subscribers["sessions"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_event_delivered_once_per_connection(self, hub, mock_event_listener):
+        """Test that each subscribed connection receives an event exactly once."""
+        websockets = [await connect(hub, f"conn-{i}") for i in range(4)]
+        for i in range(4):
+            await hub.subscribe(f"conn-{i}", "sessions")
+
+        callback = mock_event_listener.registered["sessions"][0]
+        await callback({"type": "session.started", "session_id": "s-1"})
+        await hub.connection_manager.flush()
+
+        for websocket in websockets:
+            websocket.send_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_subscribe_returns_false(self, hub, mock_event_listener):
+        """Test that re-subscribing a connection is a no-op."""
+        await connect(hub, "conn-1")
+
+        assert await hub.subscribe("conn-1", "sessions") is True
+        assert await hub.subscribe("conn-1", "sessions") is False
+
+        mock_event_listener.subscribe.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_registration_can_be_retried(self, hub, mock_event_listener):
+        """Test that a failing listener registration doesn't leave the channel claimed."""
+        await connect(hub, "conn-1")
+        mock_event_listener.subscribe.side_effect = RuntimeError("LISTEN failed")
+
+        with pytest.raises(RuntimeError):
+            await hub.subscribe("conn-1", "sessions")
+
+        assert hub.channels == set()
+        assert "sessions" not in hub.connection_manager.channel_subscribers
+
+    @pytest.mark.asyncio
+    async def test_concurrent_subscribers_wait_for_registration(self, hub, mock_event_listener):
+        """Test that subscribers arriving during registration return only once the callback exists."""
+        registered = asyncio.Event()
+        subscribe = mock_event_listener.subscribe.side_effect
+
+        async def slow_subscribe(channel, callback):
+            await registered.wait()
+            await subscribe(channel, callback)
+
+        mock_event_listener.subscribe.side_effect = slow_subscribe
+        await connect(hub, "conn-1")
+        await connect(hub, "conn-2")
+        first = asyncio.create_task(hub.subscribe("conn-1", "sessions"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hub.subscribe("conn-2", "sessions"))
+        await asyncio.sleep(0)
+
+        assert not second.done()
+        # conn-1 leaving mid-flight must not release the channel conn-2 is waiting for
+        await hub.unsubscribe("conn-1", "sessions")
+        registered.set()
+
+        assert await first is True
+        assert await second is True
+        mock_event_listener.subscribe.assert_called_once()
+        assert hub.channels == {"sessions"}
+        assert hub.connection_manager.channel_subscribers["sessions"] == {"conn-2"}
+
+    @pytest.mark.asyncio
+    async def test_failed_registration_fails_concurrent_subscribers(self, hub, mock_event_listener):
+        """Test that every subscriber waiting on a failed registration fails and is unrouted."""
+        registered = asyncio.Event()
+
+        async def failing_subscribe(channel, callback):
+            await registered.wait()
+            raise RuntimeError("LISTEN failed")
+
+        mock_event_listener.subscribe.side_effect = failing_subscribe
+        await connect(hub, "conn-1")
+        await connect(hub, "conn-2")
+        first = asyncio.create_task(hub.subscribe("conn-1", "sessions"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hub.subscribe("conn-2", "sessions"))
+        await asyncio.sleep(0)
+        registered.set()
+
+        for task in (first, second):
+            with pytest.raises(RuntimeError):
+                await task
+        mock_event_listener.subscribe.assert_called_once()
+        assert hub.channels == set()
+        assert "sessions" not in hub.connection_manager.channel_subscribers
+
+    @pytest.mark.asyncio
+    async def test_disconnect_during_registration_releases_callback(self, hub, mock_event_listener):
+        """Test that a callback registered for a connection that left meanwhile is released."""
+        registered = asyncio.Event()
+        subscribe = mock_event_listener.subscribe.side_effect
+
+        async def slow_subscribe(channel, callback):
+            await registered.wait()
+            await subscribe(channel, callback)
+
+        mock_event_listener.subscribe.side_effect = slow_subscribe
+        await connect(hub, "conn-1")
+        task = asyncio.create_task(hub.subscribe("conn-1", "sessions"))
+        await asyncio.sleep(0)
+        await hub.disconnect("conn-1")
+        registered.set()
+
+        assert await task is True
+        assert hub.channels == set()
+        assert mock_event_listener.registered["sessions"] == []
+
+
+@pytest.mark.unit
+class TestWebSocketFanoutHubRelease:
+    """Test listener release on unsubscribe and disconnect."""
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_releases_only_when_channel_empty(self, hub, mock_event_listener):
+        """Test that the listener callback is removed with the last subscriber."""
+        await connect(hub, "conn-1")
+        await connect(hub, "conn-2")
+        await hub.subscribe("conn-1", "sessions")
+        await hub.subscribe("conn-2", "sessions")
+
+        await hub.unsubscribe("conn-1", "sessions")
+        mock_event_listener.unsubscribe.assert_not_called()
+        assert hub.channels == {"sessions"}
+
+        await hub.unsubscribe("conn-2", "sessions")
+        mock_event_listener.unsubscribe.assert_called_once()
+        assert hub.channels == set()
+        assert mock_event_listener.registered["sessions"] == []
+
+    @pytest.mark.asyncio
+    async def test_disconnect_releases_unused_channels(self, hub, mock_event_listener):
+        """Test that disconnect releases channels the connection was alone on."""
+        await connect(hub, "conn-1")
+        await connect(hub, "conn-2")
+        await hub.subscribe("conn-1", "sessions")
+        await hub.subscribe("conn-1", "session:abc")
+        await hub.subscribe("conn-2", "sessions")
+
+        await hub.disconnect("conn-1")
+
+        assert "conn-1" not in hub.connection_manager.connections
+        assert hub.channels == {"sessions"}
+        mock_event_listener.unsubscribe.assert_called_once()
+        assert mock_event_listener.unsubscribe.call_args[0][0] == "session:abc"
+
+    @pytest.mark.asyncio
+    async def test_disconnect_survives_listener_errors(self, hub, mock_event_listener):
+        """Test that the connection is removed even if releasing the callback fails."""
+        await connect(hub, "conn-1")
+        await hub.subscribe("conn-1", "sessions")
+        mock_event_listener.unsubscribe.side_effect = RuntimeError("Event system unavailable")
+
+        await hub.disconnect("conn-1")
+
+        assert "conn-1" not in hub.connection_manager.connections
+        assert hub.channels == set()
@@ -43,6 +43,7 @@ class TestMainLifespan:
         
         with patch('tarsy.main.setup_logging') as mock_setup_logging, \
              patch('tarsy.main.initialize_database') as mock_init_db, \
+             patch('tarsy.main.initialize_pool_manager'), \
              patch(
                  'tarsy.services.history_service.get_history_service'
              ) as mock_history_service, \
@@ -110,7 +111,8 @@ class TestMainLifespan:
             cors_origins=["*"],
             database_url="sqlite:///test.db",
             history_retention_days=90,
-            history_cleanup_interval_hours=12
+            history_cleanup_interval_hours=12,
+            event_publish_batch_window_ms=0
         )
         deps['init_db'].return_value = True
         deps['db_info'].return_value = {"enabled": True}
@@ -145,7 +147,8 @@ class TestMainLifespan:
             cors_origins=["*"],
             database_url="sqlite:///test.db",
             history_retention_days=90,
-            history_cleanup_interval_hours=12
+            history_cleanup_interval_hours=12,
+            event_publish_batch_window_ms=0
         )
         deps['init_db'].return_value = True
         deps['db_info'].return_value = {"enabled": True}
@@ -221,7 +224,8 @@ class TestMainLifespan:
             cors_origins=["*"],
             database_url="sqlite:///test.db",
             history_retention_days=90,
-            history_cleanup_interval_hours=12
+            history_cleanup_interval_hours=12,
+            event_publish_batch_window_ms=0
         )
         deps['init_db'].return_value = True
         
@@ -262,7 +266,8 @@ class TestMainLifespan:
             cors_origins=["*"],
             database_url="sqlite:///test.db",
             history_retention_days=90,
-            history_cleanup_interval_hours=12
+            history_cleanup_interval_hours=12,
+            event_publish_batch_window_ms=0
         )
         deps['init_db'].return_value = True
         deps['db_info'].return_value = {"enabled": True}
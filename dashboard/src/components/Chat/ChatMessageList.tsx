@@ -9,6 +9,7 @@ import { websocketService } from '../../services/websocketService';
 import { apiClient } from '../../services/api';
 import type { ChatUserMessage, StageExecution, DetailedSession } from '../../types';
 import { STAGE_STATUS, isValidStageStatus, type StageStatus } from '../../utils/statusConstants';
+import { applyStreamChunk } from '../../utils/streamingDeltas';
 import { useAdvancedAutoScroll } from '../../hooks/useAdvancedAutoScroll';
 import { 
   LLM_EVENTS, 
@@ -302,20 +303,24 @@ export default function ChatMessageList({ sessionId, chatId }: ChatMessageListPr
             : `${event.llm_interaction_id}-${event.stream_type}`;
           
           const streamType = parseStreamingContentType(event.stream_type);
+          const existing = prev.get(key);
+          // Deltas are spliced into the current content; null means ignore (duplicate or gap)
+          const applied = applyStreamChunk(existing, event);
           
           if (event.is_complete) {
             // Stream completed - mark as waiting for DB update
-            const existing = prev.get(key);
             if (existing) {
               updated.set(key, {
                 ...existing,
-                content: event.chunk,
+                content: applied ? applied.content : existing.content,
+                sequence: applied ? applied.sequence : existing.sequence,
                 waitingForDb: true
               });
             } else {
               updated.set(key, {
                 type: streamType,
-                content: event.chunk,
+                content: applied?.content ?? '',
+                sequence: applied?.sequence,
                 stage_execution_id: event.stage_execution_id,
                 mcp_event_id: event.mcp_event_id,
                 llm_interaction_id: event.llm_interaction_id,
@@ -326,11 +331,12 @@ export default function ChatMessageList({ sessionId, chatId }: ChatMessageListPr
                 waitingForDb: true
               });
             }
-          } else {
+          } else if (applied) {
             // Still streaming - update content
             updated.set(key, {
               type: streamType,
-              content: event.chunk,
+              content: applied.content,
+              sequence: applied.sequence,
               stage_execution_id: event.stage_execution_id,
               mcp_event_id: event.mcp_event_id,
               llm_interaction_id: event.llm_interaction_id,
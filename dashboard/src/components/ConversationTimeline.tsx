@@ -28,6 +28,7 @@ import {
 } from '../utils/eventTypes';
 import { CHAT_FLOW_ITEM_TYPES } from '../constants/chatFlowItemTypes';
 import { generateItemKey } from '../utils/chatFlowItemKey';
+import { applyStreamChunk } from '../utils/streamingDeltas';
 // Auto-scroll is now handled by the centralized system in SessionDetailPageBase
 
 // Module-level constant to avoid creating new Map on every render
@@ -939,21 +940,25 @@ function ConversationTimeline({
             : `${event.llm_interaction_id}-${event.stream_type}`;
           
           const streamType = parseStreamingContentType(event.stream_type);
+          const existing = prev.get(key);
+          // Deltas are spliced into the current content; null means ignore (duplicate or gap)
+          const applied = applyStreamChunk(existing, event);
           
           if (event.is_complete) {
             // Stream completed - mark as waiting for DB update
-            const existing = prev.get(key);
             if (existing) {
               updated.set(key, {
                 ...existing,
-                content: event.chunk, // Final content update
+                content: applied ? applied.content : existing.content, // Final content update
+                sequence: applied ? applied.sequence : existing.sequence,
                 waitingForDb: true // Mark as waiting for DB confirmation
               });
             } else {
               // Seed a new entry for completion event with no prior partial entry
               updated.set(key, {
                 type: streamType,
-                content: event.chunk,
+                content: applied?.content ?? '',
+                sequence: applied?.sequence,
                 stage_execution_id: event.stage_execution_id,
                 mcp_event_id: event.mcp_event_id,
                 llm_interaction_id: event.llm_interaction_id,
@@ -965,11 +970,12 @@ function ConversationTimeline({
               });
             }
             console.log('✅ Stream completed, waiting for DB update to deduplicate');
-          } else {
+          } else if (applied) {
             // Still streaming - update content
             updated.set(key, {
               type: streamType,
-              content: event.chunk,
+              content: applied.content,
+              sequence: applied.sequence,
               stage_execution_id: event.stage_execution_id,
               mcp_event_id: event.mcp_event_id,
               llm_interaction_id: event.llm_interaction_id,
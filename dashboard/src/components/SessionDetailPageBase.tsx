@@ -124,6 +124,7 @@ function SessionDetailPageBase({
     refreshSessionSummary,
     refreshSessionStages,
     updateStageStatus,
+    applySessionSnapshot,
     handleParallelStageStarted
   } = useSession(sessionId);
 
@@ -545,6 +546,16 @@ function SessionDetailPageBase({
         }
       }
       
+      // Reconnect catch-up: apply the current state instead of replaying missed events
+      if (eventType === 'catchup.snapshot') {
+        console.log('🔄 Catch-up snapshot received, applying current state');
+        if (update.snapshot && !applySessionSnapshot(update.snapshot) && sessionId) {
+          // Stages started while disconnected aren't loaded yet - fetch them once
+          refreshSessionStages(sessionId);
+        }
+        return;
+      }
+
       // Handle chat events (EP-0027)
       if (eventType === 'chat.created' || eventType === 'chat.user_message') {
         console.log('💬 Chat event received:', eventType);
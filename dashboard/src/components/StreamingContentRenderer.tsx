@@ -25,6 +25,8 @@ export interface StreamingItem {
   stage_execution_id?: string;
   mcp_event_id?: string;
   waitingForDb?: boolean;
+  // Last applied llm.stream.chunk sequence number (see utils/streamingDeltas)
+  sequence?: number;
   // Tool call specific fields
   toolName?: string;
   messageId?: string;
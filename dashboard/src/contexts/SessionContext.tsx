@@ -1,12 +1,13 @@
 import { createContext, useContext, useState, useEffect, useRef, useCallback } from 'react';
 import type { ReactNode } from 'react';
 import { apiClient, handleAPIError } from '../services/api';
-import type { DetailedSession, Session, StageExecution } from '../types';
+import type { DetailedSession, Session, SessionSnapshot, StageExecution } from '../types';
 import { isValidSessionStatus, SESSION_STATUS, type StageStatus } from '../utils/statusConstants';
 import {
   createParallelPlaceholders,
   replacePlaceholderWithRealStage
 } from '../utils/parallelPlaceholders';
+import { applySessionSnapshot as applySnapshotToSession, hasUnloadedStages } from '../utils/sessionSnapshot';
 
 interface SessionContextData {
   session: DetailedSession | null;
@@ -21,6 +22,7 @@ interface SessionContextData {
   updateFinalAnalysis: (analysis: string) => void;
   updateSessionStatus: (newStatus: DetailedSession['status'], errorMessage?: string | null) => void;
   updateStageStatus: (stageId: string, status: StageStatus, errorMessage?: string | null, completedAtUs?: number | null) => void;
+  applySessionSnapshot: (snapshot: SessionSnapshot) => boolean;
   // Placeholder management for parallel stages
   handleParallelStageStarted: (stageExecution: StageExecution) => void;
   handleParallelChildStageStarted: (stageExecution: StageExecution) => void;
@@ -41,6 +43,9 @@ export function SessionProvider({ children }: SessionProviderProps) {
   const [loading, setLoading] = useState<boolean>(false);
   const [error, setError] = useState<string | null>(null);
   const [cachedSessionId, setCachedSessionId] = useState<string | null>(null);
+  // Latest session for callbacks that need to inspect it before updating
+  const sessionRef = useRef<DetailedSession | null>(null);
+  sessionRef.current = session;
 
   /**
    * Fetch session detail with intelligent caching
@@ -384,6 +389,25 @@ export function SessionProvider({ children }: SessionProviderProps) {
     });
   }, [setSession]);
 
+  /**
+   * Apply a reconnect catch-up snapshot (no API call needed)
+   * Returns false if the snapshot can't be applied from loaded data: the session isn't
+   * loaded, or stages started while disconnected (the caller refreshes stages instead)
+   */
+  const applySessionSnapshot = useCallback((snapshot: SessionSnapshot): boolean => {
+    const current = sessionRef.current;
+    if (!current || current.session_id !== snapshot.session.session_id || hasUnloadedStages(current, snapshot)) {
+      return false;
+    }
+
+    console.log('🔄 [SessionContext] Applying catch-up snapshot:', snapshot.session.status);
+    setSession(prevSession => {
+      if (!prevSession || prevSession.session_id !== snapshot.session.session_id) return prevSession;
+      return applySnapshotToSession(prevSession, snapshot);
+    });
+    return true;
+  }, [setSession]);
+
   const contextValue: SessionContextData = {
     session,
     loading,
@@ -397,6 +421,7 @@ export function SessionProvider({ children }: SessionProviderProps) {
     updateFinalAnalysis,
     updateSessionStatus,
     updateStageStatus,
+    applySessionSnapshot,
     // Placeholder management
     handleParallelStageStarted,
     handleParallelChildStageStarted
@@ -439,6 +464,7 @@ export function useSession(sessionId: string | undefined) {
     updateFinalAnalysis,
     updateSessionStatus,
     updateStageStatus,
+    applySessionSnapshot,
     handleParallelStageStarted,
     handleParallelChildStageStarted
   } = useSessionContext();
@@ -489,6 +515,7 @@ export function useSession(sessionId: string | undefined) {
     updateFinalAnalysis,
     updateSessionStatus,
     updateStageStatus,
+    applySessionSnapshot,
     handleParallelStageStarted,
     handleParallelChildStageStarted
   };
@@ -154,9 +154,10 @@ class WebSocketService {
     for (const [channel, sub] of this.channels.entries()) {
       this.sendSubscribe(channel);
       
-      // Request catchup if we have last event ID
+      // Request catchup if we have last event ID: current state plus newer events
+      // instead of replaying everything missed while disconnected
       if (sub.lastEventId > 0) {
-        this.sendCatchup(channel, sub.lastEventId);
+        this.sendCatchup(channel, sub.lastEventId, 'snapshot');
       }
     }
   }
@@ -179,12 +180,13 @@ class WebSocketService {
     }
   }
 
-  private sendCatchup(channel: string, lastEventId: number): void {
+  private sendCatchup(channel: string, lastEventId: number, mode: 'events' | 'snapshot' = 'events'): void {
     if (this.ws && this.ws.readyState === WebSocket.OPEN) {
       this.ws.send(JSON.stringify({
         action: 'catchup',
         channel: channel,
-        last_event_id: lastEventId
+        last_event_id: lastEventId,
+        mode: mode
       }));
     }
   }
@@ -226,6 +228,12 @@ class WebSocketService {
 
   private handleEvent(data: any): void {
     const eventType = data.type;
+
+    // Catch-up messages name their channel explicitly
+    if (eventType === 'catchup.snapshot' || eventType === 'catchup.complete') {
+      this.handleCatchupMessage(data);
+      return;
+    }
     
     // Update last event ID for channel
     if (data.id && data.session_id) {
@@ -267,6 +275,25 @@ class WebSocketService {
     }
   }
 
+  private handleCatchupMessage(data: any): void {
+    const sub = this.channels.get(data.channel);
+    if (!sub) {
+      return;
+    }
+
+    if (typeof data.last_event_id === 'number' && data.last_event_id > sub.lastEventId) {
+      sub.lastEventId = data.last_event_id;
+    }
+
+    if (data.type === 'catchup.snapshot') {
+      // Snapshot replaces the missed events - let the channel's handlers resync
+      sub.handlers.forEach(h => h(data));
+    } else if (data.has_more) {
+      // Replay was capped - continue from where it stopped
+      this.sendCatchup(data.channel, sub.lastEventId);
+    }
+  }
+
   onEvent(eventType: string, handler: EventHandler): () => void {
     if (!this.eventHandlers.has(eventType)) {
       this.eventHandlers.set(eventType, []);
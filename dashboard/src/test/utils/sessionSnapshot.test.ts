@@ -0,0 +1,95 @@
+import { describe, it, expect } from 'vitest';
+import { applySessionSnapshot, hasUnloadedStages } from '../../utils/sessionSnapshot';
+import type { DetailedSession, SessionSnapshot } from '../../types';
+import { SESSION_STATUS, STAGE_STATUS } from '../../utils/statusConstants';
+import { createMultiAgentParallelStage, createSingleStage } from './parallelStageMocks';
+
+const createSession = (): DetailedSession => ({
+  session_id: 'session-1',
+  status: SESSION_STATUS.IN_PROGRESS,
+  completed_at_us: null,
+  error_message: null,
+  pause_metadata: null,
+  current_stage_index: 0,
+  current_stage_id: 'analysis',
+  stages: [
+    createSingleStage({ status: STAGE_STATUS.ACTIVE, completed_at_us: null }),
+    createMultiAgentParallelStage([
+      { name: 'KubernetesAgent', status: STAGE_STATUS.ACTIVE },
+      { name: 'LogAgent', status: STAGE_STATUS.ACTIVE },
+    ]),
+  ],
+} as unknown as DetailedSession);
+
+const snapshotStage = (executionId: string, status: string, completedAtUs: number | null = null) => ({
+  execution_id: executionId,
+  stage_id: 'analysis',
+  stage_index: 0,
+  stage_name: 'Analysis',
+  agent: 'AnalysisAgent',
+  status,
+  started_at_us: 1700000000000000,
+  completed_at_us: completedAtUs,
+  error_message: null,
+  chat_id: null,
+  parent_stage_execution_id: null,
+  parallel_index: 0,
+  expected_parallel_count: null,
+}) as SessionSnapshot['stages'][number];
+
+const createSnapshot = (stages: SessionSnapshot['stages']): SessionSnapshot => ({
+  session: {
+    session_id: 'session-1',
+    agent_type: 'chain',
+    alert_type: 'PodCrash',
+    status: SESSION_STATUS.COMPLETED,
+    chain_id: 'chain-1',
+    current_stage_index: 1,
+    current_stage_id: 'investigation',
+    started_at_us: 1700000000000000,
+    completed_at_us: 1700000090000000,
+    error_message: null,
+    pause_metadata: null,
+  },
+  stages,
+} as SessionSnapshot);
+
+describe('sessionSnapshot', () => {
+  describe('applySessionSnapshot', () => {
+    it('applies session state and stage statuses, including parallel executions', () => {
+      const session = createSession();
+      const snapshot = createSnapshot([
+        snapshotStage('single-exec-1', STAGE_STATUS.COMPLETED, 1700000050000000),
+        snapshotStage('child-exec-2', STAGE_STATUS.FAILED, 1700000060000000),
+      ]);
+
+      const updated = applySessionSnapshot(session, snapshot);
+
+      expect(updated.status).toBe(SESSION_STATUS.COMPLETED);
+      expect(updated.completed_at_us).toBe(1700000090000000);
+      expect(updated.current_stage_id).toBe('investigation');
+      expect(updated.stages[0].status).toBe(STAGE_STATUS.COMPLETED);
+      expect(updated.stages[0].completed_at_us).toBe(1700000050000000);
+      const children = updated.stages[1].parallel_executions!;
+      expect(children[0].status).toBe(STAGE_STATUS.ACTIVE);
+      expect(children[1].status).toBe(STAGE_STATUS.FAILED);
+      // Interactions are kept
+      expect(updated.stages[0].llm_interactions).toBe(session.stages[0].llm_interactions);
+    });
+  });
+
+  describe('hasUnloadedStages', () => {
+    it('returns false when every snapshot stage is loaded', () => {
+      const snapshot = createSnapshot([
+        snapshotStage('single-exec-1', STAGE_STATUS.COMPLETED),
+        snapshotStage('child-exec-1', STAGE_STATUS.ACTIVE),
+      ]);
+      expect(hasUnloadedStages(createSession(), snapshot)).toBe(false);
+    });
+
+    it('returns true for stages started while disconnected', () => {
+      const snapshot = createSnapshot([snapshotStage('new-exec', STAGE_STATUS.ACTIVE)]);
+      expect(hasUnloadedStages(createSession(), snapshot)).toBe(true);
+    });
+  });
+});
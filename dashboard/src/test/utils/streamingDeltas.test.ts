@@ -0,0 +1,68 @@
+import { describe, it, expect } from 'vitest';
+import { applyStreamChunk } from '../../utils/streamingDeltas';
+
+describe('streamingDeltas', () => {
+  describe('applyStreamChunk', () => {
+    it('should replace content with a snapshot', () => {
+      const result = applyStreamChunk(
+        { content: 'stale', sequence: 3 },
+        { chunk: 'Full text', sequence: 50, offset: 0, is_snapshot: true }
+      );
+
+      expect(result).toEqual({ content: 'Full text', sequence: 50 });
+    });
+
+    it('should treat events without delta fields as full text', () => {
+      const result = applyStreamChunk({ content: 'Hello' }, { chunk: 'Hello world' });
+
+      expect(result).toEqual({ content: 'Hello world', sequence: 0 });
+    });
+
+    it('should append a delta at the current end', () => {
+      const result = applyStreamChunk(
+        { content: 'Hello', sequence: 1 },
+        { chunk: ' world', sequence: 2, offset: 5, is_snapshot: false }
+      );
+
+      expect(result).toEqual({ content: 'Hello world', sequence: 2 });
+    });
+
+    it('should splice a delta that rewrites the tail', () => {
+      const result = applyStreamChunk(
+        { content: 'Thinking...  ', sequence: 4 },
+        { chunk: '', sequence: 5, offset: 11, is_snapshot: false }
+      );
+
+      expect(result).toEqual({ content: 'Thinking...', sequence: 5 });
+    });
+
+    it('should ignore already applied sequence numbers', () => {
+      const result = applyStreamChunk(
+        { content: 'Hello world', sequence: 2 },
+        { chunk: ' world', sequence: 2, offset: 5, is_snapshot: false }
+      );
+
+      expect(result).toBeNull();
+    });
+
+    it('should ignore a delta beyond the current content (gap)', () => {
+      const result = applyStreamChunk(
+        { content: 'Hello', sequence: 1 },
+        { chunk: 'again', sequence: 4, offset: 20, is_snapshot: false }
+      );
+
+      expect(result).toBeNull();
+    });
+
+    it('should ignore a delta for an unknown stream', () => {
+      const result = applyStreamChunk(undefined, {
+        chunk: 'tail',
+        sequence: 7,
+        offset: 100,
+        is_snapshot: false,
+      });
+
+      expect(result).toBeNull();
+    });
+  });
+});
@@ -54,6 +54,19 @@ export interface Session {
   chat_message_count?: number; // Number of user messages in follow-up chat (if chat exists)
 }
 
+// Compact current state of a session:{id} channel, sent as catchup.snapshot on reconnect
+export interface SessionSnapshot {
+  session: Pick<Session,
+    'session_id' | 'agent_type' | 'alert_type' | 'status' | 'chain_id' | 'current_stage_index' |
+    'started_at_us' | 'completed_at_us' | 'error_message' | 'pause_metadata'
+  > & { current_stage_id: string | null };
+  stages: Array<Pick<StageExecution,
+    'execution_id' | 'stage_id' | 'stage_index' | 'stage_name' | 'agent' | 'status' |
+    'started_at_us' | 'completed_at_us' | 'error_message' | 'chat_id' |
+    'parent_stage_execution_id' | 'parallel_index' | 'expected_parallel_count'
+  >>;
+}
+
 // Phase 5: Interaction summary for stages
 export interface InteractionSummary {
   llm_count: number;
@@ -163,9 +176,19 @@ export interface LLMMessage {
   content: string;
 }
 
+// Context compaction applied to a conversation (older observations collapsed into references)
+export interface ConversationCompaction {
+  timestamp_us: number;
+  tokens_before: number;
+  tokens_after: number;
+  token_budget: number;
+  compacted_messages: number;
+}
+
 // LLM conversation structure
 export interface LLMConversation {
   messages: LLMMessage[];
+  compactions?: ConversationCompaction[];
 }
 
 // LLM event details
@@ -184,6 +207,7 @@ export interface LLMEventDetails {
   input_tokens: number | null;
   output_tokens: number | null;
   total_tokens: number | null;
+  cached_input_tokens?: number | null;  // Input tokens served from the provider's prompt cache
   tool_calls: any | null;
   tool_results: any | null;
   mcp_event_id?: string | null;  // For summarization - links to the tool call being summarized
@@ -319,6 +343,15 @@ export interface WebSocketMessage {
   parent_stage_execution_id?: string; // Parent stage execution ID for parallel child stages
   parallel_index?: number; // Position in parallel group (1-N for parallel children)
   agent_name?: string; // Agent name for this execution
+  token_budget?: TokenBudgetStatus | null; // Tightest active token budget (progress updates)
+}
+
+// Session / agent LLM token budget (session.progress_update)
+export interface TokenBudgetStatus {
+  scope: 'session' | 'agent';
+  limit: number;
+  used: number;
+  remaining: number;
 }
 
 export interface SessionUpdate {
@@ -335,6 +368,7 @@ export interface SessionProgressUpdate {
   session_id: string;
   phase: ProgressPhaseValue;
   metadata?: Record<string, any>;
+  token_budget?: TokenBudgetStatus | null;
 }
 
 // Phase 5: Chain progress update from WebSocket
@@ -0,0 +1,68 @@
+/**
+ * Utility functions for applying reconnect catch-up snapshots
+ * A catchup.snapshot carries the session's current state and its stages' statuses,
+ * so the loaded session is updated in place instead of being refetched over REST
+ */
+
+import type { DetailedSession, SessionSnapshot, StageExecution } from '../types';
+
+/**
+ * Collect execution IDs of loaded stages, including nested parallel executions
+ */
+function collectExecutionIds(stages: StageExecution[], ids: Set<string> = new Set()): Set<string> {
+  for (const stage of stages) {
+    ids.add(stage.execution_id);
+    if (stage.parallel_executions) {
+      collectExecutionIds(stage.parallel_executions, ids);
+    }
+  }
+  return ids;
+}
+
+/**
+ * Check whether a snapshot lists stages the loaded session doesn't have yet
+ * (started while disconnected - their details have to be fetched)
+ */
+export function hasUnloadedStages(session: DetailedSession, snapshot: SessionSnapshot): boolean {
+  const loaded = collectExecutionIds(session.stages || []);
+  return snapshot.stages.some(stage => !loaded.has(stage.execution_id));
+}
+
+/**
+ * Apply a snapshot's session state and stage statuses to the loaded session
+ * 
+ * @param session - Loaded session
+ * @param snapshot - Snapshot from a catchup.snapshot message for the same session
+ * @returns Updated session (stages not loaded yet are left out)
+ */
+export function applySessionSnapshot(session: DetailedSession, snapshot: SessionSnapshot): DetailedSession {
+  const snapshotStages = new Map(snapshot.stages.map(stage => [stage.execution_id, stage]));
+
+  const applyToStages = (stages: StageExecution[]): StageExecution[] =>
+    stages.map(stage => {
+      const current = snapshotStages.get(stage.execution_id);
+      const updated = current
+        ? {
+            ...stage,
+            status: current.status,
+            started_at_us: current.started_at_us,
+            completed_at_us: current.completed_at_us,
+            error_message: current.error_message
+          }
+        : stage;
+      return updated.parallel_executions
+        ? { ...updated, parallel_executions: applyToStages(updated.parallel_executions) }
+        : updated;
+    });
+
+  return {
+    ...session,
+    status: snapshot.session.status,
+    completed_at_us: snapshot.session.completed_at_us,
+    error_message: snapshot.session.error_message,
+    pause_metadata: snapshot.session.pause_metadata,
+    current_stage_index: snapshot.session.current_stage_index,
+    current_stage_id: snapshot.session.current_stage_id,
+    stages: applyToStages(session.stages || [])
+  };
+}
@@ -0,0 +1,55 @@
+/**
+ * Reassembly of delta-encoded LLM streaming chunks (llm.stream.chunk events)
+ *
+ * The backend publishes each stream as sequence-numbered deltas: a delta keeps
+ * content[:offset] and appends chunk. The first event of a stream and every Nth
+ * event are snapshots carrying the full text, so late joiners and clients that
+ * missed a delta resynchronize.
+ */
+
+export interface StreamChunkFields {
+  chunk: string;
+  sequence?: number;
+  offset?: number;
+  is_snapshot?: boolean;
+}
+
+export interface StreamContentState {
+  content: string;
+  sequence: number;
+}
+
+/**
+ * Apply a streaming chunk to the current content of its stream
+ *
+ * @param existing - Current streaming item (content and last applied sequence), if any
+ * @param event - Incoming llm.stream.chunk event
+ * @returns New content and sequence, or null if the event must be ignored
+ *   (already applied, or a delta beyond the current content - wait for the next snapshot)
+ */
+export function applyStreamChunk(
+  existing: { content?: string; sequence?: number } | undefined,
+  event: StreamChunkFields
+): StreamContentState | null {
+  const sequence = event.sequence ?? 0;
+
+  // Events without is_snapshot come from older backends and carry the full text
+  if (event.is_snapshot ?? true) {
+    return { content: event.chunk, sequence };
+  }
+
+  if (!existing) {
+    return null;
+  }
+  if (existing.sequence !== undefined && sequence <= existing.sequence) {
+    return null;
+  }
+
+  const current = existing.content ?? '';
+  const offset = event.offset ?? current.length;
+  if (offset > current.length) {
+    return null;
+  }
+
+  return { content: current.slice(0, offset) + event.chunk, sequence };
+}